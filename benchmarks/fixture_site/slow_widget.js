@@ -0,0 +1 @@
+document.getElementById("widget").innerHTML = '<label>Search <input type="search" name="q"></label> <button type="button">Go</button>';
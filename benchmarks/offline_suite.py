@@ -0,0 +1,310 @@
+"""
+Benchmark the framework's own overhead offline, with a scripted model and a local site.
+
+Run:
+    python benchmarks/offline_suite.py --repeat 3
+    python benchmarks/offline_suite.py --baseline benchmarks/baseline/offline_suite.json --threshold 0.25
+    python benchmarks/offline_suite.py --repeat 3 --output benchmarks/baseline/offline_suite.json
+
+Runs one scenario per page of ``benchmarks/fixture_site`` (a large DOM, nested
+shadow roots, same-origin iframes and slow-loading resources) through
+``SimpleHercules`` and a real headless browser. The site is served from disk
+by a local HTTP server that delays ``/slow/`` requests by their ``?ms=`` value.
+The planner and browser navigation agents get a scripted chat model that
+returns canned planner JSON and tool calls, so no LLM is contacted and every
+run performs the same work.
+
+Reports the wall time of each scenario, the mean planner and executor node
+durations, the latency of each browser tool and the peak memory of the
+process. With ``--baseline`` the results are compared with a stored run and
+the script exits with status 1 when a metric regresses by more than
+``--threshold``.
+
+Each run also times a fixed pure-Python workload on the same machine
+(``reference_seconds``). Timings are compared as multiples of that reference,
+so a baseline taken on one machine still applies on a faster or slower one.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixture_site")
+
+# Fixture page and the browser tools its scenario calls after opening it.
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "large_dom": {"page": "large_dom.html", "tools": ["get_interactive_elements", "get_page_text"]},
+    "shadow_dom": {"page": "shadow_dom.html", "tools": ["get_interactive_elements", "get_input_fields"]},
+    "iframes": {"page": "iframes.html", "tools": ["get_interactive_elements", "get_input_fields"]},
+    "slow_resources": {"page": "slow_resources.html", "tools": ["get_interactive_elements"]},
+}
+
+# Timing differences below this many seconds are treated as noise by the regression check.
+MIN_REGRESSION_SECONDS = 0.05
+REFERENCE_METRIC = "reference_seconds"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure framework overhead with a scripted model and a local fixture site.")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs of the whole suite; the median of each metric is reported (default: 1).")
+    parser.add_argument("--scenarios", nargs="*", choices=sorted(SCENARIOS), help="Scenarios to run (default: all).")
+    parser.add_argument("--output", help="Write the metrics of this run as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare with this metrics file, e.g. one written earlier with --output.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression per metric (default: 0.25).")
+    return parser.parse_args()
+
+
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        if parts.path.startswith("/slow/"):
+            delay_ms = int(parse_qs(parts.query).get("ms", ["1000"])[0])
+            time.sleep(delay_ms / 1000)
+            self.path = parts.path[len("/slow") :]
+        super().do_GET()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _serve_fixtures() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_FixtureHandler, directory=FIXTURE_DIR))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class ScriptedChatModel:
+    """Chat model stand-in that returns queued responses in order."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.responses: List[Any] = []
+
+    def load(self, responses: List[Any]) -> None:
+        self.responses = list(responses)
+
+    def bind_tools(self, tools: List[Any], **kwargs: Any) -> "ScriptedChatModel":
+        return self
+
+    async def ainvoke(self, messages: List[Any], **kwargs: Any) -> Any:
+        if not self.responses:
+            raise RuntimeError(f"Scripted {self.name} model ran out of responses")
+        return self.responses.pop(0)
+
+
+def _ai_message(content: str, tool_calls: Optional[List[Dict[str, Any]]] = None) -> Any:
+    from langchain_core.messages import AIMessage
+
+    return AIMessage(
+        content=content,
+        tool_calls=tool_calls or [],
+        response_metadata={"token_usage": {"prompt_tokens": 1000, "completion_tokens": 50}},
+    )
+
+
+def _planner_script(url: str) -> List[Any]:
+    step = {
+        "plan": f"1. Open {url} and read the page",
+        "next_step": f"Open {url} and list the interactive elements and page content",
+        "target_helper": "browser",
+        "terminate": "no",
+        "final_response": "",
+        "is_assert": False,
+        "is_passed": False,
+        "assert_summary": "",
+    }
+    done = {
+        **step,
+        "next_step": "",
+        "target_helper": "Not_Applicable",
+        "terminate": "yes",
+        "final_response": "The page was opened and read.",
+        "is_assert": True,
+        "is_passed": True,
+        "assert_summary": "EXPECTED RESULT: page readable\nACTUAL RESULT: page readable",
+    }
+    return [_ai_message(json.dumps(step)), _ai_message(json.dumps(done))]
+
+
+def _nav_script(url: str, tools: List[str]) -> List[Any]:
+    calls = [("open_url", {"url": url, "timeout": 0})] + [(tool, {}) for tool in tools]
+    script = [_ai_message("", [{"name": name, "args": args, "id": f"call_{index}"}]) for index, (name, args) in enumerate(calls)]
+    script.append(_ai_message("current_output: page opened and read\n##TERMINATE TASK##"))
+    return script
+
+
+def _configure_environment(project_root: str) -> None:
+    os.environ.setdefault("LLM_MODEL_NAME", "gpt-4o")
+    os.environ.setdefault("LLM_MODEL_API_KEY", "sk-benchmark-placeholder")
+    os.environ.setdefault("MODEL_API_KEY", os.environ["LLM_MODEL_API_KEY"])
+    os.environ["PROJECT_SOURCE_ROOT"] = project_root
+    os.environ["HEADLESS"] = "true"
+    os.environ["ENABLE_TELEMETRY"] = "0"
+    os.environ["LLM_CACHE_MODE"] = "off"
+    # Extensions are downloaded on first use; the suite must not touch the network.
+    os.environ["ENABLE_UBLOCK_EXTENSION"] = "false"
+    os.environ["AUTO_ACCEPT_SCREEN_SHARING"] = "false"
+
+
+async def _run_suite(base_url: str, scenarios: List[str]) -> Dict[str, float]:
+    from testzeus_hercules.core.agents_llm_config_manager import AgentsLLMConfigManager
+    from testzeus_hercules.core.playwright_manager import PlaywrightManager
+    from testzeus_hercules.core.simple_hercules import SimpleHercules
+
+    stake_id = "offline_benchmark"
+    config_manager = AgentsLLMConfigManager.get_instance()
+    config_manager.initialize()
+    browser_manager = PlaywrightManager(gui_input_mode=False, stake_id=stake_id)
+    await browser_manager.async_initialize()
+    engine = await SimpleHercules.create(
+        stake_id,
+        dict(config_manager.get_agent_config("planner_agent")),
+        dict(config_manager.get_agent_config("nav_agent")),
+        dict(config_manager.get_agent_config("helper_agent")),
+        save_chat_logs_to_files=False,
+    )
+    planner_llm = ScriptedChatModel("planner")
+    nav_llm = ScriptedChatModel("browser_nav_agent")
+    engine.agents_map["planner_agent"].llm = planner_llm
+    engine.agents_map["browser_nav_agent"].llm = nav_llm
+
+    tool_latencies: Dict[str, List[float]] = {}
+    execute_tool_call = engine._execute_tool_call
+
+    async def timed_tool_call(tool_obj: Any, tool_name: str, tool_args: Dict[str, Any]) -> str:
+        started = time.perf_counter()
+        try:
+            return await execute_tool_call(tool_obj, tool_name, tool_args)
+        finally:
+            tool_latencies.setdefault(tool_name, []).append(time.perf_counter() - started)
+
+    engine._execute_tool_call = timed_tool_call
+
+    metrics: Dict[str, float] = {}
+    node_durations: Dict[str, List[float]] = {}
+    try:
+        for name in scenarios:
+            url = f"{base_url}/{SCENARIOS[name]['page']}"
+            planner_llm.load(_planner_script(url))
+            nav_llm.load(_nav_script(url, SCENARIOS[name]["tools"]))
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = await engine.process_command(f"Open {url} and read it", await browser_manager.get_current_url())
+            metrics[f"scenario.{name}.seconds"] = time.perf_counter() - started
+            if result is None or result.terminate != "yes":
+                raise RuntimeError(f"Scenario {name} did not complete")
+            for timing in result.step_timings:
+                node_durations.setdefault(timing["node"], []).append(float(timing["duration"]))
+    finally:
+        await engine.shutdown(close_shared_resources=True)
+        await SimpleHercules.destroy_engines()
+        await browser_manager.stop_playwright()
+        PlaywrightManager.close_all_instances()
+
+    for node, durations in node_durations.items():
+        metrics[f"node.{node}.mean_seconds"] = statistics.mean(durations)
+    for tool, latencies in tool_latencies.items():
+        metrics[f"tool.{tool}.mean_seconds"] = statistics.mean(latencies)
+    # ru_maxrss is in KB on Linux and in bytes on macOS; the browser runs in its own processes.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    metrics["peak_memory_mb"] = max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return metrics
+
+
+def _reference_seconds() -> float:
+    """Time a fixed CPU-bound workload, the yardstick for this machine's speed."""
+    payload = [{"id": index, "name": f"row {index}", "tags": ["a", "b", "c"]} for index in range(2000)]
+    durations = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(10):
+            json.loads(json.dumps(payload))
+            sorted(payload, key=lambda row: row["name"])
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def _median_metrics(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    names = sorted({name for run in runs for name in run})
+    return {name: statistics.median(run[name] for run in runs if name in run) for name in names}
+
+
+def _regressions(metrics: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    # Timings are compared relative to each run's reference workload, so only the framework's
+    # own slowdown counts, not a slower machine.
+    scale = 1.0
+    if metrics.get(REFERENCE_METRIC) and baseline.get(REFERENCE_METRIC):
+        scale = baseline[REFERENCE_METRIC] / metrics[REFERENCE_METRIC]
+    found = []
+    for name, value in sorted(metrics.items()):
+        reference = baseline.get(name)
+        if name == REFERENCE_METRIC or not reference:
+            continue
+        if name.endswith("seconds"):
+            value *= scale
+            if value - reference < MIN_REGRESSION_SECONDS:
+                continue
+        if value <= reference * (1 + threshold):
+            continue
+        found.append(f"{name}: {reference:.3f} -> {value:.3f} (+{(value / reference - 1) * 100:.0f}%)")
+    return found
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.disable(logging.WARNING)
+    scenarios = args.scenarios or list(SCENARIOS)
+    server = _serve_fixtures()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    runs = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="hercules_bench_") as project_root:
+            _configure_environment(project_root)
+            for _ in range(max(args.repeat, 1)):
+                metrics = asyncio.run(_run_suite(base_url, scenarios))
+                metrics[REFERENCE_METRIC] = _reference_seconds()
+                runs.append(metrics)
+    finally:
+        server.shutdown()
+    metrics = _median_metrics(runs)
+
+    print(f"Offline suite, median of {len(runs)} run(s):")
+    for name, value in metrics.items():
+        unit = "MB" if name.endswith("_mb") else "s"
+        print(f"{name:<48} {value:10.3f}{unit}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(metrics, output_file, indent=2, sort_keys=True)
+    if not args.baseline:
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; write one with --output and commit it to compare against it.")
+        return
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        regressions = _regressions(metrics, json.load(baseline_file), args.threshold)
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0%} of {args.baseline}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
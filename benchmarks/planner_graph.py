@@ -0,0 +1,124 @@
+"""
+Benchmark the LangGraph state handling of a long planner run.
+
+Run:
+    python benchmarks/planner_graph.py --turns 1000 --dom-kb 20
+
+Drives the compiled planner/executor graph of ``SimpleHercules`` with stub LLMs
+for the given number of graph turns (planner and executor nodes each count as
+one turn). Every helper response carries a DOM-sized payload, like a browser
+navigation step would. Reports wall time, the mean time of the first and last
+50 planner rounds and peak traced memory. With append-only state channels the
+last rounds should cost about as much as the first ones. No LLM or browser is
+contacted.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import statistics
+import time
+import tracemalloc
+from typing import Any, List
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure planner graph state handling over a long run.")
+    parser.add_argument("--turns", type=int, default=1000, help="Graph turns to run, planner and executor combined (default: 1000).")
+    parser.add_argument("--dom-kb", type=int, default=20, help="Size of each helper response in KB (default: 20).")
+    return parser.parse_args()
+
+
+class _Response:
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.response_metadata = {"token_usage": {"prompt_tokens": 1, "completion_tokens": 1}}
+        self.tool_calls: List[Any] = []
+
+
+class _StubPlannerLLM:
+    def __init__(self, planner_rounds: int) -> None:
+        self.planner_rounds = planner_rounds
+        self.calls = 0
+        self.call_times: List[float] = []
+
+    async def ainvoke(self, messages: List[Any]) -> _Response:
+        self.calls += 1
+        self.call_times.append(time.perf_counter())
+        done = self.calls >= self.planner_rounds
+        return _Response(
+            json.dumps(
+                {
+                    "plan": "benchmark plan",
+                    "next_step": "" if done else f"step {self.calls}",
+                    "target_helper": "Not_Applicable" if done else "api",
+                    "terminate": "yes" if done else "no",
+                    "final_response": "done" if done else "",
+                    "is_assert": done,
+                    "is_passed": done,
+                    "assert_summary": "",
+                }
+            )
+        )
+
+
+class _StubHelperLLM:
+    def __init__(self, payload: str) -> None:
+        self.payload = payload
+
+    async def ainvoke(self, messages: List[Any]) -> _Response:
+        return _Response(f"{self.payload}\n##TERMINATE TASK##")
+
+
+class _StubAgent:
+    def __init__(self, name: str, llm: Any) -> None:
+        self.agent_name = name
+        self.system_message = f"{name} system prompt"
+        self.llm = llm
+        self.tools: List[Any] = []
+
+    def on_planner_message(self, content: str) -> None:
+        pass
+
+
+async def _run(turns: int, dom_kb: int) -> dict:
+    from testzeus_hercules.core.simple_hercules import SimpleHercules
+
+    planner_rounds = max(turns // 2, 1)
+    engine = SimpleHercules("bench_graph", save_chat_logs_to_files=False, planner_max_chat_round=planner_rounds + 1)
+    planner_llm = _StubPlannerLLM(planner_rounds)
+    engine.agents_map = {
+        "planner_agent": _StubAgent("planner_agent", planner_llm),
+        "api_nav_agent": _StubAgent("api_nav_agent", _StubHelperLLM("<div>" + "x" * (dom_kb * 1024) + "</div>")),
+    }
+    engine._graph = engine._build_graph()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = await engine.process_command("benchmark task")
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rounds = [later - earlier for earlier, later in zip(planner_llm.call_times, planner_llm.call_times[1:])]
+    return {"elapsed": elapsed, "peak": peak, "rounds": rounds, "result": result}
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.disable(logging.WARNING)
+    stats = asyncio.run(_run(args.turns, args.dom_kb))
+    result = stats["result"]
+    messages = len(result.messages) if result else 0
+    rounds = stats["rounds"] or [0.0]
+    first, last = rounds[:50], rounds[-50:]
+    print(f"Planner graph over {args.turns} turns with {args.dom_kb} KB helper responses:")
+    print(f"messages={messages}  total={stats['elapsed']:8.2f}s  peak memory={stats['peak'] / 1024 / 1024:8.1f}MB")
+    print(f"planner round  first 50 mean={statistics.mean(first) * 1000:8.2f}ms  " f"last 50 mean={statistics.mean(last) * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark the per-scenario setup cost of the agent engine.
+
+Run:
+    python benchmarks/scenario_setup.py --scenarios 20
+
+Builds the planner and navigation agents the way ``BaseRunner.initialize`` does
+for every scenario, once with ``REUSE_AGENTS=false`` (agents, LLM clients, tool
+schemas and graph rebuilt per scenario) and once with reuse enabled. No LLM or
+browser is contacted; a placeholder API key is used when none is configured.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure per-scenario agent engine setup time.")
+    parser.add_argument("--scenarios", type=int, default=20, help="Scenarios to simulate per mode (default: 20).")
+    return parser.parse_args()
+
+
+async def _setup_times(scenarios: int, reuse: bool) -> List[float]:
+    from testzeus_hercules.config import get_global_conf
+    from testzeus_hercules.core.agents_llm_config_manager import AgentsLLMConfigManager
+    from testzeus_hercules.core.simple_hercules import SimpleHercules
+
+    get_global_conf()._config["REUSE_AGENTS"] = "true" if reuse else "false"
+    config_manager = AgentsLLMConfigManager.get_instance()
+    timings = []
+    for index in range(scenarios):
+        started = time.perf_counter()
+        engine = await SimpleHercules.create(
+            f"bench_{index}",
+            dict(config_manager.get_agent_config("planner_agent")),
+            dict(config_manager.get_agent_config("nav_agent")),
+            dict(config_manager.get_agent_config("helper_agent")),
+            save_chat_logs_to_files=False,
+        )
+        timings.append(time.perf_counter() - started)
+        await engine.shutdown(close_shared_resources=False)
+    await SimpleHercules.destroy_engines()
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    first, rest = timings[0], timings[1:] or timings
+    print(f"{label:<10} first={first * 1000:8.1f}ms  " f"next median={statistics.median(rest) * 1000:8.2f}ms  " f"total={sum(timings) * 1000:8.1f}ms")
+
+
+def main() -> None:
+    args = _parse_args()
+    os.environ.setdefault("LLM_MODEL_NAME", "gpt-4o")
+    os.environ.setdefault("LLM_MODEL_API_KEY", "sk-benchmark-placeholder")
+    os.environ.setdefault("MODEL_API_KEY", os.environ["LLM_MODEL_API_KEY"])
+    rebuild = asyncio.run(_setup_times(args.scenarios, reuse=False))
+    reuse = asyncio.run(_setup_times(args.scenarios, reuse=True))
+    print(f"Per-scenario engine setup over {args.scenarios} scenarios:")
+    _report("rebuild", rebuild)
+    _report("reuse", reuse)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 import os
 import shutil
+from typing import Any, Iterable, Optional
 
 import pytest
+from langchain_core.messages import AIMessage
 
 os.environ.setdefault("IS_TEST_ENV", "true")
 
@@ -16,3 +18,36 @@ def prepare_run_data() -> None:
     if os.path.exists(RUN_DATA_PATH):
         shutil.rmtree(RUN_DATA_PATH)
     os.makedirs(RUN_DATA_PATH)
+
+
+DONE_RESPONSE = "current_output: done\n##TERMINATE TASK##"
+
+
+class FakeLLM:
+    """Chat model stand-in: answers with the queued responses in order, then with ``final``.
+
+    Every call's messages are appended to ``calls``.
+    """
+
+    def __init__(self, responses: Iterable[AIMessage] = (), final: str = DONE_RESPONSE) -> None:
+        self.responses = list(responses)
+        self.final = final
+        self.calls: list[list[Any]] = []
+
+    def bind_tools(self, tools: list[Any]) -> "FakeLLM":
+        return self
+
+    async def ainvoke(self, messages: list[Any]) -> AIMessage:
+        self.calls.append(list(messages))
+        if self.responses:
+            return self.responses.pop(0)
+        return AIMessage(content=self.final)
+
+
+class FakeAgent:
+    """Nav agent stand-in exposing the attributes SimpleHercules reads."""
+
+    def __init__(self, llm: FakeLLM, tools: Optional[list[Any]] = None, system_message: str = "browser system") -> None:
+        self.llm = llm
+        self.tools = tools or []
+        self.system_message = system_message
@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any
+
+from testzeus_hercules.core.tools.action_sequence import run_action_sequence
+from testzeus_hercules.core.tools.tool_registry import tool_registry
+from testzeus_hercules.utils.step_macros import selector_paths, tool_call_failed
+
+
+class FakeLocator:
+    def __init__(self, page: "FakePage", selector: str) -> None:
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self) -> "FakeLocator":
+        return self
+
+    async def is_visible(self) -> bool:
+        return self.selector in self.page.visible
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.url = "https://shop.test/signup"
+        self.visible: set[str] = set()
+        self.text = ""
+
+    def locator(self, selector: str) -> FakeLocator:
+        return FakeLocator(self, selector)
+
+    async def evaluate(self, script: str, text: str) -> bool:
+        return text in self.text
+
+
+def _run(actions: list[Any], page: FakePage, performed: list[str]) -> str:
+    async def get_page() -> FakePage:
+        return page
+
+    async def perform(action: dict[str, Any]) -> str:
+        performed.append(f"{action['action']} {action.get('selector', '')}".strip())
+        if action.get("selector") == "99":
+            return "Unable to find element [md='99']"
+        if action["action"] == "click" and action.get("selector") == "15":
+            page.url = "https://shop.test/welcome"
+            page.text = "Welcome, Ada"
+        if action["action"] == "click" and action.get("selector") == "14":
+            page.visible.add("[md='20']")
+        return f"{action['action']} done"
+
+    return asyncio.run(run_action_sequence(actions, get_page, perform))
+
+
+def test_sequence_runs_every_action_and_checks_post_conditions() -> None:
+    page = FakePage()
+    performed: list[str] = []
+
+    report = _run(
+        [
+            {"action": "enter_text", "selector": "12", "text": "ada"},
+            {"action": "click", "selector": "14", "expect": {"visible": "20"}},
+            {"action": "click", "selector": "15", "expect": {"url_changed": True, "url_contains": "/welcome", "text_present": "Welcome"}},
+        ],
+        page,
+        performed,
+    )
+
+    assert performed == ["enter_text 12", "click 14", "click 15"]
+    assert report.splitlines() == [
+        "1. enter_text 12: ok - enter_text done",
+        "2. click 14: ok - click done",
+        "3. click 15: ok - click done",
+        "All 3 actions completed. Get the DOM again before further interaction.",
+    ]
+    assert not tool_call_failed("execute_action_sequence", report)
+
+
+def test_sequence_stops_at_the_first_failure_or_unmet_post_condition() -> None:
+    performed: list[str] = []
+
+    failed = _run([{"action": "click", "selector": "99"}, {"action": "click", "selector": "15"}], FakePage(), performed)
+
+    assert performed == ["click 99"]
+    assert failed.splitlines() == [
+        "1. click 99: FAILED - Unable to find element [md='99']",
+        "[ERROR] Stopped at action 1 of 2; the remaining actions were not run. Get the DOM again before retrying.",
+    ]
+
+    performed.clear()
+    unmet = _run(
+        [{"action": "click", "selector": "14", "expect": {"url_changed": True, "timeout": 0.2}}, {"action": "click", "selector": "15"}],
+        FakePage(),
+        performed,
+    )
+
+    assert performed == ["click 14"]
+    assert "post-condition not met: url_changed: URL is still https://shop.test/signup" in unmet
+    assert unmet.endswith("[ERROR] Stopped at action 1 of 2; the remaining actions were not run. Get the DOM again before retrying.")
+    assert tool_call_failed("execute_action_sequence", failed)
+    assert tool_call_failed("execute_action_sequence", unmet)
+
+
+def test_tool_is_registered_for_the_browser_agent_and_macro_recording() -> None:
+    names = [entry["name"] for entry in tool_registry.get("browser_nav_agent", [])]
+    args = {"actions": [{"action": "enter_text", "selector": "12", "text": "ada"}, {"action": "press_key", "key": "Enter"}]}
+
+    assert "execute_action_sequence" in names
+    assert list(selector_paths("execute_action_sequence", args)) == [("actions.0.selector", "12")]
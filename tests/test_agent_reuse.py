@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any
+
+from testzeus_hercules.config import get_global_conf
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+
+
+class FakeAgent:
+    def __init__(self) -> None:
+        self.resets = 0
+        self.shutdowns = 0
+        self.prompt = "prompt"
+        self.llm = object()
+        self.tools = ["click"]
+
+    def render_system_message(self) -> str:
+        return self.prompt
+
+    def reset_for_scenario(self) -> None:
+        self.resets += 1
+
+    async def shutdown(self) -> None:
+        self.shutdowns += 1
+
+
+def _agent_config(model: str = "gpt-4o") -> dict[str, Any]:
+    return {"model_config_params": {"model": model}, "llm_config_params": {"temperature": 0.0}}
+
+
+def _patch_agent_builds(monkeypatch: Any) -> list[dict[str, Any]]:
+    builds: list[dict[str, Any]] = []
+
+    async def initialize_agents(self: SimpleHercules) -> dict[str, Any]:
+        agents = {"planner_agent": FakeAgent(), "browser_nav_agent": FakeAgent()}
+        builds.append(agents)
+        return agents
+
+    monkeypatch.setattr(SimpleHercules, "_initialize_agents", initialize_agents)
+    monkeypatch.setattr(SimpleHercules, "_shared_agents", {})
+    monkeypatch.setattr(SimpleHercules, "_idle_engines", {})
+    return builds
+
+
+async def _create(stake_id: str, model: str = "gpt-4o") -> SimpleHercules:
+    return await SimpleHercules.create(stake_id, _agent_config(model), _agent_config(model), _agent_config(model))
+
+
+def test_sequential_scenarios_reuse_engine_and_reset_scenario_state(monkeypatch: Any) -> None:
+    builds = _patch_agent_builds(monkeypatch)
+
+    async def run() -> None:
+        first = await _create("login")
+        first._nav_token_log.append({"agent": "browser_nav_agent"})
+        first._last_graph_result = object()  # type: ignore[assignment]
+        graph = first._graph
+        await first.shutdown()
+
+        second = await _create("checkout")
+
+        assert second is first
+        assert second._graph is graph
+        assert second.stake_id == "checkout"
+        assert second._nav_token_log == []
+        assert second._last_graph_result is None
+        assert len(builds) == 1
+        assert all(agent.resets == 1 and agent.shutdowns == 0 for agent in second.agents_map.values())
+
+        await second.shutdown()
+        await SimpleHercules.destroy_engines()
+        assert all(agent.shutdowns == 1 for agent in builds[0].values())
+        assert SimpleHercules._idle_engines == {}
+
+    asyncio.run(run())
+
+
+def test_concurrent_scenarios_get_separate_engines_sharing_agents(monkeypatch: Any) -> None:
+    builds = _patch_agent_builds(monkeypatch)
+
+    async def run() -> None:
+        first = await _create("login")
+        builds[0]["planner_agent"].prompt = "checkout test data"
+        second = await _create("checkout")
+        other_model = await _create("search", model="gpt-4o-mini")
+
+        assert first is not second
+        for name, agent in first.agents_map.items():
+            assert agent is not second.agents_map[name]
+            assert agent.llm is second.agents_map[name].llm is builds[0][name].llm
+        assert (first.stake_id, second.stake_id) == ("login", "checkout")
+        # Prompts are rendered per engine, so concurrent scenarios keep their own test data.
+        assert first._system_message_for("planner_agent", first.agents_map["planner_agent"]) != "checkout test data"
+        assert second._system_message_for("planner_agent", second.agents_map["planner_agent"]) == "checkout test data"
+        assert other_model.agents_map["planner_agent"].llm is not first.agents_map["planner_agent"].llm
+        assert len(builds) == 2
+        await SimpleHercules.destroy_engines()
+
+    asyncio.run(run())
+
+
+def test_resetting_one_engine_leaves_a_concurrent_engines_tools_alone(monkeypatch: Any) -> None:
+    _patch_agent_builds(monkeypatch)
+
+    async def run() -> None:
+        first = await _create("login")
+        first.agents_map["browser_nav_agent"].tools.append("mcp_lookup")
+        second = await _create("checkout")
+        second.agents_map["browser_nav_agent"].tools = ["click"]
+
+        assert first.agents_map["browser_nav_agent"].tools == ["click", "mcp_lookup"]
+        assert second.agents_map["browser_nav_agent"].tools == ["click"]
+        await SimpleHercules.destroy_engines()
+
+    asyncio.run(run())
+
+
+def test_reuse_can_be_disabled(monkeypatch: Any) -> None:
+    builds = _patch_agent_builds(monkeypatch)
+    monkeypatch.setitem(get_global_conf()._config, "REUSE_AGENTS", "false")
+
+    async def run() -> None:
+        first = await _create("login")
+        await first.shutdown()
+        second = await _create("checkout")
+
+        assert second is not first
+        assert len(builds) == 2
+        assert builds[0]["planner_agent"].shutdowns == 1
+
+    asyncio.run(run())
@@ -0,0 +1,148 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+from tests.conftest import FakeAgent, FakeLLM
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.core.tools.assertions import (
+    assert_api_response,
+    assert_sql_result,
+    check_element_count,
+    check_text_visible,
+    check_url,
+)
+from testzeus_hercules.utils.tool_results import (
+    API_RESULT,
+    SQL_RESULT,
+    AssertionOutcome,
+    clear_last_results,
+    parse_assertion_result,
+    record_last_result,
+)
+
+PAGE_TEXT = "Shop Cart Your order #1042 is confirmed. Continue shopping"
+
+
+class FakeLocator:
+    def __init__(self, count: int) -> None:
+        self._count = count
+
+    async def count(self) -> int:
+        return self._count
+
+
+class FakePage:
+    url = "https://shop.test/orders/1042?ref=cart"
+
+    def __init__(self) -> None:
+        self.selectors: list[str] = []
+
+    async def evaluate(self, script: str, text: str) -> dict[str, Any]:
+        index = PAGE_TEXT.lower().find(text.lower())
+        if index < 0:
+            return {"found": False, "snippet": PAGE_TEXT[:120], "length": len(PAGE_TEXT)}
+        return {"found": True, "snippet": PAGE_TEXT[max(0, index - 5) : index + len(text) + 5], "length": len(PAGE_TEXT)}
+
+    def locator(self, selector: str) -> FakeLocator:
+        self.selectors.append(selector)
+        return FakeLocator(3)
+
+
+def test_browser_checks_report_pass_or_fail_with_evidence() -> None:
+    page = FakePage()
+
+    visible = asyncio.run(check_text_visible(page, "order  #1042 is CONFIRMED"))
+    missing = asyncio.run(check_text_visible(page, "Payment failed"))
+    hidden = asyncio.run(check_text_visible(page, "Payment failed", visible=False))
+
+    assert str(visible) == "[ASSERT PASS] text 'order #1042 is CONFIRMED' is visible: found in ...Your order #1042 is confirmed. Con..."
+    assert not missing.passed and "not in the 58 characters of page text" in missing.evidence
+    assert hidden.passed
+
+    assert asyncio.run(check_url(page, "/orders/1042")).passed
+    assert str(asyncio.run(check_url(page, "https://shop.test/cart", "equals"))) == ("[ASSERT FAIL] URL equals 'https://shop.test/cart': URL is https://shop.test/orders/1042?ref=cart")
+    assert asyncio.run(check_url(page, r"/orders/\d+", "regex")).passed
+
+    count = asyncio.run(check_element_count(page, "14", 3))
+    at_least = asyncio.run(check_element_count(page, "ul.items > li", 4, "at_least"))
+
+    assert str(count) == "[ASSERT PASS] count of [md='14'] equals 3: 3 element(s) match"
+    assert not at_least.passed
+    assert page.selectors == ["[md='14']", "ul.items > li"]
+
+
+def test_outcome_lines_parse_back() -> None:
+    outcome = AssertionOutcome(passed=False, check="URL contains '/cart'", evidence="URL is https://shop.test/: home")
+
+    assert parse_assertion_result(str(outcome)) == outcome
+    assert parse_assertion_result("Clicked [md='12']") is None
+
+
+def test_api_and_sql_assertions_check_the_last_result_of_the_test() -> None:
+    clear_last_results()
+    assert asyncio.run(assert_api_response()) == "[ASSERT FAIL] API status is 200: no API call has been made in this test"
+
+    record_last_result(API_RESULT, {"method": "POST", "url": "https://api.test/orders", "status_code": 201, "body": {"id": 7, "state": "new"}})
+
+    assert asyncio.run(assert_api_response(expected_status=201, body_contains='"state": "new"')).startswith("[ASSERT PASS]")
+    assert asyncio.run(assert_api_response()) == ('[ASSERT FAIL] API status is 200: POST https://api.test/orders returned 201; body {"id":7,"state":"new"}')
+
+    record_last_result(SQL_RESULT, {"query": "SELECT id, state FROM orders", "rows": [{"id": 7, "state": "new"}, {"id": 8, "state": "paid"}]})
+
+    assert asyncio.run(assert_sql_result(expected_row_count=2, expected_value="paid")) == (
+        '[ASSERT PASS] SQL result row count is 2 and a row has the value \'paid\': 2 row(s), 1 with the value, first: {"id":8,"state":"paid"}'
+    )
+    assert asyncio.run(assert_sql_result(expected_row_count=1)).startswith("[ASSERT FAIL]")
+
+    record_last_result(SQL_RESULT, {"query": "SELECT * FROM order", "error": "syntax error"})
+
+    assert asyncio.run(assert_sql_result()) == "[ASSERT FAIL] SQL result has no error: the query failed: syntax error"
+    clear_last_results()
+
+
+def test_failed_assertion_tool_overrides_a_passing_planner_verdict() -> None:
+    async def assert_text_visible(text: str) -> str:
+        return f"[ASSERT FAIL] text {text!r} is visible: not in the 20 characters of page text, which starts 'Payment failed'"
+
+    nav_llm = FakeLLM(
+        [AIMessage(content="", tool_calls=[{"name": "assert_text_visible", "args": {"text": "Order confirmed"}, "id": "a1"}])],
+        final="The confirmation is shown. ##TERMINATE TASK##",
+    )
+    verdict = {"next_step": "", "target_helper": "Not_Applicable", "terminate": "no", "is_assert": True, "is_passed": True, "assert_summary": "Order confirmed."}
+
+    hercules = SimpleHercules(stake_id="test")
+    hercules.agents_map = {
+        "browser_nav_agent": FakeAgent(nav_llm, [StructuredTool.from_function(coroutine=assert_text_visible, name="assert_text_visible", description="assert")]),
+        "planner_agent": SimpleNamespace(system_message="planner system", llm=FakeLLM(final=json.dumps(verdict)), on_planner_message=lambda _content: None),
+    }
+
+    async def current_url() -> str:
+        return "https://shop.test/orders/1042"
+
+    hercules._get_live_current_url = current_url  # type: ignore[method-assign]
+    state: Any = {"next_step": "Verify 'Order confirmed' is visible", "target_helper": "browser", "messages": []}
+
+    executed = asyncio.run(hercules._executor_node(state))
+
+    assert executed["step_assertions"] == [
+        {
+            "tool": "assert_text_visible",
+            "passed": False,
+            "check": "text 'Order confirmed' is visible",
+            "evidence": "not in the 20 characters of page text, which starts 'Payment failed'",
+        }
+    ]
+    assert executed["messages"][0].content.endswith(
+        "Deterministic assertion results:\n[ASSERT FAIL] text 'Order confirmed' is visible: " "not in the 20 characters of page text, which starts 'Payment failed'"
+    )
+
+    planned = asyncio.run(hercules._planner_node({**state, **executed}))
+
+    assert planned["is_passed"] is False
+    assert planned["assert_summary"].startswith("[ASSERT FAIL] text 'Order confirmed' is visible")
+    assert planned["assert_summary"].endswith("Order confirmed.")
+    assert json.loads(planned["messages"][0].content)["is_passed"] is False
+    assert planned["step_assertions"] == []
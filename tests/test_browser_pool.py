@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any
+
+from testzeus_hercules.core.browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self, options: dict[str, Any]) -> None:
+        self.options = options
+
+
+class FakeBrowser:
+    def __init__(self, launch_options: dict[str, Any]) -> None:
+        self.launch_options = launch_options
+        self.contexts: list[FakeContext] = []
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    async def new_context(self, **options: Any) -> FakeContext:
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowserType:
+    def __init__(self) -> None:
+        self.launched: list[FakeBrowser] = []
+
+    async def launch(self, **options: Any) -> FakeBrowser:
+        browser = FakeBrowser(options)
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeBrowserType()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+def _pool(size: int, recycle_after: int = 0) -> tuple[BrowserPool, FakePlaywright]:
+    driver = FakePlaywright()
+    BrowserPool._instance = BrowserPool(size=size, recycle_after=recycle_after)
+    BrowserPool._instance._playwright = driver  # type: ignore[assignment]
+    return BrowserPool._instance, driver
+
+
+def test_sequential_scenarios_reuse_one_warm_browser_with_fresh_contexts() -> None:
+    async def run() -> None:
+        pool, driver = _pool(size=2)
+        first = await pool.new_context("chromium", {"headless": True}, {"record_video_dir": "/proofs/a/videos"})
+        await BrowserPool.release(first)
+        second = await pool.new_context("chromium", {"headless": True}, {"record_video_dir": "/proofs/b/videos"})
+        await BrowserPool.release(second)
+
+        assert len(driver.chromium.launched) == 1
+        assert first is not second
+        assert second.options == {"record_video_dir": "/proofs/b/videos"}
+
+        await BrowserPool.destroy()
+        assert driver.chromium.launched[0].closed
+        assert driver.stopped
+
+    asyncio.run(run())
+
+
+def test_concurrent_contexts_spread_over_at_most_pool_size_browsers() -> None:
+    async def run() -> None:
+        pool, driver = _pool(size=2)
+        contexts = [await pool.new_context("chromium", {"headless": True}, {}) for _ in range(5)]
+
+        assert len(driver.chromium.launched) == 2
+        assert sorted(len(browser.contexts) for browser in driver.chromium.launched) == [2, 3]
+
+        other = await pool.new_context("chromium", {"headless": False}, {})
+        assert len(driver.chromium.launched) == 3
+        assert other in driver.chromium.launched[2].contexts
+
+        for context in contexts + [other]:
+            await BrowserPool.release(context)
+        await BrowserPool.destroy()
+
+    asyncio.run(run())
+
+
+def test_browser_is_recycled_after_serving_configured_number_of_contexts() -> None:
+    async def run() -> None:
+        pool, driver = _pool(size=1, recycle_after=2)
+        for _ in range(3):
+            await BrowserPool.release(await pool.new_context("chromium", {}, {}))
+
+        first, second = driver.chromium.launched
+        assert first.closed and len(first.contexts) == 2
+        assert not second.closed and len(second.contexts) == 1
+        await BrowserPool.destroy()
+
+    asyncio.run(run())
+
+
+def test_release_after_destroy_is_a_noop() -> None:
+    async def run() -> None:
+        pool, _ = _pool(size=1)
+        context = await pool.new_context("chromium", {}, {})
+        await BrowserPool.destroy()
+
+        await BrowserPool.release(context)
+        assert BrowserPool._instance is None
+
+    asyncio.run(run())
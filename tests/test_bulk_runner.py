@@ -0,0 +1,68 @@
+import asyncio
+import os
+from typing import Any, Optional
+
+from junitparser import JUnitXml
+from testzeus_hercules.config import get_global_conf
+from testzeus_hercules.core.bulk_runner import (
+    BulkFolderResult,
+    bulk_folder_config,
+    discover_test_folders,
+    run_bulk_in_processes,
+)
+
+
+def fake_folder_worker(test_dir: str, scenarios: Optional[list[str]] = None) -> BulkFolderResult:
+    """Stand-in for run_test_folder that runs in the pool without a browser or LLM."""
+    name = os.path.basename(test_dir)
+    if name == "broken":
+        return BulkFolderResult(folder=test_dir, error="SystemExit: 1")
+    result_file = os.path.join(test_dir, "output", f"{name}.feature_result.xml")
+    os.makedirs(os.path.dirname(result_file), exist_ok=True)
+    with open(result_file, "w", encoding="utf-8") as f:
+        f.write(
+            f'<testsuites><testsuite name="{name}" tests="1" failures="0" errors="0" skipped="0" time="1.5">'
+            f'<testcase name="{name} scenario" classname="{name}" time="1.5"/>'
+            f"</testsuite></testsuites>"
+        )
+    return BulkFolderResult(folder=test_dir, result_file=result_file)
+
+
+def _make_tests_dir(tmp_path: Any, names: list[str]) -> str:
+    tests_dir = tmp_path / "tests"
+    for name in names:
+        (tests_dir / name / "input").mkdir(parents=True)
+    (tests_dir / "README.md").write_text("not a test folder", encoding="utf-8")
+    return str(tests_dir)
+
+
+def test_bulk_folder_config_points_at_folder_inputs() -> None:
+    config = bulk_folder_config("/suite/tests/login")
+
+    assert config == {
+        "PROJECT_SOURCE_ROOT": "/suite/tests/login",
+        "INPUT_GHERKIN_FILE_PATH": "/suite/tests/login/input/login.feature",
+        "TEST_DATA_PATH": "/suite/tests/login/test_data",
+    }
+
+
+def test_discover_test_folders_skips_files_and_sorts(tmp_path: Any) -> None:
+    tests_dir = _make_tests_dir(tmp_path, ["zeta", "alpha"])
+
+    assert [os.path.basename(path) for path in discover_test_folders(tests_dir)] == ["alpha", "zeta"]
+
+
+def test_bulk_pool_merges_folder_results_and_reports_failed_folders(tmp_path: Any, monkeypatch: Any) -> None:
+    tests_dir = _make_tests_dir(tmp_path, ["checkout", "broken", "login"])
+    monkeypatch.setitem(get_global_conf()._config, "PROJECT_SOURCE_ROOT", str(tmp_path / "root"))
+
+    summary_file = asyncio.run(run_bulk_in_processes(tests_dir, workers=2, worker=fake_folder_worker))
+
+    summary = JUnitXml.fromfile(summary_file)
+    suites = {suite.name: suite for suite in summary}
+    assert set(suites) == {"checkout", "login", "broken"}
+    assert suites["broken"].failures == 1
+    assert suites["login"].failures == 0
+    assert os.path.exists(summary_file[: -len(".xml")] + ".html")
+    # Per-folder results stay where each folder's run published them.
+    assert os.path.exists(os.path.join(tests_dir, "login", "output", "login.feature_result.xml"))
@@ -72,6 +72,15 @@ def _set_test_env() -> Generator[None, None, None]:
     yield
 
 
+@pytest.fixture(autouse=True)
+def _restore_testzeus_modules() -> Generator[None, None, None]:
+    """Put back the real package modules replaced by the isolated config loads."""
+    saved = {name: module for name, module in sys.modules.items() if name == "testzeus_hercules" or name.startswith("testzeus_hercules.")}
+    yield
+    _clear_testzeus_modules()
+    sys.modules.update(saved)
+
+
 def test_test_env_import_skips_strict_llm_validation(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("IS_TEST_ENV", "true")
     monkeypatch.delenv("LLM_MODEL_NAME", raising=False)
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import StructuredTool
+from tests.conftest import FakeAgent, FakeLLM
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.core.tools.api_calls import _is_safe_method
+from testzeus_hercules.core.tools.sql_calls import _is_read_only_query
+from testzeus_hercules.core.tools.tool_registry import tool, tool_registry
+from testzeus_hercules.utils.langchain_tools import registry_tools_to_structured_tools
+from testzeus_hercules.utils.tool_results import API_RESULT, clear_last_results, get_last_result, record_last_result, start_result
+
+
+def test_tool_decorator_records_read_only_and_resource_metadata() -> None:
+    @tool(agent_names=["metadata_test_agent"], description="Reads the page title", name="read_title", read_only=True, resource="browser")
+    async def read_title() -> str:
+        return "title"
+
+    entry = tool_registry.get("metadata_test_agent")[-1]
+    structured = registry_tools_to_structured_tools("metadata_test_agent")[-1]
+
+    assert (entry["read_only"], entry["resource"]) == (True, "browser")
+    assert structured.metadata == {"read_only": True, "resource": "browser"}
+
+
+def test_http_and_sql_tools_are_read_only_per_call() -> None:
+    assert _is_safe_method({"method": "get", "url": "https://example.com"})
+    assert not _is_safe_method({"method": "POST", "url": "https://example.com"})
+    assert _is_read_only_query({"query": "SELECT id FROM users"})
+    assert _is_read_only_query({"query": "WITH a AS (SELECT 1) SELECT * FROM a"})
+    assert not _is_read_only_query({"query": "WITH gone AS (DELETE FROM users RETURNING id) SELECT * FROM gone"})
+    assert _is_read_only_query({"query": "SELECT updated_at FROM users;"})
+    assert not _is_read_only_query({"query": "SELECT 1; DELETE FROM users"})
+    assert not _is_read_only_query({"query": "select * into backup from users"})
+
+
+def test_read_only_calls_run_concurrently_and_keep_their_order() -> None:
+    events: list[str] = []
+
+    def make_tool(name: str, read_only: Any) -> StructuredTool:
+        async def run(method: str = "GET") -> str:
+            events.append(f"start {name}")
+            await asyncio.sleep(0.05)
+            events.append(f"end {name}")
+            return f"{name} result"
+
+        return StructuredTool.from_function(coroutine=run, name=name, description=name, metadata={"read_only": read_only, "resource": "http"})
+
+    calls = [
+        {"name": "read_a", "args": {}, "id": "call_a"},
+        {"name": "read_b", "args": {}, "id": "call_b"},
+        {"name": "request", "args": {"method": "POST"}, "id": "call_post"},
+        {"name": "request", "args": {"method": "GET"}, "id": "call_get"},
+        {"name": "read_c", "args": {}, "id": "call_c"},
+    ]
+    llm = FakeLLM([AIMessage(content="", tool_calls=calls)])
+    agent = FakeAgent(llm, [make_tool("read_a", True), make_tool("read_b", True), make_tool("request", _is_safe_method), make_tool("read_c", True)], system_message="api system")
+
+    asyncio.run(SimpleHercules(stake_id="test")._run_nav_agent(agent, "call the api", "api_nav_agent"))
+
+    assert events[:2] == ["start read_a", "start read_b"]
+    # The POST waits for the reads before it and finishes before any later call starts.
+    assert events[4:6] == ["start request", "end request"]
+    assert set(events[6:8]) == {"start request", "start read_c"}
+    tool_messages = [message for message in llm.calls[-1] if isinstance(message, ToolMessage)]
+    assert [message.tool_call_id for message in tool_messages] == ["call_a", "call_b", "call_post", "call_get", "call_c"]
+    assert tool_messages[0].content == "read_a result"
+
+
+def test_last_api_result_is_the_call_that_started_last_not_the_one_that_finished_last() -> None:
+    def make_get(url: str, delay: float) -> StructuredTool:
+        async def run() -> str:
+            started = start_result()
+            await asyncio.sleep(delay)
+            record_last_result(API_RESULT, {"method": "GET", "url": url, "status_code": 200}, started)
+            return f"{url} result"
+
+        return StructuredTool.from_function(coroutine=run, name=f"get_{url}", description=url, metadata={"read_only": True, "resource": "http"})
+
+    calls = [{"name": "get_a", "args": {}, "id": "call_a"}, {"name": "get_b", "args": {}, "id": "call_b"}]
+    llm = FakeLLM([AIMessage(content="", tool_calls=calls)])
+    agent = FakeAgent(llm, [make_get("a", 0.1), make_get("b", 0.01)], system_message="api system")
+
+    try:
+        asyncio.run(SimpleHercules(stake_id="test")._run_nav_agent(agent, "call the api", "api_nav_agent"))
+        # GET a finishes after GET b, but an assertion after both must see b's response.
+        assert get_last_result(API_RESULT)["url"] == "b"
+    finally:
+        clear_last_results()
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import os
+from typing import Any, Optional
+
+import httpx
+from aiohttp.test_utils import TestClient, TestServer
+from testzeus_hercules.daemon import HerculesDaemon, build_app
+
+
+def _current_conf() -> Any:
+    # Resolved at call time, like the daemon does, in case another test reloaded the config module.
+    from testzeus_hercules.config import get_global_conf
+
+    return get_global_conf()
+
+
+def _write_result(path: str, scenario: str, passed: bool) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    failure = "" if passed else '<failure message="assertion failed"/>'
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'<testsuites><testsuite name="Suite" tests="1"><testcase name="{scenario}" time="1.0">{failure}</testcase></testsuite></testsuites>')
+    return path
+
+
+class FakeProcess:
+    """Stand-in for sequential_process that reads the job's scoped config."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.seen: list[dict[str, Any]] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, scenarios: Optional[list[str]] = None, close_shared_resources: bool = True, on_progress: Any = None) -> str:
+        conf = _current_conf()
+        with open(conf.get_input_gherkin_file_path(), encoding="utf-8") as f:
+            gherkin = f.read()
+        self.seen.append({"run_id": conf.get_run_id(), "gherkin": gherkin, "test_data": sorted(os.listdir(conf.get_test_data_path())), "close": close_shared_resources})
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+            on_progress({"event": "scenario_started", "scenario": "login"})
+            fragment = _write_result(os.path.join(conf.get_project_source_root(), "fragment.xml"), "login", passed="fail" not in gherkin)
+            on_progress({"event": "scenario_finished", "scenario": "login", "result_file": fragment})
+            return _write_result(os.path.join(conf.get_project_source_root(), "output", "result.xml"), "login", passed="fail" not in gherkin)
+        finally:
+            self.running -= 1
+
+
+def test_daemon_runs_jobs_in_isolated_folders_with_bounded_concurrency(tmp_path: Any) -> None:
+    process = FakeProcess()
+
+    async def run() -> None:
+        daemon = HerculesDaemon(str(tmp_path), max_concurrent_runs=2, process=process)
+        await daemon.start()
+        runs = [daemon.submit(f"Feature: job {index}", {"users.json": "{}"}) for index in range(3)]
+        await asyncio.sleep(0.05)
+        assert [run.status for run in runs] == ["running", "running", "queued"]
+        process.release.set()
+        await daemon._queue.join()
+        await daemon.stop(close_shared_resources=False)
+
+        assert len({run.run_id for run in runs}) == 3
+        assert process.max_running == 2
+        assert sorted(seen["gherkin"] for seen in process.seen) == ["Feature: job 0", "Feature: job 1", "Feature: job 2"]
+        assert all(seen["test_data"] == ["users.json"] and not seen["close"] for seen in process.seen)
+        assert {seen["run_id"] for seen in process.seen} == {run.run_id for run in runs}
+        assert all(run.status == "passed" and run.result["tests"] == 1 for run in runs)
+        # The global config is untouched by the jobs' scoped configs.
+        assert _current_conf().get_run_id() is None
+
+    asyncio.run(run())
+
+
+def test_daemon_api_streams_progress_and_reports_results(tmp_path: Any) -> None:
+    process = FakeProcess()
+    process.release.set()
+
+    async def run() -> None:
+        daemon = HerculesDaemon(str(tmp_path), process=process)
+        async with TestClient(TestServer(build_app(daemon))) as client:
+            response = await client.post("/runs", json={"gherkin": "Feature: fail me"})
+            assert response.status == 202
+            run_id = (await response.json())["run_id"]
+
+            stream = await client.get(f"/runs/{run_id}/events")
+            events = [json.loads(line) for line in (await stream.text()).splitlines()]
+            assert [event["event"] for event in events] == ["run_queued", "run_started", "scenario_started", "scenario_finished", "run_finished"]
+            assert events[3]["status"] == "failed"
+            assert events[-1]["status"] == "failed"
+
+            details = await (await client.get(f"/runs/{run_id}")).json()
+            assert details["result"]["test_cases"][0]["failure"] == "assertion failed"
+            assert [run["run_id"] for run in await (await client.get("/runs")).json()] == [run_id]
+
+            assert (await client.post("/runs", json={"gherkin": ""})).status == 400
+            assert (await client.post("/runs", json={"gherkin": "Feature: x", "test_data": {"../escape.txt": ""}})).status == 400
+            assert (await client.get("/runs/unknown")).status == 404
+
+    asyncio.run(run())
+
+
+def test_daemon_reports_crashed_job_as_error(tmp_path: Any) -> None:
+    async def crashing_process(**kwargs: Any) -> str:
+        raise SystemExit(1)
+
+    async def run() -> None:
+        daemon = HerculesDaemon(str(tmp_path), process=crashing_process)
+        await daemon.start()
+        run = daemon.submit("Feature: empty")
+        await daemon._queue.join()
+        await daemon.stop(close_shared_resources=False)
+
+        assert run.status == "error"
+        assert run.error == "SystemExit: 1"
+        assert run.events[-1]["event"] == "run_finished"
+
+    asyncio.run(run())
+
+
+def test_mcp_run_on_daemon_sends_the_shared_test_data(tmp_path: Any, monkeypatch: Any) -> None:
+    from testzeus_hercules import mcp_server
+
+    test_data = tmp_path / "root" / "opt" / "test_data"
+    test_data.mkdir(parents=True)
+    (test_data / "users.json").write_text('{"user": "ada"}', encoding="utf-8")
+    (test_data / "logo.png").write_bytes(b"\x89PNG\xff\xfe")
+    monkeypatch.setenv("TESTZEUS_ROOT", str(tmp_path / "root"))
+    process = FakeProcess()
+    process.release.set()
+
+    async def run() -> str:
+        daemon = HerculesDaemon(str(tmp_path / "runs"), process=process)
+        async with TestServer(build_app(daemon)) as server:
+            async with httpx.AsyncClient(base_url=str(server.make_url("")), timeout=10) as client:
+                return await mcp_server._run_on_daemon(client, "Feature: login")
+
+    output = asyncio.run(run())
+
+    assert process.seen[0]["test_data"] == ["users.json"]
+    assert "Test data not sent to the daemon (not UTF-8 text): logo.png" in output
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.tools import StructuredTool
+from tests.conftest import FakeAgent, FakeLLM
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils.history_budget import ELIDED_PREVIEW_CHARS, estimate_message_tokens, fit_history
+
+DOM = "<div>" + "x" * 8000 + "</div>"
+
+
+def _history() -> list[Any]:
+    return [
+        SystemMessage(content="system prompt"),
+        HumanMessage(content="task " + "t" * 2000),
+        AIMessage(content="", tool_calls=[{"name": "get_dom", "args": {}, "id": "call_1"}]),
+        ToolMessage(content=DOM, tool_call_id="call_1"),
+        AIMessage(content="", tool_calls=[{"name": "get_dom", "args": {}, "id": "call_2"}]),
+        ToolMessage(content=DOM, tool_call_id="call_2"),
+        AIMessage(content="", tool_calls=[{"name": "get_dom", "args": {}, "id": "call_3"}]),
+        ToolMessage(content=DOM, tool_call_id="call_3"),
+    ]
+
+
+def test_history_within_budget_is_sent_unchanged() -> None:
+    history = _history()
+
+    fitted = fit_history(history, budget_tokens=100_000, keep_recent=2)
+
+    assert fitted.messages == history
+    assert fitted.messages is not history
+    assert fitted.tokens_saved == 0
+
+
+def test_oldest_tool_outputs_are_elided_first_and_recent_ones_kept() -> None:
+    history = _history()
+    total = sum(estimate_message_tokens(message) for message in history)
+
+    fitted = fit_history(history, budget_tokens=total - 1000, keep_recent=2)
+
+    contents = [message.content for message in fitted.messages]
+    # Only the oldest tool output had to go; no message is dropped.
+    assert len(fitted.messages) == len(history)
+    assert contents[3].startswith(DOM[:ELIDED_PREVIEW_CHARS])
+    assert "elided to fit the history budget" in contents[3]
+    assert contents[5] == DOM
+    assert contents[7] == DOM
+    assert fitted.messages[3].tool_call_id == "call_1"
+    assert fitted.tokens_saved > 1000
+    assert fitted.tokens_after <= total - 1000
+    # The caller's history is left untouched.
+    assert history[3].content == DOM
+
+
+def test_system_prompt_task_and_recent_messages_are_never_elided() -> None:
+    history = _history()
+
+    fitted = fit_history(history, budget_tokens=1, keep_recent=2)
+
+    assert fitted.messages[0].content == "system prompt"
+    assert fitted.messages[1].content == history[1].content
+    assert "elided" in fitted.messages[3].content
+    assert "elided" in fitted.messages[5].content
+    assert fitted.messages[7].content == DOM
+
+
+def test_nav_agent_records_tokens_saved_by_the_history_budget(monkeypatch: Any) -> None:
+    monkeypatch.setenv("LLM_HISTORY_TOKEN_BUDGET", "3000")
+    monkeypatch.setenv("LLM_HISTORY_KEEP_RECENT", "2")
+    llm = FakeLLM([AIMessage(content="", tool_calls=[{"name": "get_dom", "args": {}, "id": f"call_{index}"}]) for index in range(3)])
+    reads: list[str] = []
+
+    def get_dom() -> str:
+        # Distinct outputs, so repeated-output compaction does not apply.
+        reads.append(f"{DOM}{len(reads)}")
+        return reads[-1]
+
+    agent = FakeAgent(llm, [StructuredTool.from_function(func=get_dom, name="get_dom", description="dom")], system_message="api system")
+
+    async def run() -> None:
+        hercules = SimpleHercules(stake_id="test", browser_nav_max_chat_round=5)
+        hercules.agents_map = {"api_nav_agent": agent}
+        result = await hercules._executor_node(
+            {
+                "messages": [HumanMessage(content="root task")],
+                "next_step": "read the page",
+                "target_helper": "api",
+                "current_url": "",
+            }
+        )
+
+        assert "elided" in llm.calls[-1][3].content
+        assert llm.calls[-1][-1].content == reads[-1]
+        assert result["step_token_log"][-1]["history_tokens_saved"] > 0
+
+    asyncio.run(run())
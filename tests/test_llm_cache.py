@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_openai import ChatOpenAI
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils.llm_cache import LLMCacheMiss, llm_cache_key, open_llm_cache
+
+
+def _model(**params: Any) -> ChatOpenAI:
+    return ChatOpenAI(model="gpt-4o", api_key="test-key", **params)
+
+
+def _messages(task: str = "open the report", timestamp: str = "2026-10-16 10:00:00") -> list[Any]:
+    return [SystemMessage(content="system"), HumanMessage(content=f"{task}\n\nCurrent timestamp is {timestamp}")]
+
+
+class CountingLLM:
+    """Stands in for a bound chat model; only ``ainvoke`` is called."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def ainvoke(self, messages: list[Any]) -> AIMessage:
+        self.calls += 1
+        return AIMessage(
+            content="",
+            tool_calls=[{"name": "click", "args": {"selector": "#report"}, "id": "call_1"}],
+            response_metadata={"token_usage": {"prompt_tokens": 900, "completion_tokens": 12}},
+        )
+
+
+def test_key_ignores_timestamp_but_not_model_tools_or_messages() -> None:
+    llm = _model(temperature=0)
+
+    key = llm_cache_key(llm, _messages())
+
+    assert key == llm_cache_key(llm, _messages(timestamp="2026-10-17 09:30:00"))
+    assert key != llm_cache_key(llm, _messages(task="open the invoice"))
+    assert key != llm_cache_key(_model(temperature=0.5), _messages())
+    assert key != llm_cache_key(llm.bind_tools([{"type": "function", "function": {"name": "click", "parameters": {"type": "object", "properties": {}}}}]), _messages())
+
+
+def test_record_then_replay_serves_the_stored_response_without_usage(tmp_path: Any) -> None:
+    path = str(tmp_path / "llm_cache.sqlite")
+    llm = CountingLLM()
+    hercules = SimpleHercules(stake_id="test")
+
+    async def run() -> tuple[Any, Any]:
+        hercules._llm_cache = open_llm_cache("record", path)
+        recorded = await hercules._llm_ainvoke(llm, _messages(), "browser_nav_agent")
+        hercules._llm_cache = open_llm_cache("replay", path)
+        replayed = await hercules._llm_ainvoke(llm, _messages(timestamp="2026-10-17 09:30:00"), "browser_nav_agent")
+        return recorded, replayed
+
+    recorded, replayed = asyncio.run(run())
+
+    assert llm.calls == 1
+    assert replayed.tool_calls == recorded.tool_calls
+    assert replayed.response_metadata == {"llm_cache": "hit"}
+    assert hercules._token_counts(replayed) == (0, 0)
+
+
+def test_replay_fails_on_a_miss_and_auto_records_it(tmp_path: Any) -> None:
+    path = str(tmp_path / "llm_cache.sqlite")
+    llm = CountingLLM()
+    hercules = SimpleHercules(stake_id="test")
+
+    hercules._llm_cache = open_llm_cache("replay", path)
+    with pytest.raises(LLMCacheMiss):
+        asyncio.run(hercules._llm_ainvoke(llm, _messages(), "planner_agent"))
+    assert llm.calls == 0
+
+    hercules._llm_cache = open_llm_cache("auto", path)
+    asyncio.run(hercules._llm_ainvoke(llm, _messages(), "planner_agent"))
+    asyncio.run(hercules._llm_ainvoke(llm, _messages(), "planner_agent"))
+
+    assert llm.calls == 1
+    assert hercules._llm_cache.hits == 1
+    assert open_llm_cache("off", path) is None
@@ -3,6 +3,9 @@ import logging
 import pathlib
 import sys
 import types
+from typing import Generator
+
+import pytest
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 CONFIG_PATH = ROOT / "testzeus_hercules" / "config.py"
@@ -14,6 +17,15 @@ def _clear_testzeus_modules() -> None:
             del sys.modules[name]
 
 
+@pytest.fixture(autouse=True)
+def _restore_testzeus_modules() -> Generator[None, None, None]:
+    """Put back the real package modules replaced by the isolated config loads."""
+    saved = {name: module for name, module in sys.modules.items() if name == "testzeus_hercules" or name.startswith("testzeus_hercules.")}
+    yield
+    _clear_testzeus_modules()
+    sys.modules.update(saved)
+
+
 def _load_config_module(argv: list[str]):
     _clear_testzeus_modules()
 
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import pytest
+from langchain_core.messages import HumanMessage
+from testzeus_hercules.utils.llm_helper import create_chat_model
+from testzeus_hercules.utils.llm_http_pool import llm_http_pool_stats, llm_http_pool_usage, shared_llm_http_client
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+def test_models_of_one_endpoint_share_a_keep_alive_connection(base_url: str) -> None:
+    async def run() -> tuple[Any, Any, Any, dict[str, Any]]:
+        before = llm_http_pool_stats()
+        planner = create_chat_model({"model": "gpt-4o", "api_key": "key-a", "base_url": base_url})
+        navigator = create_chat_model({"model": "gpt-4o", "api_key": "key-a", "base_url": base_url})
+        other_key = create_chat_model({"model": "gpt-4o", "api_key": "key-b", "base_url": base_url})
+        await planner.ainvoke([HumanMessage(content="plan")])
+        await navigator.ainvoke([HumanMessage(content="navigate")])
+        return planner, navigator, other_key, llm_http_pool_usage(before)
+
+    planner, navigator, other_key, usage = asyncio.run(run())
+
+    assert planner.http_async_client is navigator.http_async_client
+    assert other_key.http_async_client is not planner.http_async_client
+    assert usage[base_url]["requests"] == 2
+    assert usage[base_url]["connections_opened"] == 1
+    assert usage[base_url]["connections_reused"] == 1
+    assert usage[base_url]["ttfb_mean_seconds"] > 0
+
+
+def test_each_event_loop_gets_its_own_client() -> None:
+    async def client() -> Any:
+        return shared_llm_http_client("http://gateway.invalid/v1", "key", 5.0)
+
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    first, second = (loop.run_until_complete(client()) for loop in loops)
+    for loop in loops:
+        loop.close()
+
+    assert first is not second
+    assert shared_llm_http_client("http://gateway.invalid/v1", "key") is shared_llm_http_client("http://gateway.invalid/v1", "key")
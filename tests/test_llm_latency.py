@@ -0,0 +1,131 @@
+import asyncio
+from typing import Any, Optional
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils.llm_latency import LLMLatencyTracker, hedged_call, llm_latency_tracker
+from testzeus_hercules.utils.llm_rate_limiter import llm_rate_limiter
+
+
+def test_adaptive_timeout_follows_p95_within_the_hard_limit() -> None:
+    tracker = LLMLatencyTracker(min_samples=20)
+    for _ in range(19):
+        tracker.record("gpt-4o", "planner_agent", 4.0)
+
+    assert tracker.p95("gpt-4o", "planner_agent") is None
+    assert tracker.timeout_for("gpt-4o", "planner_agent", 60.0, 3.0) == 60.0
+
+    tracker.record("gpt-4o", "planner_agent", 8.0)
+
+    assert tracker.p95("gpt-4o", "planner_agent") == 4.0
+    assert tracker.timeout_for("gpt-4o", "planner_agent", 60.0, 3.0) == 12.0
+    assert tracker.timeout_for("gpt-4o", "planner_agent", 60.0, 0) == 60.0
+    assert tracker.timeout_for("gpt-4o", "planner_agent", 10.0, 5.0) == 10.0
+    assert tracker.summary()["gpt-4o/planner_agent"]["calls"] == 20
+
+    before = tracker.counts()
+    tracker.record("gpt-4o", "planner_agent", 6.0)
+
+    assert tracker.summary(before) == {"gpt-4o/planner_agent": {"calls": 1, "p50_seconds": 6.0, "p95_seconds": 6.0}}
+
+
+def test_slow_call_is_hedged_and_the_loser_cancelled() -> None:
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def call() -> str:
+        attempt = len(started)
+        started.append(attempt)
+        try:
+            await asyncio.sleep(2.0 if attempt == 0 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return f"attempt {attempt}"
+
+    async def run() -> Any:
+        result = await hedged_call(call, timeout=5.0, hedge_after=0.05)
+        await asyncio.sleep(0)
+        return result
+
+    result = asyncio.run(run())
+
+    assert (result.response, result.hedged, result.hedge_won) == ("attempt 1", True, True)
+    # The caller waited from the original request's start, not just the duplicate's.
+    assert result.latency >= 0.05
+    assert cancelled == [0]
+
+
+def test_fast_call_is_not_hedged_and_deadline_raises() -> None:
+    async def fast() -> str:
+        return "ok"
+
+    async def stalled() -> str:
+        await asyncio.sleep(5.0)
+        return "late"
+
+    result = asyncio.run(hedged_call(fast, timeout=1.0, hedge_after=0.5))
+
+    assert (result.response, result.hedged) == ("ok", False)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(hedged_call(stalled, timeout=0.05, hedge_after=None))
+
+
+def test_engine_hedges_past_the_p95_and_reports_the_extra_requests(monkeypatch: Any) -> None:
+    monkeypatch.setenv("LLM_HEDGE_REQUESTS", "true")
+    for _ in range(20):
+        llm_latency_tracker.record("hedge-model", "browser_nav_agent", 0.05)
+
+    class FakeLLM:
+        model_name = "hedge-model"
+        calls = 0
+
+        async def ainvoke(self, messages: list[Any]) -> AIMessage:
+            FakeLLM.calls += 1
+            await asyncio.sleep(2.0 if FakeLLM.calls == 1 else 0.01)
+            return AIMessage(content=f"answer {FakeLLM.calls}")
+
+    hercules = SimpleHercules(stake_id="test")
+    before = llm_latency_tracker.counts()
+
+    response = asyncio.run(hercules._llm_ainvoke(FakeLLM(), [HumanMessage(content="next step " * 40)], "browser_nav_agent"))
+
+    assert response.content == "answer 2"
+    metrics = hercules._build_cost_metrics({}, llm_latency_since=before)
+    assert metrics["llm_hedging"]["hedged_requests"] == 1
+    assert metrics["llm_hedging"]["hedges_won"] == 1
+    assert metrics["llm_hedging"]["extra_prompt_tokens"] > 0
+    assert metrics["llm_latency"]["hedge-model/browser_nav_agent"]["calls"] == 1
+    assert metrics["llm_latency"]["hedge-model/browser_nav_agent"]["p50_seconds"] >= 0.05
+
+
+def test_hedge_reservation_is_settled_with_the_response_usage(monkeypatch: Any) -> None:
+    monkeypatch.setenv("LLM_HEDGE_REQUESTS", "true")
+    monkeypatch.setenv("LLM_RATE_LIMIT_TPM", "1000000")
+    monkeypatch.delenv("LLM_RATE_LIMIT_RPM", raising=False)
+    for _ in range(20):
+        llm_latency_tracker.record("hedge-settle-model", "browser_nav_agent", 0.05)
+    limiter = llm_rate_limiter("hedge-settle-model", 0, 1000000)
+    settled: list[Optional[int]] = []
+    settle = limiter.settle
+
+    def record_settle(reservation: Any, used_tokens: Optional[int]) -> None:
+        settled.append(used_tokens)
+        settle(reservation, used_tokens)
+
+    monkeypatch.setattr(limiter, "settle", record_settle)
+
+    class FakeLLM:
+        model_name = "hedge-settle-model"
+        calls = 0
+
+        async def ainvoke(self, messages: list[Any]) -> AIMessage:
+            FakeLLM.calls += 1
+            await asyncio.sleep(2.0 if FakeLLM.calls == 1 else 0.01)
+            return AIMessage(content="answer", response_metadata={"token_usage": {"prompt_tokens": 20, "completion_tokens": 5}})
+
+    asyncio.run(SimpleHercules(stake_id="test")._llm_ainvoke(FakeLLM(), [HumanMessage(content="next step")], "browser_nav_agent"))
+
+    # One settlement for the duplicate's reservation, one for the original's.
+    assert settled == [25, 25]
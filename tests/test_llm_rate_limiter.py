@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils.llm_rate_limiter import NAV_PRIORITY, PLANNER_PRIORITY, LLMRateLimiter, llm_rate_limiter
+
+
+def test_planner_calls_are_served_before_queued_nav_calls() -> None:
+    # 1200 requests per minute refill one request every 50ms.
+    limiter = LLMRateLimiter("priority-model", requests_per_minute=1200, tokens_per_minute=0)
+    limiter._requests.available = 0
+    served: list[str] = []
+
+    async def call(name: str, priority: int) -> None:
+        await limiter.acquire(10, priority)
+        served.append(name)
+
+    async def run() -> None:
+        nav = asyncio.create_task(call("nav", NAV_PRIORITY))
+        await asyncio.sleep(0.01)
+        await asyncio.gather(nav, call("planner", PLANNER_PRIORITY))
+
+    asyncio.run(run())
+
+    assert served == ["planner", "nav"]
+
+
+def test_token_reservation_is_settled_with_real_usage() -> None:
+    limiter = LLMRateLimiter("settle-model", requests_per_minute=0, tokens_per_minute=6000)
+
+    reservation = asyncio.run(limiter.acquire(1000))
+    after_reservation = limiter._tokens.available
+    limiter.settle(reservation, 400)
+
+    assert abs(after_reservation - 5000) < 1
+    assert abs(limiter._tokens.available - after_reservation - 600) < 1e-6
+    assert llm_rate_limiter("settle-model", 0, 0) is None
+
+
+def test_engine_calls_wait_for_capacity_and_record_queue_wait(monkeypatch: Any) -> None:
+    monkeypatch.setenv("LLM_RATE_LIMIT_RPM", "600")
+    monkeypatch.delenv("LLM_RATE_LIMIT_TPM", raising=False)
+
+    class FakeLLM:
+        model_name = "queue-wait-model"
+
+        async def ainvoke(self, messages: list[Any]) -> AIMessage:
+            return AIMessage(content="done", response_metadata={"token_usage": {"prompt_tokens": 20, "completion_tokens": 5}})
+
+    limiter = llm_rate_limiter("queue-wait-model", 600, 0)
+    limiter._requests.available = 0
+    hercules = SimpleHercules(stake_id="test")
+
+    response = asyncio.run(hercules._llm_ainvoke(FakeLLM(), [HumanMessage(content="next step")], "browser_nav_agent"))
+
+    assert response.content == "done"
+    # 600 requests per minute refill one request every 100ms.
+    assert 0.05 < hercules._llm_queue_wait < 1.0
@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.tools import StructuredTool
+from tests.conftest import FakeAgent, FakeLLM
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils.nav_history import NavHistoryCompactor
+
+DOM_BEFORE = "<form>" + "a" * 1000 + "</form>"
+DOM_AFTER = "<table>" + "b" * 1000 + "</table>"
+REPORT = "status: ok " + "r" * 500
+
+
+def _append_tool_output(messages: list[Any], compactor: NavHistoryCompactor, turn: int, name: str, content: str, changes_page: bool = False) -> None:
+    call_id = f"call_{turn}_{name}"
+    messages.append(AIMessage(content="", tool_calls=[{"name": name, "args": {}, "id": call_id}]))
+    compactor.record(len(messages), turn, name, content, changes_page)
+    messages.append(ToolMessage(content=content, tool_call_id=call_id))
+
+
+def test_snapshot_is_superseded_by_newer_snapshot_and_page_changes() -> None:
+    messages: list[Any] = [SystemMessage(content="system"), HumanMessage(content="task")]
+    compactor = NavHistoryCompactor()
+    _append_tool_output(messages, compactor, 1, "get_interactive_elements", DOM_BEFORE)
+    _append_tool_output(messages, compactor, 1, "get_page_text", "page text " + "p" * 500)
+    _append_tool_output(messages, compactor, 2, "get_interactive_elements", DOM_BEFORE)
+    _append_tool_output(messages, compactor, 3, "click", "Success. Page has changed.", changes_page=True)
+    _append_tool_output(messages, compactor, 4, "get_interactive_elements", DOM_AFTER)
+
+    removed = compactor.compact(messages)
+
+    assert messages[3].content == "[get_interactive_elements output superseded by snapshot at turn 2]"
+    assert messages[5].content == "[get_page_text output superseded: page changed by click at turn 3]"
+    assert messages[7].content == "[get_interactive_elements output superseded: page changed by click at turn 3]"
+    assert messages[11].content == DOM_AFTER
+    # Placeholders keep the tool call ids so every tool call still has its result.
+    assert messages[3].tool_call_id == "call_1_get_interactive_elements"
+    assert removed == compactor.chars_saved > 2000
+    assert compactor.compact(messages) == 0
+
+
+def test_repeated_tool_outputs_become_references_to_the_first_one() -> None:
+    messages: list[Any] = [SystemMessage(content="system"), HumanMessage(content="task")]
+    compactor = NavHistoryCompactor()
+    _append_tool_output(messages, compactor, 1, "get_api_call", REPORT)
+    _append_tool_output(messages, compactor, 2, "get_api_call", REPORT)
+    _append_tool_output(messages, compactor, 3, "get_api_call", REPORT)
+    _append_tool_output(messages, compactor, 4, "get_api_call", "short")
+    _append_tool_output(messages, compactor, 5, "get_api_call", "short")
+
+    compactor.compact(messages)
+
+    assert messages[3].content == REPORT
+    assert messages[5].content == "[same output as get_api_call at turn 1]"
+    assert messages[7].content == "[same output as get_api_call at turn 1]"
+    assert messages[11].content == "short"
+
+
+def test_nav_agent_sends_only_the_latest_dom_snapshot() -> None:
+    snapshots = [DOM_BEFORE, DOM_AFTER]
+
+    def get_interactive_elements() -> str:
+        return snapshots.pop(0)
+
+    def click() -> str:
+        return "Success. As a consequence of this action, new elements have appeared in view."
+
+    llm = FakeLLM(AIMessage(content="", tool_calls=[{"name": name, "args": {}, "id": f"call_{index}"}]) for index, name in enumerate(["get_interactive_elements", "click", "get_interactive_elements"]))
+    agent = FakeAgent(
+        llm,
+        [
+            StructuredTool.from_function(func=get_interactive_elements, name="get_interactive_elements", description="dom"),
+            StructuredTool.from_function(func=click, name="click", description="click"),
+        ],
+    )
+
+    result = asyncio.run(SimpleHercules(stake_id="test", browser_nav_max_chat_round=5)._run_nav_agent(agent, "open the report", "browser_nav_agent"))
+
+    assert "##TERMINATE TASK##" in result
+    final_tool_outputs = [message.content for message in llm.calls[-1] if isinstance(message, ToolMessage)]
+    assert final_tool_outputs[0] == "[get_interactive_elements output superseded: page changed by click at turn 2]"
+    assert final_tool_outputs[-1] == DOM_AFTER
+    assert DOM_BEFORE not in "".join(final_tool_outputs)
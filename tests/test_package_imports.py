@@ -77,3 +77,46 @@ print("testzeus_hercules.core.agents" in sys.modules)
 
     assert result.returncode == 0, result.stderr
     assert result.stdout.splitlines()[-2:] == ["True", "False"]
+
+
+# Modules that only specific tools or integrations need; loading any of them on
+# start-up means an eager import crept back in.
+DEFERRED_MODULES = ["sentry_sdk", "portkey_ai", "sqlalchemy", "unstructured", "PIL", "anthropic", "testzeus_hercules.core.tools.open_url"]
+
+
+def test_cli_import_time_stays_within_budget(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    env = os.environ.copy()
+    env["AUTO_MODE"] = "1"
+    env["ENABLE_TELEMETRY"] = "1"
+    env["IS_TEST_ENV"] = "true"
+    env["PYTHONPATH"] = str(repo_root)
+    budget_seconds = float(os.environ.get("HERCULES_IMPORT_BUDGET_SECONDS", "4"))
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"""
+import sys
+
+import testzeus_hercules.__main__
+
+print([name for name in {DEFERRED_MODULES!r} if name in sys.modules])
+""",
+        ],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "[]"
+    # -X importtime lines: "import time: <self us> | <cumulative us> | <module>"
+    cumulative_us = [int(line.split("|")[1]) for line in result.stderr.splitlines() if line.startswith("import time:") and line.split("|")[2].strip() == "testzeus_hercules.__main__"]
+    assert cumulative_us, result.stderr[-2000:]
+    assert cumulative_us[0] / 1_000_000 < budget_seconds
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any
+
+import testzeus_hercules.__main__ as hercules_main
+from testzeus_hercules.config import get_global_conf
+from testzeus_hercules.core.playwright_manager import PlaywrightManager
+
+
+def _feats(count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "feature": "Feature",
+            "scenario": f"Scenario {index}",
+            "output_file": f"/tmp/scenario_{index}.feature",
+        }
+        for index in range(count)
+    ]
+
+
+def _stub_shared_cleanup(monkeypatch: Any) -> list[str]:
+    cleaned: list[str] = []
+
+    async def fake_destroy() -> bool:
+        cleaned.append("mcp")
+        return True
+
+    monkeypatch.setattr(PlaywrightManager, "close_all_instances", classmethod(lambda cls: cleaned.append("browsers")))
+    monkeypatch.setattr(hercules_main.MCPHelper, "destroy", fake_destroy)
+    return cleaned
+
+
+def test_scoped_test_id_is_isolated_per_task() -> None:
+    conf = get_global_conf()
+
+    async def scenario(test_id: str, delay: float) -> tuple[str, str]:
+        conf.set_default_test_id(test_id)
+        await asyncio.sleep(delay)
+        return test_id, conf.get_default_test_id()
+
+    async def run() -> list[tuple[str, str]]:
+        return await asyncio.gather(scenario("first", 0.02), scenario("second", 0.0))
+
+    for expected, seen in asyncio.run(run()):
+        assert seen == expected
+
+
+def test_parallel_pool_bounds_concurrency_and_keeps_scenario_order(monkeypatch: Any) -> None:
+    cleaned = _stub_shared_cleanup(monkeypatch)
+    in_flight = 0
+    peak = 0
+    close_flags: list[bool] = []
+
+    async def fake_run_scenario(feat: dict[str, str], dont_close_browser: bool = False, close_shared_resources: bool = True) -> str:
+        nonlocal in_flight, peak
+        close_flags.append(close_shared_resources)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later scenarios finish first so ordering cannot come from completion order.
+        await asyncio.sleep(0.01 * (10 - int(feat["scenario"].split()[-1])))
+        in_flight -= 1
+        return f"{feat['scenario']}.xml"
+
+    monkeypatch.setattr(hercules_main, "run_scenario", fake_run_scenario)
+
+    results = asyncio.run(hercules_main.run_scenarios_in_parallel(_feats(7), workers=3))
+
+    assert results == [f"Scenario {index}.xml" for index in range(7)]
+    assert peak == 3
+    assert close_flags == [False] * 7
+    assert cleaned == ["browsers", "mcp"]
+
+
+def test_parallel_pool_records_crashed_scenario_as_failure(monkeypatch: Any) -> None:
+    _stub_shared_cleanup(monkeypatch)
+
+    async def fake_run_scenario(feat: dict[str, str], dont_close_browser: bool = False, close_shared_resources: bool = True) -> str:
+        if feat["scenario"] == "Scenario 1":
+            raise RuntimeError("browser crashed")
+        return f"{feat['scenario']}.xml"
+
+    async def fake_crashed_result(feat: dict[str, str], error: BaseException) -> str:
+        return f"{feat['scenario']}.crashed:{error}"
+
+    monkeypatch.setattr(hercules_main, "run_scenario", fake_run_scenario)
+    monkeypatch.setattr(hercules_main, "_crashed_scenario_result", fake_crashed_result)
+
+    results = asyncio.run(hercules_main.run_scenarios_in_parallel(_feats(3), workers=2))
+
+    assert results == ["Scenario 0.xml", "Scenario 1.crashed:browser crashed", "Scenario 2.xml"]
+
+
+def test_parallel_scenarios_setting_falls_back_to_one_for_invalid_values(monkeypatch: Any) -> None:
+    conf = get_global_conf()
+    monkeypatch.setitem(conf._config, "PARALLEL_SCENARIOS", "4")
+    assert conf.get_parallel_scenarios() == 4
+    monkeypatch.setitem(conf._config, "PARALLEL_SCENARIOS", "0")
+    assert conf.get_parallel_scenarios() == 1
+    monkeypatch.setitem(conf._config, "PARALLEL_SCENARIOS", "many")
+    assert conf.get_parallel_scenarios() == 1
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from testzeus_hercules.core.agents.base_nav_agent import BaseNavAgent
+from testzeus_hercules.core.agents.browser_nav_agent import BrowserNavAgent
+from testzeus_hercules.core.agents.high_level_planner_agent import PlannerAgent
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils.prompt_layout import TEST_DATA_POINTER, layout_system_prompt
+
+
+def test_test_data_follows_the_static_prompt() -> None:
+    template = "Follow the rules.\nAvailable Test Data: $basic_test_information\n"
+
+    first = layout_system_prompt(template, "user: alice")
+    second = layout_system_prompt(template, "user: bob")
+
+    assert first == "Follow the rules.\nAvailable Test Data: user: alice"
+    assert second.startswith("Follow the rules.\nAvailable Test Data: ")
+
+
+def test_placeholder_inside_a_custom_prompt_moves_to_the_end() -> None:
+    template = "Use ${basic_test_information} when filling forms.\nAlways verify."
+
+    rendered = layout_system_prompt(template, "user: alice")
+
+    assert rendered == f"Use {TEST_DATA_POINTER} when filling forms.\nAlways verify.\n\nAvailable Test Data: user: alice"
+    assert layout_system_prompt("No placeholder", "user: alice") == "No placeholder"
+
+
+def test_agent_prompts_are_identical_across_renders() -> None:
+    nav = BaseNavAgent.__new__(BrowserNavAgent)
+    nav._system_message_template = BrowserNavAgent.prompt
+    planner = PlannerAgent.__new__(PlannerAgent)
+    planner._base_prompt = PlannerAgent.prompt
+
+    nav_prompt = nav._render_system_message("user: alice")
+
+    assert nav_prompt == nav._render_system_message("user: alice")
+    assert nav_prompt.endswith("Available Test Data: \nuser: alice")
+    assert "Current timestamp" not in nav_prompt
+    assert planner._render_system_message("user: alice").endswith("Available Test Data: user: alice")
+
+
+def test_nav_call_sends_timestamp_with_task_and_reports_cached_tokens(monkeypatch: Any) -> None:
+    monkeypatch.setenv("LLM_PROMPT_CACHE_HINTS", "true")
+    calls: list[list[Any]] = []
+
+    class FakeLLM:
+        async def ainvoke(self, messages: list[Any]) -> AIMessage:
+            calls.append(list(messages))
+            return AIMessage(
+                content="done\n##TERMINATE TASK##",
+                response_metadata={"token_usage": {"prompt_tokens": 1200, "completion_tokens": 10, "prompt_tokens_details": {"cached_tokens": 1024}}},
+            )
+
+    class FakeAgent:
+        system_message = "browser system"
+        timestamp_format = "%Y"
+        llm = FakeLLM()
+        tools: list[Any] = []
+
+    hercules = SimpleHercules(stake_id="test")
+    asyncio.run(hercules._run_nav_agent(FakeAgent(), "open the report", "browser_nav_agent"))
+
+    system, task = calls[0]
+    assert isinstance(system, SystemMessage)
+    assert system.content == [{"type": "text", "text": "browser system", "cache_control": {"type": "ephemeral"}}]
+    assert isinstance(task, HumanMessage)
+    assert task.content.startswith("open the report\n\nCurrent timestamp is ")
+    assert hercules._nav_token_log[-1]["cached_tokens"] == 1024
+    assert hercules._nav_token_log[-1]["prompt_tokens"] == 1200
+
+
+def test_cached_tokens_are_read_from_each_usage_format() -> None:
+    hercules = SimpleHercules(stake_id="test")
+
+    langchain_usage = AIMessage(content="", usage_metadata={"input_tokens": 50, "output_tokens": 5, "total_tokens": 55, "input_token_details": {"cache_read": 40}})
+    anthropic_usage = AIMessage(content="", response_metadata={"token_usage": {"input_tokens": 50, "cache_read_input_tokens": 30}})
+
+    assert hercules._cached_tokens(langchain_usage) == 40
+    assert hercules._cached_tokens(anthropic_usage) == 30
+    assert hercules._cached_tokens(AIMessage(content="")) == 0
+    metrics = hercules._build_cost_metrics({"total_prompt_tokens": 50, "total_cached_tokens": 40})
+    assert metrics["usage_including_cached_inference"]["langgraph"]["cached_tokens"] == 40
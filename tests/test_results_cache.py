@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any
+
+import testzeus_hercules.__main__ as hercules_main
+from junitparser import JUnitXml
+from testzeus_hercules.utils.results_cache import REUSED_PROPERTY, fingerprint_config
+from testzeus_hercules.utils.scenario_history import ScenarioHistory
+
+FEATURE = """Feature: Shop
+
+  Scenario: login
+    Given the login page
+    Then the user is logged in
+
+  Scenario: search
+    Given the search page
+    Then results are shown
+"""
+
+
+def _configure(monkeypatch: Any, tmp_path: Any) -> Any:
+    conf = hercules_main.get_global_conf()
+    feature_file = tmp_path / "input" / "shop.feature"
+    feature_file.parent.mkdir()
+    feature_file.write_text(FEATURE, encoding="utf-8")
+    (tmp_path / "test_data").mkdir()
+    (tmp_path / "test_data" / "users.json").write_text('{"user": "a"}', encoding="utf-8")
+    for key, value in {
+        "INPUT_GHERKIN_FILE_PATH": str(feature_file),
+        "TMP_GHERKIN_PATH": str(tmp_path / "gherkin_files"),
+        "TEST_DATA_PATH": str(tmp_path / "test_data"),
+        "PROJECT_SOURCE_ROOT": str(tmp_path),
+        "INCREMENTAL": "true",
+        "PARALLEL_SCENARIOS": "1",
+        "SHARD": None,
+        "DONT_CLOSE_BROWSER": "false",
+    }.items():
+        monkeypatch.setitem(conf._config, key, value)
+    return conf
+
+
+def _fake_runs(monkeypatch: Any, failing: set[str]) -> list[str]:
+    ran: list[str] = []
+
+    async def fake_run_scenario(feat: dict[str, str], dont_close_browser: bool = False, close_shared_resources: bool = True) -> str:
+        ran.append(feat["scenario"])
+        passed = feat["scenario"] not in failing
+        return await hercules_main.build_junit_xml(
+            {"terminate": "yes", "is_assert": True, "is_passed": passed, "assert_summary": "ok" if passed else "boom"},
+            2.5,
+            {},
+            feat["feature"],
+            feat["scenario"],
+            feature_file_path=feat["output_file"],
+        )
+
+    monkeypatch.setattr(hercules_main, "run_scenario", fake_run_scenario)
+    return ran
+
+
+def _cases(result_file: str) -> dict[str, dict[str, Any]]:
+    cases: dict[str, dict[str, Any]] = {}
+    for suite in JUnitXml.fromfile(result_file):
+        for case in suite:
+            properties = {prop.get("name"): prop.get("value") for prop in case._elem.iter("property")}
+            cases[case.name] = {"passed": case.is_passed, "reused": properties.get(REUSED_PROPERTY) == "true"}
+    return cases
+
+
+def test_incremental_run_reuses_unchanged_passes_and_reruns_failures(monkeypatch: Any, tmp_path: Any) -> None:
+    _configure(monkeypatch, tmp_path)
+
+    ran = _fake_runs(monkeypatch, failing={"search"})
+    first = asyncio.run(hercules_main.sequential_process())
+    assert ran == ["login", "search"]
+    assert _cases(first) == {"login": {"passed": True, "reused": False}, "search": {"passed": False, "reused": False}}
+    # Cached passes live in the scenario history, next to outcomes and durations.
+    history = ScenarioHistory.for_current_run()
+    assert history.get("login")["result_xml"] and history.get("login")["fingerprint"]
+    assert "result_xml" not in history.get("search")
+
+    ran = _fake_runs(monkeypatch, failing=set())
+    events: list[dict[str, Any]] = []
+    second = asyncio.run(hercules_main.sequential_process(on_progress=events.append))
+    assert ran == ["search"]
+    assert list(_cases(second)) == ["login", "search"]
+    assert _cases(second) == {"login": {"passed": True, "reused": True}, "search": {"passed": True, "reused": False}}
+    assert {"event": "scenario_finished", "scenario": "login", "reused": True}.items() <= events[-1].items()
+
+    # Changing the test data invalidates every cached pass.
+    (tmp_path / "test_data" / "users.json").write_text('{"user": "b"}', encoding="utf-8")
+    ran = _fake_runs(monkeypatch, failing=set())
+    asyncio.run(hercules_main.sequential_process())
+    assert ran == ["login", "search"]
+
+
+def test_config_fingerprint_tracks_relevant_settings_only(tmp_path: Any) -> None:
+    llm_config = tmp_path / "agents_llm_config.json"
+    llm_config.write_text('{"model": "a"}', encoding="utf-8")
+    base = {"LLM_MODEL_NAME": "gpt-4o", "AGENTS_LLM_CONFIG_FILE": str(llm_config), "RUN_ID": "1"}
+
+    assert fingerprint_config(base) == fingerprint_config({**base, "RUN_ID": "2"})
+    assert fingerprint_config(base) != fingerprint_config({**base, "LLM_MODEL_NAME": "gpt-4.1"})
+
+    before = fingerprint_config(base)
+    llm_config.write_text('{"model": "b"}', encoding="utf-8")
+    assert fingerprint_config(base) != before
@@ -0,0 +1,119 @@
+import asyncio
+from typing import Any
+
+import testzeus_hercules.__main__ as hercules_main
+from junitparser import JUnitXml
+from testzeus_hercules.utils.scenario_history import ScenarioHistory
+
+FEATURE = """Feature: Shop
+
+  Scenario: login
+    Given the login page
+
+  Scenario: search
+    Given the search page
+
+  Scenario: checkout
+    Given the cart page
+"""
+
+
+def _configure(monkeypatch: Any, tmp_path: Any, **overrides: str) -> None:
+    conf = hercules_main.get_global_conf()
+    feature_file = tmp_path / "input" / "shop.feature"
+    feature_file.parent.mkdir(exist_ok=True)
+    feature_file.write_text(FEATURE, encoding="utf-8")
+    settings = {
+        "INPUT_GHERKIN_FILE_PATH": str(feature_file),
+        "TMP_GHERKIN_PATH": str(tmp_path / "gherkin_files"),
+        "TEST_DATA_PATH": str(tmp_path / "test_data"),
+        "PROJECT_SOURCE_ROOT": str(tmp_path),
+        "INCREMENTAL": "false",
+        "PARALLEL_SCENARIOS": "1",
+        "SHARD": None,
+        "DONT_CLOSE_BROWSER": "false",
+        "SCENARIO_ORDER": "file",
+        "FAIL_FAST": "0",
+        **overrides,
+    }
+    for key, value in settings.items():
+        monkeypatch.setitem(conf._config, key, value)
+
+
+def _fake_runs(monkeypatch: Any, failing: set[str], durations: dict[str, float]) -> list[str]:
+    ran: list[str] = []
+
+    async def fake_run_scenario(feat: dict[str, str], dont_close_browser: bool = False, close_shared_resources: bool = True) -> str:
+        ran.append(feat["scenario"])
+        passed = feat["scenario"] not in failing
+        return await hercules_main.build_junit_xml(
+            {"terminate": "yes", "is_assert": True, "is_passed": passed, "assert_summary": "ok" if passed else "boom"},
+            durations.get(feat["scenario"], 1.0),
+            {},
+            feat["feature"],
+            feat["scenario"],
+            feature_file_path=feat["output_file"],
+        )
+
+    monkeypatch.setattr(hercules_main, "run_scenario", fake_run_scenario)
+    return ran
+
+
+def _outcomes(result_file: str) -> list[tuple[str, str]]:
+    outcomes = []
+    for suite in JUnitXml.fromfile(result_file):
+        for case in suite:
+            outcomes.append((case.name, "skipped" if case.is_skipped else "passed" if case.is_passed else "failed"))
+    return outcomes
+
+
+def test_history_orders_failed_first_then_longest_first(tmp_path: Any) -> None:
+    history = ScenarioHistory(str(tmp_path / "history.json"), "shop.feature")
+    history._entries = {
+        history._key("short pass"): {"last_passed": True, "duration": 5.0},
+        history._key("long pass"): {"last_passed": True, "duration": 50.0},
+        history._key("short failure"): {"last_passed": False, "duration": 2.0},
+        history._key("long failure"): {"last_passed": False, "duration": 20.0},
+    }
+    feats = [{"scenario": name} for name in ("short pass", "new", "long pass", "short failure", "long failure")]
+
+    assert [feat["scenario"] for feat in history.order(feats)] == ["short failure", "long failure", "new", "short pass", "long pass"]
+    assert [feat["scenario"] for feat in history.order(feats, longest_first=True)] == ["long failure", "short failure", "new", "long pass", "short pass"]
+
+
+def test_failed_first_with_fail_fast_skips_remaining_scenarios(monkeypatch: Any, tmp_path: Any) -> None:
+    _configure(monkeypatch, tmp_path)
+    durations = {"login": 3.0, "search": 8.0, "checkout": 4.0}
+
+    ran = _fake_runs(monkeypatch, failing={"checkout"}, durations=durations)
+    asyncio.run(hercules_main.sequential_process())
+    assert ran == ["login", "search", "checkout"]
+    history = ScenarioHistory.for_current_run()
+    assert history.get("checkout")["last_passed"] is False
+    assert history.expected_duration("search") == 8.0
+
+    _configure(monkeypatch, tmp_path, SCENARIO_ORDER="failed-first", FAIL_FAST="1")
+    ran = _fake_runs(monkeypatch, failing={"checkout"}, durations=durations)
+    events: list[dict[str, Any]] = []
+    result = asyncio.run(hercules_main.sequential_process(on_progress=events.append))
+
+    assert ran == ["checkout"]
+    # The merged report stays in feature file order.
+    assert _outcomes(result) == [("login", "skipped"), ("search", "skipped"), ("checkout", "failed")]
+    assert [event["scenario"] for event in events if event.get("skipped")] == ["login", "search"]
+    # Skipped scenarios leave their history untouched.
+    assert ScenarioHistory.for_current_run().get("login")["runs"] == 1
+
+
+def test_parallel_failed_first_starts_longest_scenarios_first(monkeypatch: Any, tmp_path: Any) -> None:
+    _configure(monkeypatch, tmp_path)
+    durations = {"login": 3.0, "search": 8.0, "checkout": 4.0}
+    _fake_runs(monkeypatch, failing=set(), durations=durations)
+    asyncio.run(hercules_main.sequential_process())
+
+    _configure(monkeypatch, tmp_path, SCENARIO_ORDER="failed-first", PARALLEL_SCENARIOS="2")
+    ran = _fake_runs(monkeypatch, failing=set(), durations=durations)
+    result = asyncio.run(hercules_main.sequential_process())
+
+    assert ran == ["search", "checkout", "login"]
+    assert [name for name, _ in _outcomes(result)] == ["login", "search", "checkout"]
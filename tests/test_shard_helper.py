@@ -0,0 +1,126 @@
+import asyncio
+from typing import Any
+
+from junitparser import JUnitXml
+from testzeus_hercules.config import get_global_conf
+from testzeus_hercules.core.bulk_runner import plan_bulk_shard
+from testzeus_hercules.merge_shards import main as merge_shards_main
+from testzeus_hercules.utils.scenario_history import HISTORY_FILE_NAME, ScenarioHistory
+from testzeus_hercules.utils.shard_helper import (
+    assign_shards,
+    load_scenario_durations,
+    merge_shard_reports,
+    select_shard_scenarios,
+)
+
+
+def _write_result(path: Any, suite: str, cases: dict[str, float]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    testcases = "".join(f'<testcase name="{name}" classname="{suite}" time="{time}"/>' for name, time in cases.items())
+    path.write_text(
+        f'<testsuites><testsuite name="{suite}" tests="{len(cases)}" failures="0" errors="0" skipped="0">{testcases}</testsuite></testsuites>',
+        encoding="utf-8",
+    )
+
+
+def _write_history(project_root: Any, feature_file: str, suite: str, cases: dict[str, float]) -> None:
+    result_file = project_root / "output" / "1" / "result.xml"
+    _write_result(result_file, suite, cases)
+    history = ScenarioHistory(str(project_root / HISTORY_FILE_NAME), feature_file)
+    history.record([str(result_file)])
+    history.save()
+
+
+def _write_feature(path: Any, scenarios: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    body = "".join(f"\n  Scenario: {scenario}\n    Given a step\n" for scenario in scenarios)
+    path.write_text(f"Feature: Suite\n{body}", encoding="utf-8")
+
+
+def test_assign_shards_balances_by_duration_longest_first() -> None:
+    weights = [("a", 10.0), ("b", 7.0), ("c", 6.0), ("d", 5.0), ("e", 4.0)]
+
+    assignment = assign_shards(weights, 2)
+
+    loads = {1: 0.0, 2: 0.0}
+    for key, weight in weights:
+        loads[assignment[key]] += weight
+    # Count-based splitting would give 10+7+6 vs 5+4; LPT keeps the shards within one job.
+    assert sorted(loads.values()) == [15.0, 17.0]
+    assert assign_shards(weights, 2) == assignment
+
+
+def test_assign_shards_uses_median_for_unknown_durations_and_counts_without_history() -> None:
+    # "new" has no history, so it weighs as much as the median scenario ("mid").
+    assignment = assign_shards([("slow", 100.0), ("new", None), ("mid", 5.0), ("fast", 1.0)], 2)
+    assert assignment == {"slow": 1, "new": 2, "mid": 2, "fast": 2}
+
+    no_history = assign_shards([(name, None) for name in "abcd"], 2)
+    assert sorted(no_history.values()) == [1, 1, 2, 2]
+
+
+def test_load_scenario_durations_reads_only_the_given_shared_file(tmp_path: Any) -> None:
+    feature_file = str(tmp_path / "input" / "suite.feature")
+    _write_history(tmp_path, feature_file, "Suite", {"login": 20.0, "search": 12.0})
+    history_file = str(tmp_path / HISTORY_FILE_NAME)
+
+    assert load_scenario_durations(history_file, feature_file) == {"login": 20.0, "search": 12.0}
+    assert load_scenario_durations(history_file, str(tmp_path / "input" / "other.feature")) == {}
+    # The node's own history is never used implicitly, and a missing file splits by count.
+    assert load_scenario_durations(None, feature_file) == {}
+    assert load_scenario_durations(str(tmp_path / "missing.json"), feature_file) == {}
+
+
+def test_select_shard_scenarios_covers_every_scenario_once_in_file_order() -> None:
+    feats = [{"feature": "Suite", "scenario": f"s{index}", "output_file": f"s{index}.feature"} for index in range(7)]
+    durations = {f"s{index}": float(index + 1) for index in range(7)}
+
+    shards = [select_shard_scenarios(feats, (index, 3), durations) for index in (1, 2, 3)]
+
+    assert sorted(feat["scenario"] for shard in shards for feat in shard) == sorted(feat["scenario"] for feat in feats)
+    for shard in shards:
+        assert shard == sorted(shard, key=feats.index)
+
+
+def test_plan_bulk_shard_balances_scenarios_across_folders(monkeypatch: Any, tmp_path: Any) -> None:
+    tests_dir = tmp_path / "tests"
+    _write_feature(tests_dir / "checkout" / "input" / "checkout.feature", ["pay", "refund"])
+    _write_feature(tests_dir / "login" / "input" / "login.feature", ["valid", "invalid"])
+    _write_history(tests_dir / "checkout", str(tests_dir / "checkout" / "input" / "checkout.feature"), "Suite", {"pay": 50.0, "refund": 40.0})
+    _write_history(tests_dir / "login", str(tests_dir / "login" / "input" / "login.feature"), "Suite", {"valid": 30.0, "invalid": 20.0})
+    test_dirs = [str(tests_dir / "checkout"), str(tests_dir / "login")]
+
+    by_count = asyncio.run(plan_bulk_shard(test_dirs, (1, 2)))
+    monkeypatch.setitem(get_global_conf()._config, "SHARD_DURATIONS_FILE", HISTORY_FILE_NAME)
+    first = asyncio.run(plan_bulk_shard(test_dirs, (1, 2)))
+    second = asyncio.run(plan_bulk_shard(test_dirs, (2, 2)))
+    together = asyncio.run(plan_bulk_shard(test_dirs, (1, 2), keep_folders_together=True))
+
+    # Without a shared durations file the local history is ignored and scenarios are dealt out by count.
+    assert by_count == {test_dirs[0]: ["pay"], test_dirs[1]: ["valid"]}
+    assert first == {test_dirs[0]: ["pay"], test_dirs[1]: ["invalid"]}
+    assert second == {test_dirs[0]: ["refund"], test_dirs[1]: ["valid"]}
+    assert together == {test_dirs[0]: ["pay", "refund"]}
+
+
+def test_merge_shard_reports_combines_suites_and_keeps_inputs(tmp_path: Any) -> None:
+    _write_result(tmp_path / "shard-1" / "output" / "1" / "suite.feature_result.xml", "Suite", {"login": 2.0})
+    _write_result(tmp_path / "shard-2" / "output" / "1" / "suite.feature_result.xml", "Suite", {"search": 3.0})
+    merged_file = str(tmp_path / "merged" / "merged_result.xml")
+
+    asyncio.run(merge_shard_reports([str(tmp_path / "shard-1"), str(tmp_path / "shard-2")], merged_file))
+
+    suites = list(JUnitXml.fromfile(merged_file))
+    assert len(suites) == 1
+    assert sorted(case.name for case in suites[0]) == ["login", "search"]
+    assert (tmp_path / "shard-1" / "output" / "1" / "suite.feature_result.xml").exists()
+
+
+def test_merge_shards_command_writes_xml_and_html(tmp_path: Any) -> None:
+    _write_result(tmp_path / "shard-1" / "suite.feature_result.xml", "Suite", {"login": 2.0})
+    merged_file = tmp_path / "merged_result.xml"
+
+    merge_shards_main(["-o", str(merged_file), str(tmp_path / "shard-1")])
+
+    assert merged_file.exists()
+    assert (tmp_path / "merged_result.html").exists()
@@ -1,11 +1,15 @@
 import asyncio
 import json
 from types import SimpleNamespace
-from typing import Any
+from typing import Annotated, Any, TypedDict
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_core.tools import StructuredTool
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.core.state_channels import AppendLog
 from testzeus_hercules.utils.llm_helper import GraphChatResult
 
 
@@ -435,3 +439,161 @@ def test_graph_chat_result_summary_uses_terminal_planner_json() -> None:
     )
 
     assert json.loads(result.summary)["final_response"] == "done"
+
+
+def test_append_log_copies_share_entries_without_duplicating_writes() -> None:
+    channel = AppendLog(list)
+    channel.update([["task"]])
+    step = object()
+
+    # A conditional edge reads a copy with the node's writes applied first.
+    routed = channel.copy()
+    routed.update([[step]])
+    channel.update([[step]])
+
+    assert channel.get() == ["task", step]
+    assert routed.get() is channel.get()
+
+    # A copy that diverges stops sharing the entries.
+    stale = routed.copy()
+    channel.update([["next"]])
+    stale.update([["other"]])
+    assert channel.get() == ["task", step, "next"]
+    assert stale.get() == ["task", step, "other"]
+
+
+def test_graph_appends_history_once_per_turn() -> None:
+    async def run() -> None:
+        steps = [
+            {"next_step": "call the API", "target_helper": "api", "terminate": "no"},
+            {"next_step": "call the API again", "target_helper": "api", "terminate": "no"},
+            {"next_step": "", "target_helper": "Not_Applicable", "terminate": "yes", "is_assert": True, "is_passed": True, "final_response": "done"},
+        ]
+        hercules = _hercules()
+        hercules.agents_map = {
+            "planner_agent": SimpleNamespace(
+                system_message="planner system",
+                llm=FakeLLM([AIMessage(content=json.dumps(step)) for step in steps]),
+                on_planner_message=lambda _content: None,
+            ),
+            "api_nav_agent": FakeAgent(
+                "api_nav_agent",
+                [AIMessage(content="current_output: ok\n##TERMINATE TASK##") for _ in range(2)],
+            ),
+        }
+        hercules._graph = hercules._build_graph()
+
+        result = await hercules.process_command("root task")
+
+        assert result is not None
+        assert [type(message).__name__ for message in result.messages] == [
+            "SystemMessage",
+            "HumanMessage",
+            "AIMessage",
+            "HumanMessage",
+            "AIMessage",
+            "HumanMessage",
+            "AIMessage",
+        ]
+        # The planner saw the seeded system prompt once, not re-prefixed.
+        assert [type(message).__name__ for message in hercules.agents_map["planner_agent"].llm.calls[0]] == ["SystemMessage", "HumanMessage"]
+        assert result.terminate == "yes"
+        assert [timing["node"] for timing in result.step_timings] == ["planner", "executor", "planner", "executor", "planner"]
+
+    asyncio.run(run())
+
+
+def test_planned_batch_runs_back_to_back_until_an_assertion_or_failure(monkeypatch: Any) -> None:
+    monkeypatch.setitem(get_global_conf()._config, "PLANNER_BATCH_STEPS", "3")
+
+    def batch(*steps: dict[str, Any]) -> AIMessage:
+        first = steps[0]
+        return AIMessage(content=json.dumps({"next_step": first["step"], "target_helper": "api", "terminate": "no", "next_steps": list(steps)}))
+
+    async def run() -> None:
+        planner_responses = [
+            batch(
+                {"step": "create the user", "target_helper": "api"},
+                {"step": "fetch the user", "target_helper": "api"},
+                {"step": "check the user", "target_helper": "api", "is_assert": True},
+                {"step": "delete the user", "target_helper": "api"},
+            ),
+            batch({"step": "delete the user", "target_helper": "api"}, {"step": "fetch the deleted user", "target_helper": "api"}),
+            AIMessage(content=json.dumps({"next_step": "", "target_helper": "Not_Applicable", "terminate": "yes", "is_passed": False, "final_response": "delete failed"})),
+        ]
+        hercules = _hercules()
+        hercules.agents_map = {
+            "planner_agent": SimpleNamespace(system_message="planner system", llm=FakeLLM(planner_responses), on_planner_message=lambda _content: None),
+            "api_nav_agent": FakeAgent(
+                "api_nav_agent",
+                [AIMessage(content=f"current_output: {name} ok\n##TERMINATE TASK##") for name in ("created", "fetched", "checked")]
+                + [AIMessage(content="[ERROR] delete returned 500")],
+            ),
+        }
+        hercules._graph = hercules._build_graph()
+
+        result = await hercules.process_command("root task")
+
+        assert result is not None
+        assert len(hercules.agents_map["planner_agent"].llm.calls) == 3
+        # The assertion ends the first batch before "delete the user"; the failed delete drops the rest of the second.
+        assert [timing["node"] for timing in result.step_timings] == ["planner", "executor", "executor", "executor", "planner", "executor", "planner"]
+        nav_tasks = [call[1].content for call in hercules.agents_map["api_nav_agent"].llm.calls]
+        assert [task.split("\n")[0] for task in nav_tasks] == ["create the user", "fetch the user", "check the user", "delete the user"]
+        helper_messages = [message.content for message in result.messages if isinstance(message, HumanMessage)][1:]
+        assert len(helper_messages) == 4
+
+    asyncio.run(run())
+
+
+def test_planner_batch_is_ignored_when_batching_is_off(monkeypatch: Any) -> None:
+    monkeypatch.setitem(get_global_conf()._config, "PLANNER_BATCH_STEPS", "1")
+    parsed = {"next_steps": [{"step": "a", "target_helper": "api"}, {"step": "b", "target_helper": "api"}]}
+
+    assert SimpleHercules._planned_batch(parsed, "a", "api") == ("a", "api", [])
+
+    monkeypatch.setitem(get_global_conf()._config, "PLANNER_BATCH_STEPS", "5")
+
+    assert SimpleHercules._planned_batch(parsed, "", "browser") == ("a", "api", [{"step": "b", "target_helper": "api", "is_assert": False}])
+
+
+class _LogState(TypedDict):
+    messages: Annotated[list, AppendLog]
+    turns: int
+
+
+def test_append_log_history_survives_a_checkpoint_round_trip() -> None:
+    def speak(state: _LogState) -> dict[str, Any]:
+        return {
+            "messages": [f"turn {state.get('turns', 0)}"],
+            "turns": state.get("turns", 0) + 1,
+        }
+
+    def route(state: _LogState) -> str:
+        return "speak" if state["turns"] % 2 else END
+
+    graph = StateGraph(_LogState)
+    graph.add_node("speak", speak)
+    graph.set_entry_point("speak")
+    graph.add_conditional_edges("speak", route)
+    saver = MemorySaver()
+    config = {"configurable": {"thread_id": "scenario"}}
+
+    graph.compile(checkpointer=saver).invoke({"messages": ["task"], "turns": 0}, config)
+    # A freshly compiled graph restores the channel from the checkpoint and keeps appending.
+    resumed = graph.compile(checkpointer=saver).invoke(
+        {"messages": ["follow-up"]}, config
+    )
+
+    assert resumed["messages"] == [
+        "task",
+        "turn 0",
+        "turn 1",
+        "follow-up",
+        "turn 2",
+        "turn 3",
+    ]
+    assert (
+        graph.compile(checkpointer=saver).get_state(config).values["messages"]
+        == resumed["messages"]
+    )
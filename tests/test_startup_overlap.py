@@ -0,0 +1,132 @@
+import asyncio
+import time
+from typing import Any
+
+from testzeus_hercules.core import runner as runner_module
+from testzeus_hercules.core.runner import BaseRunner
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils import llm_helper
+
+PHASE_SECONDS = 0.2
+
+
+class FakeConfigManager:
+    def initialize(self) -> None:
+        pass
+
+    def get_agent_config(self, name: str) -> dict[str, Any]:
+        return {"name": name}
+
+
+class FakeBrowserManager:
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    async def async_initialize(self) -> None:
+        await asyncio.sleep(PHASE_SECONDS)
+
+
+class FakeEngine:
+    def __init__(self) -> None:
+        self.mcp_task: Any = None
+
+    async def warm_up_llm_connections(self) -> None:
+        await asyncio.sleep(PHASE_SECONDS)
+
+    async def connect_mcp_servers(self) -> None:
+        self.mcp_task = asyncio.current_task()
+        await asyncio.sleep(PHASE_SECONDS)
+
+
+def test_initialize_overlaps_browser_launch_with_agent_setup(monkeypatch: Any) -> None:
+    engine = FakeEngine()
+
+    async def create(*args: Any, **kwargs: Any) -> FakeEngine:
+        await asyncio.sleep(PHASE_SECONDS)
+        return engine
+
+    monkeypatch.setattr(runner_module.AgentsLLMConfigManager, "get_instance", staticmethod(FakeConfigManager))
+    monkeypatch.setattr(runner_module, "PlaywrightManager", FakeBrowserManager)
+    monkeypatch.setattr(SimpleHercules, "create", staticmethod(create))
+
+    async def run() -> None:
+        runner = BaseRunner(stake_id="startup")
+        started = time.perf_counter()
+        await runner.initialize()
+        elapsed = time.perf_counter() - started
+
+        timings = runner.startup_timings
+        assert set(timings) == {"llm_config", "browser", "agents", "llm_warmup", "mcp", "total"}
+        # agents -> mcp run back to back while the browser and warm-up overlap them.
+        assert elapsed < 3 * PHASE_SECONDS
+        assert timings["total"] < sum(timings[phase] for phase in ("browser", "agents", "llm_warmup", "mcp"))
+        assert engine.mcp_task is asyncio.current_task()
+
+    asyncio.run(run())
+
+
+def test_failed_agent_setup_cancels_browser_launch(monkeypatch: Any) -> None:
+    launched: list[bool] = []
+
+    class SlowBrowserManager(FakeBrowserManager):
+        async def async_initialize(self) -> None:
+            await asyncio.sleep(10)
+            launched.append(True)
+
+    async def create(*args: Any, **kwargs: Any) -> FakeEngine:
+        raise RuntimeError("bad model config")
+
+    monkeypatch.setattr(runner_module.AgentsLLMConfigManager, "get_instance", staticmethod(FakeConfigManager))
+    monkeypatch.setattr(runner_module, "PlaywrightManager", SlowBrowserManager)
+    monkeypatch.setattr(SimpleHercules, "create", staticmethod(create))
+
+    async def run() -> None:
+        runner = BaseRunner(stake_id="startup")
+        try:
+            await runner.initialize()
+        except RuntimeError as e:
+            assert str(e) == "bad model config"
+        else:
+            raise AssertionError("initialize should fail")
+        assert not launched
+        assert "total" in runner.startup_timings
+
+    asyncio.run(run())
+
+
+class FakeModels:
+    def __init__(self, calls: list[str], endpoint: str) -> None:
+        self.calls = calls
+        self.endpoint = endpoint
+
+    async def list(self) -> None:
+        self.calls.append(self.endpoint)
+        raise ConnectionError("warm-up errors are ignored")
+
+
+class FakeClient:
+    def __init__(self, calls: list[str], endpoint: str) -> None:
+        self.base_url = endpoint
+        self.models = FakeModels(calls, endpoint)
+
+    def with_options(self, **options: Any) -> "FakeClient":
+        return self
+
+
+class FakeLLM:
+    def __init__(self, calls: list[str], endpoint: str) -> None:
+        self.root_async_client = FakeClient(calls, endpoint)
+
+
+def test_warm_up_hits_each_endpoint_once_per_process(monkeypatch: Any) -> None:
+    monkeypatch.setattr(llm_helper, "_warmed_llm_endpoints", set())
+    calls: list[str] = []
+    llms = [FakeLLM(calls, "https://a.example/v1"), FakeLLM(calls, "https://a.example/v1"), FakeLLM(calls, "https://b.example/v1"), None]
+
+    assert asyncio.run(llm_helper.warm_up_llm_connections(llms)) == ["https://a.example/v1", "https://b.example/v1"]
+    assert asyncio.run(llm_helper.warm_up_llm_connections(llms)) == []
+    assert sorted(calls) == ["https://a.example/v1", "https://b.example/v1"]
+
+    monkeypatch.setenv("LLM_WARMUP_TIMEOUT", "0")
+    monkeypatch.setattr(llm_helper, "_warmed_llm_endpoints", set())
+    assert asyncio.run(llm_helper.warm_up_llm_connections(llms)) == []
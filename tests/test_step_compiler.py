@@ -0,0 +1,144 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from langchain_core.messages import AIMessage
+from tests.conftest import FakeLLM
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.core.step_compiler import (
+    StepContext,
+    StepPatternRegistry,
+    StepResult,
+    run_leading_steps,
+    scenario_lines,
+    step_patterns,
+)
+
+SCENARIO = (
+    "Feature: Shop ;next; Scenario: Checkout ;next; Given I open https://shop.test/ ;next; "
+    'And I wait 2 seconds ;next; When I add the blue shirt to the cart ;next; Then the page title should be "Cart"'
+)
+
+
+class FakeBrowser:
+    def __init__(self, title: str) -> None:
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+        self.page = SimpleNamespace(title=self._title)
+        self._page_title = title
+
+    async def _title(self) -> str:
+        return self._page_title
+
+    async def run_tool(self, agent_name: str, tool_name: str, tool_args: dict[str, Any]) -> str:
+        self.calls.append((agent_name, tool_name, tool_args))
+        return f"{tool_name} ok"
+
+    async def get_page(self) -> Any:
+        return self.page
+
+    def context(self) -> StepContext:
+        return StepContext(run_tool=self.run_tool, get_page=self.get_page)
+
+
+def test_builtin_patterns_match_mechanical_steps_only() -> None:
+    assert step_patterns.match("Given the user navigates to 'https://shop.test/login'").params == {"url": "https://shop.test/login"}
+    assert step_patterns.match("When I wait for 1.5 seconds").params == {"seconds": "1.5"}
+    assert step_patterns.match('Then the page title should contain "Cart"').pattern.name == "page_title"
+    assert step_patterns.match("When I open the login page") is None
+    assert step_patterns.match("Then the page title should look nice") is None
+
+    lines = scenario_lines("Given I open https://shop.test/ ;next; | col | ;next; When I wait 1 second")
+    assert step_patterns.compile(lines, 0) is None
+    assert step_patterns.compile(lines, 2) is not None
+
+
+def test_later_patterns_take_precedence_and_placeholders_capture() -> None:
+    registry = StepPatternRegistry()
+
+    @registry.register(r"I open {target}", name="generic")
+    async def generic(context: StepContext, target: str) -> StepResult:
+        return StepResult(passed=True, message=target)
+
+    @registry.register(r"I open the {name} page", name="named_page")
+    async def named_page(context: StepContext, name: str) -> StepResult:
+        return StepResult(passed=True, message=name)
+
+    assert registry.match("Given I open the login page").pattern.name == "named_page"
+    assert registry.match("Given I open https://shop.test/").params == {"target": "https://shop.test/"}
+
+
+def test_leading_steps_run_until_the_first_unmatched_step() -> None:
+    browser = FakeBrowser(title="Cart")
+
+    run = asyncio.run(run_leading_steps(SCENARIO, browser.context()))
+
+    assert browser.calls == [
+        ("browser_nav_agent", "open_url", {"url": "https://shop.test/"}),
+        ("time_keeper_nav_agent", "wait_for_duration", {"duration": 2.0}),
+    ]
+    assert [step.pattern.name for step, _ in run.executed] == ["open_url", "wait"]
+    assert run.remaining_command == ("Feature: Shop ;next; Scenario: Checkout ;next; When I add the blue shirt to the cart ;next; " 'Then the page title should be "Cart"')
+    assert [(timing["node"], timing["turn"], timing["pattern"]) for timing in run.timings] == [
+        ("compiled_step", 1, "open_url"),
+        ("compiled_step", 2, "wait"),
+    ]
+    assert not run.finished
+
+
+def test_failed_action_is_left_for_the_planner_and_failed_assertion_ends_the_run() -> None:
+    class FailingBrowser(FakeBrowser):
+        async def run_tool(self, agent_name: str, tool_name: str, tool_args: dict[str, Any]) -> str:
+            return "Timeout error opening URL: https://shop.test/"
+
+    failed_action = asyncio.run(run_leading_steps("Given I open https://shop.test/ ;next; Then I wait 1 second", FailingBrowser("Cart").context()))
+
+    assert failed_action.executed == []
+    assert failed_action.remaining_command == "Given I open https://shop.test/ ;next; Then I wait 1 second"
+    assert failed_action.timings[0]["passed"] is False
+    assert not failed_action.finished
+
+    failed_assert = asyncio.run(run_leading_steps('Given I open https://shop.test/ ;next; Then the page title should be "Cart"', FakeBrowser("Home").context()))
+
+    assert failed_assert.finished
+    assert failed_assert.failed_assertion[1].message == "Page title 'Home' equals 'Cart': but it does not."
+
+
+def _engine(browser: FakeBrowser, planner_responses: list[AIMessage]) -> SimpleHercules:
+    hercules = SimpleHercules(stake_id="test")
+    hercules.agents_map = {
+        "planner_agent": SimpleNamespace(system_message="planner system", llm=FakeLLM(planner_responses), on_planner_message=lambda _content: None),
+    }
+    hercules._graph = hercules._build_graph()
+    hercules._run_registered_tool = browser.run_tool  # type: ignore[method-assign]
+    hercules._get_live_page = browser.get_page  # type: ignore[method-assign]
+
+    async def current_url() -> str:
+        return "https://shop.test/"
+
+    hercules._get_live_current_url = current_url  # type: ignore[method-assign]
+    return hercules
+
+
+def test_fully_compiled_scenario_skips_the_planner() -> None:
+    hercules = _engine(FakeBrowser(title="Cart"), [])
+
+    result = asyncio.run(hercules.process_command('Scenario: Cart ;next; Given I open https://shop.test/cart ;next; Then the page title should be "Cart"'))
+
+    summary = json.loads(result.summary)
+    assert (summary["terminate"], summary["is_passed"], summary["is_assert"]) == ("yes", True, True)
+    assert [timing["node"] for timing in result.step_timings] == ["compiled_step", "compiled_step"]
+    assert hercules.agents_map["planner_agent"].llm.calls == []
+
+
+def test_planner_gets_the_remaining_steps_after_the_compiled_ones() -> None:
+    final = {"next_step": "", "target_helper": "Not_Applicable", "terminate": "yes", "is_assert": True, "is_passed": True, "final_response": "done"}
+    hercules = _engine(FakeBrowser(title="Cart"), [AIMessage(content=json.dumps(final))])
+
+    result = asyncio.run(hercules.process_command(SCENARIO))
+
+    planner_task = hercules.agents_map["planner_agent"].llm.calls[0][1].content
+    assert planner_task.startswith("Feature: Shop ;next; Scenario: Checkout ;next; When I add the blue shirt")
+    assert "- Given I open https://shop.test/: open_url ok" in planner_task
+    assert planner_task.endswith("Current Page: https://shop.test/")
+    assert [timing["node"] for timing in result.step_timings] == ["compiled_step", "compiled_step", "planner"]
@@ -0,0 +1,207 @@
+import asyncio
+from typing import Any
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+from tests.conftest import FakeAgent, FakeLLM
+from testzeus_hercules.core.simple_hercules import SimpleHercules
+from testzeus_hercules.utils.step_macros import (
+    MacroCall,
+    MacroReplay,
+    StepMacro,
+    StepMacroRecorder,
+    open_step_macro_store,
+    replay_step_macro,
+    url_pattern,
+)
+
+
+def _fingerprint(text: str) -> dict[str, str]:
+    return {"tag": "button", "type": "", "role": "", "id": "", "name": "", "label": "", "placeholder": "", "text": text}
+
+
+class FakePage:
+    """Answers the fingerprint scripts from a map of md id to element fingerprint."""
+
+    url = "https://shop.test/login?session=1"
+
+    def __init__(self, elements: dict[str, dict[str, str]]) -> None:
+        self.elements = elements
+
+    async def title(self) -> str:
+        return "Shop"
+
+    async def evaluate(self, script: str, selector: str | None = None) -> Any:
+        if selector is None:
+            return [{"md": md, "fingerprint": fingerprint} for md, fingerprint in self.elements.items()]
+        return self.elements.get(selector.split("'")[1])
+
+
+def test_url_pattern_drops_query_fragment_and_ids() -> None:
+    assert url_pattern("https://shop.test/orders/1234/items/9f8e7d6c5b4a?tab=2#top") == "https://shop.test/orders/*/items/*"
+    assert url_pattern("https://shop.test/cart") == "https://shop.test/cart"
+
+
+def test_recorder_stores_action_calls_and_is_invalidated_by_reads(tmp_path: Any) -> None:
+    page = FakePage({"12": _fingerprint("Login")})
+
+    async def record(tool_names: list[str]) -> StepMacroRecorder:
+        recorder = StepMacroRecorder(page)
+        for name in tool_names:
+            call = await recorder.before_call(name, {"selector": "[md='12']"} if name == "click" else {})
+            recorder.after_call(call, "Clicked" if name != "hover" else "[ERROR] Unable to hover")
+        return recorder
+
+    recorder = asyncio.run(record(["get_interactive_elements", "hover", "click"]))
+    macro = recorder.macro("browser_nav_agent", "click login", "https://shop.test/login?next=/")
+
+    assert [call.name for call in macro.calls] == ["get_interactive_elements", "click"]
+    assert macro.calls[1].fingerprints == {"selector": _fingerprint("Login")}
+    assert asyncio.run(record(["click", "get_page_text"])).macro("browser_nav_agent", "click login", "https://shop.test/login") is None
+
+    store = open_step_macro_store("auto", str(tmp_path / "macros.sqlite"))
+    asyncio.run(store.put(macro))
+    loaded = asyncio.run(store.get("browser_nav_agent", "click login", "https://shop.test/login"))
+
+    assert loaded == macro
+    assert asyncio.run(store.get("browser_nav_agent", "click login", "https://shop.test/signup")) is None
+
+
+def test_replay_retargets_moved_elements_and_stops_on_divergence() -> None:
+    macro = StepMacro(
+        agent_name="browser_nav_agent",
+        step_signature="fill the form",
+        url_pattern="https://shop.test/form",
+        calls=[
+            MacroCall("bulk_enter_text", {"entries": [{"selector": "5", "text": "ada"}]}, {"entries.0.selector": _fingerprint("Name")}),
+            MacroCall("click", {"selector": "[md='7']"}, {"selector": _fingerprint("Submit")}),
+        ],
+    )
+    executed: list[tuple[str, dict[str, Any]]] = []
+
+    async def run_call(name: str, args: dict[str, Any]) -> str:
+        executed.append((name, args))
+        return "done"
+
+    def replay(elements: dict[str, dict[str, str]]) -> MacroReplay:
+        page = FakePage(elements)
+
+        async def get_page() -> FakePage:
+            return page
+
+        return asyncio.run(replay_step_macro(macro, get_page, run_call))
+
+    replayed = replay({"5": _fingerprint("Name"), "8": _fingerprint("Submit"), "7": _fingerprint("Cancel")})
+
+    assert replayed.completed
+    assert replayed.report() == ('1. bulk_enter_text({"entries": [{"selector": "5", "text": "ada"}]}) -> done\n' '2. click({"selector": "[md=\'8\']"}) -> done')
+    assert executed == [
+        ("bulk_enter_text", {"entries": [{"selector": "5", "text": "ada"}]}),
+        ("click", {"selector": "[md='8']"}),
+    ]
+    assert macro.calls[1].args == {"selector": "[md='7']"}
+
+    executed.clear()
+    diverged = replay({"5": _fingerprint("Name"), "7": _fingerprint("Cancel")})
+
+    assert not diverged.completed and diverged.acted
+    assert diverged.stopped == "the button 'Submit' that click targets is no longer on the page"
+    assert [name for name, _ in executed] == ["bulk_enter_text"]
+
+
+def _click_step_engine(tmp_path: Any, page: FakePage, llm: FakeLLM, clicks: list[str]) -> SimpleHercules:
+    async def click(selector: str) -> str:
+        clicks.append(selector)
+        return f"Clicked {selector}"
+
+    hercules = SimpleHercules(stake_id="test")
+    hercules.agents_map = {"browser_nav_agent": FakeAgent(llm, [StructuredTool.from_function(coroutine=click, name="click", description="click")])}
+    hercules._step_macros = open_step_macro_store("auto", str(tmp_path / "macros.sqlite"))
+
+    async def get_live_page() -> FakePage:
+        return page
+
+    async def get_live_current_url() -> str:
+        return page.url
+
+    hercules._get_live_page = get_live_page  # type: ignore[method-assign]
+    hercules._get_live_current_url = get_live_current_url  # type: ignore[method-assign]
+    return hercules
+
+
+def _click(md: str) -> AIMessage:
+    return AIMessage(content="", tool_calls=[{"name": "click", "args": {"selector": f"[md='{md}']"}, "id": f"click_{md}"}])
+
+
+def test_executor_learns_a_step_and_replays_it_without_the_llm(tmp_path: Any) -> None:
+    clicks: list[str] = []
+    llm = FakeLLM([_click("12")], final="Clicked login ##TERMINATE TASK##")
+    page = FakePage({"12": _fingerprint("Login")})
+    hercules = _click_step_engine(tmp_path, page, llm, clicks)
+    state: Any = {"next_step": "Click  Login", "target_helper": "browser"}
+
+    first = asyncio.run(hercules._executor_node(state))
+    page.elements = {"30": _fingerprint("Login")}
+    second = asyncio.run(hercules._executor_node(state))
+
+    assert len(llm.calls) == 2
+    assert clicks == ["[md='12']", "[md='30']"]
+    assert first["step_token_log"][0]["macro_replayed"] is False
+    assert second["step_token_log"][0]["macro_replayed"] is True
+    # The response reports what the replayed calls returned, not the recorded run's answer.
+    assert second["last_helper_response"] == (
+        "Replayed the recorded tool calls of this step:\n"
+        "1. click({\"selector\": \"[md='30']\"}) -> Clicked [md='30']\n"
+        "Current page: https://shop.test/login?session=1 (title: 'Shop')\n"
+        "##TERMINATE TASK##"
+    )
+    assert second["completed_step_signatures"] == ["click login"]
+
+    page.elements = {}
+    llm.responses = [_click("12")]
+    third = asyncio.run(hercules._executor_node(state))
+
+    assert third["step_token_log"][0]["macro_replayed"] is False
+    assert len(llm.calls) == 4
+
+
+def test_executor_hands_a_diverged_replay_to_the_llm_with_the_calls_made(tmp_path: Any) -> None:
+    clicks: list[str] = []
+    llm = FakeLLM([_click("12"), _click("14")], final="Confirmed ##TERMINATE TASK##")
+    page = FakePage({"12": _fingerprint("Login"), "14": _fingerprint("Confirm")})
+    hercules = _click_step_engine(tmp_path, page, llm, clicks)
+    state: Any = {"next_step": "Log in and confirm", "target_helper": "browser"}
+
+    asyncio.run(hercules._executor_node(state))
+    page.elements = {"12": _fingerprint("Login")}
+    second = asyncio.run(hercules._executor_node(state))
+
+    assert clicks == ["[md='12']", "[md='14']", "[md='12']"]
+    assert second["step_token_log"][0]["macro_replayed"] is False
+    task = llm.calls[-1][1].content
+    assert "stopped early: the button 'Confirm' that click targets is no longer on the page" in task
+    assert "1. click({\"selector\": \"[md='12']\"}) -> Clicked [md='12']" in task
+    # The partial run is not recorded over the complete macro.
+    macro = asyncio.run(hercules._step_macros.get("browser_nav_agent", "log in and confirm", page.url))
+    assert [call.args["selector"] for call in macro.calls] == ["[md='12']", "[md='14']"]
+
+
+def test_executor_does_not_replay_a_macro_learned_with_other_test_data(tmp_path: Any) -> None:
+    clicks: list[str] = []
+    llm = FakeLLM([_click("12")], final="Entered the user ##TERMINATE TASK##")
+    page = FakePage({"12": _fingerprint("Login")})
+    hercules = _click_step_engine(tmp_path, page, llm, clicks)
+    test_data = ["username: ada"]
+    hercules.agents_map["browser_nav_agent"].get_ltm = lambda: test_data[0]
+    state: Any = {"next_step": "Log in as the test user", "target_helper": "browser"}
+
+    asyncio.run(hercules._executor_node(state))
+    test_data[0] = "username: grace"
+    llm.responses = [_click("12")]
+    second = asyncio.run(hercules._executor_node(state))
+    test_data[0] = "username: ada"
+    third = asyncio.run(hercules._executor_node(state))
+
+    assert second["step_token_log"][0]["macro_replayed"] is False
+    assert third["step_token_log"][0]["macro_replayed"] is True
+    assert len(llm.calls) == 4
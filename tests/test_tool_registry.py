@@ -0,0 +1,71 @@
+import importlib
+import sys
+from typing import Any
+
+BROWSER_TOOLS = """
+from testzeus_hercules.core.tools.tool_registry import tool
+
+@tool(agent_names=["browser_nav_agent"], description="Opens a page.", name="open_page")
+def open_page(url: str) -> str:
+    return url
+
+def helper() -> str:
+    return "helper"
+"""
+
+SQL_TOOLS = """
+from testzeus_hercules.core.tools.tool_registry import tool
+
+@tool(agent_names=["sql_nav_agent"], description="Runs a query.")
+def run_query(query: str) -> str:
+    return query
+"""
+
+DYNAMIC_TOOLS = """
+from testzeus_hercules.core.tools.tool_registry import tool
+
+for agent in ["sec_nav_agent"]:
+    tool(agent_names=[agent], description="Scans.", name="scan")(lambda: "scan")
+"""
+
+
+def _tool_package(tmp_path: Any, monkeypatch: Any) -> tuple[Any, str]:
+    package = tmp_path / "lazy_tools_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "browser_tools.py").write_text(BROWSER_TOOLS)
+    (package / "sql_tools.py").write_text(SQL_TOOLS)
+    (package / "dynamic_tools.py").write_text(DYNAMIC_TOOLS)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Resolved at call time in case another test reloaded the config and tool modules.
+    tool_registry_module = importlib.import_module("testzeus_hercules.core.tools.tool_registry")
+    registry = tool_registry_module.LazyToolRegistry()
+    # The @tool decorator registers into the module-level registry.
+    monkeypatch.setattr(tool_registry_module, "tool_registry", registry)
+    registry.register_package("lazy_tools_pkg", str(package))
+    return registry, "lazy_tools_pkg"
+
+
+def test_metadata_is_available_without_importing_tool_modules(tmp_path: Any, monkeypatch: Any) -> None:
+    registry, package = _tool_package(tmp_path, monkeypatch)
+
+    assert registry.describe("browser_nav_agent") == [{"module": f"{package}.browser_tools", "name": "open_page", "description": "Opens a page."}]
+    assert registry.describe("sql_nav_agent") == [{"module": f"{package}.sql_tools", "name": None, "description": "Runs a query."}]
+    assert registry.find_export(package, "helper") == f"{package}.browser_tools"
+    assert not any(name.startswith(f"{package}.") for name in sys.modules)
+
+
+def test_lookup_imports_only_the_modules_providing_the_agents_tools(tmp_path: Any, monkeypatch: Any) -> None:
+    registry, package = _tool_package(tmp_path, monkeypatch)
+    for module in ("browser_tools", "sql_tools", "dynamic_tools"):
+        monkeypatch.delitem(sys.modules, f"{package}.{module}", raising=False)
+
+    assert [entry["name"] for entry in registry.get("sql_nav_agent", [])] == ["run_query"]
+    assert f"{package}.sql_tools" in sys.modules
+    assert f"{package}.browser_tools" not in sys.modules
+    # Modules whose agent names are not literals are imported on the first lookup.
+    assert f"{package}.dynamic_tools" in sys.modules
+
+    assert [entry["name"] for entry in registry["sec_nav_agent"]] == ["scan"]
+    assert [entry["name"] for entry in registry.get("browser_nav_agent", [])] == ["open_page"]
+    assert registry.get("unknown_agent") is None
@@ -1,34 +1,289 @@
 import asyncio
 import json
 import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from junit2htmlreport.runner import run as prepare_html
 from testzeus_hercules.config import get_global_conf, set_global_conf
-from testzeus_hercules.core.runner import SingleCommandInputRunner
-from testzeus_hercules.telemetry import EventData, EventType, add_event
-from testzeus_hercules.utils.gherkin_generator import (
-    generate_gherkin_from_description,
-    print_feature_block,
+from testzeus_hercules.core.browser_pool import BrowserPool
+from testzeus_hercules.core.bulk_runner import (
+    bulk_folder_config,
+    discover_test_folders,
+    plan_bulk_shard,
+    run_bulk_in_processes,
 )
+from testzeus_hercules.core.playwright_manager import PlaywrightManager
+from testzeus_hercules.core.runner import SingleCommandInputRunner
+from testzeus_hercules.telemetry import EventData, EventType, add_event, init_telemetry
 from testzeus_hercules.utils.gherkin_helper import (
     process_feature_file,
     serialize_feature_file,
 )
 from testzeus_hercules.utils.junit_helper import JUnitXMLGenerator, build_junit_xml
-from testzeus_hercules.utils.litellm_helper import get_litellm_chat_model
-from testzeus_hercules.utils.llm_helper import parse_agent_response
 from testzeus_hercules.utils.logger import logger
-from testzeus_hercules.utils.test_builder import run_guided_mode
+from testzeus_hercules.utils.mcp_help import MCPHelper
+from testzeus_hercules.utils.results_cache import ResultsCache
+from testzeus_hercules.utils.scenario_history import ScenarioHistory, is_failed_result
+from testzeus_hercules.utils.shard_helper import (
+    load_scenario_durations,
+    select_shard_scenarios,
+)
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def _stake_id_for(scenario: str) -> str:
+    stake_id = scenario.replace(" ", "_").replace(":", "_").replace("/", "_").replace("\\", "_").replace(".", "_")
+    # Daemon jobs may run the same scenario concurrently; keep their browsers apart.
+    run_id = get_global_conf().get_run_id()
+    return f"{run_id}_{stake_id}" if run_id else stake_id
+
+
+def _notify(on_progress: Optional[ProgressCallback], event: str, **fields: Any) -> None:
+    if on_progress is not None:
+        on_progress({"event": event, **fields})
+
+
+async def run_scenario(
+    feat: Dict[str, str],
+    dont_close_browser: bool = False,
+    close_shared_resources: bool = True,
+) -> str:
+    """Run one split scenario end to end and return the path of its JUnit XML fragment."""
+    file_path = feat["output_file"]
+    feature_name = feat["feature"]
+    scenario = feat["scenario"]
+    stake_id = _stake_id_for(scenario)
+
+    get_global_conf().set_default_test_id(stake_id)
+
+    cmd = await serialize_feature_file(file_path)
+    logger.info(f"Running testcase: {stake_id}")
+    logger.info(f"testcase details: {cmd}")
+
+    runner = SingleCommandInputRunner(
+        stake_id=stake_id,
+        command=cmd,
+        dont_terminate_browser_after_run=dont_close_browser,
+        close_shared_resources=close_shared_resources,
+    )
+    await runner.start()
+
+    runner_result = {}
+    cost_metrics = {}
+
+    if runner.result and getattr(runner.result, "cost", None):
+        cost_metrics = runner.result.cost
+    elif get_global_conf().get_token_verbose():
+        logger.warning("Token verbose enabled, but LangGraph result did not include cost metrics.")
+
+    execution_time = runner.execution_time
+
+    if runner.result:
+        summary = runner.result.summary
+        if summary:
+            from testzeus_hercules.utils.llm_helper import parse_agent_response
+
+            runner_result = parse_agent_response(summary)
+            if not runner_result:
+                logger.warning("Could not parse planner result from test output; marking as incomplete.")
+        elif getattr(runner.result, "terminate", "no") == "yes":
+            runner_result = {
+                "terminate": "yes",
+                "is_passed": False,
+                "final_response": "Test ended without planner output.",
+            }
+        else:
+            # runner.result exists but produced neither a summary nor a clean
+            # termination signal — this is an unexpected runner state, not a
+            # controlled failure. Mark it failed explicitly so it surfaces in
+            # CI rather than drifting through as an empty result.
+            logger.error(
+                "runner.result present but has no summary and did not terminate " "cleanly for scenario: %s. Marking as failed.",
+                scenario,
+            )
+            runner_result = {
+                "terminate": "yes",
+                "is_passed": False,
+                "final_response": "Unexpected runner state: no summary, no clean termination.",
+            }
+
+    logger.info(f"Run completed for testcase: {scenario}")
+    if cost_metrics:
+        logger.info(f"Test run cost is : {cost_metrics}")
+
+    return await build_junit_xml(
+        runner_result,
+        execution_time,
+        cost_metrics,
+        feature_name,
+        scenario,
+        feature_file_path=file_path,
+        output_file_path="",
+        proofs_path=get_global_conf().get_proof_path(runner.browser_manager.stake_id),
+        proofs_screenshot_path=runner.browser_manager._screenshots_dir,
+        proofs_video_path=runner.browser_manager.get_latest_video_path(),
+        network_logs_path=runner.browser_manager.request_response_log_file,
+        logs_path=get_global_conf().get_source_log_folder_path(stake_id),
+        planner_thoughts_path=get_global_conf().get_source_log_folder_path(stake_id) + "/agent_inner_thoughts.json",
+    )
+
+
+async def _crashed_scenario_result(feat: Dict[str, str], error: BaseException) -> str:
+    """Record a scenario that raised inside a parallel worker as a failed test case."""
+    stake_id = _stake_id_for(feat["scenario"])
+    return await build_junit_xml(
+        {
+            "terminate": "yes",
+            "is_assert": True,
+            "is_passed": False,
+            "assert_summary": f"Scenario crashed before producing a result: {error}",
+            "final_response": f"Scenario crashed before producing a result: {error}",
+        },
+        0.0,
+        {},
+        feat["feature"],
+        feat["scenario"],
+        feature_file_path=feat["output_file"],
+        output_file_path="",
+        logs_path=get_global_conf().get_source_log_folder_path(stake_id),
+    )
+
+
+async def _skipped_scenario_result(feat: Dict[str, str], reason: str) -> str:
+    """Record a scenario that was not started as a skipped test case."""
+    return await build_junit_xml(
+        {"terminate": "no", "is_skipped": True, "final_response": reason},
+        0.0,
+        {},
+        feat["feature"],
+        feat["scenario"],
+        feature_file_path=feat["output_file"],
+        output_file_path="",
+    )
+
+
+class FailFast:
+    """Counts failed scenarios and tells the scheduler when to stop starting new ones."""
+
+    def __init__(self, max_failures: int) -> None:
+        self.max_failures = max_failures
+        self.failures = 0
+
+    @property
+    def tripped(self) -> bool:
+        return self.max_failures > 0 and self.failures >= self.max_failures
+
+    def record(self, result_file: str) -> None:
+        if self.max_failures > 0 and is_failed_result(result_file):
+            self.failures += 1
+
+    async def skip(self, feat: Dict[str, str], on_progress: Optional[ProgressCallback]) -> str:
+        logger.info(f"Skipping scenario after {self.failures} failures (fail-fast): {feat['scenario']}")
+        result_file = await _skipped_scenario_result(feat, f"Not run: fail-fast stopped the run after {self.failures} failed scenarios.")
+        _notify(on_progress, "scenario_finished", scenario=feat["scenario"], result_file=result_file, skipped=True)
+        return result_file
+
+
+async def _run_and_report(
+    feat: Dict[str, str],
+    on_progress: Optional[ProgressCallback],
+    dont_close_browser: bool = False,
+    close_shared_resources: bool = True,
+) -> str:
+    _notify(on_progress, "scenario_started", scenario=feat["scenario"])
+    result_file = await run_scenario(feat, dont_close_browser=dont_close_browser, close_shared_resources=close_shared_resources)
+    _notify(on_progress, "scenario_finished", scenario=feat["scenario"], result_file=result_file)
+    return result_file
+
+
+async def run_scenarios_in_parallel(
+    list_of_feats: List[Dict[str, str]],
+    workers: int,
+    close_shared_resources: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
+    fail_fast: Optional[FailFast] = None,
+) -> List[str]:
+    """
+    Run scenarios on a bounded pool of worker tasks.
+
+    Each scenario gets its own stake_id, browser and proof folder. JUnit fragments
+    are written as scenarios finish and returned in the original scenario order.
+    Once ``fail_fast`` trips, queued scenarios are reported as skipped instead of run.
+    """
+    queue: asyncio.Queue[tuple[int, Dict[str, str]]] = asyncio.Queue()
+    for index, feat in enumerate(list_of_feats):
+        queue.put_nowait((index, feat))
+    results: List[Optional[str]] = [None] * len(list_of_feats)
+
+    async def worker(worker_id: int) -> None:
+        while True:
+            try:
+                index, feat = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if fail_fast is not None and fail_fast.tripped:
+                results[index] = await fail_fast.skip(feat, on_progress)
+                continue
+            logger.info(f"Worker {worker_id} picked scenario: {feat['scenario']}")
+            try:
+                results[index] = await _run_and_report(feat, on_progress, close_shared_resources=False)
+            except Exception as e:
+                logger.exception("Scenario %s crashed in worker %s", feat["scenario"], worker_id)
+                results[index] = await _crashed_scenario_result(feat, e)
+            if fail_fast is not None:
+                fail_fast.record(results[index])
+
+    pool_size = min(workers, len(list_of_feats))
+    logger.info(f"Running {len(list_of_feats)} scenarios on {pool_size} parallel workers")
+    try:
+        await asyncio.gather(*(worker(worker_id) for worker_id in range(pool_size)))
+    finally:
+        if close_shared_resources:
+            PlaywrightManager.close_all_instances()
+            await MCPHelper.destroy()
+
+    return [result for result in results if result is not None]
 
 
-async def sequential_process() -> None:
+def _select_shard(list_of_feats: List[Dict[str, str]], shard: Tuple[int, int], dont_close_browser: bool) -> List[Dict[str, str]]:
+    shard_index, shard_count = shard
+    if dont_close_browser:
+        logger.warning("DONT_CLOSE_BROWSER is set: scenarios share one browser session, so shard 1 runs all of them.")
+        selected = list_of_feats if shard_index == 1 else []
+    else:
+        conf = get_global_conf()
+        durations = load_scenario_durations(conf.get_shard_durations_file(conf.get_project_source_root()), conf.get_input_gherkin_file_path())
+        selected = select_shard_scenarios(list_of_feats, shard, durations)
+    logger.info(f"Shard {shard_index}/{shard_count}: running {len(selected)} of {len(list_of_feats)} scenarios")
+    return selected
+
+
+async def sequential_process(
+    scenarios: Optional[List[str]] = None,
+    close_shared_resources: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
+) -> str:
+    """
+    Run the scenarios of the configured feature file and publish the merged results.
+
+    Args:
+        scenarios: Titles of the scenarios to run. Defaults to every scenario, or to
+            this node's share of them when ``--shard`` is set.
+        close_shared_resources: Whether to tear down process-wide resources (browsers,
+            MCP connections, reused agents, the browser pool) afterwards. The daemon
+            passes False and keeps them warm for the next job.
+        on_progress: Called with an event dict when a scenario starts and finishes.
+
+    Returns:
+        The path of the merged ``<feature>_result.xml``.
+    """
     dont_close_browser = get_global_conf().get_dont_close_browser()
     list_of_feats = await process_feature_file(dont_append_header=dont_close_browser)
     input_gherkin_file_path = get_global_conf().get_input_gherkin_file_path()
     feature_file_name = os.path.basename(input_gherkin_file_path)
 
     result_of_tests = []
-    add_event(EventType.RUN, EventData(detail="Total Runs: " + str(len(list_of_feats))))
 
     if not list_of_feats:
         logger.error(
@@ -37,83 +292,67 @@ async def sequential_process() -> None:
         )
         raise SystemExit(1)
 
-    for feat in list_of_feats:
-        file_path = feat["output_file"]
-        feature_name = feat["feature"]
-        scenario = feat["scenario"]
-        stake_id = scenario.replace(" ", "_").replace(":", "_").replace("/", "_").replace("\\", "_").replace(".", "_")
+    if scenarios is not None:
+        list_of_feats = [feat for feat in list_of_feats if feat["scenario"] in scenarios]
+    elif shard := get_global_conf().get_shard():
+        list_of_feats = _select_shard(list_of_feats, shard, dont_close_browser)
+
+    history = ScenarioHistory.for_current_run()
+    results_cache = None
+    reused_feats: List[Dict[str, str]] = []
+    scenario_order = [feat["scenario"] for feat in list_of_feats]
+    if get_global_conf().should_run_incremental():
+        if dont_close_browser:
+            logger.warning("--incremental is ignored when DONT_CLOSE_BROWSER is set; scenarios share one browser session and must all run.")
+        else:
+            results_cache = ResultsCache(history)
+            list_of_feats, reused_feats = results_cache.partition(list_of_feats)
+            logger.info(f"Incremental run: reusing {len(reused_feats)} unchanged passed scenarios, running {len(list_of_feats)}")
 
-        get_global_conf().set_default_test_id(stake_id)
+    add_event(EventType.RUN, EventData(detail="Total Runs: " + str(len(list_of_feats))))
 
-        cmd = await serialize_feature_file(file_path)
-        logger.info(f"Running testcase: {stake_id}")
-        logger.info(f"testcase details: {cmd}")
+    workers = get_global_conf().get_parallel_scenarios()
+    if workers > 1 and dont_close_browser:
+        logger.warning("--parallel is ignored when DONT_CLOSE_BROWSER is set; scenarios share one browser session and must run in order.")
+        workers = 1
 
-        runner = SingleCommandInputRunner(
-            stake_id=stake_id,
-            command=cmd,
-            dont_terminate_browser_after_run=dont_close_browser,
-        )
-        await runner.start()
-
-        runner_result = {}
-        cost_metrics = {}
-
-        if runner.result and getattr(runner.result, "cost", None):
-            cost_metrics = runner.result.cost
-        elif get_global_conf().get_token_verbose():
-            logger.warning("Token verbose enabled, but LangGraph result did not include cost metrics.")
-
-        execution_time = runner.execution_time
-
-        if runner.result:
-            summary = runner.result.summary
-            if summary:
-                runner_result = parse_agent_response(summary)
-                if not runner_result:
-                    logger.warning("Could not parse planner result from test output; marking as incomplete.")
-            elif getattr(runner.result, "terminate", "no") == "yes":
-                runner_result = {
-                    "terminate": "yes",
-                    "is_passed": False,
-                    "final_response": "Test ended without planner output.",
-                }
-            else:
-                # runner.result exists but produced neither a summary nor a clean
-                # termination signal — this is an unexpected runner state, not a
-                # controlled failure. Mark it failed explicitly so it surfaces in
-                # CI rather than drifting through as an empty result.
-                logger.error(
-                    "runner.result present but has no summary and did not terminate " "cleanly for scenario: %s. Marking as failed.",
-                    scenario,
-                )
-                runner_result = {
-                    "terminate": "yes",
-                    "is_passed": False,
-                    "final_response": "Unexpected runner state: no summary, no clean termination.",
-                }
-
-        logger.info(f"Run completed for testcase: {scenario}")
-        if cost_metrics:
-            logger.info(f"Test run cost is : {cost_metrics}")
-
-        result_of_tests.append(
-            await build_junit_xml(
-                runner_result,
-                execution_time,
-                cost_metrics,
-                feature_name,
-                scenario,
-                feature_file_path=file_path,
-                output_file_path="",
-                proofs_path=get_global_conf().get_proof_path(runner.browser_manager.stake_id),
-                proofs_screenshot_path=runner.browser_manager._screenshots_dir,
-                proofs_video_path=runner.browser_manager.get_latest_video_path(),
-                network_logs_path=runner.browser_manager.request_response_log_file,
-                logs_path=get_global_conf().get_source_log_folder_path(stake_id),
-                planner_thoughts_path=get_global_conf().get_source_log_folder_path(stake_id) + "/agent_inner_thoughts.json",
-            )
-        )
+    if get_global_conf().get_scenario_order() == "failed-first":
+        if dont_close_browser:
+            logger.warning("--scenario-order is ignored when DONT_CLOSE_BROWSER is set; scenarios share one browser session and must run in order.")
+        else:
+            list_of_feats = history.order(list_of_feats, longest_first=workers > 1)
+            logger.info(f"Scenario order (failed first{', longest first' if workers > 1 else ''}): {[feat['scenario'] for feat in list_of_feats]}")
+    fail_fast = FailFast(get_global_conf().get_fail_fast())
+
+    try:
+        if workers > 1 and len(list_of_feats) > 1:
+            result_of_tests = await run_scenarios_in_parallel(list_of_feats, workers, close_shared_resources, on_progress, fail_fast)
+        else:
+            for feat in list_of_feats:
+                if fail_fast.tripped:
+                    result_of_tests.append(await fail_fast.skip(feat, on_progress))
+                    continue
+                result_file = await _run_and_report(feat, on_progress, dont_close_browser, close_shared_resources)
+                fail_fast.record(result_file)
+                result_of_tests.append(result_file)
+    finally:
+        if close_shared_resources:
+            from testzeus_hercules.core.simple_hercules import SimpleHercules
+
+            await SimpleHercules.destroy_engines()
+            await BrowserPool.destroy()
+
+    history.record(result_of_tests, results_cache.fingerprints if results_cache is not None else None)
+    history.save()
+    result_by_scenario = dict(zip((feat["scenario"] for feat in list_of_feats), result_of_tests))
+    if results_cache is not None:
+        for feat in reused_feats:
+            reused_result = results_cache.write_reused_result(feat, get_global_conf().get_junit_xml_base_path())
+            if reused_result:
+                result_by_scenario[feat["scenario"]] = reused_result
+                _notify(on_progress, "scenario_finished", scenario=feat["scenario"], result_file=reused_result, reused=True)
+    # Keep the merged report in feature file order, whatever order the scenarios ran in.
+    result_of_tests = [result_by_scenario[scenario] for scenario in scenario_order if scenario in result_by_scenario]
 
     final_result_file_name = f"{get_global_conf().get_junit_xml_base_path()}/{feature_file_name}_result.xml"
     await JUnitXMLGenerator.merge_junit_xml(result_of_tests, final_result_file_name)
@@ -122,6 +361,7 @@ async def sequential_process() -> None:
     final_result_html_file_name = f"{get_global_conf().get_junit_xml_base_path()}/{feature_file_name}_result.html"
     prepare_html([final_result_file_name, final_result_html_file_name])
     logger.info(f"Results published in html file: {final_result_html_file_name}")
+    return final_result_file_name
 
 
 def _print_banner() -> None:
@@ -142,6 +382,14 @@ async def a_main() -> None:
     guided_test = cfg.get_guided_test_description()
 
     if cfg.should_run_guided() or guided_test:
+        # The guided and dry-run modes need a chat model; import it only for them.
+        from testzeus_hercules.utils.gherkin_generator import (
+            generate_gherkin_from_description,
+            print_feature_block,
+        )
+        from testzeus_hercules.utils.litellm_helper import get_litellm_chat_model
+        from testzeus_hercules.utils.test_builder import run_guided_mode
+
         if cfg.should_dry_run():
             if not guided_test:
                 logger.error("--dry-run requires --test with a description.")
@@ -166,20 +414,26 @@ async def a_main() -> None:
             raise SystemExit(1)
 
         logger.info(f"Bulk execution: Processing tests directory at {tests_dir}")
-        for test_folder in os.listdir(tests_dir):
-            test_dir = os.path.join(tests_dir, test_folder)
-            if os.path.isdir(test_dir):
-                logger.info(f"Processing test folder: {test_folder}")
-                test_dir_name = os.path.basename(test_dir)
-                set_global_conf(
-                    {
-                        "PROJECT_SOURCE_ROOT": test_dir,
-                        "INPUT_GHERKIN_FILE_PATH": os.path.join(test_dir, "input", f"{test_dir_name}.feature"),
-                        "TEST_DATA_PATH": os.path.join(test_dir, "test_data"),
-                    },
-                    override=True,
-                )
-                await sequential_process()
+        shard = get_global_conf().get_shard()
+        shard_plan = None
+        if shard:
+            shard_plan = await plan_bulk_shard(
+                discover_test_folders(tests_dir),
+                shard,
+                keep_folders_together=get_global_conf().get_dont_close_browser(),
+            )
+
+        bulk_workers = get_global_conf().get_bulk_workers()
+        if bulk_workers > 1:
+            await run_bulk_in_processes(tests_dir, bulk_workers, shard_plan=shard_plan)
+            return
+
+        for test_dir in discover_test_folders(tests_dir):
+            if shard_plan is not None and test_dir not in shard_plan:
+                continue
+            logger.info(f"Processing test folder: {os.path.basename(test_dir)}")
+            set_global_conf(bulk_folder_config(test_dir), override=True)
+            await sequential_process(scenarios=shard_plan[test_dir] if shard_plan is not None else None)
         return
 
     logger.info("Single test execution mode")
@@ -187,6 +441,7 @@ async def a_main() -> None:
 
 
 def main() -> None:
+    init_telemetry()
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
@@ -4,7 +4,8 @@ import argparse
 import json
 import os
 import re
-from typing import Any, Dict, List, Literal, Optional, Union
+from contextvars import ContextVar
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -37,6 +38,18 @@ ConfigDict = Dict[str, Any]
 PortkeyConfig = Dict[str, Any]
 PathsDict = Dict[str, str]
 
+# Test id bound to the running asyncio task, so scenarios executing concurrently
+# resolve their own proof, log and temp folders.
+_SCOPED_TEST_ID: ContextVar[Optional[str]] = ContextVar(
+    "hercules_scoped_test_id", default=None
+)
+
+# Config bound to the running asyncio task, so daemon jobs running side by side
+# resolve their own input, output and test data folders.
+_SCOPED_CONF: ContextVar[Optional["BaseConfigManager"]] = ContextVar(
+    "hercules_scoped_conf", default=None
+)
+
 
 class BaseConfigManager:
     """
@@ -169,6 +182,22 @@ class BaseConfigManager:
             "portkey_api_key": "PORTKEY_API_KEY",
             "portkey_strategy": "PORTKEY_STRATEGY",
             "bulk": "EXECUTE_BULK",
+            "parallel": "PARALLEL_SCENARIOS",
+            "bulk_workers": "BULK_WORKERS",
+            "shard": "SHARD",
+            "shard_durations": "SHARD_DURATIONS_FILE",
+            "browser_pool": "BROWSER_POOL_SIZE",
+            "browser_pool_size": "BROWSER_POOL_SIZE",
+            "reuse_agents": "REUSE_AGENTS",
+            "compile_steps": "COMPILE_STEPS",
+            "incremental": "INCREMENTAL",
+            "scenario_order": "SCENARIO_ORDER",
+            "fail_fast": "FAIL_FAST",
+            "planner_batch_steps": "PLANNER_BATCH_STEPS",
+            "llm_cache": "LLM_CACHE_MODE",
+            "llm_cache_path": "LLM_CACHE_PATH",
+            "step_macros": "STEP_MACRO_MODE",
+            "step_macro_path": "STEP_MACRO_PATH",
             "browser": "BROWSER_TYPE",
             "browser_type": "BROWSER_TYPE",
             "browser_channel": "BROWSER_CHANNEL",
@@ -323,6 +352,87 @@ class BaseConfigManager:
             help="Execute tests in bulk from tests directory",
             required=False,
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            help="Number of scenarios to execute concurrently (default: 1).",
+            required=False,
+        )
+        parser.add_argument(
+            "--bulk-workers",
+            type=int,
+            help="Number of worker processes used to run test folders with --bulk (default: 1).",
+            required=False,
+        )
+        parser.add_argument(
+            "--shard",
+            type=str,
+            help="Run only shard i of n (e.g. 2/4); scenarios are split by count, or by duration with --shard-durations.",
+            required=False,
+        )
+        parser.add_argument(
+            "--shard-durations",
+            type=str,
+            help="Scenario history file shared by every shard (e.g. a committed scenario_history.json) whose durations balance the shards; relative paths are resolved against the project folder.",
+            required=False,
+        )
+        parser.add_argument(
+            "--browser-pool",
+            type=int,
+            help="Keep up to N warm browser processes per run and give each scenario a fresh context (default: 0, disabled).",
+            required=False,
+        )
+        parser.add_argument(
+            "--no-agent-reuse",
+            action="store_true",
+            help="Rebuild agents, LLM clients and the agent graph for every scenario instead of reusing them.",
+            required=False,
+        )
+        parser.add_argument(
+            "--no-step-compiler",
+            action="store_true",
+            help="Send every step to the planner instead of running known mechanical steps (open a URL, wait, check the title) directly.",
+            required=False,
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Skip scenarios that passed last time and whose feature file, test data and config are unchanged.",
+            required=False,
+        )
+        parser.add_argument(
+            "--scenario-order",
+            type=str,
+            choices=["file", "failed-first"],
+            help="Order in which scenarios run: feature file order (default) or previously failed first, longest first when running in parallel.",
+            required=False,
+        )
+        parser.add_argument(
+            "--fail-fast",
+            type=int,
+            help="Stop starting new scenarios after K failures; the remaining ones are reported as skipped (default: 0, disabled).",
+            required=False,
+        )
+        parser.add_argument(
+            "--planner-batch-steps",
+            type=int,
+            help="Let the planner return up to K steps at once; they run back to back until one fails or asserts (default: 1, one step per planner call).",
+            required=False,
+        )
+        parser.add_argument(
+            "--llm-cache",
+            type=str,
+            choices=["off", "record", "replay", "auto"],
+            help="LLM response cache: record every response, replay only from the cache (a miss fails), or auto (replay hits, record misses).",
+            required=False,
+        )
+        parser.add_argument(
+            "--step-macros",
+            type=str,
+            choices=["off", "record", "replay", "auto"],
+            help="Learned browser step macros: record the tool calls of succeeded steps, replay recorded steps without the LLM, or auto (both).",
+            required=False,
+        )
         parser.add_argument(
             "--guided",
             action="store_true",
@@ -467,6 +577,32 @@ class BaseConfigManager:
         # Test execution options
         if args.bulk:
             set_cli_value("EXECUTE_BULK", "true")
+        if args.parallel is not None:
+            set_cli_value("PARALLEL_SCENARIOS", args.parallel)
+        if args.bulk_workers is not None:
+            set_cli_value("BULK_WORKERS", args.bulk_workers)
+        if args.shard:
+            set_cli_value("SHARD", args.shard)
+        if args.shard_durations:
+            set_cli_value("SHARD_DURATIONS_FILE", args.shard_durations)
+        if args.browser_pool is not None:
+            set_cli_value("BROWSER_POOL_SIZE", args.browser_pool)
+        if args.no_agent_reuse:
+            set_cli_value("REUSE_AGENTS", "false")
+        if args.no_step_compiler:
+            set_cli_value("COMPILE_STEPS", "false")
+        if args.incremental:
+            set_cli_value("INCREMENTAL", "true")
+        if args.scenario_order:
+            set_cli_value("SCENARIO_ORDER", args.scenario_order)
+        if args.fail_fast is not None:
+            set_cli_value("FAIL_FAST", args.fail_fast)
+        if args.planner_batch_steps is not None:
+            set_cli_value("PLANNER_BATCH_STEPS", args.planner_batch_steps)
+        if args.llm_cache:
+            set_cli_value("LLM_CACHE_MODE", args.llm_cache)
+        if args.step_macros:
+            set_cli_value("STEP_MACRO_MODE", args.step_macros)
         if args.guided:
             set_cli_value("GUIDED_MODE", "true")
         if args.test:
@@ -557,6 +693,22 @@ class BaseConfigManager:
             "GEO_PROVIDER",
             "GEO_API_KEY",
             "EXECUTE_BULK",
+            "PARALLEL_SCENARIOS",
+            "BULK_WORKERS",
+            "SHARD",
+            "SHARD_DURATIONS_FILE",
+            "BROWSER_POOL_SIZE",
+            "BROWSER_POOL_RECYCLE_AFTER",
+            "REUSE_AGENTS",
+            "COMPILE_STEPS",
+            "INCREMENTAL",
+            "SCENARIO_ORDER",
+            "FAIL_FAST",
+            "PLANNER_BATCH_STEPS",
+            "LLM_CACHE_MODE",
+            "LLM_CACHE_PATH",
+            "STEP_MACRO_MODE",
+            "STEP_MACRO_PATH",
             "GUIDED_MODE",
             "GUIDED_TEST_DESCRIPTION",
             "GUIDED_DRY_RUN",
@@ -715,6 +867,22 @@ class BaseConfigManager:
         self._config.setdefault("GEO_API_KEY", None)
         self._config.setdefault("REACTION_DELAY_TIME", "0.1")
         self._config.setdefault("EXECUTE_BULK", "false")
+        self._config.setdefault("PARALLEL_SCENARIOS", "1")
+        self._config.setdefault("BULK_WORKERS", "1")
+        self._config.setdefault("SHARD", None)
+        self._config.setdefault("SHARD_DURATIONS_FILE", None)
+        self._config.setdefault("BROWSER_POOL_SIZE", "0")
+        self._config.setdefault("BROWSER_POOL_RECYCLE_AFTER", "20")
+        self._config.setdefault("REUSE_AGENTS", "true")
+        self._config.setdefault("COMPILE_STEPS", "true")
+        self._config.setdefault("INCREMENTAL", "false")
+        self._config.setdefault("SCENARIO_ORDER", "file")
+        self._config.setdefault("FAIL_FAST", "0")
+        self._config.setdefault("PLANNER_BATCH_STEPS", "1")
+        self._config.setdefault("LLM_CACHE_MODE", "off")
+        self._config.setdefault("LLM_CACHE_PATH", None)
+        self._config.setdefault("STEP_MACRO_MODE", "off")
+        self._config.setdefault("STEP_MACRO_PATH", None)
         self._config.setdefault("GUIDED_MODE", "false")
         self._config.setdefault("GUIDED_TEST_DESCRIPTION", "")
         self._config.setdefault("GUIDED_DRY_RUN", "false")
@@ -861,12 +1029,21 @@ class BaseConfigManager:
     def set_default_test_id(self, test_id: str = "running_interactive") -> None:
         self._default_test_id = test_id
         self._config["DEFAULT_TEST_ID"] = test_id
+        _SCOPED_TEST_ID.set(test_id)
 
     def reset_default_test_id(self) -> None:
         self.set_default_test_id("default")
 
     def get_default_test_id(self) -> str:
-        return self._default_test_id
+        return _SCOPED_TEST_ID.get() or self._default_test_id
+
+    def get_run_id(self) -> Optional[str]:
+        """Return the id of the daemon job this config belongs to, if any."""
+        return self._config.get("RUN_ID")
+
+    def get_scoped_test_id(self) -> Optional[str]:
+        """Return the test id bound to the current asyncio task, if any."""
+        return _SCOPED_TEST_ID.get()
 
     def get_dont_close_browser(self) -> bool:
         return self._config["DONT_CLOSE_BROWSER"].lower().strip() == "true"
@@ -929,6 +1106,124 @@ class BaseConfigManager:
         """Return whether tests should be executed in bulk mode"""
         return self._config["EXECUTE_BULK"].lower().strip() == "true"
 
+    def get_parallel_scenarios(self) -> int:
+        """Return how many scenarios may run concurrently (at least 1)."""
+        raw = self._config.get("PARALLEL_SCENARIOS", "1")
+        try:
+            workers = int(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid PARALLEL_SCENARIOS={raw!r}; running sequentially.")
+            return 1
+        return max(workers, 1)
+
+    def get_bulk_workers(self) -> int:
+        """Return how many worker processes bulk execution may use (at least 1)."""
+        raw = self._config.get("BULK_WORKERS", "1")
+        try:
+            workers = int(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid BULK_WORKERS={raw!r}; running test folders serially.")
+            return 1
+        return max(workers, 1)
+
+    def get_shard(self) -> Optional[Tuple[int, int]]:
+        """Return the configured (shard_index, shard_count), 1-based, or None when not sharding."""
+        raw = self._config.get("SHARD")
+        if not raw:
+            return None
+        match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", str(raw))
+        if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+            logger.error(f"Invalid SHARD={raw!r}; expected i/n with 1 <= i <= n, e.g. 2/4.")
+            raise SystemExit(1)
+        return int(match.group(1)), int(match.group(2))
+
+    def get_shard_durations_file(self, project_root: str) -> Optional[str]:
+        """Return the scenario history file that balances shards by duration, resolved against ``project_root``, or None."""
+        raw = self._config.get("SHARD_DURATIONS_FILE")
+        if not raw:
+            return None
+        return os.path.join(project_root, str(raw))
+
+    def get_browser_pool_size(self) -> int:
+        """Return how many warm browser processes the browser pool may keep (0 disables the pool)."""
+        raw = self._config.get("BROWSER_POOL_SIZE", "0")
+        try:
+            return max(int(raw), 0)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid BROWSER_POOL_SIZE={raw!r}; browser pool disabled.")
+            return 0
+
+    def get_browser_pool_recycle_after(self) -> int:
+        """Return after how many contexts a pooled browser is relaunched (0 never recycles)."""
+        raw = self._config.get("BROWSER_POOL_RECYCLE_AFTER", "20")
+        try:
+            return max(int(raw), 0)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid BROWSER_POOL_RECYCLE_AFTER={raw!r}; using 20.")
+            return 20
+
+    def should_reuse_agents(self) -> bool:
+        """Return whether agents, LLM clients and the agent graph are reused across scenarios."""
+        return str(self._config.get("REUSE_AGENTS", "true")).lower().strip() == "true"
+
+    def should_compile_steps(self) -> bool:
+        """Return whether known mechanical steps run directly instead of through the planner."""
+        return str(self._config.get("COMPILE_STEPS", "true")).lower().strip() == "true"
+
+    def should_run_incremental(self) -> bool:
+        """Return whether unchanged scenarios that passed before are reused instead of run."""
+        return str(self._config.get("INCREMENTAL", "false")).lower().strip() == "true"
+
+    def get_scenario_order(self) -> str:
+        """Return the scenario scheduling policy: ``file`` or ``failed-first``."""
+        raw = str(self._config.get("SCENARIO_ORDER") or "file").lower().strip()
+        if raw not in ("file", "failed-first"):
+            logger.warning(f"Invalid SCENARIO_ORDER={raw!r}; running in file order.")
+            return "file"
+        return raw
+
+    def get_fail_fast(self) -> int:
+        """Return after how many failures no new scenarios are started (0 disables fail-fast)."""
+        raw = self._config.get("FAIL_FAST", "0")
+        try:
+            return max(int(raw), 0)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid FAIL_FAST={raw!r}; fail-fast disabled.")
+            return 0
+
+    def get_planner_batch_steps(self) -> int:
+        """Return how many steps the planner may return at once (1 plans one step per call)."""
+        raw = self._config.get("PLANNER_BATCH_STEPS", "1")
+        try:
+            return max(int(raw), 1)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid PLANNER_BATCH_STEPS={raw!r}; planning one step at a time.")
+            return 1
+
+    def get_llm_cache_mode(self) -> str:
+        """Return the LLM response cache mode: ``off``, ``record``, ``replay`` or ``auto``."""
+        raw = str(self._config.get("LLM_CACHE_MODE") or "off").lower().strip()
+        if raw not in ("off", "record", "replay", "auto"):
+            logger.warning(f"Invalid LLM_CACHE_MODE={raw!r}; LLM response cache disabled.")
+            return "off"
+        return raw
+
+    def get_llm_cache_path(self) -> str:
+        """Return the SQLite file of the LLM response cache."""
+        return self._config.get("LLM_CACHE_PATH") or os.path.join(self.get_project_source_root(), "llm_cache.sqlite")
+
+    def get_step_macro_mode(self) -> str:
+        """Return the learned step macro mode: ``off``, ``record``, ``replay`` or ``auto``."""
+        raw = str(self._config.get("STEP_MACRO_MODE") or "off").lower().strip()
+        if raw not in ("off", "record", "replay", "auto"):
+            logger.warning(f"Invalid STEP_MACRO_MODE={raw!r}; step macros disabled.")
+            return "off"
+        return raw
+
+    def get_step_macro_path(self) -> str:
+        """Return the SQLite file of the learned step macros."""
+        return self._config.get("STEP_MACRO_PATH") or os.path.join(self.get_project_source_root(), "step_macros.sqlite")
+
     def should_run_guided(self) -> bool:
         """Return whether guided test builder mode is enabled."""
         return self._config["GUIDED_MODE"].lower().strip() == "true"
@@ -1017,7 +1312,7 @@ class BaseConfigManager:
         return path
 
     def get_project_temp_path(self, test_id: Optional[str] = None) -> str:
-        test_id = test_id or self._default_test_id
+        test_id = test_id or self.get_default_test_id()
         base_path = self._config["PROJECT_TEMP_PATH"]
         path = os.path.join(base_path, test_id)
         if not os.path.exists(path):
@@ -1058,7 +1353,7 @@ class BaseConfigManager:
     def get_trace_path(self, stake_id: Optional[str] = None) -> PathsDict:
         """Get all trace related paths for a test run."""
         base_path = self.get_project_source_root()
-        test_id = stake_id if stake_id else self._default_test_id
+        test_id = stake_id if stake_id else self.get_default_test_id()
 
         paths: PathsDict = {
             "proofs": os.path.join(base_path, "proofs", test_id, self.timestamp),
@@ -1284,8 +1579,19 @@ class SingletonConfigManager(BaseConfigManager):
         cls._instance = None
 
 
-def get_global_conf() -> SingletonConfigManager:
-    return SingletonConfigManager.instance()
+def get_global_conf() -> BaseConfigManager:
+    return _SCOPED_CONF.get() or SingletonConfigManager.instance()
+
+
+def scope_global_conf(config_dict: ConfigDict) -> BaseConfigManager:
+    """
+    Bind a copy of the global config with ``config_dict`` applied to the current
+    asyncio task and the tasks it starts. Other tasks keep the global config.
+    """
+    base_config = SingletonConfigManager.instance().get_config()
+    scoped = NonSingletonConfigManager({**base_config, **config_dict}, ignore_env=True)
+    _SCOPED_CONF.set(scoped)
+    return scoped
 
 
 def set_global_conf(
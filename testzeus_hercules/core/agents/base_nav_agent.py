@@ -1,8 +1,6 @@
 import importlib
 import os
 import sys
-from datetime import datetime
-from string import Template
 from typing import Any
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -13,11 +11,16 @@ from testzeus_hercules.telemetry import EventData, EventType, add_event
 from testzeus_hercules.utils.langchain_tools import registry_tools_to_structured_tools
 from testzeus_hercules.utils.llm_helper import create_chat_model
 from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.prompt_layout import (
+    DEFAULT_TIMESTAMP_FORMAT,
+    layout_system_prompt,
+)
 
 
 class BaseNavAgent:
     agent_name: str = "base_nav_agent"
     prompt = "Base Agent"
+    timestamp_format = DEFAULT_TIMESTAMP_FORMAT
 
     def __init__(
         self,
@@ -41,22 +44,14 @@ class BaseNavAgent:
                 f"Using custom system prompt for BaseNavAgent: {system_message}"
             )
 
-        system_message = (
-            system_message
-            + "\n"
-            + f"Current timestamp is {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+        self._system_message_template = system_message
+        system_message = self._render_system_message(user_ltm)
         logger.warning(
             "[SYSTEM_PROMPT_DEBUG] agent=%s user_ltm=%r system_message_tail=%r",
             self.agent_name,
             user_ltm,
             system_message[-200:],
         )
-        if user_ltm:
-            user_ltm = "\n" + user_ltm
-            system_message = Template(system_message).substitute(
-                basic_test_information=user_ltm
-            )
 
         logger.info(
             "Nav agent %s using model %s", self.agent_name, model_config.get("model")
@@ -67,6 +62,17 @@ class BaseNavAgent:
         self.tools: list[StructuredTool] = []
         self.register_tools()
 
+    def _render_system_message(self, user_ltm: str | None) -> str:
+        # The current timestamp is sent with each task instead, so the system
+        # prompt stays a stable prefix for provider-side prompt caching.
+        return layout_system_prompt(
+            self._system_message_template, "\n" + user_ltm if user_ltm else ""
+        )
+
+    def render_system_message(self) -> str:
+        """Render the system prompt with the current test data."""
+        return self._render_system_message(self.get_ltm())
+
     def get_ltm(self) -> str | None:
         """Get the the long term memory of the user."""
         return get_user_ltm()
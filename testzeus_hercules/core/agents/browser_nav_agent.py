@@ -122,6 +122,7 @@ current_output: [Precise description of the issue encountered]
 • Fill mandatory fields FIRST, then proceed to optional fields
 • THEN map appropriate functions/tools to each interactive element
 • Group related form interactions when possible
+• Once the md ids of a form are known, fill and submit it with ONE execute_action_sequence call, with an 'expect' post-condition on the submitting action (e.g. url_changed or a confirmation text)
 • Validate input formats match field requirements
 • Focus on the currently active form; ignore background forms
 • Ensure all required fields are filled before attempting form submission
@@ -133,6 +134,10 @@ current_output: [Precise description of the issue encountered]
 • Include specific error messages and current page state in error reports
 • If the page is not responding, try to close the modal/popup/dialog/notification/toast/alert/etc.
 
+### ASSERTIONS
+• To verify that a text is visible, what the URL contains or how many elements match, call assert_text_visible, assert_url or assert_element_count instead of reading the page text
+• Quote their [ASSERT PASS]/[ASSERT FAIL] line, with its evidence, in your response
+
 ### VISUAL VALIDATION
 • Perform visual validation of UI when appropriate tools are available
 • You have excellent tools to analyse the screen.
@@ -1,13 +1,15 @@
-from string import Template
 from typing import Any
 
 from langchain_openai import ChatOpenAI
+from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.core.memory.static_ltm import get_user_ltm
 from testzeus_hercules.utils.llm_helper import (
     get_llm_max_retries,
     get_llm_request_timeout_seconds,
 )
+from testzeus_hercules.utils.llm_http_pool import shared_llm_http_client
 from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.prompt_layout import layout_system_prompt
 
 
 class PlannerAgent:
@@ -19,14 +21,13 @@ class PlannerAgent:
         llm_config_params: dict,
         system_prompt: str | None = None,
     ) -> None:
-        base_prompt = system_prompt or self.prompt
+        self._base_prompt = system_prompt or self.prompt
         user_ltm = get_user_ltm()
         print("===== LTM =====")
         print(user_ltm)
         print("===============")
 
-        self.system_message = Template(base_prompt).safe_substitute(basic_test_information=user_ltm if user_ltm else "No test data provided")
-        self.system_message = self._json_instruction + self.system_message
+        self.system_message = self._render_system_message(user_ltm)
 
         # Normalize model key: ChatOpenAI expects 'model', not 'model_name'
         normalized = dict(model_config)
@@ -54,8 +55,23 @@ class PlannerAgent:
             safe_llm_params["timeout"] = get_llm_request_timeout_seconds()
         if "max_retries" not in filtered and safe_llm_params.get("max_retries") is None:
             safe_llm_params["max_retries"] = get_llm_max_retries()
+        if safe_llm_params.get("http_async_client") is None:
+            safe_llm_params["http_async_client"] = shared_llm_http_client(
+                filtered.get("base_url"),
+                filtered.get("api_key"),
+                filtered.get("timeout", safe_llm_params.get("timeout")),
+            )
         self.llm = ChatOpenAI(**filtered, **safe_llm_params)
 
+    def _render_system_message(self, user_ltm: str | None) -> str:
+        batch_steps = get_global_conf().get_planner_batch_steps()
+        batch_instruction = self._batch_instruction.replace("$max_steps", str(batch_steps)) if batch_steps > 1 else ""
+        return self._json_instruction + batch_instruction + layout_system_prompt(self._base_prompt, user_ltm if user_ltm else "No test data provided")
+
+    def render_system_message(self) -> str:
+        """Render the system prompt with the current test data."""
+        return self._render_system_message(get_user_ltm())
+
     _json_instruction = """CRITICAL INSTRUCTION: You MUST respond ONLY with a valid JSON object. No preamble, no explanation, no markdown. Your entire response must be parseable JSON.
 
 IMPORTANT RULES:
@@ -312,6 +328,17 @@ Must return well-formatted JSON with:
 17. **ALWAYS count plan step completion: if all steps show "(Completed)", immediately set terminate="yes"**
 
 Available Test Data: $basic_test_information
+"""
+
+    _batch_instruction = """
+MULTI-STEP MODE: You may return up to $max_steps consecutive steps at once in an extra field
+"next_steps": [{"step": "...", "target_helper": "browser", "is_assert": false}, ...]
+- The first entry MUST be the same step as "next_step" and "target_helper".
+- The steps run in order without asking you in between. You get every helper response back after the last
+  step, or right after a step that failed or has "is_assert": true.
+- Only batch steps that do not depend on reading the result of the step before them. Put a verification
+  step last and mark it "is_assert": true. When unsure, return a single step.
+
 """
 
     def on_planner_message(self, message: str) -> None:
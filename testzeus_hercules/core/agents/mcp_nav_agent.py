@@ -102,9 +102,18 @@ Available Test Data: $basic_test_information
 
     def register_tools(self) -> None:
         self.load_tools()
+        self._local_tools = list(self.tools)
         self._mcp_tools_ready = False
         self._mcp_init_error: BaseException | None = None
 
+    def reset_for_scenario(self) -> None:
+        if MCPHelper._instance is None:
+            # The MCP connections were torn down after the previous scenario; drop
+            # their tools so ensure_tools_ready reconnects and attaches fresh ones.
+            self.tools = list(self._local_tools)
+            self._mcp_tools_ready = False
+            self._mcp_init_error = None
+
     async def ensure_tools_ready(self) -> bool:
         """Attach external MCP tools before the agent is used."""
         if getattr(self, "_mcp_tools_ready", False):
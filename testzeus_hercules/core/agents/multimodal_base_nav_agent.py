@@ -1,5 +1,3 @@
-from datetime import datetime
-from string import Template
 from typing import Any
 
 from testzeus_hercules.core.agents.base_nav_agent import BaseNavAgent
@@ -11,6 +9,7 @@ class MultimodalBaseNavAgent(BaseNavAgent):
 
     agent_name: str = "multimodal_base_nav_agent"
     prompt = "Base Multimodal Agent"
+    timestamp_format = "%Y/%m/%d %H:%M:%S"
 
     def __init__(
         self,
@@ -35,22 +34,14 @@ class MultimodalBaseNavAgent(BaseNavAgent):
                 system_message,
             )
 
-        system_message = (
-            system_message
-            + "\n"
-            + f"Current timestamp is {datetime.now().strftime('%Y/%m/%d %H:%M:%S')}"
-        )
+        self._system_message_template = system_message
+        system_message = self._render_system_message(user_ltm)
         logger.warning(
             "[SYSTEM_PROMPT_DEBUG] agent=%s user_ltm=%r system_message_tail=%r",
             self.agent_name,
             user_ltm,
             system_message[-200:],
         )
-        if user_ltm:
-            user_ltm = "\n" + user_ltm
-            system_message = Template(system_message).substitute(
-                basic_test_information=user_ltm
-            )
 
         from testzeus_hercules.utils.llm_helper import create_chat_model
 
@@ -29,6 +29,7 @@ class SqlNavAgent(BaseNavAgent):
    - Clarification requests
    - Detailed error reporting
    - Limited retry attempts
+   - Check row counts and expected values of the last query with assert_sql_result, and quote its [ASSERT PASS]/[ASSERT FAIL] line
 
    4. Task Management:
    - Document steps
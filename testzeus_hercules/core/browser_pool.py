@@ -0,0 +1,146 @@
+"""
+Warm browser pool shared by the scenarios of a run.
+
+One Playwright driver and up to ``BROWSER_POOL_SIZE`` browser processes per launch
+configuration are started on first use. Every scenario gets a fresh BrowserContext
+from the least busy browser, so cookies, storage and per-stake video folders stay
+isolated while the browser launch cost is paid once. A browser is relaunched once
+it has served ``BROWSER_POOL_RECYCLE_AFTER`` contexts, bounding memory growth.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright
+from playwright.async_api import async_playwright as playwright
+from testzeus_hercules.config import get_global_conf
+from testzeus_hercules.utils.logger import logger
+
+
+@dataclass(eq=False)
+class PooledBrowser:
+    """A launched browser process and its usage counters."""
+
+    browser: Browser
+    launch_key: str
+    active_contexts: int = 0
+    served_contexts: int = 0
+
+
+class BrowserPool:
+    """Singleton pool of warm browsers handing out fresh contexts."""
+
+    _instance: Optional["BrowserPool"] = None
+
+    def __init__(self, size: int, recycle_after: int) -> None:
+        self.size = max(size, 1)
+        self.recycle_after = recycle_after
+        self._playwright: Optional[Playwright] = None
+        self._browsers: List[PooledBrowser] = []
+        self._context_owners: Dict[BrowserContext, PooledBrowser] = {}
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Return whether the run is configured to use the browser pool."""
+        return get_global_conf().get_browser_pool_size() > 0
+
+    @classmethod
+    def instance(cls) -> "BrowserPool":
+        """Get or create the singleton instance."""
+        if cls._instance is None:
+            conf = get_global_conf()
+            cls._instance = BrowserPool(conf.get_browser_pool_size(), conf.get_browser_pool_recycle_after())
+        return cls._instance
+
+    @classmethod
+    async def destroy(cls) -> None:
+        """Close every pooled browser and the shared Playwright driver."""
+        if cls._instance is None:
+            return
+        instance, cls._instance = cls._instance, None
+        await instance.close()
+
+    async def get_playwright(self) -> Playwright:
+        """Return the shared Playwright driver, starting it on first use."""
+        async with self._lock:
+            return await self._ensure_playwright()
+
+    async def new_context(self, browser_type: str, launch_options: Dict[str, Any], context_options: Dict[str, Any]) -> BrowserContext:
+        """
+        Create a fresh context on a pooled browser launched with ``launch_options``.
+
+        The caller must hand the context back with ``BrowserPool.release`` once closed.
+        """
+        launch_key = json.dumps({"browser_type": browser_type, **launch_options}, sort_keys=True, default=str)
+        async with self._lock:
+            pooled = await self._acquire(browser_type, launch_key, launch_options)
+            pooled.active_contexts += 1
+            pooled.served_contexts += 1
+        try:
+            context = await pooled.browser.new_context(**context_options)
+        except Exception:
+            await self._release(pooled)
+            raise
+        self._context_owners[context] = pooled
+        return context
+
+    @classmethod
+    async def release(cls, context: BrowserContext) -> None:
+        """Mark a pooled context as closed; a no-op for unknown contexts or once the pool is destroyed."""
+        if cls._instance is None:
+            return
+        pooled = cls._instance._context_owners.pop(context, None)
+        if pooled is not None:
+            await cls._instance._release(pooled)
+
+    async def close(self) -> None:
+        browsers, self._browsers = self._browsers, []
+        self._context_owners.clear()
+        for pooled in browsers:
+            await self._close_browser(pooled)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _ensure_playwright(self) -> Playwright:
+        if self._playwright is None:
+            self._playwright = await playwright().start()
+        return self._playwright
+
+    def _is_retired(self, pooled: PooledBrowser) -> bool:
+        return bool(self.recycle_after) and pooled.served_contexts >= self.recycle_after
+
+    async def _acquire(self, browser_type: str, launch_key: str, launch_options: Dict[str, Any]) -> PooledBrowser:
+        for pooled in [p for p in self._browsers if not p.browser.is_connected()]:
+            logger.warning("Pooled browser disconnected; dropping it from the pool.")
+            self._browsers.remove(pooled)
+
+        launched = [p for p in self._browsers if p.launch_key == launch_key]
+        usable = [p for p in launched if not self._is_retired(p)]
+        if usable:
+            least_busy = min(usable, key=lambda p: p.active_contexts)
+            if least_busy.active_contexts == 0 or len(launched) >= self.size:
+                return least_busy
+
+        playwright_driver = await self._ensure_playwright()
+        logger.info(f"Browser pool: launching {browser_type} ({len(launched) + 1}/{self.size})")
+        browser = await getattr(playwright_driver, browser_type).launch(**launch_options)
+        pooled = PooledBrowser(browser=browser, launch_key=launch_key)
+        self._browsers.append(pooled)
+        return pooled
+
+    async def _release(self, pooled: PooledBrowser) -> None:
+        pooled.active_contexts = max(pooled.active_contexts - 1, 0)
+        if pooled.active_contexts == 0 and self._is_retired(pooled) and pooled in self._browsers:
+            logger.info(f"Browser pool: recycling browser after {pooled.served_contexts} contexts")
+            self._browsers.remove(pooled)
+            await self._close_browser(pooled)
+
+    async def _close_browser(self, pooled: PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"Error while closing pooled browser: {e}")
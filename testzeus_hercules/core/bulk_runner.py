@@ -0,0 +1,198 @@
+"""
+Process-pool execution for ``--bulk`` runs.
+
+Every folder under ``tests/`` is executed in its own worker process, so each one
+builds an isolated global config, browser and agent set exactly as a serial bulk
+run would. Worker processes are forked from a forkserver that has the heavy
+imports loaded already, which keeps per-folder start-up cheap.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from typing import Callable, Dict, List, Optional, Tuple
+
+from junit2htmlreport.runner import run as prepare_html
+from testzeus_hercules.config import get_global_conf, set_global_conf
+from testzeus_hercules.utils.junit_helper import JUnitXMLGenerator, build_junit_xml
+from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.shard_helper import (
+    assign_shards,
+    list_feature_scenarios,
+    load_scenario_durations,
+)
+
+# Modules imported once by the forkserver so that forked workers start warm.
+FORKSERVER_PRELOAD = [
+    "testzeus_hercules.config",
+    "testzeus_hercules.core.runner",
+    "testzeus_hercules.utils.junit_helper",
+    "playwright.async_api",
+]
+
+BULK_SUMMARY_FILE_NAME = "bulk_result.xml"
+
+
+@dataclass
+class BulkFolderResult:
+    """Outcome of running one test folder in a worker process."""
+
+    folder: str
+    result_file: Optional[str] = None
+    error: Optional[str] = None
+
+
+def bulk_folder_config(test_dir: str) -> Dict[str, str]:
+    """Return the config overrides that point a run at one bulk test folder."""
+    test_dir_name = os.path.basename(test_dir)
+    return {
+        "PROJECT_SOURCE_ROOT": test_dir,
+        "INPUT_GHERKIN_FILE_PATH": os.path.join(test_dir, "input", f"{test_dir_name}.feature"),
+        "TEST_DATA_PATH": os.path.join(test_dir, "test_data"),
+    }
+
+
+def discover_test_folders(tests_dir: str) -> List[str]:
+    """Return the test folders under ``tests_dir`` in a stable order."""
+    return sorted(os.path.join(tests_dir, name) for name in os.listdir(tests_dir) if os.path.isdir(os.path.join(tests_dir, name)))
+
+
+async def plan_bulk_shard(
+    test_dirs: List[str],
+    shard: Tuple[int, int],
+    keep_folders_together: bool = False,
+) -> Dict[str, List[str]]:
+    """
+    Decide which scenarios of which test folders run on ``shard``.
+
+    Scenarios of all folders are balanced together, by their durations in the
+    shared durations file of each folder (``--shard-durations``) or by count. With
+    ``keep_folders_together``, and for folders without scenarios, each folder is
+    placed on a single shard as a whole.
+
+    Returns:
+        Dict[str, List[str]]: The folders this shard runs, with their scenario titles.
+    """
+    shard_index, shard_count = shard
+    folder_scenarios = {test_dir: await list_feature_scenarios(bulk_folder_config(test_dir)["INPUT_GHERKIN_FILE_PATH"]) for test_dir in test_dirs}
+
+    weights: List[Tuple[Tuple[str, Optional[str]], Optional[float]]] = []
+    for test_dir, scenarios in folder_scenarios.items():
+        durations = load_scenario_durations(
+            get_global_conf().get_shard_durations_file(test_dir),
+            bulk_folder_config(test_dir)["INPUT_GHERKIN_FILE_PATH"],
+        )
+        if keep_folders_together or not scenarios:
+            known = [durations[scenario] for scenario in scenarios if scenario in durations]
+            weights.append(((test_dir, None), sum(known) if known else None))
+        else:
+            weights.extend(((test_dir, scenario), durations.get(scenario)) for scenario in scenarios)
+
+    assignment = assign_shards(weights, shard_count)
+    plan: Dict[str, List[str]] = {}
+    for (test_dir, scenario), _ in weights:
+        if assignment[(test_dir, scenario)] != shard_index:
+            continue
+        selected = plan.setdefault(test_dir, [])
+        selected.extend(folder_scenarios[test_dir] if scenario is None else [scenario])
+
+    logger.info(f"Shard {shard_index}/{shard_count}: running {sum(len(s) for s in plan.values())} scenarios from {len(plan)} test folders")
+    return plan
+
+
+def run_test_folder(test_dir: str, scenarios: Optional[List[str]] = None) -> BulkFolderResult:
+    """Worker entry point: run the scenarios of one test folder (all by default) in this process."""
+    # Imported lazily: the CLI module imports this one.
+    from testzeus_hercules.__main__ import sequential_process
+
+    logger.info(f"Processing test folder: {os.path.basename(test_dir)}")
+    try:
+        set_global_conf(bulk_folder_config(test_dir), override=True)
+        result_file = asyncio.run(sequential_process(scenarios=scenarios))
+    except BaseException as e:  # SystemExit included: one bad folder must not stop the pool
+        logger.exception("Bulk test folder %s failed", test_dir)
+        return BulkFolderResult(folder=test_dir, error=f"{type(e).__name__}: {e}")
+    return BulkFolderResult(folder=test_dir, result_file=result_file)
+
+
+def _worker_context() -> BaseContext:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(FORKSERVER_PRELOAD)
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+async def _failed_folder_result(result: BulkFolderResult) -> str:
+    folder_name = os.path.basename(result.folder)
+    message = f"Test folder did not produce a result: {result.error or 'no JUnit output found'}"
+    return await build_junit_xml(
+        {
+            "terminate": "yes",
+            "is_assert": True,
+            "is_passed": False,
+            "assert_summary": message,
+            "final_response": message,
+        },
+        0.0,
+        {},
+        folder_name,
+        folder_name,
+        feature_file_path=bulk_folder_config(result.folder)["INPUT_GHERKIN_FILE_PATH"],
+        output_file_path="",
+    )
+
+
+async def run_bulk_in_processes(
+    tests_dir: str,
+    workers: int,
+    shard_plan: Optional[Dict[str, List[str]]] = None,
+    worker: Callable[[str, Optional[List[str]]], BulkFolderResult] = run_test_folder,
+) -> str:
+    """
+    Run all test folders on a pool of worker processes and merge their results.
+
+    With a ``shard_plan`` (see ``plan_bulk_shard``) only the planned folders and
+    scenarios run. Each folder keeps its own ``<feature>_result.xml``; a combined
+    XML and HTML summary is written to the current run's JUnit folder and the XML
+    path returned.
+    """
+    test_dirs = discover_test_folders(tests_dir)
+    if not test_dirs:
+        logger.error("Bulk execution requested but no test folders found in: %s", tests_dir)
+        raise SystemExit(1)
+    if shard_plan is not None:
+        test_dirs = [test_dir for test_dir in test_dirs if test_dir in shard_plan]
+
+    pool_size = max(min(workers, len(test_dirs)), 1)
+    logger.info(f"Bulk execution: running {len(test_dirs)} test folders on {pool_size} worker processes")
+
+    loop = asyncio.get_running_loop()
+    # One folder per process: singletons (config, browsers, test data) never leak between folders.
+    with ProcessPoolExecutor(max_workers=pool_size, mp_context=_worker_context(), max_tasks_per_child=1) as pool:
+        results: List[BulkFolderResult] = await asyncio.gather(*(loop.run_in_executor(pool, worker, test_dir, shard_plan[test_dir] if shard_plan is not None else None) for test_dir in test_dirs))
+
+    folder_results: List[str] = []
+    failure_results: List[str] = []
+    for result in results:
+        if result.result_file and os.path.exists(result.result_file):
+            folder_results.append(result.result_file)
+        else:
+            logger.error(f"Bulk test folder {result.folder} failed: {result.error}")
+            failure_results.append(await _failed_folder_result(result))
+
+    summary_file = os.path.join(get_global_conf().get_junit_xml_base_path(), BULK_SUMMARY_FILE_NAME)
+    await JUnitXMLGenerator.merge_junit_xml(folder_results + failure_results, summary_file, delete_sources=False)
+    if get_global_conf().get_mode() not in ["debug"]:
+        for failure_result in failure_results:
+            os.remove(failure_result)
+
+    logger.info(f"Bulk execution summary published in junitxml file: {summary_file}")
+
+    summary_html_file = summary_file[: -len(".xml")] + ".html"
+    prepare_html([summary_file, summary_html_file])
+    logger.info(f"Bulk execution summary published in html file: {summary_html_file}")
+    return summary_file
@@ -1,7 +1,6 @@
 import json
 from typing import Any, Dict, List, Optional, Union, cast
 
-from portkey_ai import PORTKEY_GATEWAY_URL, createHeaders
 from testzeus_hercules.utils.logger import logger
 
 
@@ -58,6 +57,9 @@ class PortkeyConfigLoader:
         model = model_config.get("model", "")
         api_key = model_config.get("api_key", "")
 
+        # The Portkey SDK is slow to import, so only load it when Portkey is in use
+        from portkey_ai import PORTKEY_GATEWAY_URL, createHeaders
+
         # Create the basic headers for Portkey
         portkey_headers = createHeaders(
             api_key=portkey_api_key,
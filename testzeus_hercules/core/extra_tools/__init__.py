@@ -1,22 +1,20 @@
 import importlib
-import pkgutil
-import sys
 from pathlib import Path
+from typing import Any
 
 from testzeus_hercules.config import get_global_conf
-
-# Get the current directory path
-package_path = Path(__file__).parent
+from testzeus_hercules.core.tools.tool_registry import tool_registry as _tool_registry
 
 if get_global_conf().get_load_extra_tools().lower().strip() != "false":
-    # Dynamically import all modules
-    for _, module_name, _ in pkgutil.iter_modules([str(package_path)]):
-        # Construct the full module path
-        full_module_name = f"testzeus_hercules.core.extra_tools.{module_name}"
-        # Import the module
-        module = importlib.import_module(full_module_name)
-        # Add all objects from the module to the current namespace
-        for attribute_name in dir(module):
-            # Skip private attributes
-            if not attribute_name.startswith("_"):
-                globals()[attribute_name] = getattr(module, attribute_name)
+    # Tool modules are imported when an agent first asks for its tools rather than here.
+    _tool_registry.register_package(__name__, str(Path(__file__).parent))
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the tool functions reachable as package attributes without importing every module up front.
+    module_name = _tool_registry.find_export(__name__, name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -3,7 +3,6 @@ import time
 import traceback
 from typing import Annotated, Dict, Union
 
-from PIL import Image
 from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.core.playwright_manager import PlaywrightManager
 from testzeus_hercules.core.tools.tool_registry import tool
@@ -13,6 +12,8 @@ from testzeus_hercules.utils.logger import logger
 @tool(
     agent_names=["browser_nav_agent"],
     name="take_browser_screenshot",
+    read_only=True,
+    resource="browser",
     description="Take a screenshot of the current browser view and save it",
 )
 async def take_browser_screenshot(
@@ -51,6 +52,8 @@ async def take_browser_screenshot(
         screenshot_file = os.path.join(screenshots_dir, f"{base_filename}.png")
 
         # Save the screenshot
+        from PIL import Image
+
         screenshot = Image.open(screenshot_stream)
         screenshot.save(screenshot_file)
 
@@ -67,6 +70,8 @@ async def take_browser_screenshot(
 @tool(
     agent_names=["browser_nav_agent"],
     name="capture_the_screen",
+    read_only=True,
+    resource="browser",
     description="give you the current screenshot of the browser view",
 )
 async def capture_the_screen() -> Annotated[str, "Path to of screenshot"]:
@@ -98,6 +103,8 @@ async def capture_the_screen() -> Annotated[str, "Path to of screenshot"]:
         screenshot_file = os.path.join(screenshots_dir, "current_page.png")
 
         # Save the screenshot, overwriting if exists
+        from PIL import Image
+
         screenshot = Image.open(screenshot_stream)
         screenshot.save(screenshot_file)
 
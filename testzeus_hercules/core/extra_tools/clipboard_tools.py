@@ -20,6 +20,8 @@ from testzeus_hercules.utils.logger import logger
     Accepts a parameter to specify the clipboard type: 'text' for plain text
     or 'binary' for a binary object representation.""",
     name="read_clipboard",
+    read_only=True,
+    resource="clipboard",
 )
 async def read_clipboard(clipboard_type: Annotated[str, "Clipboard content type: 'text' or 'binary'"] = "text") -> Annotated[Any, "Clipboard content read result"]:
     """
@@ -13,6 +13,7 @@ from testzeus_hercules.utils.logger import logger
     agent_names=["browser_nav_agent"],
     description="Performs drag and drop operation from source to target.",
     name="drag_and_drop",
+    resource="browser",
 )
 async def drag_and_drop(
     source_selector: Annotated[
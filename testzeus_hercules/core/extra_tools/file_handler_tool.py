@@ -14,6 +14,7 @@ from testzeus_hercules.core.tools.tool_registry import tool
 @tool(
     agent_names=["browser_nav_agent", "api_nav_agent"],
     name="persist_findings",
+    resource="findings",
     description=(
         "Writes data to a file with the specified file_path. Supported file formats: "
         "JSON (.json), YAML (.yaml/.yml), TXT (.txt) and LOG (.log). The provided data must be a string. "
@@ -72,6 +73,8 @@ def persist_findings(
 @tool(
     agent_names=["browser_nav_agent", "api_nav_agent"],
     name="recall_findings",
+    read_only=True,
+    resource="findings",
     description=(
         "Reads data from a file at the given file_path. For JSON and YAML files, returns the parsed "
         "Python object; for TXT and LOG files, returns the raw text content. Returns an error message if the "
@@ -110,6 +113,7 @@ def recall_findings(
 @tool(
     agent_names=["browser_nav_agent", "api_nav_agent"],
     name="augment_findings",
+    resource="findings",
     description=(
         "Appends data to an existing file at the specified file_path. The provided data must be a string. "
         "For JSON and YAML files, the string must represent a dict or list. If the file contains a list, the "
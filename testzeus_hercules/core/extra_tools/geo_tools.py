@@ -11,6 +11,8 @@ from testzeus_hercules.utils.logger import logger
 @tool(
     agent_names=["browser_nav_agent", "api_nav_agent"],
     name="get_current_geo_location",
+    read_only=True,
+    resource="geo",
     description=("Retrieve the current geolocation"),
 )
 async def get_current_geo_location() -> Union[str, Dict[str, str]]:
@@ -53,6 +55,7 @@ async def get_current_geo_location() -> Union[str, Dict[str, str]]:
 @tool(
     agent_names=["browser_nav_agent", "api_nav_agent"],
     name="set_current_geo_location",
+    resource="browser",
     description="Set the browser geolocation",
 )
 async def set_current_geo_location(
@@ -7,13 +7,14 @@ from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.core.playwright_manager import PlaywrightManager
 from testzeus_hercules.core.tools.tool_registry import tool
 from testzeus_hercules.utils.logger import logger
-from unstructured.partition.pdf import partition_pdf
 
 
 @tool(
     agent_names=["browser_nav_agent"],
     description="""Extracts text from PDF at given URL.""",
     name="extract_text_from_pdf",
+    read_only=True,
+    resource="file",
 )
 async def extract_text_from_pdf(
     pdf_url: Annotated[str, "URL of the PDF file to extract text from."],
@@ -34,7 +35,9 @@ async def extract_text_from_pdf(
         if not os.path.exists(download_result):
             return download_result  # Return error message if download failed
 
-        # Extract text using unstructured
+        # Extract text using unstructured, imported here as it is slow to load
+        from unstructured.partition.pdf import partition_pdf
+
         elements = partition_pdf(download_result)
         extracted_text = "\n".join([str(element) for element in elements])
 
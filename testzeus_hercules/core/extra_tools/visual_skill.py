@@ -6,7 +6,6 @@ import traceback
 from typing import Annotated, Dict, Union
 
 from langchain_core.messages import AIMessage
-from PIL import Image
 from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.core.playwright_manager import PlaywrightManager
 from testzeus_hercules.core.tools.tool_registry import tool
@@ -17,6 +16,8 @@ from testzeus_hercules.utils.logger import logger
 @tool(
     agent_names=["browser_nav_agent"],
     name="compare_visual_screenshot",
+    read_only=True,
+    resource="browser",
     description="Compare the current screen view with a reference image or screenshot and return results",
 )
 async def compare_visual_screenshot(
@@ -68,6 +69,8 @@ async def compare_visual_screenshot(
         screenshot_file = os.path.join(comparisons_dir, f"{base_filename}_current.png")
 
         # Save the current screenshot
+        from PIL import Image
+
         screenshot = Image.open(screenshot_stream)
         screenshot.save(screenshot_file)
 
@@ -152,6 +155,8 @@ async def _write_comparison_to_file(comparison_data: Dict, filepath: str) -> Non
 @tool(
     agent_names=["browser_nav_agent"],
     name="validate_visual_feature",
+    read_only=True,
+    resource="browser",
     description="Validate if specific features or items are present in the current screen",
 )
 async def validate_visual_feature(
@@ -198,6 +203,8 @@ async def validate_visual_feature(
         screenshot_file = os.path.join(validation_dir, f"{base_filename}.png")
 
         # Save the current screenshot
+        from PIL import Image
+
         screenshot = Image.open(screenshot_stream)
         screenshot.save(screenshot_file)
 
@@ -13,13 +13,16 @@ class StaticLTM:
     _instance = None
 
     def __new__(cls) -> "StaticLTM":
-        if cls._instance is None:
+        test_data_path = get_global_conf().get_test_data_path()
+        if cls._instance is None or cls._instance.test_data_path != test_data_path:
+            # Reload when a later run in the same process points at other test data.
             cls._instance = super().__new__(cls)
-            cls._instance._initialize()
+            cls._instance._initialize(test_data_path)
         return cls._instance
 
-    def _initialize(self) -> None:
+    def _initialize(self, test_data_path: str) -> None:
         """Initialize the StaticLTM instance by loading data."""
+        self.test_data_path = test_data_path
         # Append stored data and run data
         result = load_data()
         stored_data = get_stored_data()
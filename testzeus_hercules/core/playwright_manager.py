@@ -14,13 +14,13 @@ from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import httpx
-from PIL import Image, ImageDraw, ImageFont
 from playwright.async_api import BrowserContext, BrowserType, ElementHandle
 from playwright.async_api import Error as PlaywrightError  # for exception handling
 from playwright.async_api import Page, Playwright
 from playwright.async_api import async_playwright as playwright
 from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.core.browser_logger import get_browser_logger
+from testzeus_hercules.core.browser_pool import BrowserPool
 from testzeus_hercules.core.notification_manager import NotificationManager
 from testzeus_hercules.utils.dom_mutation_observer import (
     dom_mutation_change_detected,
@@ -86,6 +86,13 @@ class PlaywrightManager:
     _homepage = "about:blank"
 
     def __new__(cls, *args, stake_id: Optional[str] = None, **kwargs) -> "PlaywrightManager":
+        # Tools ask for PlaywrightManager() without a stake_id; resolve it to the
+        # instance of the scenario running in the current task, if there is one.
+        if stake_id is None:
+            scoped_instance = cls._scoped_instance()
+            if scoped_instance is not None:
+                return scoped_instance
+
         # If no stake_id provided and we have a default instance, return it
         if stake_id is None:
             if cls._default_instance is None:
@@ -108,10 +115,21 @@ class PlaywrightManager:
                 cls._default_instance = instance
         return cls._instances[stake_id]
 
+    @classmethod
+    def _scoped_instance(cls) -> Optional["PlaywrightManager"]:
+        """Return the instance bound to the test id of the current asyncio task."""
+        scoped_id = get_global_conf().get_scoped_test_id()
+        if scoped_id is None:
+            return None
+        return cls._instances.get(scoped_id)
+
     @classmethod
     def get_instance(cls, stake_id: Optional[str] = None) -> "PlaywrightManager":
         """Get PlaywrightManager instance for given stake_id, or default instance if none provided."""
         if stake_id is None:
+            scoped_instance = cls._scoped_instance()
+            if scoped_instance is not None:
+                return scoped_instance
             if cls._default_instance is None:
                 # This will create the default instance
                 return cls()
@@ -251,6 +269,9 @@ class PlaywrightManager:
         # ----------------------
         self._playwright: Optional[Playwright] = None
         self._browser_context: Optional[BrowserContext] = None
+        # Contexts come from the shared warm browser pool when it is enabled; CDP
+        # sessions and persistent user-data dirs keep their own browser.
+        self._use_browser_pool = BrowserPool.is_enabled() and not self.cdp_config and not os.environ.get("BROWSER_STORAGE_DIR")
         self.__async_initialize_done = False
         self._latest_screenshot_bytes: Optional[bytes] = None
 
@@ -324,12 +345,17 @@ class PlaywrightManager:
 
     async def start_playwright(self) -> None:
         if not self._playwright:
-            self._playwright = await playwright().start()
+            if self._use_browser_pool:
+                self._playwright = await BrowserPool.instance().get_playwright()
+            else:
+                self._playwright = await playwright().start()
 
     async def stop_playwright(self) -> None:
         await self.close_browser_context()
         if self._playwright is not None:
-            await self._playwright.stop()
+            # The pool's driver outlives this scenario; BrowserPool.destroy() stops it.
+            if not self._use_browser_pool:
+                await self._playwright.stop()
             self._playwright = None
 
     async def prepare_extension(self) -> None:
@@ -568,7 +594,9 @@ class PlaywrightManager:
             browser_type = getattr(self._playwright, self.browser_type)
             await self.prepare_extension()
 
-            if self._record_video:
+            if self._use_browser_pool:
+                await self._launch_pooled_context(disable_args)
+            elif self._record_video:
                 await self._launch_browser_with_video(browser_type, user_dir, disable_args)
             else:
                 await self._launch_persistent_browser(browser_type, user_dir, disable_args)
@@ -615,6 +643,89 @@ class PlaywrightManager:
 
         return context_options
 
+    def _build_launch_options(self, disable_args: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Build the options for launching a (non-persistent) browser process.
+        """
+        if disable_args is None:
+            disable_args = []
+        if self.browser_type == "chromium" and self._extension_path is not None:
+            disable_args.append(f"--disable-extensions-except={self._extension_path}")
+            disable_args.append(f"--load-extension={self._extension_path}")
+
+        launch_options: Dict[str, Any] = {
+            "headless": self.isheadless,
+            "args": disable_args,
+        }
+
+        # Handle browser-specific launch options
+        if self.browser_type == "chromium":
+            if self.browser_channel:
+                launch_options["channel"] = self.browser_channel
+            # Note: version is handled during installation, not at launch time
+        elif self.browser_type == "firefox":
+            firefox_prefs = {
+                "app.update.auto": False,
+                "browser.shell.checkDefaultBrowser": False,
+                "media.navigator.permission.disabled": True,
+                "permissions.default.screen": 1,
+                "media.getusermedia.window.enabled": True,
+            }
+
+            # Auto-accept screen sharing if enabled in config
+            if get_global_conf().should_auto_accept_screen_sharing():
+                firefox_prefs.update(
+                    {
+                        "permissions.default.camera": 1,  # 0=ask, 1=allow, 2=block
+                        "permissions.default.microphone": 1,
+                        "permissions.default.desktop-notification": 1,
+                        "media.navigator.streams.fake": True,
+                        "media.getusermedia.screensharing.enabled": True,
+                        "media.getusermedia.browser.enabled": True,
+                        "dom.disable_beforeunload": True,
+                        "media.autoplay.default": 0,
+                        "media.autoplay.enabled": True,
+                        "privacy.webrtc.legacyGlobalIndicator": False,
+                        "privacy.webrtc.hideGlobalIndicator": True,
+                        "permissions.default.desktop": 1,
+                    }
+                )
+
+            launch_options["firefox_user_prefs"] = firefox_prefs
+            # Note: version is handled during installation, not at launch time
+        elif self.browser_type == "webkit":
+            # WebKit doesn't support channels or direct version specification at launch
+            pass
+
+        # Add custom executable path if specified
+        if self.browser_path:
+            launch_options["executable_path"] = self.browser_path
+
+        return launch_options
+
+    async def _launch_pooled_context(self, disable_args: Optional[List[str]] = None) -> None:
+        """
+        Get a fresh context from the warm browser pool instead of launching a browser.
+        """
+        # Pooled browsers serve many scenarios, so crash dumps go to a run-level folder
+        # rather than this scenario's temp folder (which would also defeat reuse).
+        crash_dir = os.path.join(get_global_conf().get_project_temp_path("browser_pool"), "crashpad")
+        os.makedirs(crash_dir, exist_ok=True)
+        disable_args = [arg for arg in disable_args or [] if not arg.startswith("--crash-dumps-dir=")]
+        if self.browser_type == "chromium":
+            disable_args.append(f"--crash-dumps-dir={crash_dir}")
+
+        launch_options = self._build_launch_options(disable_args)
+        context_options = self._build_emulation_context_options()
+        if self._record_video:
+            context_options["record_video_dir"] = self._video_dir
+
+        logger.info(f"Creating {self.browser_type} context from the browser pool for stake_id '{self.stake_id}'.")
+        self._browser_context = await BrowserPool.instance().new_context(self.browser_type, launch_options, context_options)
+
+        # Add cookies if provided
+        await self._add_cookies_if_provided()
+
     async def _launch_browser_with_video(
         self,
         browser_type: BrowserType,
@@ -634,58 +745,7 @@ class PlaywrightManager:
             user_dir = temp_user_dir
 
         try:
-            if self.browser_type == "chromium" and self._extension_path is not None:
-                disable_args.append(f"--disable-extensions-except={self._extension_path}")
-                disable_args.append(f"--load-extension={self._extension_path}")
-
-            launch_options = {
-                "headless": self.isheadless,
-                "args": disable_args or [],
-            }
-
-            # Handle browser-specific launch options
-            if self.browser_type == "chromium":
-                if self.browser_channel:
-                    launch_options["channel"] = self.browser_channel
-                # Note: version is handled during installation, not at launch time
-            elif self.browser_type == "firefox":
-                firefox_prefs = {
-                    "app.update.auto": False,
-                    "browser.shell.checkDefaultBrowser": False,
-                    "media.navigator.permission.disabled": True,
-                    "permissions.default.screen": 1,
-                    "media.getusermedia.window.enabled": True,
-                }
-
-                # Auto-accept screen sharing if enabled in config
-                if get_global_conf().should_auto_accept_screen_sharing():
-                    firefox_prefs.update(
-                        {
-                            "permissions.default.camera": 1,  # 0=ask, 1=allow, 2=block
-                            "permissions.default.microphone": 1,
-                            "permissions.default.desktop-notification": 1,
-                            "media.navigator.streams.fake": True,
-                            "media.getusermedia.screensharing.enabled": True,
-                            "media.getusermedia.browser.enabled": True,
-                            "dom.disable_beforeunload": True,
-                            "media.autoplay.default": 0,
-                            "media.autoplay.enabled": True,
-                            "privacy.webrtc.legacyGlobalIndicator": False,
-                            "privacy.webrtc.hideGlobalIndicator": True,
-                            "permissions.default.desktop": 1,
-                        }
-                    )
-
-                launch_options["firefox_user_prefs"] = firefox_prefs
-                # Note: version is handled during installation, not at launch time
-            elif self.browser_type == "webkit":
-                # WebKit doesn't support channels or direct version specification at launch
-                pass
-
-            # Add custom executable path if specified
-            if self.browser_path:
-                launch_options["executable_path"] = self.browser_path
-
+            launch_options = self._build_launch_options(disable_args)
             browser = await browser_type.launch(**launch_options)
 
             context_options = {"record_video_dir": self._video_dir}
@@ -1177,8 +1237,11 @@ class PlaywrightManager:
                     traceback.print_exc()
                     logger.error(f"Error stopping trace: {e}")
 
-            await self._browser_context.close()
+            browser_context = self._browser_context
+            await browser_context.close()
             self._browser_context = None
+            if self._use_browser_pool:
+                await BrowserPool.release(browser_context)
 
             # Rename videos after context is closed so Chromium has released the file
             # lock (fixes WinError 32 on Windows)
@@ -1392,8 +1455,11 @@ class PlaywrightManager:
         """Close the current context, re-create with updated emulation settings, then navigate home."""
         logger.debug("Recreating browser context to apply new emulation settings.")
         if self._browser_context:
-            await self._browser_context.close()
+            browser_context = self._browser_context
+            await browser_context.close()
             self._browser_context = None
+            if self._use_browser_pool:
+                await BrowserPool.release(browser_context)
         await self.create_browser_context()
         # Note: create_browser_context already calls _add_cookies_if_provided
         await self.go_to_homepage()
@@ -1645,6 +1711,8 @@ class PlaywrightManager:
         element_name: Optional[str] = None,
     ) -> None:
         """Capture screenshot with bounding box and metadata overlay."""
+        from PIL import Image, ImageDraw, ImageFont
+
         try:
             # Get element's bounding box
             bbox = await element.bounding_box()
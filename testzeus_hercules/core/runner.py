@@ -2,16 +2,18 @@ import asyncio
 import json
 import os
 import time
-from typing import Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import aiofiles
 from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.core.agents_llm_config_manager import AgentsLLMConfigManager
 from testzeus_hercules.core.playwright_manager import PlaywrightManager
-from testzeus_hercules.core.simple_hercules import SimpleHercules
 from testzeus_hercules.utils.cli_helper import async_input  # type: ignore
 from testzeus_hercules.utils.logger import logger
 
+if TYPE_CHECKING:
+    from testzeus_hercules.core.simple_hercules import SimpleHercules
+
 
 class BaseRunner:
     """
@@ -24,6 +26,7 @@ class BaseRunner:
         browser_nav_max_chat_round: int = 50,
         stake_id: str | None = None,
         dont_terminate_browser_after_run: bool = False,
+        close_shared_resources: bool = True,
     ):
         self.planner_number_of_rounds = planner_max_chat_round
         self.nav_agent_number_of_rounds = browser_nav_max_chat_round
@@ -32,6 +35,10 @@ class BaseRunner:
         self.is_running = False
         self.stake_id = stake_id
         self.dont_terminate_browser_after_run = dont_terminate_browser_after_run
+        # When False, shutdown only tears down this runner's own browser and leaves
+        # process-wide resources (other browser instances, MCP connections) alone,
+        # so scenarios running concurrently are not affected.
+        self.close_shared_resources = close_shared_resources
         self.save_chat_logs_to_files = os.getenv(
             "SAVE_CHAT_LOGS_TO_FILE", "True"
         ).lower() in ["true", "1"]
@@ -41,11 +48,30 @@ class BaseRunner:
         self.planner_agent_config: Dict[str, Any] | None = None
         self.nav_agent_config: Dict[str, Any] | None = None
         self.helper_config: Dict[str, Any] | None = None
+        self.startup_timings: Dict[str, float] = {}
 
     async def initialize(self) -> None:
+        """
+        Bring up the configuration, agents, MCP servers and browser for the run.
+
+        The browser launch and the LLM connection warm-up run in the background
+        while the agents are built and the MCP servers are connected, so the
+        start-up cost is that of the slowest phase rather than their sum.
+        """
         if not self.stake_id:
             raise ValueError("stake_id is required")
 
+        started = time.perf_counter()
+        self.startup_timings = {}
+
+        async def timed(phase: str, awaitable: Any) -> Any:
+            phase_started = time.perf_counter()
+            try:
+                return await awaitable
+            finally:
+                self.startup_timings[phase] = time.perf_counter() - phase_started
+
+        config_started = time.perf_counter()
         config_manager = AgentsLLMConfigManager.get_instance()
         config_manager.initialize()
 
@@ -58,25 +84,65 @@ class BaseRunner:
         self.planner_agent_config = dict(planner_config)
         self.nav_agent_config = dict(nav_config)
         self.helper_config = dict(helper_config)
-
-        self.simple_hercules = await SimpleHercules.create(
-            self.stake_id,
-            self.planner_agent_config,
-            self.nav_agent_config,
-            self.helper_config,
-            save_chat_logs_to_files=self.save_chat_logs_to_files,
-            planner_max_chat_round=self.planner_number_of_rounds,
-            browser_nav_max_chat_round=self.nav_agent_number_of_rounds,
-        )
+        self.startup_timings["llm_config"] = time.perf_counter() - config_started
 
         self.browser_manager = PlaywrightManager(
             gui_input_mode=False, stake_id=self.stake_id
         )
-        await self.browser_manager.async_initialize()
+        background = [
+            asyncio.create_task(
+                timed("browser", self.browser_manager.async_initialize())
+            )
+        ]
+        # Imported here: the agents pull in langchain_core's language models, which take
+        # seconds to import and are not needed until a scenario runs.
+        from testzeus_hercules.core.simple_hercules import SimpleHercules
+
+        try:
+            self.simple_hercules = await timed(
+                "agents",
+                SimpleHercules.create(
+                    self.stake_id,
+                    self.planner_agent_config,
+                    self.nav_agent_config,
+                    self.helper_config,
+                    save_chat_logs_to_files=self.save_chat_logs_to_files,
+                    planner_max_chat_round=self.planner_number_of_rounds,
+                    browser_nav_max_chat_round=self.nav_agent_number_of_rounds,
+                ),
+            )
+            background.append(
+                asyncio.create_task(
+                    timed("llm_warmup", self.simple_hercules.warm_up_llm_connections())
+                )
+            )
+            # MCP sessions are bound to the task that opens them, so connect
+            # them here rather than in a background task.
+            await timed("mcp", self.simple_hercules.connect_mcp_servers())
+            for task in background:
+                await task
+        except BaseException:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            raise
+        finally:
+            self.startup_timings["total"] = time.perf_counter() - started
+
+        logger.info(
+            "Start-up timings for %s: %s",
+            self.stake_id,
+            " ".join(
+                f"{phase}={seconds:.2f}s"
+                for phase, seconds in self.startup_timings.items()
+            ),
+        )
 
     async def clean_up(self) -> None:
         if self.simple_hercules:
-            await self.simple_hercules.shutdown()
+            await self.simple_hercules.shutdown(
+                close_shared_resources=self.close_shared_resources
+            )
             self.simple_hercules = None
         if self.browser_manager:
             await self.browser_manager.stop_playwright()
@@ -183,11 +249,16 @@ class BaseRunner:
     async def shutdown(self) -> None:
         logger.info("Shutting down...")
         if self.simple_hercules:
-            await self.simple_hercules.shutdown()
+            await self.simple_hercules.shutdown(
+                close_shared_resources=self.close_shared_resources
+            )
             self.simple_hercules = None
         if self.browser_manager:
             await self.browser_manager.stop_playwright()
-        PlaywrightManager.close_all_instances()
+        if self.close_shared_resources:
+            PlaywrightManager.close_all_instances()
+        else:
+            PlaywrightManager.close_instance(self.stake_id)
         self.shutdown_event.set()
 
     async def start(self) -> None:
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import dataclasses
 import json
 import re
 import time
 import traceback
-from typing import Any, Dict, Literal, Optional, TypedDict
+from typing import Annotated, Any, ClassVar, Dict, Literal, Optional, TypedDict
 
 import nest_asyncio
 import openai
+import testzeus_hercules.core.extra_tools  # noqa: F401
+import testzeus_hercules.core.tools  # noqa: F401
 from langchain_core.messages import (
     AIMessage,
     AnyMessage,
@@ -28,29 +32,74 @@ from testzeus_hercules.core.agents.mcp_nav_agent import McpNavAgent
 from testzeus_hercules.core.agents.sec_nav_agent import SecNavAgent
 from testzeus_hercules.core.agents.sql_nav_agent import SqlNavAgent
 from testzeus_hercules.core.agents.time_keeper_nav_agent import TimeKeeperNavAgent
-from testzeus_hercules.core.extra_tools import *  # noqa: F403
 from testzeus_hercules.core.post_process_responses import (
     final_reply_callback_planner_agent as notify_planner_messages,
 )
-from testzeus_hercules.core.tools import *  # noqa: F403
+from testzeus_hercules.core.state_channels import AppendLog
+from testzeus_hercules.core.step_compiler import (
+    CompiledRun,
+    StepContext,
+    run_leading_steps,
+)
 from testzeus_hercules.core.tools.tool_registry import tool_registry
 from testzeus_hercules.utils.llm_helper import (
     GraphChatResult,
     convert_model_config_to_langchain_format,
     create_multimodal_agent,
+    get_llm_adaptive_timeout_factor,
+    get_llm_hedge_requests,
+    get_llm_history_keep_recent,
+    get_llm_history_token_budget,
+    get_llm_prompt_cache_hints,
+    get_llm_rate_limit_rpm,
+    get_llm_rate_limit_tpm,
     get_llm_request_timeout_seconds,
+    warm_up_llm_connections,
+)
+from testzeus_hercules.utils.history_budget import estimate_message_tokens, fit_history
+from testzeus_hercules.utils.llm_cache import LLMResponseCache, open_llm_cache
+from testzeus_hercules.utils.llm_http_pool import (
+    llm_http_pool_stats,
+    llm_http_pool_usage,
+)
+from testzeus_hercules.utils.llm_latency import hedged_call, llm_latency_tracker
+from testzeus_hercules.utils.llm_rate_limiter import (
+    NAV_PRIORITY,
+    PLANNER_PRIORITY,
+    RateLimitReservation,
+    llm_rate_limiter,
+    model_name_of,
 )
 from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.nav_history import SNAPSHOT_TOOLS, NavHistoryCompactor
+from testzeus_hercules.utils.prompt_layout import (
+    DEFAULT_TIMESTAMP_FORMAT,
+    system_prompt_content,
+    timestamp_line,
+)
 from testzeus_hercules.utils.response_parser import parse_response
+from testzeus_hercules.utils.step_macros import (
+    MacroReplay,
+    StepMacroRecorder,
+    StepMacroStore,
+    open_step_macro_store,
+    replay_step_macro,
+    test_data_digest,
+)
 from testzeus_hercules.utils.timestamp_helper import get_timestamp_str
+from testzeus_hercules.utils.tool_results import (
+    AssertionOutcome,
+    clear_last_results,
+    parse_assertion_result,
+)
 from testzeus_hercules.utils.ui_messagetype import MessageType
 
 nest_asyncio.apply()
 
 
 class AgentState(TypedDict, total=False):
-    # Full planner ↔ helper conversation
-    messages: list[AnyMessage]
+    # Full planner ↔ helper conversation (append-only)
+    messages: Annotated[list[AnyMessage], AppendLog]
     task: str
 
     # Latest parsed planner JSON fields (PlannerAgent schema)
@@ -63,18 +112,27 @@ class AgentState(TypedDict, total=False):
     assert_summary: str
     is_passed: bool
 
-    # Planner turn counter
+    # Turn counters
     planner_turn: int
+    executor_turn: int
 
-    # Token accounting
-    step_token_log: list[dict[str, Any]]
+    # Token accounting (lists are append-only: nodes return only new entries)
+    step_token_log: Annotated[list[dict[str, Any]], AppendLog]
     total_prompt_tokens: int
+    total_cached_tokens: int
     total_completion_tokens: int
     total_steps: int
     total_cost: float
     cost_available: bool
-    step_timings: list[dict[str, Any]]
-    completed_step_signatures: list[str]
+    step_timings: Annotated[list[dict[str, Any]], AppendLog]
+    completed_step_signatures: Annotated[list[str], AppendLog]
+    # Steps of a multi-step plan (PLANNER_BATCH_STEPS) still to run after next_step,
+    # and whether the executor runs the next of them without the planner.
+    queued_steps: list[dict[str, Any]]
+    batch_continues: bool
+    # Outcomes of the assertion tools run since the planner last ran; a failed one
+    # overrides the planner's is_passed.
+    step_assertions: list[dict[str, Any]]
     last_helper_response: str
     current_url: str
 
@@ -82,6 +140,12 @@ class AgentState(TypedDict, total=False):
 class SimpleHercules:
     """LangGraph orchestrator for planner and navigation helper agents."""
 
+    # One set of agents is built per agent configuration; every engine of the process
+    # works on its own copies of them, which share the LLM clients and tool schemas.
+    _shared_agents: ClassVar[dict[str, dict[str, Any]]] = {}
+    # Engines (agents plus compiled graph) parked by ``shutdown`` for the next scenario.
+    _idle_engines: ClassVar[dict[str, list[SimpleHercules]]] = {}
+
     def __init__(
         self,
         stake_id: str,
@@ -101,6 +165,25 @@ class SimpleHercules:
         self._graph = None
         self._last_graph_result: GraphChatResult | None = None
         self._nav_token_log: list[dict[str, Any]] = []
+        # Outcomes of assertion tool calls, appended by ``_run_nav_agent``.
+        self._assertion_log: list[dict[str, Any]] = []
+        self._engine_key: str | None = None
+        # Prompts rendered for this engine's scenario; agents are shared by engines
+        # running concurrently, possibly with different test data.
+        self._system_messages: dict[str, str] = {}
+        # Record/replay store of model responses (LLM_CACHE_MODE), set up by ``create``.
+        self._llm_cache: LLMResponseCache | None = None
+        # Learned browser step macros (STEP_MACRO_MODE), set up by ``create``.
+        self._step_macros: StepMacroStore | None = None
+        # Seconds this engine's model calls spent queued by the rate limiter; nodes
+        # report their share as ``queue_wait`` in ``step_timings``.
+        self._llm_queue_wait = 0.0
+        # Duplicate requests sent by hedging in the current scenario (LLM_HEDGE_REQUESTS).
+        self._llm_hedging = self._new_hedging_stats()
+
+    @staticmethod
+    def _new_hedging_stats() -> dict[str, int]:
+        return {"hedged_requests": 0, "hedges_won": 0, "extra_prompt_tokens": 0}
 
     @staticmethod
     def _step_signature(step: str) -> str:
@@ -123,6 +206,10 @@ class SimpleHercules:
         )
         return not any(marker in lower for marker in failure_markers)
 
+    @staticmethod
+    def _assertion_line(entry: dict[str, Any]) -> str:
+        return str(AssertionOutcome(entry["passed"], entry["check"], entry["evidence"]))
+
     @classmethod
     async def create(
         cls,
@@ -134,6 +221,23 @@ class SimpleHercules:
         planner_max_chat_round: int = 500,
         browser_nav_max_chat_round: int = 10,
     ) -> "SimpleHercules":
+        engine_key = None
+        if get_global_conf().should_reuse_agents():
+            engine_key = cls._engine_key_for(
+                planner_agent_config,
+                nav_agent_config,
+                helper_agent_config,
+                save_chat_logs_to_files,
+                planner_max_chat_round,
+                browser_nav_max_chat_round,
+            )
+            idle_engines = cls._idle_engines.get(engine_key)
+            if idle_engines:
+                self = idle_engines.pop()
+                logger.info("Reusing SimpleHercules engine for %s", stake_id)
+                self._reset_for_scenario(stake_id)
+                return self
+
         logger.info(
             "Creating SimpleHercules (LangGraph), planner rounds=%s, nav rounds=%s",
             planner_max_chat_round,
@@ -163,10 +267,104 @@ class SimpleHercules:
                 model, cfg["llm_config_params"]
             )
 
-        self.agents_map = await self._initialize_agents()
+        shared_agents = cls._shared_agents.get(engine_key) if engine_key else None
+        if shared_agents is None:
+            self.agents_map = await self._initialize_agents()
+            if engine_key:
+                cls._shared_agents[engine_key] = self.agents_map
+                self.agents_map = self._engine_local_agents(self.agents_map)
+        else:
+            self.agents_map = self._engine_local_agents(shared_agents)
+            self._reset_for_scenario(stake_id)
         self._graph = self._build_graph()
+        self._engine_key = engine_key
+        conf = get_global_conf()
+        self._llm_cache = open_llm_cache(
+            conf.get_llm_cache_mode(), conf.get_llm_cache_path()
+        )
+        self._step_macros = open_step_macro_store(
+            conf.get_step_macro_mode(), conf.get_step_macro_path()
+        )
         return self
 
+    @staticmethod
+    def _engine_key_for(*settings: Any) -> str:
+        return json.dumps(settings, sort_keys=True, default=str)
+
+    @staticmethod
+    def _engine_local_agents(shared_agents: dict[str, Any]) -> dict[str, Any]:
+        """Copy the shared agents for one engine, so resetting its tools leaves concurrent engines alone."""
+        agents_map: dict[str, Any] = {}
+        for agent_name, agent in shared_agents.items():
+            local_agent = copy.copy(agent)
+            if isinstance(getattr(agent, "tools", None), list):
+                local_agent.tools = list(agent.tools)
+            agents_map[agent_name] = local_agent
+        return agents_map
+
+    def _reset_for_scenario(self, stake_id: str) -> None:
+        """Point a reused engine at a new scenario and drop the previous one's state."""
+        self.stake_id = stake_id
+        self.timestamp = get_timestamp_str()
+        self._last_graph_result = None
+        self._nav_token_log = []
+        self._assertion_log = []
+        self._system_messages = {}
+        for agent_name, agent in self.agents_map.items():
+            render_system_message = getattr(agent, "render_system_message", None)
+            if render_system_message is not None:
+                self._system_messages[agent_name] = render_system_message()
+            reset_for_scenario = getattr(agent, "reset_for_scenario", None)
+            if reset_for_scenario is not None:
+                reset_for_scenario()
+
+    def _system_message_for(self, agent_name: str, agent: Any) -> str:
+        return self._system_messages.get(agent_name) or getattr(
+            agent, "system_message", "You are a helpful agent."
+        )
+
+    def _system_prompt(self, text: str) -> SystemMessage:
+        """Wrap a rendered system prompt, with a cache breakpoint when hints are enabled."""
+        return SystemMessage(
+            content=system_prompt_content(text, get_llm_prompt_cache_hints())
+        )
+
+    def _nav_task_message(self, nav_agent: Any, task: str) -> HumanMessage:
+        """Build the helper task message; the timestamp goes here, after the cacheable system prompt."""
+        timestamp_format = getattr(
+            nav_agent, "timestamp_format", DEFAULT_TIMESTAMP_FORMAT
+        )
+        return HumanMessage(content=f"{task}\n\n{timestamp_line(timestamp_format)}")
+
+    async def connect_mcp_servers(self) -> None:
+        """Connect the configured MCP servers and attach their tools up front."""
+        conf = get_global_conf()
+        mcp_agent = self.agents_map.get("mcp_nav_agent")
+        if mcp_agent is None or not conf.is_mcp_enabled() or not conf.get_mcp_servers():
+            return
+        await self._ensure_nav_agent_ready(mcp_agent)
+
+    async def warm_up_llm_connections(self) -> None:
+        """Open the connections to the model endpoints used by the agents."""
+        warmed = await warm_up_llm_connections(
+            getattr(agent, "llm", None) for agent in self.agents_map.values()
+        )
+        if warmed:
+            logger.info("Warmed up LLM connections: %s", ", ".join(warmed))
+
+    @classmethod
+    async def destroy_engines(cls) -> None:
+        """Shut down the agents shared across scenarios; call once the run is over."""
+        shared_agents = list(cls._shared_agents.values())
+        cls._shared_agents.clear()
+        cls._idle_engines.clear()
+        for agents_map in shared_agents:
+            for agent in agents_map.values():
+                if hasattr(agent, "shutdown"):
+                    result = agent.shutdown()
+                    if asyncio.iscoroutine(result):
+                        await result
+
     async def _initialize_agents(self) -> dict[str, Any]:
         agents: dict[str, Any] = {}
         if self.nav_agent_config is None:
@@ -248,10 +446,45 @@ class SimpleHercules:
         )
         return prompt_tokens, completion_tokens
 
-    def _record_nav_token_usage(self, agent_name: str, response: Any) -> None:
+    def _cached_tokens(self, response: Any) -> int:
+        """Return the prompt tokens the provider served from its prompt cache."""
+        sources: list[Any] = [self._extract_tokens(response)]
+        usage_metadata = getattr(response, "usage_metadata", None)
+        if isinstance(usage_metadata, dict):
+            sources.append(usage_metadata)
+        for usage in sources:
+            if not isinstance(usage, dict):
+                continue
+            details = (
+                usage.get("prompt_tokens_details")
+                or usage.get("input_token_details")
+                or {}
+            )
+            cached = (
+                usage.get("cache_read_input_tokens")
+                or (details.get("cached_tokens") if isinstance(details, dict) else 0)
+                or (details.get("cache_read") if isinstance(details, dict) else 0)
+            )
+            if cached:
+                try:
+                    return int(cached)
+                except (TypeError, ValueError):
+                    logger.warning(
+                        "[TOKEN_COUNT] Ignoring invalid cached token count %r", cached
+                    )
+        return 0
+
+    def _record_nav_token_usage(
+        self, agent_name: str, response: Any, history_tokens_saved: int = 0
+    ) -> None:
         prompt_tokens, completion_tokens = self._token_counts(response)
         response_cost = self._extract_response_cost(response)
-        if not prompt_tokens and not completion_tokens and response_cost is None:
+        if (
+            not prompt_tokens
+            and not completion_tokens
+            and response_cost is None
+            and not history_tokens_saved
+        ):
             return
         entry = {
             "node": "executor",
@@ -265,8 +498,10 @@ class SimpleHercules:
             )
             + 1,
             "prompt_tokens": prompt_tokens,
+            "cached_tokens": self._cached_tokens(response),
             "completion_tokens": completion_tokens,
             "total_tokens": prompt_tokens + completion_tokens,
+            "history_tokens_saved": history_tokens_saved,
         }
         if response_cost is not None:
             entry["cost"] = response_cost
@@ -288,6 +523,23 @@ class SimpleHercules:
         msg = str(e).lower()
         return any(p in msg for p in self._CONTEXT_LIMIT_PATTERNS)
 
+    def _fit_history(
+        self, messages: list[AnyMessage], agent_name: str
+    ) -> tuple[list[AnyMessage], int]:
+        """Elide older tool outputs before a call so the history fits the token budget."""
+        fitted = fit_history(
+            messages, get_llm_history_token_budget(), get_llm_history_keep_recent()
+        )
+        if fitted.tokens_saved:
+            logger.info(
+                "[HISTORY_BUDGET] agent=%s estimated_tokens=%d->%d saved=%d",
+                agent_name,
+                fitted.tokens_before,
+                fitted.tokens_after,
+                fitted.tokens_saved,
+            )
+        return fitted.messages, fitted.tokens_saved
+
     def _compress_messages(self, messages: list[AnyMessage]) -> list[AnyMessage]:
         """Compress message history to a single summary when context limit is hit."""
         lines = []
@@ -312,13 +564,101 @@ class SimpleHercules:
     async def _llm_ainvoke(
         self, llm: Any, messages: list[AnyMessage], agent_name: str
     ) -> Any:
-        timeout = get_llm_request_timeout_seconds()
+        if self._llm_cache is not None:
+            return await self._llm_cache.ainvoke(
+                llm,
+                messages,
+                agent_name,
+                lambda: self._llm_ainvoke_live(llm, messages, agent_name),
+            )
+        return await self._llm_ainvoke_live(llm, messages, agent_name)
+
+    async def _llm_ainvoke_live(
+        self, llm: Any, messages: list[AnyMessage], agent_name: str
+    ) -> Any:
+        limiter = llm_rate_limiter(
+            model_name_of(llm), get_llm_rate_limit_rpm(), get_llm_rate_limit_tpm()
+        )
+        estimated_tokens = sum(estimate_message_tokens(message) for message in messages)
+        if limiter is None:
+            return await self._llm_ainvoke_timed(
+                llm, messages, agent_name, estimated_tokens
+            )
+        reservation = await limiter.acquire(
+            estimated_tokens,
+            PLANNER_PRIORITY if agent_name == "planner_agent" else NAV_PRIORITY,
+        )
+        self._llm_queue_wait += reservation.queue_wait
+        used_tokens = None
         try:
-            return await asyncio.wait_for(llm.ainvoke(messages), timeout=timeout)
+            response = await self._llm_ainvoke_timed(
+                llm, messages, agent_name, estimated_tokens, limiter
+            )
+            used_tokens = sum(self._token_counts(response))
+            return response
+        finally:
+            limiter.settle(reservation, used_tokens)
+
+    async def _llm_ainvoke_timed(
+        self,
+        llm: Any,
+        messages: list[AnyMessage],
+        agent_name: str,
+        estimated_tokens: int = 0,
+        limiter: Any = None,
+    ) -> Any:
+        model = model_name_of(llm)
+        timeout = llm_latency_tracker.timeout_for(
+            model,
+            agent_name,
+            get_llm_request_timeout_seconds(),
+            get_llm_adaptive_timeout_factor(),
+        )
+        hedge_after = (
+            llm_latency_tracker.p95(model, agent_name)
+            if get_llm_hedge_requests()
+            else None
+        )
+
+        hedge_reservations: list[RateLimitReservation] = []
+
+        def can_hedge() -> bool:
+            # The duplicate only goes out if the rate limiter has spare capacity now.
+            if limiter is None:
+                return True
+            reservation = limiter.try_acquire(estimated_tokens)
+            if reservation is not None:
+                hedge_reservations.append(reservation)
+            return reservation is not None
+
+        hedge_used_tokens = None
+        try:
+            result = await hedged_call(
+                lambda: llm.ainvoke(messages), timeout, hedge_after, can_hedge
+            )
+            hedge_used_tokens = sum(self._token_counts(result.response))
         except asyncio.TimeoutError as e:
             raise TimeoutError(
                 f"{agent_name} LLM call timed out after {timeout:g}s"
             ) from e
+        finally:
+            # The duplicate sent the same prompt; without a response it keeps its estimate.
+            for reservation in hedge_reservations:
+                limiter.settle(reservation, hedge_used_tokens)
+        llm_latency_tracker.record(model, agent_name, result.latency)
+        if result.hedged:
+            # The losing request is cancelled, but its prompt may still be billed.
+            self._llm_hedging["hedged_requests"] += 1
+            self._llm_hedging["hedges_won"] += int(result.hedge_won)
+            self._llm_hedging["extra_prompt_tokens"] += estimated_tokens
+            logger.info(
+                "[LLM_HEDGE] %s call to %s hedged after %.2fs; %s request answered",
+                agent_name,
+                model,
+                hedge_after,
+                "duplicate" if result.hedge_won else "original",
+            )
+        return result.response
 
     async def _ainvoke_with_context_fallback(
         self,
@@ -333,7 +673,7 @@ class SimpleHercules:
             if not self._is_context_limit_error(e):
                 raise
             compressed = self._compress_messages(messages)
-            retry_messages = [SystemMessage(content=system_message), *compressed]
+            retry_messages = [self._system_prompt(system_message), *compressed]
             return await self._llm_ainvoke(llm, retry_messages, agent_name)
 
     def _log_model_call(self, agent_name: str, messages: list[AnyMessage]) -> None:
@@ -347,10 +687,10 @@ class SimpleHercules:
     def _planner_timeout_result(
         self,
         state: AgentState,
-        messages: list[AnyMessage],
         turn: int,
         start: float,
         error: TimeoutError,
+        queue_wait_start: float = 0.0,
     ) -> dict[str, Any]:
         elapsed = time.perf_counter() - start
         final_response = str(error)
@@ -374,7 +714,7 @@ class SimpleHercules:
         notify_planner_messages(final_response, message_type=MessageType.ANSWER)
         return {
             "planner_turn": turn,
-            "messages": messages + [AIMessage(content=content)],
+            "messages": [AIMessage(content=content)],
             "next_step": "",
             "target_helper": "not_applicable",
             "terminate": "yes",
@@ -382,12 +722,12 @@ class SimpleHercules:
             "is_assert": True,
             "assert_summary": assert_summary,
             "is_passed": False,
-            "step_timings": state.get("step_timings", [])
-            + [
+            "step_timings": [
                 {
                     "node": "planner",
                     "turn": turn,
                     "duration": elapsed,
+                    "queue_wait": self._llm_queue_wait - queue_wait_start,
                 }
             ],
         }
@@ -398,6 +738,7 @@ class SimpleHercules:
 
     async def _planner_node(self, state: AgentState) -> dict[str, Any]:
         start = time.perf_counter()
+        queue_wait_start = self._llm_queue_wait
 
         turn = state.get("planner_turn", 0) + 1
 
@@ -413,8 +754,7 @@ class SimpleHercules:
                     f"EXPECTED: task completes within {self.planner_number_of_rounds} rounds. "
                     "ACTUAL: max planner rounds exceeded."
                 ),
-                "step_timings": state.get("step_timings", [])
-                + [
+                "step_timings": [
                     {
                         "node": "planner",
                         "turn": turn,
@@ -424,22 +764,27 @@ class SimpleHercules:
             }
 
         planner: PlannerAgent = self.agents_map["planner_agent"]
+        planner_system_message = self._system_message_for("planner_agent", planner)
 
-        # Build conversation: system + full history (task + all prior exchanges)
-        messages: list[AnyMessage] = list(state.get("messages", []))
-        if not messages or not isinstance(messages[0], SystemMessage):
-            messages = [SystemMessage(content=planner.system_message)] + messages
+        # Build conversation: system + full history (task + all prior exchanges).
+        # The history is the live append-only channel; the model gets a fitted copy.
+        history: list[AnyMessage] = state.get("messages", [])
+        if not history or not isinstance(history[0], SystemMessage):
+            history = [self._system_prompt(planner_system_message), *history]
+        messages, history_tokens_saved = self._fit_history(history, "planner_agent")
 
         self._log_model_call("planner_agent", messages)
         try:
             response = await self._ainvoke_with_context_fallback(
                 planner.llm,
                 messages,
-                planner.system_message,
+                planner_system_message,
                 "planner_agent",
             )
         except TimeoutError as e:
-            return self._planner_timeout_result(state, messages, turn, start, e)
+            return self._planner_timeout_result(
+                state, turn, start, e, queue_wait_start
+            )
 
         # Token accounting
         prompt_tokens, completion_tokens = self._token_counts(response)
@@ -447,8 +792,10 @@ class SimpleHercules:
             "node": "planner",
             "turn": turn,
             "prompt_tokens": prompt_tokens,
+            "cached_tokens": self._cached_tokens(response),
             "completion_tokens": completion_tokens,
             "total_tokens": prompt_tokens + completion_tokens,
+            "history_tokens_saved": history_tokens_saved,
         }
         response_cost = self._extract_response_cost(response)
         if response_cost is not None:
@@ -457,12 +804,15 @@ class SimpleHercules:
 
         content = str(response.content) if response.content else ""
         logger.warning("[PLANNER_DEBUG] turn=%d raw=%s", turn, repr(content)[:400])
-        planner.on_planner_message(content)
 
         try:
             parsed = parse_response(content)
         except Exception:
             parsed = {}
+        content = self._apply_step_assertions(
+            parsed, content, state.get("step_assertions") or []
+        )
+        planner.on_planner_message(content)
 
         # PlannerAgent schema: next_step, target_helper, terminate, is_assert, etc.
         next_step = str(parsed.get("next_step") or "")
@@ -473,12 +823,17 @@ class SimpleHercules:
         assert_summary = str(parsed.get("assert_summary") or "")
         is_passed = bool(parsed.get("is_passed", False))
         plan = str(parsed.get("plan") or state.get("plan", ""))
+        queued_steps: list[dict[str, Any]] = []
+        if terminate != "yes" and not is_assert:
+            next_step, target_helper, queued_steps = self._planned_batch(
+                parsed, next_step, target_helper
+            )
 
         if (
             terminate != "yes"
             and next_step
             and self._step_signature(next_step)
-            in set(state.get("completed_step_signatures", []))
+            in state.get("completed_step_signatures", [])
         ):
             logger.warning(
                 "[PLANNER_REPEAT_NOTICE] Planner repeated an already completed step; allowing execution to continue. step=%s",
@@ -495,14 +850,12 @@ class SimpleHercules:
         if terminate == "yes":
             notify_planner_messages(final_response, message_type=MessageType.ANSWER)
 
-        # Append planner AI message so helper response follows naturally
-        new_messages = messages + [AIMessage(content=content)]
-
         elapsed = time.perf_counter() - start
 
         return {
             "planner_turn": turn,
-            "messages": new_messages,
+            # Appended after the history so the helper response follows naturally
+            "messages": [AIMessage(content=content)],
             "plan": plan,
             "next_step": next_step,
             "target_helper": target_helper,
@@ -511,8 +864,13 @@ class SimpleHercules:
             "is_assert": is_assert,
             "assert_summary": assert_summary,
             "is_passed": is_passed,
-            "step_token_log": state.get("step_token_log", []) + [step_entry],
+            "queued_steps": queued_steps,
+            "batch_continues": False,
+            "step_assertions": [],
+            "step_token_log": [step_entry],
             "total_prompt_tokens": state.get("total_prompt_tokens", 0) + prompt_tokens,
+            "total_cached_tokens": int(state.get("total_cached_tokens", 0) or 0)
+            + step_entry["cached_tokens"],
             "total_completion_tokens": state.get("total_completion_tokens", 0)
             + completion_tokens,
             "total_cost": float(state.get("total_cost", 0.0) or 0.0)
@@ -520,16 +878,83 @@ class SimpleHercules:
             "cost_available": bool(
                 state.get("cost_available", False) or response_cost is not None
             ),
-            "step_timings": state.get("step_timings", [])
-            + [
+            "step_timings": [
                 {
                     "node": "planner",
                     "turn": turn,
                     "duration": elapsed,
+                    "queue_wait": self._llm_queue_wait - queue_wait_start,
                 }
             ],
         }
 
+    def _apply_step_assertions(
+        self,
+        parsed: dict[str, Any],
+        content: str,
+        step_assertions: list[dict[str, Any]],
+    ) -> str:
+        """
+        Let the assertion tools of the last step decide the planner's verdict.
+
+        A planner response asserting the step passed is turned into a failure when one
+        of the step's assertion tools failed; an empty assert_summary gets the tools'
+        evidence. ``parsed`` is updated in place and the response text is returned,
+        rewritten when it changed.
+        """
+        if not step_assertions or not parsed.get("is_assert"):
+            return content
+        failed = [entry for entry in step_assertions if not entry["passed"]]
+        summary = str(parsed.get("assert_summary") or "")
+        if failed and parsed.get("is_passed"):
+            evidence = " ".join(self._assertion_line(entry) for entry in failed)
+            logger.warning(
+                "[PLANNER] assertion tool failed; overriding is_passed: %s",
+                evidence[:300],
+            )
+            parsed["is_passed"] = False
+            parsed["assert_summary"] = f"{evidence} {summary}".strip()
+        elif not summary:
+            parsed["assert_summary"] = " ".join(
+                self._assertion_line(entry) for entry in step_assertions
+            )
+        else:
+            return content
+        return json.dumps(parsed)
+
+    @staticmethod
+    def _planned_batch(
+        parsed: dict[str, Any], next_step: str, target_helper: str
+    ) -> tuple[str, str, list[dict[str, Any]]]:
+        """
+        Return the first step, its helper and the steps queued after it from a planner response.
+
+        Only responses with a ``next_steps`` list (PLANNER_BATCH_STEPS above 1) queue
+        steps; at most PLANNER_BATCH_STEPS steps are kept in total.
+        """
+        batch_steps = get_global_conf().get_planner_batch_steps()
+        planned = parsed.get("next_steps")
+        if batch_steps <= 1 or not isinstance(planned, list):
+            return next_step, target_helper, []
+        steps = [
+            {
+                "step": str(entry.get("step") or "").strip(),
+                "target_helper": str(entry.get("target_helper") or "browser").lower(),
+                "is_assert": bool(entry.get("is_assert", False)),
+            }
+            for entry in planned
+            if isinstance(entry, dict) and str(entry.get("step") or "").strip()
+        ]
+        if not next_step and steps:
+            next_step, target_helper = steps[0]["step"], steps[0]["target_helper"]
+        # The first entry repeats next_step.
+        if steps and steps[0]["step"] == next_step.strip():
+            steps = steps[1:]
+        queued = [
+            step for step in steps[: batch_steps - 1] if step["target_helper"] != "not_applicable"
+        ]
+        return next_step, target_helper, queued
+
     # ------------------------------------------------------------------
     # Helper → target nav-agent mapping
     # ------------------------------------------------------------------
@@ -555,6 +980,7 @@ class SimpleHercules:
         "click_and_upload_file",
         "drag_and_drop",
         "entertext",
+        "execute_action_sequence",
         "hover",
         "press_key_combination",
         "set_current_geo_location",
@@ -583,19 +1009,34 @@ class SimpleHercules:
         if asyncio.iscoroutine(result):
             await result
 
-    async def _get_live_current_url(self) -> str:
-        try:
-            from testzeus_hercules.core.playwright_manager import PlaywrightManager
+    def _browser_managers(self) -> list[Any]:
+        from testzeus_hercules.core.playwright_manager import PlaywrightManager
 
-            managers: list[Any] = []
-            stake_manager = PlaywrightManager._instances.get(self.stake_id)
-            if stake_manager is not None:
-                managers.append(stake_manager)
-            default_manager = PlaywrightManager._default_instance
-            if default_manager is not None and default_manager not in managers:
-                managers.append(default_manager)
+        managers: list[Any] = []
+        stake_manager = PlaywrightManager._instances.get(self.stake_id)
+        if stake_manager is not None:
+            managers.append(stake_manager)
+        default_manager = PlaywrightManager._default_instance
+        if default_manager is not None and default_manager not in managers:
+            managers.append(default_manager)
+        return managers
 
-            for manager in managers:
+    async def _get_live_page(self) -> Any | None:
+        try:
+            for manager in self._browser_managers():
+                get_current_page = getattr(manager, "get_current_page", None)
+                if get_current_page is None:
+                    continue
+                page = await get_current_page()
+                if page is not None:
+                    return page
+        except Exception as e:
+            logger.debug("[EXECUTOR] Unable to get current browser page: %s", e)
+        return None
+
+    async def _get_live_current_url(self) -> str:
+        try:
+            for manager in self._browser_managers():
                 get_current_url = getattr(manager, "get_current_url", None)
                 if get_current_url is None:
                     continue
@@ -691,17 +1132,167 @@ class SimpleHercules:
             else:
                 fn = getattr(tool_obj, "func", tool_obj)
                 tool_result = fn(**tool_args)
+                if asyncio.iscoroutine(tool_result):
+                    tool_result = await tool_result
             return str(tool_result)
         except Exception as te:
             logger.warning("[EXECUTOR] tool %s error: %s", tool_name, te)
             return f"[TOOL ERROR] {tool_name}: {te}"
 
-    def _build_cost_metrics(self, final_state: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    def _is_read_only_call(tool_obj: Any, tool_args: dict[str, Any]) -> bool:
+        """Return whether the ``@tool`` metadata declares this call free of side effects."""
+        read_only = (getattr(tool_obj, "metadata", None) or {}).get("read_only", False)
+        if callable(read_only):
+            try:
+                return bool(read_only(tool_args))
+            except Exception:
+                return False
+        return bool(read_only)
+
+    def _tool_call_batches(
+        self, tool_calls: list[Any], tool_map: dict[str, Any]
+    ) -> list[list[Any]]:
+        """
+        Split tool calls, in order, into batches that may run concurrently.
+
+        Consecutive read-only calls share a batch; any other call runs alone, so
+        it never overlaps the calls before or after it.
+        """
+        batches: list[list[Any]] = []
+        batch_read_only = False
+        for tool_call in tool_calls:
+            tool_obj = tool_map.get(self._tool_call_name(tool_call))
+            # Unknown tools only produce an error message, which is safe to overlap.
+            read_only = tool_obj is None or self._is_read_only_call(
+                tool_obj, self._tool_call_args(tool_call)
+            )
+            if read_only and batch_read_only and batches:
+                batches[-1].append(tool_call)
+            else:
+                batches.append([tool_call])
+            batch_read_only = read_only
+        return batches
+
+    async def _run_tool_call(self, tool_map: dict[str, Any], tool_call: Any) -> str:
+        tool_name = self._tool_call_name(tool_call)
+        tool_obj = tool_map.get(tool_name)
+        if tool_obj is None:
+            return f"[ERROR] Tool '{tool_name}' not found."
+        return await self._execute_tool_call(
+            tool_obj, tool_name, self._tool_call_args(tool_call)
+        )
+
+    async def _run_registered_tool(
+        self, agent_name: str, tool_name: str, tool_args: dict[str, Any]
+    ) -> str:
+        for tool_entry in tool_registry.get(agent_name, []):
+            if tool_entry.get("name") == tool_name:
+                return await self._execute_tool_call(
+                    tool_entry.get("func"), tool_name, tool_args
+                )
+        return f"[ERROR] Tool '{tool_name}' not found."
+
+    def _compiled_final_state(self, compiled: CompiledRun, task: str) -> dict[str, Any]:
+        """Return the final graph state of a scenario the step compiler ran to the end."""
+        results = list(compiled.executed)
+        final_response = "All steps ran as deterministic steps. The test passed."
+        if compiled.failed_assertion is not None:
+            results.append(compiled.failed_assertion)
+            failed_step, failed_result = compiled.failed_assertion
+            final_response = f"Step failed: {failed_step.text}. {failed_result.message}"
+        is_passed = compiled.failed_assertion is None
+        assert_summary = " ".join(
+            result.message for _, result in results if result.is_assert
+        )
+        final_result = {
+            "plan": "",
+            "next_step": "",
+            "terminate": "yes",
+            "final_response": final_response,
+            "is_assert": any(result.is_assert for _, result in results),
+            "assert_summary": assert_summary,
+            "is_passed": is_passed,
+            "target_helper": "Not_Applicable",
+        }
+        notify_planner_messages(final_response, message_type=MessageType.ANSWER)
+        return {
+            "messages": [
+                HumanMessage(content=task),
+                AIMessage(content=json.dumps(final_result)),
+            ],
+            "terminate": "yes",
+            "final_response": final_response,
+            "is_passed": is_passed,
+            "assert_summary": assert_summary,
+            "total_steps": len(compiled.timings),
+            "step_timings": compiled.timings,
+        }
+
+    @staticmethod
+    def _macro_test_data(nav_agent: Any) -> str:
+        """Digest of the test data ``nav_agent`` works with, part of its step macro keys."""
+        get_ltm = getattr(nav_agent, "get_ltm", None)
+        return test_data_digest(get_ltm() if get_ltm is not None else None)
+
+    async def _replay_step_macro(
+        self, nav_agent: Any, step_signature: str, page_url: str
+    ) -> MacroReplay | None:
+        """Replay the learned macro of a browser step; None when there is none."""
+        assert self._step_macros is not None
+        macro = await self._step_macros.get(
+            "browser_nav_agent",
+            step_signature,
+            page_url,
+            self._macro_test_data(nav_agent),
+        )
+        if macro is None:
+            return None
+        await self._ensure_nav_agent_ready(nav_agent)
+        tool_map: dict[str, Any] = {t.name: t for t in getattr(nav_agent, "tools", [])}
+
+        async def run_call(tool_name: str, tool_args: dict[str, Any]) -> str:
+            return await self._run_tool_call(
+                tool_map, {"name": tool_name, "args": tool_args}
+            )
+
+        replay = await replay_step_macro(macro, self._get_live_page, run_call)
+        if replay.completed:
+            logger.info(
+                "[EXECUTOR] replayed step macro (%d tool calls) for: %s",
+                len(macro.calls),
+                step_signature[:200],
+            )
+        return replay
+
+    async def _replay_response(self, replay: MacroReplay) -> str:
+        """The step's response after a complete replay: what each call returned and where the page is now."""
+        page = await self._get_live_page()
+        page_state = "no browser page is open"
+        if page is not None:
+            try:
+                page_state = f"{page.url} (title: {await page.title()!r})"
+            except Exception as e:
+                page_state = f"unknown ({e})"
+        return (
+            "Replayed the recorded tool calls of this step:\n"
+            f"{replay.report()}\n"
+            f"Current page: {page_state}\n"
+            "##TERMINATE TASK##"
+        )
+
+    def _build_cost_metrics(
+        self,
+        final_state: dict[str, Any],
+        llm_http_usage: dict[str, Any] | None = None,
+        llm_latency_since: dict[tuple[str, str], int] | None = None,
+    ) -> dict[str, Any]:
         prompt_tokens = int(final_state.get("total_prompt_tokens", 0) or 0)
         completion_tokens = int(final_state.get("total_completion_tokens", 0) or 0)
         total_tokens = prompt_tokens + completion_tokens
         langgraph_usage: dict[str, Any] = {
             "prompt_tokens": prompt_tokens,
+            "cached_tokens": int(final_state.get("total_cached_tokens", 0) or 0),
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
         }
@@ -715,9 +1306,19 @@ class SimpleHercules:
         else:
             usage["cost_unavailable"] = True
             langgraph_usage["cost_unavailable"] = True
-        return {
+        metrics: dict[str, Any] = {
             "usage_including_cached_inference": usage,
         }
+        if llm_http_usage:
+            # Connection reuse and time to first byte of the pooled LLM clients, per base URL.
+            metrics["llm_http"] = llm_http_usage
+        # Latency of the model calls made since llm_latency_since, i.e. during this scenario.
+        latency = llm_latency_tracker.summary(llm_latency_since)
+        if latency:
+            metrics["llm_latency"] = latency
+        if self._llm_hedging["hedged_requests"]:
+            metrics["llm_hedging"] = dict(self._llm_hedging)
+        return metrics
 
     # ------------------------------------------------------------------
     # Executor node — runs the full nav-agent tool loop for next_step
@@ -725,6 +1326,7 @@ class SimpleHercules:
 
     async def _executor_node(self, state: AgentState) -> dict[str, Any]:
         start = time.perf_counter()
+        queue_wait_start = self._llm_queue_wait
 
         print("\n===== EXECUTOR =====")
         print("STEP RECEIVED:", state.get("next_step"))
@@ -734,39 +1336,30 @@ class SimpleHercules:
         next_step = state.get("next_step", "")
         target_helper = state.get("target_helper", "browser").lower()
 
+        turn = state.get("executor_turn", 0) + 1
         executor_entry = {
             "node": "executor",
-            "turn": len(
-                [
-                    e
-                    for e in state.get("step_token_log", [])
-                    if e.get("node") == "executor"
-                ]
-            )
-            + 1,
+            "turn": turn,
             "prompt_tokens": 0,
+            "cached_tokens": 0,
             "completion_tokens": 0,
             "total_tokens": 0,
             "total_steps": 0,
+            "history_tokens_saved": 0,
         }
 
         if not next_step or target_helper == "not_applicable":
             # Nothing to execute — go straight back to planner
             elapsed = time.perf_counter() - start
             return {
-                "step_token_log": state.get("step_token_log", []) + [executor_entry],
-                "step_timings": state.get("step_timings", [])
-                + [
+                "executor_turn": turn,
+                "queued_steps": [],
+                "batch_continues": False,
+                "step_token_log": [executor_entry],
+                "step_timings": [
                     {
                         "node": "executor",
-                        "turn": len(
-                            [
-                                t
-                                for t in state.get("step_timings", [])
-                                if t["node"] == "executor"
-                            ]
-                        )
-                        + 1,
+                        "turn": turn,
                         "duration": elapsed,
                     }
                 ],
@@ -781,12 +1374,60 @@ class SimpleHercules:
         logger.info("[EXECUTOR] routing to %s | step: %s", agent_name, next_step[:200])
 
         helper_task = await self._build_helper_task(next_step, target_helper, state)
+        step_signature = self._step_signature(next_step)
         nav_token_start = len(self._nav_token_log)
-        helper_response = await self._run_nav_agent(nav_agent, helper_task, agent_name)
+        assertion_start = len(self._assertion_log)
+        helper_response: str | None = None
+        macro_recorder: StepMacroRecorder | None = None
+        step_macros = self._step_macros if agent_name == "browser_nav_agent" else None
+        step_page_url = ""
+        if step_macros is not None and step_signature:
+            step_page_url = await self._get_live_current_url()
+            replay = None
+            if step_macros.replays:
+                replay = await self._replay_step_macro(
+                    nav_agent, step_signature, step_page_url
+                )
+                executor_entry["macro_replayed"] = (
+                    replay is not None and replay.completed
+                )
+            if replay is not None and replay.completed:
+                helper_response = await self._replay_response(replay)
+            elif replay is not None and replay.acted:
+                # The page already went through part of the step; the agent continues from
+                # there. Its calls alone would not be the whole step, so they are not recorded.
+                helper_task += (
+                    "\n\nA recorded action sequence for this step was replayed and stopped early: "
+                    f"{replay.stopped}. These tool calls were already made:\n"
+                    f"{replay.report()}\n"
+                    "Continue the step from the current page state; do not repeat the calls that succeeded."
+                )
+            elif step_macros.records:
+                macro_recorder = StepMacroRecorder(await self._get_live_page())
+        if helper_response is None:
+            helper_response = await self._run_nav_agent(
+                nav_agent, helper_task, agent_name, macro_recorder
+            )
+            if (
+                step_macros is not None
+                and macro_recorder is not None
+                and self._helper_response_succeeded(helper_response)
+            ):
+                macro = macro_recorder.macro(
+                    agent_name,
+                    step_signature,
+                    step_page_url,
+                    self._macro_test_data(nav_agent),
+                )
+                if macro is not None:
+                    await step_macros.put(macro)
         nav_token_entries = self._nav_token_log[nav_token_start:]
         nav_prompt_tokens = sum(
             int(entry.get("prompt_tokens", 0) or 0) for entry in nav_token_entries
         )
+        nav_cached_tokens = sum(
+            int(entry.get("cached_tokens", 0) or 0) for entry in nav_token_entries
+        )
         nav_completion_tokens = sum(
             int(entry.get("completion_tokens", 0) or 0) for entry in nav_token_entries
         )
@@ -796,40 +1437,84 @@ class SimpleHercules:
         ]
         nav_cost = sum(nav_cost_entries)
         executor_entry["prompt_tokens"] = nav_prompt_tokens
+        executor_entry["cached_tokens"] = nav_cached_tokens
         executor_entry["completion_tokens"] = nav_completion_tokens
         executor_entry["total_tokens"] = nav_total_tokens
+        executor_entry["history_tokens_saved"] = sum(
+            int(entry.get("history_tokens_saved", 0) or 0)
+            for entry in nav_token_entries
+        )
         if nav_cost_entries:
             executor_entry["cost"] = nav_cost
 
         logger.info("[EXECUTOR] %s response: %s", agent_name, helper_response[:300])
 
-        # Feed the helper's full response back into the planner conversation
-        messages: list[AnyMessage] = list(state.get("messages", []))
-        messages.append(HumanMessage(content=f"[{agent_name}]: {helper_response}"))
+        # The latest outcome of each check counts, e.g. when the agent re-checked after a wait.
+        step_assertions = list(
+            {
+                entry["check"]: entry
+                for entry in self._assertion_log[assertion_start:]
+            }.values()
+        )
+        helper_message = f"[{agent_name}]: {helper_response}"
+        if step_assertions:
+            helper_message += "\n\nDeterministic assertion results:\n" + "\n".join(
+                self._assertion_line(entry) for entry in step_assertions
+            )
+        if state.get("batch_continues"):
+            step_assertions = list(state.get("step_assertions") or []) + step_assertions
 
-        completed_step_signatures = list(state.get("completed_step_signatures", []))
-        step_signature = self._step_signature(next_step)
+        new_step_signatures: list[str] = []
         if (
             step_signature
             and self._helper_response_succeeded(helper_response)
-            and step_signature not in completed_step_signatures
+            and step_signature not in state.get("completed_step_signatures", [])
         ):
-            completed_step_signatures.append(step_signature)
+            new_step_signatures.append(step_signature)
 
         current_url = str(state.get("current_url") or "")
         if target_helper in {"browser", "agent"}:
             current_url = (await self._get_live_current_url()) or current_url
 
+        # A planned batch goes on with its next step, unless this one failed or asserted.
+        queued_steps = list(state.get("queued_steps") or [])
+        batch_update: dict[str, Any] = {"queued_steps": [], "batch_continues": False}
+        if (
+            queued_steps
+            and not state.get("is_assert", False)
+            and self._helper_response_succeeded(helper_response)
+            and all(entry["passed"] for entry in step_assertions)
+        ):
+            following = queued_steps.pop(0)
+            batch_update = {
+                "next_step": following["step"],
+                "target_helper": following["target_helper"],
+                "is_assert": following["is_assert"],
+                "queued_steps": queued_steps,
+                "batch_continues": True,
+            }
+        elif queued_steps:
+            logger.info(
+                "[EXECUTOR] returning to the planner; %d queued step(s) dropped",
+                len(queued_steps),
+            )
+
         elapsed = time.perf_counter() - start
 
         return {
-            "messages": messages,
-            "completed_step_signatures": completed_step_signatures,
+            **batch_update,
+            # Feed the helper's full response back into the planner conversation
+            "messages": [HumanMessage(content=helper_message)],
+            "completed_step_signatures": new_step_signatures,
+            "step_assertions": step_assertions,
             "last_helper_response": helper_response,
             "current_url": current_url,
-            "step_token_log": state.get("step_token_log", []) + [executor_entry],
+            "executor_turn": turn,
+            "step_token_log": [executor_entry],
             "total_prompt_tokens": int(state.get("total_prompt_tokens", 0) or 0)
             + nav_prompt_tokens,
+            "total_cached_tokens": int(state.get("total_cached_tokens", 0) or 0)
+            + nav_cached_tokens,
             "total_completion_tokens": int(state.get("total_completion_tokens", 0) or 0)
             + nav_completion_tokens,
             "total_cost": float(state.get("total_cost", 0.0) or 0.0) + nav_cost,
@@ -837,32 +1522,32 @@ class SimpleHercules:
                 state.get("cost_available", False) or nav_cost_entries
             ),
             "total_steps": state.get("total_steps", 0) + 1,
-            "step_timings": state.get("step_timings", [])
-            + [
+            "step_timings": [
                 {
                     "node": "executor",
-                    "turn": len(
-                        [
-                            t
-                            for t in state.get("step_timings", [])
-                            if t["node"] == "executor"
-                        ]
-                    )
-                    + 1,
+                    "turn": turn,
                     "duration": elapsed,
+                    "queue_wait": self._llm_queue_wait - queue_wait_start,
                 }
             ],
         }
 
-    async def _run_nav_agent(self, nav_agent: Any, task: str, agent_name: str) -> str:
+    async def _run_nav_agent(
+        self,
+        nav_agent: Any,
+        task: str,
+        agent_name: str,
+        macro_recorder: StepMacroRecorder | None = None,
+    ) -> str:
         """
         Run a nav agent's full multi-turn tool-calling loop.
         Exits when the agent outputs ##TERMINATE TASK## or rounds are exhausted.
+        Executed tool calls are passed to ``macro_recorder`` when one is given.
         """
         await self._ensure_nav_agent_ready(nav_agent)
         tools = getattr(nav_agent, "tools", [])
         llm = getattr(nav_agent, "llm", None)
-        system_msg = getattr(nav_agent, "system_message", "You are a helpful agent.")
+        system_msg = self._system_message_for(agent_name, nav_agent)
 
         if llm is None:
             return f"[ERROR] {agent_name} has no LLM."
@@ -873,8 +1558,8 @@ class SimpleHercules:
                 resp = await self._llm_ainvoke(
                     llm,
                     [
-                        SystemMessage(content=system_msg),
-                        HumanMessage(content=task),
+                        self._system_prompt(system_msg),
+                        self._nav_task_message(nav_agent, task),
                     ],
                     agent_name,
                 )
@@ -891,8 +1576,8 @@ class SimpleHercules:
                 resp = await self._llm_ainvoke(
                     llm,
                     [
-                        SystemMessage(content=system_msg),
-                        HumanMessage(content=task),
+                        self._system_prompt(system_msg),
+                        self._nav_task_message(nav_agent, task),
                     ],
                     agent_name,
                 )
@@ -903,23 +1588,36 @@ class SimpleHercules:
 
         tool_map: dict[str, Any] = {t.name: t for t in tools}
         messages: list[AnyMessage] = [
-            SystemMessage(content=system_msg),
-            HumanMessage(content=task),
+            self._system_prompt(system_msg),
+            self._nav_task_message(nav_agent, task),
         ]
 
-        for _turn in range(self.nav_agent_number_of_rounds):
+        # Superseded page snapshots and repeated tool outputs are replaced by placeholders.
+        compactor = NavHistoryCompactor()
+
+        for turn in range(1, self.nav_agent_number_of_rounds + 1):
             try:
-                response = await self._llm_ainvoke(llm_with_tools, messages, agent_name)
-                self._record_nav_token_usage(agent_name, response)
+                call_messages, history_tokens_saved = self._fit_history(
+                    messages, agent_name
+                )
+                response = await self._llm_ainvoke(
+                    llm_with_tools, call_messages, agent_name
+                )
+                self._record_nav_token_usage(
+                    agent_name,
+                    response,
+                    history_tokens_saved + compactor.chars_saved // 4,
+                )
             except Exception as e:
                 if not self._is_context_limit_error(e):
                     logger.error("[EXECUTOR] %s LLM error: %s", agent_name, e)
                     return f"[ERROR] {agent_name} LLM error: {e}"
                 messages = self._compress_messages(messages)
+                compactor = NavHistoryCompactor()
                 try:
                     response = await self._llm_ainvoke(
                         llm_with_tools,
-                        [SystemMessage(content=system_msg)] + messages,
+                        [self._system_prompt(system_msg)] + messages,
                         agent_name,
                     )
                     self._record_nav_token_usage(agent_name, response)
@@ -938,30 +1636,61 @@ class SimpleHercules:
                 return content_str
 
             tool_messages: list[ToolMessage] = []
+            tool_outputs: list[tuple[str, str, bool]] = []
             executed_tool_calls: list[Any] = []
             refresh_required = False
             skipped_tool_count = 0
 
-            for tool_call in tool_calls:
-                tool_name = self._tool_call_name(tool_call)
-                tool_args = self._tool_call_args(tool_call)
-                tool_id = self._tool_call_id(tool_call, tool_name)
-
-                tool_obj = tool_map.get(tool_name)
-                if tool_obj is None:
-                    tool_result = f"[ERROR] Tool '{tool_name}' not found."
-                else:
-                    tool_result = await self._execute_tool_call(
-                        tool_obj, tool_name, tool_args
+            for batch in self._tool_call_batches(tool_calls, tool_map):
+                if len(batch) > 1:
+                    logger.info(
+                        "[EXECUTOR] %s running %d read-only tool calls concurrently: %s",
+                        agent_name,
+                        len(batch),
+                        [self._tool_call_name(tool_call) for tool_call in batch],
                     )
-
-                executed_tool_calls.append(tool_call)
-                tool_messages.append(
-                    ToolMessage(content=tool_result, tool_call_id=tool_id)
+                macro_calls: list[Any] = []
+                if macro_recorder is not None:
+                    # Target elements are fingerprinted before any call of the batch changes the page.
+                    for tool_call in batch:
+                        macro_calls.append(
+                            await macro_recorder.before_call(
+                                self._tool_call_name(tool_call),
+                                self._tool_call_args(tool_call),
+                            )
+                        )
+                # Results come back in call order, so tool messages keep the model's order.
+                batch_results = await asyncio.gather(
+                    *(self._run_tool_call(tool_map, tool_call) for tool_call in batch)
                 )
+                if macro_recorder is not None:
+                    for macro_call, tool_result in zip(macro_calls, batch_results):
+                        macro_recorder.after_call(macro_call, tool_result)
+                for tool_call, tool_result in zip(batch, batch_results):
+                    tool_name = self._tool_call_name(tool_call)
+                    tool_id = self._tool_call_id(tool_call, tool_name)
+                    executed_tool_calls.append(tool_call)
+                    assertion = parse_assertion_result(tool_result)
+                    if assertion is not None:
+                        self._assertion_log.append(
+                            {"tool": tool_name, **dataclasses.asdict(assertion)}
+                        )
+                    tool_messages.append(
+                        ToolMessage(content=tool_result, tool_call_id=tool_id)
+                    )
+                    changes_page = self._requires_state_refresh(
+                        agent_name, tool_name, tool_result
+                    )
+                    tool_outputs.append(
+                        (
+                            tool_name,
+                            tool_result,
+                            changes_page and tool_name not in SNAPSHOT_TOOLS,
+                        )
+                    )
+                    refresh_required = refresh_required or changes_page
 
-                if self._requires_state_refresh(agent_name, tool_name, tool_result):
-                    refresh_required = True
+                if refresh_required:
                     skipped_tool_count = len(tool_calls) - len(executed_tool_calls)
                     logger.warning(
                         "[EXECUTOR] %s tool %s changed browser state; skipped %s stale tool call(s).",
@@ -977,7 +1706,20 @@ class SimpleHercules:
                 )
             else:
                 messages.append(response)
-            messages.extend(tool_messages)
+            for tool_message, (tool_name, tool_result, changes_page) in zip(
+                tool_messages, tool_outputs
+            ):
+                compactor.record(
+                    len(messages), turn, tool_name, tool_result, changes_page
+                )
+                messages.append(tool_message)
+            compacted_chars = compactor.compact(messages)
+            if compacted_chars:
+                logger.info(
+                    "[EXECUTOR] %s compacted %d characters of superseded tool output",
+                    agent_name,
+                    compacted_chars,
+                )
 
             if refresh_required:
                 messages.append(
@@ -1039,10 +1781,8 @@ class SimpleHercules:
             "final_response": final_response,
             "is_passed": is_passed,
             "assert_summary": assert_summary,
-            "messages": state.get("messages", [])
-            + [AIMessage(content=json.dumps(final_result))],
-            "step_timings": state.get("step_timings", [])
-            + [
+            "messages": [AIMessage(content=json.dumps(final_result))],
+            "step_timings": [
                 {
                     "node": "assertion",
                     "turn": 1,
@@ -1065,8 +1805,11 @@ class SimpleHercules:
 
     def _route_after_executor(
         self, state: AgentState
-    ) -> Literal["planner", "assertion"]:
-        # Always return to planner — it decides when to assert
+    ) -> Literal["planner", "executor", "assertion"]:
+        # The next step of a planned batch runs directly; otherwise the planner decides,
+        # including when to assert.
+        if state.get("batch_continues", False):
+            return "executor"
         return "planner"
 
     def _build_graph(self) -> Any:
@@ -1083,13 +1826,26 @@ class SimpleHercules:
         graph.add_conditional_edges(
             "executor",
             self._route_after_executor,
-            {"planner": "planner", "assertion": "assertion"},
+            {"planner": "planner", "executor": "executor", "assertion": "assertion"},
         )
         graph.add_edge("assertion", END)
         return graph.compile()
 
-    async def shutdown(self) -> None:
+    async def shutdown(self, close_shared_resources: bool = True) -> None:
         await self.clean_up_plan()
+        if self._engine_key is not None:
+            # Keep the agents for the next scenario; only the MCP connections are
+            # per scenario and McpNavAgent reattaches its tools after a reset.
+            self._idle_engines.setdefault(self._engine_key, []).append(self)
+            if close_shared_resources:
+                from testzeus_hercules.utils.mcp_help import MCPHelper
+
+                await MCPHelper.destroy()
+            return
+        if not close_shared_resources:
+            # Agent shutdown tears down the process-wide MCP connections; the
+            # caller releases them once every concurrent scenario has finished.
+            return
         for agent in self.agents_map.values():
             if hasattr(agent, "shutdown"):
                 result = agent.shutdown()
@@ -1113,15 +1869,46 @@ class SimpleHercules:
         if current_url is None and args:
             current_url = str(args[0]) if args[0] else None
 
+        llm_http_stats_before = llm_http_pool_stats()
+        llm_latency_before = llm_latency_tracker.counts()
+        self._llm_hedging = self._new_hedging_stats()
+        # API and SQL assertions only check results of this scenario.
+        clear_last_results()
+        compiled: CompiledRun | None = None
+        if get_global_conf().should_compile_steps():
+            compiled = await run_leading_steps(
+                command,
+                StepContext(
+                    run_tool=self._run_registered_tool, get_page=self._get_live_page
+                ),
+            )
+            if compiled.timings:
+                current_url = (await self._get_live_current_url()) or current_url
+
         task = command
+        if compiled is not None and compiled.executed:
+            executed = "\n".join(
+                f"- {step.text}: {result.message}" for step, result in compiled.executed
+            )
+            task = (
+                f"{compiled.remaining_command}\n\n"
+                f"These steps were already executed, do not repeat them:\n{executed}"
+            )
         if current_url:
-            task = f"{command}\n\nCurrent Page: {current_url}"
+            task = f"{task}\n\nCurrent Page: {current_url}"
         logger.info("Task for command: %s", task)
         try:
             if self._graph is None:
                 raise ValueError("Graph is not initialized.")
+            planner_system_message = self._system_message_for(
+                "planner_agent", self.agents_map["planner_agent"]
+            )
             initial: AgentState = {
-                "messages": [HumanMessage(content=task)],
+                # The planner reads this history as is, so it starts with its prompt.
+                "messages": [
+                    self._system_prompt(planner_system_message),
+                    HumanMessage(content=task),
+                ],
                 "task": task,
                 "plan": "",
                 "next_step": "",
@@ -1132,19 +1919,30 @@ class SimpleHercules:
                 "assert_summary": "",
                 "is_passed": False,
                 "planner_turn": 0,
+                "executor_turn": 0,
                 "step_token_log": [],
                 "total_prompt_tokens": 0,
+                "total_cached_tokens": 0,
                 "total_completion_tokens": 0,
                 "total_cost": 0.0,
                 "cost_available": False,
-                "step_timings": [],
+                "step_timings": list(compiled.timings) if compiled else [],
                 "completed_step_signatures": [],
+                "queued_steps": [],
+                "batch_continues": False,
+                "step_assertions": [],
                 "last_helper_response": "",
                 "current_url": current_url or "",
             }
-            final_state = await self._graph.ainvoke(
-                initial, config={"recursion_limit": 2000}
-            )
+            if compiled is not None and compiled.timings:
+                initial["total_steps"] = len(compiled.timings)
+            if compiled is not None and compiled.finished:
+                # Every step ran deterministically, or an assertion failed: no planner needed.
+                final_state = self._compiled_final_state(compiled, task)
+            else:
+                final_state = await self._graph.ainvoke(
+                    initial, config={"recursion_limit": 2000}
+                )
 
             print("\n===== STEP TIMINGS =====")
 
@@ -1175,8 +1973,13 @@ class SimpleHercules:
             result = GraphChatResult(
                 chat_history=history,
                 messages=messages,
-                cost=self._build_cost_metrics(final_state),
+                cost=self._build_cost_metrics(
+                    final_state,
+                    llm_http_pool_usage(llm_http_stats_before),
+                    llm_latency_before,
+                ),
                 terminate=terminate,
+                step_timings=list(final_state.get("step_timings", [])),
             )
             self._last_graph_result = result
             return result
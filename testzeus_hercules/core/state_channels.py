@@ -0,0 +1,79 @@
+"""Append-only LangGraph state channels for long planner runs."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from langgraph.channels.base import BaseChannel
+
+
+class AppendLog(BaseChannel[list, list, list]):
+    """
+    State channel that appends the entries of every update to a list.
+
+    Nodes return only the entries they add. Unlike an ``operator.add`` reducer
+    the history is never copied: copies of the channel (LangGraph makes one for
+    every conditional edge read) share the backing list and each keeps its own
+    length, so an entry a copy already appended is recognised and not added
+    twice. Values read from the channel must be treated as read-only.
+    """
+
+    __slots__ = ("entries", "length")
+
+    def __init__(self, typ: Any = list, key: str = "") -> None:
+        super().__init__(typ, key)
+        self.entries: list[Any] = []
+        self.length = 0
+
+    @property
+    def ValueType(self) -> Any:
+        return self.typ
+
+    @property
+    def UpdateType(self) -> Any:
+        return self.typ
+
+    def copy(self) -> AppendLog:
+        copied = self.__class__(self.typ, self.key)
+        copied.entries = self.entries
+        copied.length = self.length
+        return copied
+
+    def from_checkpoint(self, checkpoint: Any) -> AppendLog:
+        restored = self.__class__(self.typ, self.key)
+        # LangGraph passes a sentinel, not a list, for a channel the checkpoint lacks.
+        if isinstance(checkpoint, list):
+            restored.entries = list(checkpoint)
+            restored.length = len(restored.entries)
+        return restored
+
+    def update(self, values: Sequence[list]) -> bool:
+        updated = False
+        for value in values:
+            for entry in value:
+                self._append(entry)
+                updated = True
+        return updated
+
+    def _append(self, entry: Any) -> None:
+        if self.length < len(self.entries):
+            if self.entries[self.length] is entry:
+                # A copy of this channel already appended the same write.
+                self.length += 1
+                return
+            # This channel diverged from a copy; stop sharing the backing list.
+            self.entries = self.entries[: self.length]
+        self.entries.append(entry)
+        self.length += 1
+
+    def get(self) -> list:
+        if self.length == len(self.entries):
+            return self.entries
+        return self.entries[: self.length]
+
+    def is_available(self) -> bool:
+        return True
+
+    def checkpoint(self) -> list:
+        return self.get()
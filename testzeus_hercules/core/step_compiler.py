@@ -0,0 +1,250 @@
+"""
+Deterministic execution of mechanical Gherkin steps ahead of the planner.
+
+Steps such as ``Given I open https://example.com``, ``When I wait 5 seconds`` or
+``Then the page title should be "Home"`` need neither planning nor a navigation
+agent loop. Before the planner starts, the leading steps of a scenario are
+matched against the registered step patterns and the matching ones run their
+tool directly. The scenario is handed to the planner, without those steps,
+from the first step that matches no pattern or whose action fails; a failed
+assertion ends the scenario right away.
+
+Patterns are regular expressions matched against the whole step text without
+its Gherkin keyword, ignoring case. ``{name}`` is shorthand for the named group
+``(?P<name>.+?)``. More patterns can be registered from any imported module:
+
+    @step_pattern(r"I clear the cookies", name="clear_cookies")
+    async def clear_cookies(context: StepContext) -> StepResult:
+        ...
+
+Patterns registered later take precedence over earlier ones, including the
+built-in patterns below.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from testzeus_hercules.utils.logger import logger
+
+# Line separator of serialized feature files (see ``serialize_feature_file``).
+LINE_SEPARATOR = ";next;"
+_KEYWORD_PREFIX = re.compile(r"^(?:Given|When|Then|And|But)\s+|^\*\s+")
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_]\w*)\}")
+_FAILED_TOOL_MARKERS = ("[error]", "[tool error]", "'status': 'error'", "error opening url", "timeout error")
+
+
+@dataclass
+class StepContext:
+    """What step handlers may use: registered tools and the current browser page."""
+
+    # Runs a registered tool: (agent name, tool name, arguments) -> result text.
+    run_tool: Callable[[str, str, Dict[str, Any]], Awaitable[str]]
+    # Returns the current browser page, or None when there is no browser.
+    get_page: Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class StepResult:
+    """Outcome of a compiled step."""
+
+    passed: bool
+    message: str
+    is_assert: bool = False
+
+
+StepHandler = Callable[..., Awaitable[StepResult]]
+
+
+@dataclass
+class StepPattern:
+    name: str
+    regex: "re.Pattern[str]"
+    handler: StepHandler
+
+
+@dataclass
+class CompiledStep:
+    """A step matched by a pattern, ready to run."""
+
+    text: str
+    pattern: StepPattern
+    params: Dict[str, str] = field(default_factory=dict)
+
+    async def run(self, context: StepContext) -> StepResult:
+        try:
+            return await self.pattern.handler(context, **self.params)
+        except Exception as e:
+            logger.warning("[STEP_COMPILER] step %r failed: %s", self.text, e)
+            return StepResult(passed=False, message=f"[ERROR] {self.pattern.name}: {e}")
+
+
+class StepPatternRegistry:
+    """Ordered step patterns; the most recently registered match wins."""
+
+    def __init__(self) -> None:
+        self._patterns: List[StepPattern] = []
+
+    def register(self, pattern: str, name: Optional[str] = None) -> Callable[[StepHandler], StepHandler]:
+        regex = re.compile(_PLACEHOLDER.sub(r"(?P<\1>.+?)", pattern), re.IGNORECASE)
+
+        def decorator(handler: StepHandler) -> StepHandler:
+            self._patterns.append(StepPattern(name=name or handler.__name__, regex=regex, handler=handler))
+            return handler
+
+        return decorator
+
+    def match(self, step: str) -> Optional[CompiledStep]:
+        """Return the compiled step for a Gherkin step line, or None when no pattern matches."""
+        text = strip_step_keyword(step)
+        for pattern in reversed(self._patterns):
+            found = pattern.regex.fullmatch(text)
+            if found:
+                params = {key: value for key, value in found.groupdict().items() if value is not None}
+                return CompiledStep(text=step, pattern=pattern, params=params)
+        return None
+
+    def compile(self, lines: List[str], index: int) -> Optional[CompiledStep]:
+        """Compile the step at ``lines[index]``; steps with a data table or doc string never compile."""
+        following = lines[index + 1] if index + 1 < len(lines) else ""
+        if following.startswith(("|", '"""', "```")):
+            return None
+        return self.match(lines[index])
+
+
+step_patterns = StepPatternRegistry()
+
+
+def step_pattern(pattern: str, name: Optional[str] = None) -> Callable[[StepHandler], StepHandler]:
+    """Register a step handler in the global step pattern registry."""
+    return step_patterns.register(pattern, name)
+
+
+def scenario_lines(command: str) -> List[str]:
+    """Split a serialized scenario into its non-empty lines."""
+    return [line.strip() for line in command.split(LINE_SEPARATOR) if line.strip()]
+
+
+def join_scenario_lines(lines: List[str]) -> str:
+    return f" {LINE_SEPARATOR} ".join(lines)
+
+
+def is_step_line(line: str) -> bool:
+    return bool(_KEYWORD_PREFIX.match(line))
+
+
+def strip_step_keyword(step: str) -> str:
+    return _KEYWORD_PREFIX.sub("", step.strip(), count=1).strip()
+
+
+def _tool_failed(result: str) -> bool:
+    lower = result.lower()
+    return any(marker in lower for marker in _FAILED_TOOL_MARKERS)
+
+
+@step_pattern(
+    r"(?:I |the user )?(?:open|opens|navigate to|navigates to|go to|goes to|visit|visits) " r"(?:the )?(?:url |page |website )?[\"']?(?P<url>https?://[^\s\"']+)[\"']?",
+    name="open_url",
+)
+async def open_url_step(context: StepContext, url: str) -> StepResult:
+    result = await context.run_tool("browser_nav_agent", "open_url", {"url": url})
+    return StepResult(passed=not _tool_failed(result), message=result)
+
+
+@step_pattern(
+    r"(?:I |the user )?waits? (?:for )?(?P<seconds>\d+(?:\.\d+)?) ?(?:seconds?|secs?|s)",
+    name="wait",
+)
+async def wait_step(context: StepContext, seconds: str) -> StepResult:
+    result = await context.run_tool("time_keeper_nav_agent", "wait_for_duration", {"duration": float(seconds)})
+    return StepResult(passed=not _tool_failed(result), message=result)
+
+
+@step_pattern(
+    r"(?:the )?(?:page )?title (?:should|must) (?P<operator>be|equal|contain) [\"'](?P<expected>.+)[\"']",
+    name="page_title",
+)
+async def page_title_step(context: StepContext, operator: str, expected: str) -> StepResult:
+    page = await context.get_page()
+    if page is None:
+        return StepResult(passed=False, message="[ERROR] No browser page to read the title from.", is_assert=True)
+    title = re.sub(r"\s+", " ", (await page.title()).strip())
+    expected = re.sub(r"\s+", " ", expected.strip())
+    passed = expected in title if operator.lower() == "contain" else title == expected
+    verb = "contains" if operator.lower() == "contain" else "equals"
+    outcome = "as expected" if passed else "but it does not"
+    return StepResult(passed=passed, message=f"Page title {title!r} {verb} {expected!r}: {outcome}.", is_assert=True)
+
+
+def _step_timing(turn: int, step: CompiledStep, started: float, result: StepResult) -> Dict[str, Any]:
+    return {
+        "node": "compiled_step",
+        "turn": turn,
+        "duration": time.perf_counter() - started,
+        "queue_wait": 0.0,
+        "step": step.text,
+        "pattern": step.pattern.name,
+        "passed": result.passed,
+    }
+
+
+@dataclass
+class CompiledRun:
+    """Steps run by ``run_leading_steps`` and the scenario left for the planner."""
+
+    remaining_command: str
+    executed: List[Tuple[CompiledStep, StepResult]] = field(default_factory=list)
+    # ``step_timings`` entries of every step run, including a failed last one.
+    timings: List[Dict[str, Any]] = field(default_factory=list)
+    failed_assertion: Optional[Tuple[CompiledStep, StepResult]] = None
+    steps_left: bool = True
+
+    @property
+    def finished(self) -> bool:
+        """Whether the scenario needs no planner: every step ran or an assertion failed."""
+        return self.failed_assertion is not None or not self.steps_left
+
+
+async def run_leading_steps(
+    command: str,
+    context: StepContext,
+    registry: StepPatternRegistry = step_patterns,
+) -> CompiledRun:
+    """
+    Run the leading steps of a serialized scenario that match a step pattern.
+
+    Parameters:
+        command (str): The serialized scenario (``serialize_feature_file``).
+        context (StepContext): Tools and page available to step handlers.
+        registry (StepPatternRegistry): The patterns to match; the global registry by default.
+
+    Returns:
+        CompiledRun: The steps run and the scenario without them. A step whose action
+        failed stays in the remaining scenario so the planner can handle it.
+    """
+    lines = scenario_lines(command)
+    run = CompiledRun(remaining_command=command)
+    consumed: set[int] = set()
+    for index, line in enumerate(lines):
+        if not is_step_line(line):
+            continue
+        step = registry.compile(lines, index)
+        if step is None:
+            break
+        started = time.perf_counter()
+        result = await step.run(context)
+        run.timings.append(_step_timing(len(run.timings) + 1, step, started, result))
+        logger.info("[STEP_COMPILER] %s step %r: %s", step.pattern.name, step.text, result.message[:200])
+        if not result.passed:
+            if result.is_assert:
+                run.failed_assertion = (step, result)
+                consumed.add(index)
+            break
+        run.executed.append((step, result))
+        consumed.add(index)
+    if consumed:
+        remaining = [line for index, line in enumerate(lines) if index not in consumed]
+        run.remaining_command = join_scenario_lines(remaining)
+        run.steps_left = any(is_step_line(line) for line in remaining)
+    return run
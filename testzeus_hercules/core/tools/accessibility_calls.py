@@ -20,6 +20,8 @@ AXE_SCRIPT_URL = "https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.10.2/axe.min
     agent_names=["browser_nav_agent"],
     description="Test the current page a11y accessibility using Axe-core. This tool is used to check only the a11y accessibility of the page.",
     name="test_page_accessibility",
+    read_only=True,
+    resource="browser",
 )
 async def test_page_accessibility(
     page_path: Annotated[str, "Current page URL"],
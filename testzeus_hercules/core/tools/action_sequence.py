@@ -0,0 +1,176 @@
+import asyncio
+import time
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Optional
+
+from testzeus_hercules.core.playwright_manager import PlaywrightManager
+from testzeus_hercules.core.tools.click_using_selector import click
+from testzeus_hercules.core.tools.dropdown_using_selector import select_option
+from testzeus_hercules.core.tools.enter_text_using_selector import entertext
+from testzeus_hercules.core.tools.hover import hover
+from testzeus_hercules.core.tools.press_key_combination import press_key_combination
+from testzeus_hercules.core.tools.tool_registry import tool
+from testzeus_hercules.telemetry import EventData, EventType, add_event
+from testzeus_hercules.utils.logger import logger
+
+DEFAULT_POST_CONDITION_TIMEOUT = 5.0
+_POLL_SECONDS = 0.1
+# Failure wording of the browser tools' results.
+_ACTION_FAILURE_MARKERS = ("error:", "[error]", "unable to", "not found", "failed to", "could not")
+_MESSAGE_CHARS = 160
+
+
+def _md_selector(selector: str) -> str:
+    selector = str(selector).strip()
+    return selector if "md=" in selector or not selector.isdigit() else f"[md='{selector}']"
+
+
+async def _perform(action: Dict[str, Any]) -> str:
+    """Run one action through the browser tool that implements it."""
+    kind = str(action.get("action") or "").lower()
+    selector = str(action.get("selector") or "")
+    if kind == "click":
+        return await click(selector=selector, type_of_click=str(action.get("type_of_click") or "click"))
+    if kind in ("enter_text", "entertext"):
+        return await entertext(entry={"selector": selector, "text_to_enter": str(action.get("text") or "")})
+    if kind == "select_option":
+        return await select_option(entry={"selector": selector, "value_to_fill": str(action.get("value") or "")})
+    if kind in ("press_key", "press_key_combination"):
+        return await press_key_combination(key_combination=str(action.get("key") or ""))
+    if kind == "hover":
+        return await hover(selector=selector)
+    if kind == "wait":
+        seconds = min(max(float(action.get("seconds") or 0), 0.0), 60.0)
+        await asyncio.sleep(seconds)
+        return f"Waited {seconds} seconds"
+    return f"Error: unknown action '{kind}'. Use click, enter_text, select_option, press_key, hover or wait."
+
+
+async def _wait_until(check: Callable[[], Awaitable[bool]], timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if await check():
+                return True
+        except Exception as e:
+            logger.debug("Post-condition check failed: %s", e)
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(_POLL_SECONDS)
+
+
+async def _check_post_conditions(
+    expect: Dict[str, Any],
+    get_page: Callable[[], Awaitable[Any]],
+    url_before: str,
+) -> Optional[str]:
+    """Wait for every post-condition of an action; return a description of the first unmet one, or None."""
+    timeout = float(expect.get("timeout") or DEFAULT_POST_CONDITION_TIMEOUT)
+
+    if expect.get("url_changed"):
+
+        async def url_changed() -> bool:
+            return (await get_page()).url != url_before
+
+        if not await _wait_until(url_changed, timeout):
+            return f"url_changed: URL is still {url_before}"
+
+    if expect.get("url_contains"):
+        fragment = str(expect["url_contains"])
+
+        async def url_contains() -> bool:
+            return fragment in (await get_page()).url
+
+        if not await _wait_until(url_contains, timeout):
+            return f"url_contains {fragment!r}: URL is {(await get_page()).url}"
+
+    if expect.get("visible"):
+        visible_selector = _md_selector(expect["visible"])
+
+        async def element_visible() -> bool:
+            return bool(await (await get_page()).locator(visible_selector).first.is_visible())
+
+        if not await _wait_until(element_visible, timeout):
+            return f"visible {visible_selector}: element not visible after {timeout}s"
+
+    if expect.get("text_present"):
+        text = str(expect["text_present"])
+
+        async def text_present() -> bool:
+            return bool(await (await get_page()).evaluate("(text) => !!document.body && document.body.innerText.includes(text)", text))
+
+        if not await _wait_until(text_present, timeout):
+            return f"text_present {text!r}: text not on the page after {timeout}s"
+
+    return None
+
+
+async def run_action_sequence(
+    actions: List[Dict[str, Any]],
+    get_page: Callable[[], Awaitable[Any]],
+    perform: Callable[[Dict[str, Any]], Awaitable[str]] = _perform,
+) -> str:
+    """
+    Run actions in order, checking each one's post-conditions before the next starts.
+
+    Returns a compact report with one line per action run. The sequence stops at the
+    first action that reports a failure or whose post-condition is not met.
+    """
+    lines: List[str] = []
+    completed = 0
+    for index, action in enumerate(actions, start=1):
+        if not isinstance(action, dict):
+            lines.append(f"{index}. invalid action {action!r}: expected an object")
+            break
+        label = f"{index}. {action.get('action', '?')}"
+        if action.get("selector"):
+            label += f" {action['selector']}"
+        url_before = (await get_page()).url
+        result = (await perform(action)).strip()
+        message = result.splitlines()[0][:_MESSAGE_CHARS] if result else "done"
+        if any(marker in result.lower() for marker in _ACTION_FAILURE_MARKERS):
+            lines.append(f"{label}: FAILED - {message}")
+            break
+        unmet = await _check_post_conditions(action.get("expect") or {}, get_page, url_before)
+        if unmet is not None:
+            lines.append(f"{label}: done, but post-condition not met: {unmet}")
+            break
+        appeared = " (new elements appeared)" if "new elements have appeared" in result.lower() else ""
+        lines.append(f"{label}: ok - {message}{appeared}")
+        completed += 1
+    if completed == len(actions):
+        lines.append(f"All {completed} actions completed. Get the DOM again before further interaction.")
+    else:
+        # The [ERROR] prefix lets step macros and the planner tell a stopped sequence from a finished one.
+        lines.append(f"[ERROR] Stopped at action {completed + 1} of {len(actions)}; the remaining actions were not run. Get the DOM again before retrying.")
+    return "\n".join(lines)
+
+
+@tool(
+    agent_names=["browser_nav_agent"],
+    description=(
+        "Runs an ordered list of page actions in ONE call, e.g. filling and submitting a whole form whose md ids are known. "
+        "Each action is an object with 'action' (click, enter_text, select_option, press_key, hover, wait), "
+        "'selector' (md id), 'text' (enter_text), 'value' (select_option), 'key' (press_key) or 'seconds' (wait), and an "
+        "optional 'expect' post-condition object: 'visible' (md id or CSS selector), 'url_changed' (true), 'url_contains', "
+        "'text_present', 'timeout' (seconds, default 5). Stops at the first failed action or unmet post-condition and "
+        "returns a report with one line per action."
+    ),
+    name="execute_action_sequence",
+    resource="browser",
+)
+async def execute_action_sequence(
+    actions: Annotated[
+        List[Dict[str, Any]],
+        "Ordered actions, e.g. [{'action': 'enter_text', 'selector': '12', 'text': 'ada'}, " "{'action': 'click', 'selector': '15', 'expect': {'url_changed': true}}]",
+    ],
+) -> Annotated[str, "One line per action run, then whether the sequence completed or where it stopped."]:
+    add_event(EventType.INTERACTION, EventData(detail="execute_action_sequence"))
+    logger.info(f"Executing action sequence of {len(actions)} actions")
+    browser_manager = PlaywrightManager()
+
+    async def get_page() -> Any:
+        return await browser_manager.get_current_page()
+
+    if not actions:
+        return "Error: no actions given."
+    return await run_action_sequence(actions, get_page)
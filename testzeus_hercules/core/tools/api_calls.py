@@ -7,6 +7,7 @@ import httpx
 from testzeus_hercules.core.tools.tool_registry import api_logger as file_logger
 from testzeus_hercules.core.tools.tool_registry import tool
 from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.tool_results import API_RESULT, record_last_result, start_result
 
 # ------------------------------------------------------------------------------
 # Logging and Utility Functions
@@ -139,6 +140,7 @@ async def _send_request(
         headers.setdefault("Content-Type", "application/json")
         req_kwargs["json"] = body
 
+    started = start_result()
     start_time = time.perf_counter()
     try:
         async with httpx.AsyncClient(
@@ -162,6 +164,7 @@ async def _send_request(
                 "status_type": determine_status_type(response.status_code),
                 "body": parsed_body,
             }
+            record_last_result(API_RESULT, {"method": method.upper(), "url": url, "duration": duration, **result}, started)
             # Minify the JSON response and replace double quotes with single quotes.
             result_str = json.dumps(result, separators=(",", ":")).replace('"', "'")
             return result_str, duration
@@ -170,6 +173,7 @@ async def _send_request(
         duration = time.perf_counter() - start_time
         logger.error(f"HTTP error: {e}")
         error_data = await handle_error_response(e)
+        record_last_result(API_RESULT, {"method": method.upper(), "url": url, "duration": duration, **error_data}, started)
         return json.dumps(error_data, separators=(",", ":")).replace('"', "'"), duration
 
     except Exception as e:
@@ -179,6 +183,7 @@ async def _send_request(
         duration = time.perf_counter() - start_time
         logger.error(f"Unexpected error: {e}")
         error_data = {"error": str(e), "status_code": None, "status_type": "failure"}
+        record_last_result(API_RESULT, {"method": method.upper(), "url": url, "duration": duration, **error_data}, started)
         return json.dumps(error_data, separators=(",", ":")).replace('"', "'"), duration
 
 
@@ -187,9 +192,16 @@ async def _send_request(
 # ------------------------------------------------------------------------------
 
 
+def _is_safe_method(args: Dict[str, Any]) -> bool:
+    """Only GET, HEAD and OPTIONS requests leave the server state unchanged."""
+    return str(args.get("method") or "").strip().upper() in ("GET", "HEAD", "OPTIONS")
+
+
 @tool(
     agent_names=["api_nav_agent"],
     name="generic_http_api",
+    read_only=_is_safe_method,
+    resource="http",
     description=(
         "Generic HTTP API call that supports any combination of HTTP method, "
         "authentication, query parameters, and request body encoding. "
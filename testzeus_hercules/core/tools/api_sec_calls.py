@@ -14,9 +14,15 @@ from testzeus_hercules.core.tools.tool_registry import sec_logger as file_logger
 from testzeus_hercules.core.tools.tool_registry import tool
 from testzeus_hercules.utils.logger import logger
 
-# Define cache and binary paths
-CACHE_DIR = Path(get_global_conf().get_hf_home()) / "nuclei_tool"
-NUCLEI_BINARY = CACHE_DIR / "nuclei"
+
+def get_nuclei_cache_dir() -> Path:
+    """Return the folder the Nuclei binary is cached in, read from the config when needed rather than at import."""
+    return Path(get_global_conf().get_hf_home()) / "nuclei_tool"
+
+
+def get_nuclei_binary() -> Path:
+    """Return the path of the cached Nuclei binary."""
+    return get_nuclei_cache_dir() / "nuclei"
 
 
 NUCLEI_RELEASE_API_URL = "https://api.github.com/repos/projectdiscovery/nuclei/releases/latest"
@@ -72,14 +78,15 @@ async def get_latest_nuclei_version(
 
 async def ensure_nuclei_installed() -> None:
     """Ensure that Nuclei binary is installed in the cache directory."""
-    if NUCLEI_BINARY.exists():
+    cache_dir = get_nuclei_cache_dir()
+    if get_nuclei_binary().exists():
         logger.info("Nuclei binary already exists.")
         file_logger("Nuclei binary already exists.")
         return
 
     logger.info("Nuclei binary not found. Downloading...")
     file_logger("Nuclei binary not found. Downloading...")
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
 
     system = platform.system()
     arch = platform.machine()
@@ -102,19 +109,19 @@ async def ensure_nuclei_installed() -> None:
 
     nuclei_url = NUCLEI_DOWNLOAD_URL_TEMPLATE.format(version=version, filename=nuclei_filename)
 
-    archive_path = CACHE_DIR / nuclei_filename
+    archive_path = cache_dir / nuclei_filename
     await download_file(nuclei_url, archive_path)
 
     # Extract the binary
     if archive_path.suffix == ".zip":
         with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            zip_ref.extract(binary_name, CACHE_DIR)
+            zip_ref.extract(binary_name, cache_dir)
     else:
         with tarfile.open(archive_path, "r:gz") as tar_ref:
-            tar_ref.extract(binary_name, path=CACHE_DIR)
+            tar_ref.extract(binary_name, path=cache_dir)
 
     # Make the binary executable
-    nuclei_binary_path = CACHE_DIR / binary_name
+    nuclei_binary_path = cache_dir / binary_name
     nuclei_binary_path.chmod(0o755)
     logger.info("Nuclei binary downloaded and installed.")
     file_logger("Nuclei binary downloaded and installed.")
@@ -133,7 +140,7 @@ async def run_nuclei_command(
     await ensure_nuclei_installed()
 
     command = [
-        str(NUCLEI_BINARY),
+        str(get_nuclei_binary()),
         "-skip-format-validation",
         "-v",
         "-tags",
@@ -0,0 +1,247 @@
+"""
+Deterministic assertion tools.
+
+Each tool checks one condition in the browser, or on the last API response or SQL
+result, and answers with a single line that starts with ``[ASSERT PASS]`` or
+``[ASSERT FAIL]`` followed by the evidence, instead of handing the page text to the
+model to judge. The executor collects these lines and feeds them into the planner's
+``is_assert``/``is_passed`` state (see ``SimpleHercules._executor_node``).
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Optional
+
+from testzeus_hercules.core.playwright_manager import PlaywrightManager
+from testzeus_hercules.core.tools.tool_registry import tool
+from testzeus_hercules.telemetry import EventData, EventType, add_event
+from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.tool_results import (
+    API_RESULT,
+    ASSERT_FAIL,
+    SQL_RESULT,
+    AssertionOutcome,
+    get_last_result,
+)
+
+DEFAULT_ASSERT_TIMEOUT = 3.0
+_POLL_SECONDS = 0.2
+_EVIDENCE_CHARS = 200
+
+_TEXT_ON_PAGE_JS = """(text) => {
+    const rendered = (document.body ? document.body.innerText : "").replace(/\\s+/g, " ");
+    const index = rendered.toLowerCase().indexOf(text.toLowerCase());
+    if (index < 0) {
+        return {found: false, snippet: rendered.slice(0, 120), length: rendered.length};
+    }
+    const start = Math.max(0, index - 40);
+    return {found: true, snippet: rendered.slice(start, index + text.length + 40), length: rendered.length};
+}"""
+
+
+def _clip(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, default=str, separators=(",", ":"))
+    return text if len(text) <= _EVIDENCE_CHARS else text[:_EVIDENCE_CHARS] + "..."
+
+
+def _md_selector(selector: str) -> str:
+    selector = str(selector).strip()
+    return selector if "md=" in selector or not selector.isdigit() else f"[md='{selector}']"
+
+
+def _compare(actual: int, expected: int, comparison: str) -> bool:
+    if comparison == "at_least":
+        return actual >= expected
+    if comparison == "at_most":
+        return actual <= expected
+    return actual == expected
+
+
+async def check_text_visible(page: Any, text: str, visible: bool = True) -> AssertionOutcome:
+    """Check whether ``text`` is part of the rendered page text, ignoring case and whitespace."""
+    text = re.sub(r"\s+", " ", str(text)).strip()
+    found = await page.evaluate(_TEXT_ON_PAGE_JS, text)
+    check = f"text {text!r} is {'visible' if visible else 'not visible'}"
+    if found["found"]:
+        evidence = f"found in ...{found['snippet']}..."
+    else:
+        evidence = f"not in the {found['length']} characters of page text, which starts {found['snippet']!r}"
+    return AssertionOutcome(passed=bool(found["found"]) == visible, check=check, evidence=evidence)
+
+
+async def check_url(page: Any, expected: str, match: str = "contains") -> AssertionOutcome:
+    """Check the page URL against ``expected`` with ``match`` ("contains", "equals" or "regex")."""
+    url = page.url
+    if match == "equals":
+        passed = url.rstrip("/") == expected.rstrip("/")
+    elif match == "regex":
+        passed = re.search(expected, url) is not None
+    else:
+        match = "contains"
+        passed = expected in url
+    return AssertionOutcome(passed=passed, check=f"URL {match} {expected!r}", evidence=f"URL is {url}")
+
+
+async def check_element_count(page: Any, selector: str, expected_count: int, comparison: str = "equals") -> AssertionOutcome:
+    """Count the elements matching ``selector`` (md id or CSS selector) and compare with ``expected_count``."""
+    selector = _md_selector(selector)
+    count = await page.locator(selector).count()
+    comparison = comparison if comparison in ("at_least", "at_most") else "equals"
+    return AssertionOutcome(
+        passed=_compare(count, int(expected_count), comparison),
+        check=f"count of {selector} {comparison.replace('_', ' ')} {expected_count}",
+        evidence=f"{count} element(s) match",
+    )
+
+
+def check_api_response(result: Optional[Dict[str, Any]], expected_status: int = 200, body_contains: str = "") -> AssertionOutcome:
+    """Check the status code, and optionally the body, of the last API response."""
+    check = f"API status is {expected_status}" + (f" and body contains {body_contains!r}" if body_contains else "")
+    if result is None:
+        return AssertionOutcome(passed=False, check=check, evidence="no API call has been made in this test")
+    status = result.get("status_code")
+    body = result.get("body", result.get("error_detail", result.get("error", "")))
+    passed = status == int(expected_status)
+    if body_contains:
+        body_text = body if isinstance(body, str) else json.dumps(body, default=str)
+        passed = passed and body_contains in body_text
+    evidence = f"{result.get('method', '')} {result.get('url', '')} returned {status}; body {_clip(body)}"
+    return AssertionOutcome(passed=passed, check=check, evidence=evidence.strip())
+
+
+def check_sql_result(result: Optional[Dict[str, Any]], expected_row_count: int = -1, expected_value: str = "") -> AssertionOutcome:
+    """Check the row count of, and optionally a value in, the last SQL query result."""
+    parts = []
+    if expected_row_count >= 0:
+        parts.append(f"row count is {expected_row_count}")
+    if expected_value:
+        parts.append(f"a row has the value {expected_value!r}")
+    check = "SQL result " + (" and ".join(parts) or "has no error")
+    if result is None:
+        return AssertionOutcome(passed=False, check=check, evidence="no SQL query has been run in this test")
+    if "error" in result:
+        return AssertionOutcome(passed=False, check=check, evidence=f"the query failed: {_clip(result['error'])}")
+    rows: List[Dict[str, Any]] = result.get("rows") or []
+    passed = expected_row_count < 0 or len(rows) == expected_row_count
+    evidence = f"{len(rows)} row(s)"
+    if expected_value:
+        matching = [row for row in rows if any(str(value) == expected_value for value in row.values())]
+        passed = passed and bool(matching)
+        evidence += f", {len(matching)} with the value"
+        if matching:
+            evidence += f", first: {_clip(matching[0])}"
+    elif rows:
+        evidence += f", first: {_clip(rows[0])}"
+    return AssertionOutcome(passed=passed, check=check, evidence=evidence)
+
+
+async def check_eventually(check: Callable[[], Awaitable[AssertionOutcome]], timeout: float) -> AssertionOutcome:
+    """Re-run a browser check until it passes or ``timeout`` seconds are over; return the last outcome."""
+    deadline = time.monotonic() + max(float(timeout), 0.0)
+    while True:
+        outcome = await check()
+        if outcome.passed or time.monotonic() >= deadline:
+            return outcome
+        await asyncio.sleep(_POLL_SECONDS)
+
+
+async def _page_check(name: str, check: Callable[[Any], Awaitable[AssertionOutcome]], timeout: float) -> str:
+    add_event(EventType.INTERACTION, EventData(detail=name))
+    page = await PlaywrightManager().get_current_page()
+    if page is None:
+        return f"{ASSERT_FAIL} {name}: no active page. OpenURL command opens a new page."
+    try:
+        outcome = await check_eventually(lambda: check(page), timeout)
+    except Exception as e:
+        logger.exception(f"Error in {name}: {e}")
+        return f"{ASSERT_FAIL} {name}: the check could not run: {e}"
+    logger.info(f"{name}: {outcome}")
+    return str(outcome)
+
+
+@tool(
+    agent_names=["browser_nav_agent"],
+    description=("Asserts that a text is (or is not) visible on the current page, without reading the page text. " "Returns one line: [ASSERT PASS] or [ASSERT FAIL] with evidence."),
+    name="assert_text_visible",
+    read_only=True,
+    resource="browser",
+)
+async def assert_text_visible(
+    text: Annotated[str, "Text expected on the page; case and whitespace are ignored."],
+    visible: Annotated[bool, "False to assert the text is NOT visible."] = True,
+    timeout: Annotated[float, "Seconds to wait for the condition to hold."] = DEFAULT_ASSERT_TIMEOUT,
+) -> Annotated[str, "[ASSERT PASS] or [ASSERT FAIL] with evidence."]:
+    return await _page_check("assert_text_visible", lambda page: check_text_visible(page, text, visible), timeout)
+
+
+@tool(
+    agent_names=["browser_nav_agent"],
+    description=("Asserts the current page URL contains, equals or matches (regex) an expected value. " "Returns one line: [ASSERT PASS] or [ASSERT FAIL] with evidence."),
+    name="assert_url",
+    read_only=True,
+    resource="browser",
+)
+async def assert_url(
+    expected: Annotated[str, "Expected URL, URL part or regular expression."],
+    match: Annotated[str, "How to compare: contains, equals or regex."] = "contains",
+    timeout: Annotated[float, "Seconds to wait for the condition to hold."] = DEFAULT_ASSERT_TIMEOUT,
+) -> Annotated[str, "[ASSERT PASS] or [ASSERT FAIL] with evidence."]:
+    return await _page_check("assert_url", lambda page: check_url(page, expected, match), timeout)
+
+
+@tool(
+    agent_names=["browser_nav_agent"],
+    description=(
+        "Asserts how many elements on the current page match a selector (md id or CSS selector), e.g. the rows " "of a result list. Returns one line: [ASSERT PASS] or [ASSERT FAIL] with evidence."
+    ),
+    name="assert_element_count",
+    read_only=True,
+    resource="browser",
+)
+async def assert_element_count(
+    selector: Annotated[str, "md id or CSS selector of the elements to count, e.g. 'ul.results > li'."],
+    expected_count: Annotated[int, "Expected number of matching elements."],
+    comparison: Annotated[str, "equals, at_least or at_most."] = "equals",
+    timeout: Annotated[float, "Seconds to wait for the condition to hold."] = DEFAULT_ASSERT_TIMEOUT,
+) -> Annotated[str, "[ASSERT PASS] or [ASSERT FAIL] with evidence."]:
+    return await _page_check(
+        "assert_element_count",
+        lambda page: check_element_count(page, selector, expected_count, comparison),
+        timeout,
+    )
+
+
+# The API and SQL assertions are not read-only tools, so they never run concurrently
+# with (and before) the call whose result they check.
+@tool(
+    agent_names=["api_nav_agent"],
+    description=("Asserts the status code, and optionally a text in the body, of the last API response of this test. " "Returns one line: [ASSERT PASS] or [ASSERT FAIL] with evidence."),
+    name="assert_api_response",
+    resource="http",
+)
+async def assert_api_response(
+    expected_status: Annotated[int, "Expected HTTP status code."] = 200,
+    body_contains: Annotated[str, "Optional text the response body must contain."] = "",
+) -> Annotated[str, "[ASSERT PASS] or [ASSERT FAIL] with evidence."]:
+    add_event(EventType.INTERACTION, EventData(detail="assert_api_response"))
+    outcome = check_api_response(get_last_result(API_RESULT), expected_status, body_contains)
+    logger.info(f"assert_api_response: {outcome}")
+    return str(outcome)
+
+
+@tool(
+    agent_names=["sql_nav_agent"],
+    description=("Asserts the row count of, and optionally a value in, the last SQL query result of this test. " "Returns one line: [ASSERT PASS] or [ASSERT FAIL] with evidence."),
+    name="assert_sql_result",
+    resource="sql",
+)
+async def assert_sql_result(
+    expected_row_count: Annotated[int, "Expected number of rows; -1 to skip the row count check."] = -1,
+    expected_value: Annotated[str, "Optional value some column of some row must equal."] = "",
+) -> Annotated[str, "[ASSERT PASS] or [ASSERT FAIL] with evidence."]:
+    add_event(EventType.INTERACTION, EventData(detail="assert_sql_result"))
+    outcome = check_sql_result(get_last_result(SQL_RESULT), expected_row_count, expected_value)
+    logger.info(f"assert_sql_result: {outcome}")
+    return str(outcome)
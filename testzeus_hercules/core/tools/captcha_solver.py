@@ -11,6 +11,7 @@ from testzeus_hercules.utils.logger import logger
 @tool(
     agent_names=["browser_nav_agent"],
     name="captcha_solver",
+    resource="browser",
     description="solves captcha on the page, should be only used when you are sure that there is a captcha on the page and has to be solved.",
 )
 async def captcha_solver(
@@ -31,6 +31,7 @@ def get_page_data(page: Any) -> dict[str, Any]:
     agent_names=["browser_nav_agent"],
     description="""Clicks element by md attribute. Returns success/failure status.""",
     name="click",
+    resource="browser",
 )
 async def click(
     selector: Annotated[str, """selector using md attribute, just give the md ID value"""],
@@ -355,6 +355,7 @@ async def interact_with_element_select_type(
 @tool(
     agent_names=["browser_nav_agent"],
     name="bulk_select_option",
+    resource="browser",
     description=("Used to select/search options in multiple picklists/listboxes/comboboxes/dropdowns/spinners in a single attempt. Each entry is a dictionary with selector and value_to_fill."),
 )
 async def bulk_select_option(
@@ -130,6 +130,7 @@ async def do_set_date_time_value(page: Page, selector: str, input_value: str) ->
 @tool(
     agent_names=["browser_nav_agent"],
     name="bulk_set_date_time_value",
+    resource="browser",
     description="Sets values in multiple date, time elements using a bulk operation. only used for date or time fields.",
 )
 async def bulk_set_date_time_value(
@@ -258,6 +258,7 @@ async def do_entertext(page: Page, selector: str, text_to_enter: str, use_keyboa
 @tool(
     agent_names=["browser_nav_agent"],
     name="bulk_enter_text",
+    resource="browser",
     description="Enters text into multiple text fields and textarea elements using a bulk operation based on detected fields details. An dict containing'selector' (selector query using md attribute e.g. [md='114'] md is ID) and 'text' (text to enter on the element)",
 )
 async def bulk_enter_text(
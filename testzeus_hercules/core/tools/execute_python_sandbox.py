@@ -35,6 +35,7 @@ class ExecutionTimeout(Exception):
     The code file can contain both synchronous and asynchronous functions.
     Supports multi-tenant injections configured via environment variables.""",
     name="execute_python_sandbox",
+    resource="browser",
 )
 async def execute_python_sandbox(
     file_path: Annotated[str, "Path to Python file to execute"],
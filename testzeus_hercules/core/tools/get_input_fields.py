@@ -22,6 +22,8 @@ from testzeus_hercules.utils.logger import logger
     description="""DOM Type dict Retrieval Tool, giving only html input types elements on page.
 Notes: [Elements ordered as displayed, Consider ordinal/numbered item positions]""",
     name="get_input_fields",
+    read_only=True,
+    resource="browser",
 )
 async def get_input_fields() -> Annotated[str, "DOM type dict giving all input elements on page"]:
 
@@ -22,6 +22,8 @@ from testzeus_hercules.utils.logger import logger
     description="""DOM Type dict Retrieval Tool, giving all interactive elements on page.
 Notes: [Elements ordered as displayed, Consider ordinal/numbered item positions, List ordinal represent z-index on page]""",
     name="get_interactive_elements",
+    read_only=True,
+    resource="browser",
 )
 async def get_interactive_elements() -> Annotated[str, "DOM type dict giving all interactive elements on page"]:
     add_event(EventType.INTERACTION, EventData(detail="get_interactive_elements"))
@@ -16,6 +16,8 @@ from testzeus_hercules.utils.logger import logger
     agent_names=["browser_nav_agent"],
     description="""Retrieve Text on the current page""",
     name="get_page_text",
+    read_only=True,
+    resource="browser",
 )
 async def get_page_text() -> Annotated[str, "DOM content based on type to analyze and decide"]:
 
@@ -25,6 +25,7 @@ from testzeus_hercules.utils.logger import logger
         "are also accepted."
     ),
     name="hover",
+    resource="browser",
 )
 async def hover(
     selector: Annotated[str, "Numeric md id, CSS selector, or visible element description to hover"],
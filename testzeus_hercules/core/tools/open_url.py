@@ -16,6 +16,7 @@ from testzeus_hercules.utils.logger import logger
     agent_names=["browser_nav_agent"],
     description="""Opens specified URL in browser. Returns new page URL or error message.""",
     name="open_url",
+    resource="browser",
 )
 async def open_url(
     url: Annotated[
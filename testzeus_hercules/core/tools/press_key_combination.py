@@ -16,6 +16,7 @@ from testzeus_hercules.utils.logger import logger
     agent_names=["browser_nav_agent"],
     description="""Executes key press on page (Enter, PageDown, ArrowDown, etc.).""",
     name="press_key_combination",
+    resource="browser",
 )
 async def press_key_combination(
     key_combination: Annotated[str, "key to press, e.g., Enter, PageDown etc"],
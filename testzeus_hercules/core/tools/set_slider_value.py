@@ -267,6 +267,7 @@ async def do_setslider(page: Page, selector: str, value_to_set: float) -> dict[s
     agent_names=["browser_nav_agent"],
     description="used to set slider values in multiple sliders in single attempt.",
     name="bulk_set_slider",
+    resource="browser",
 )
 async def bulk_set_slider(
     entries: Annotated[
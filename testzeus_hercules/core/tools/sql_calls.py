@@ -1,17 +1,32 @@
+import re
 import traceback
-from typing import Annotated, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional, Union
 
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
-from sqlalchemy.sql import text
 from testzeus_hercules.core.tools.tool_registry import tool, tool_registry
 from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.tool_results import SQL_RESULT, record_last_result, start_result
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+# A SELECT can still write through SELECT ... INTO, a WITH query through a
+# data-modifying CTE, and either through a second statement after a ";".
+_DATA_MODIFYING_SQL = re.compile(r"\b(insert|update|delete|merge|truncate|drop|alter|create|into)\b")
+
+
+def _is_read_only_query(args: Dict[str, Any]) -> bool:
+    query = str(args.get("query") or "").strip().lower().rstrip(";").rstrip()
+    if not query.startswith(("select", "with")) or ";" in query:
+        return False
+    return not _DATA_MODIFYING_SQL.search(query)
 
 
 @tool(
     agent_names=["sql_nav_agent"],
     description="Execute a SELECT SQL query on remote db, it should be only used when the instruction request to fetch data from database.",
     name="execute_select_query_sql_async",
+    read_only=_is_read_only_query,
+    resource="sql",
 )
 async def execute_select_cte_query_sql(
     connection_string: Annotated[
@@ -108,7 +123,13 @@ async def execute_select_cte_query_sql(
       Check for this in your code to handle errors gracefully.
 
     """
-    engine: AsyncEngine = None
+    # SQLAlchemy is only imported once a query actually runs.
+    from sqlalchemy.exc import SQLAlchemyError
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.sql import text
+
+    engine: "AsyncEngine" = None
+    started = start_result()
     try:
         # Ensure only SELECT queries are allowed
         query_lower = query.strip().lower()
@@ -116,7 +137,7 @@ async def execute_select_cte_query_sql(
             raise ValueError("Only SELECT queries are allowed.")
 
         # Create the async engine
-        engine: AsyncEngine = create_async_engine(connection_string, echo=False)
+        engine = create_async_engine(connection_string, echo=False)
 
         async with engine.connect() as connection:  # type: AsyncConnection
             if schema_name:
@@ -129,16 +150,19 @@ async def execute_select_cte_query_sql(
             safe_params = params if isinstance(params, dict) else {}
             result = await connection.execute(text(query), safe_params)
             rows = [dict(row._mapping) for row in result]
+            record_last_result(SQL_RESULT, {"query": query, "rows": rows}, started)
             return rows
     except SQLAlchemyError as e:
 
         traceback.print_exc()
         logger.error(f"SQLAlchemy error occurred: {e}")
+        record_last_result(SQL_RESULT, {"query": query, "error": str(e)}, started)
         return {"error": str(e)}
     except Exception as e:
 
         traceback.print_exc()
         logger.error(f"An unexpected error occurred: {e}")
+        record_last_result(SQL_RESULT, {"query": query, "error": str(e)}, started)
         return {"error": str(e)}
     finally:
         try:
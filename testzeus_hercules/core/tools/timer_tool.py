@@ -10,6 +10,7 @@ from testzeus_hercules.utils.logger import logger
     agent_names=["time_keeper_nav_agent"],
     description="Wait for a specified number of seconds. Only accepts numeric values between 0 and 3600 seconds.",
     name="wait_for_duration",
+    resource="clock",
 )
 async def wait_for_duration(
     duration: Annotated[
@@ -71,6 +72,8 @@ async def wait_for_duration(
     agent_names=["time_keeper_nav_agent"],
     description="Get the current timestamp in string format.",
     name="get_current_timestamp",
+    read_only=True,
+    resource="clock",
 )
 async def get_current_timestamp() -> Annotated[
     Dict[str, str],
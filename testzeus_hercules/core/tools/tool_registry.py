@@ -1,6 +1,9 @@
 # tool_registry.py
+import ast
 import csv
+import importlib
 import os
+import pkgutil
 from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
@@ -11,9 +14,112 @@ from testzeus_hercules.utils.logger import logger
 # Define the type of the functions that will be registered as tools
 toolType = Callable[..., Any]
 
+# Key under which modules whose @tool agents cannot be read statically are indexed;
+# they are imported on the first lookup of any agent.
+ANY_AGENT = "*"
+
+
+class LazyToolRegistry(defaultdict):
+    """
+    Registry of tool entries per agent name that imports tool modules on demand.
+
+    Tool packages are registered by path only; the first lookup parses their modules
+    (without importing them) to learn which agents and tools each one provides, and a
+    lookup for an agent imports just the modules providing tools for it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(list)
+        self._packages: list[tuple[str, str]] = []
+        self._pending: dict[str, list[str]] = defaultdict(list)
+        self._manifest: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._exports: dict[str, str] = {}
+
+    def register_package(self, package_name: str, package_path: str) -> None:
+        """Index the tool modules of a package for lazy import."""
+        self._packages.append((package_name, package_path))
+
+    def __getitem__(self, agent_name: str) -> list[dict[str, Any]]:
+        self._load_agent(agent_name)
+        return super().__getitem__(agent_name)
+
+    def get(self, agent_name: str, default: Any = None) -> Any:
+        self._load_agent(agent_name)
+        return super().get(agent_name, default)
+
+    def add(self, agent_name: str, entry: dict[str, Any]) -> None:
+        """Append a tool entry without triggering lazy imports."""
+        super().__getitem__(agent_name).append(entry)
+
+    def describe(self, agent_name: str) -> list[dict[str, Any]]:
+        """Return the statically known name, description and module of an agent's tools without importing them."""
+        self._scan_packages()
+        return list(self._manifest.get(agent_name, []))
+
+    def find_export(self, package_name: str, attribute: str) -> str | None:
+        """Return the module of ``package_name`` defining the public ``attribute``, if any."""
+        self._scan_packages()
+        return self._exports.get(f"{package_name}:{attribute}")
+
+    def _load_agent(self, agent_name: str) -> None:
+        self._scan_packages()
+        for key in (ANY_AGENT, agent_name):
+            while self._pending.get(key):
+                importlib.import_module(self._pending[key].pop(0))
+
+    def _scan_packages(self) -> None:
+        while self._packages:
+            package_name, package_path = self._packages.pop(0)
+            for _, module_name, _ in pkgutil.iter_modules([package_path]):
+                full_module_name = f"{package_name}.{module_name}"
+                self._scan_module(package_name, full_module_name, os.path.join(package_path, f"{module_name}.py"))
+
+    def _scan_module(self, package_name: str, full_module_name: str, file_path: str) -> None:
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=file_path)
+        except (OSError, SyntaxError):
+            # Not a plain source module (e.g. a sub-package); import it on first use.
+            self._pending[ANY_AGENT].append(full_module_name)
+            return
+
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names = [node.name]
+            elif isinstance(node, ast.Assign):
+                names = [target.id for target in node.targets if isinstance(target, ast.Name)]
+            else:
+                continue
+            for name in names:
+                if not name.startswith("_"):
+                    self._exports.setdefault(f"{package_name}:{name}", full_module_name)
+
+        agents: set[str] = set()
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "tool"):
+                continue
+            kwargs = {keyword.arg: keyword.value for keyword in node.keywords if keyword.arg}
+            try:
+                agent_names = ast.literal_eval(kwargs["agent_names"])
+            except (KeyError, ValueError):
+                agents.add(ANY_AGENT)
+                continue
+            metadata = {"module": full_module_name, "name": None, "description": None}
+            for key in ("name", "description"):
+                try:
+                    metadata[key] = ast.literal_eval(kwargs[key]) if key in kwargs else None
+                except ValueError:
+                    pass
+            for agent_name in agent_names:
+                agents.add(agent_name)
+                self._manifest[agent_name].append(metadata)
+
+        for agent_name in sorted(agents):
+            self._pending[agent_name].append(full_module_name)
+
+
 # Global registry to store private tool functions and their metadata
-#
-tool_registry: dict[list[dict[str, Any]]] = defaultdict(list)
+tool_registry = LazyToolRegistry()
 
 
 def accessibility_logger(identity: str, violations_json: dict) -> None:
@@ -126,13 +232,23 @@ def sec_logger(logging_string: str) -> None:
         file.write(logging_string + "\n")
 
 
-def tool(agent_names: list[str], description: str, name: str | None = None) -> Callable[[toolType], toolType]:
+def tool(
+    agent_names: list[str],
+    description: str,
+    name: str | None = None,
+    read_only: bool | Callable[[dict[str, Any]], bool] = False,
+    resource: str | None = None,
+) -> Callable[[toolType], toolType]:
     """
     Decorator for registering private tools.
 
     Parameters:
     - description: A string describing the tool's function.
     - name: Optional name to register the tool with. If not provided, the function's name will be used.
+    - read_only: Whether a call leaves the page, app and data it touches unchanged, so it can run
+      concurrently with other read-only calls. A callable receives the call's arguments and decides
+      per call (e.g. only GET requests). Defaults to False.
+    - resource: Optional name of what the tool reads or changes, e.g. "browser", "http" or "sql".
 
     Returns:
     - A decorator function that registers the tool in the global registry.
@@ -140,12 +256,15 @@ def tool(agent_names: list[str], description: str, name: str | None = None) -> C
 
     def decorator(func: toolType) -> toolType:
         for agent_name in agent_names:
-            tool_registry[agent_name].append(
+            tool_registry.add(
+                agent_name,
                 {
                     "name": (name if name else func.__name__),  # Use provided name or fallback to function name
                     "func": func,
                     "description": description,
-                }
+                    "read_only": read_only,
+                    "resource": resource,
+                },
             )
         return func
 
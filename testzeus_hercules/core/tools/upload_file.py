@@ -19,6 +19,7 @@ from testzeus_hercules.utils.ui_messagetype import MessageType
 @tool(
     agent_names=["browser_nav_agent"],
     name="click_and_upload_file",
+    resource="browser",
     description="Click and Upload a file to a file input element on the page.",
 )
 async def click_and_upload_file(
@@ -0,0 +1,320 @@
+"""
+Long-lived Hercules daemon with a local job API.
+
+Run:
+    testzeus-hercules-daemon --port 8765
+    testzeus-hercules-daemon --socket /tmp/hercules.sock --max-concurrent-runs 2
+
+The interpreter, the reused agents and a warm browser pool stay up between jobs.
+Every job gets a unique run id and its own folder (``<runs-dir>/<run_id>``) for
+the feature file, test data, proofs, logs and results, so concurrent jobs never
+share files. Jobs wait in a queue; at most ``--max-concurrent-runs`` execute at once.
+
+API:
+    POST /runs                  {"gherkin": "...", "test_data": {"users.json": "..."}, "scenarios": ["..."]}
+                                -> 202 {"run_id": "...", "status": "queued"}
+    GET  /runs                  -> every run with its status
+    GET  /runs/{run_id}         -> status, progress events and result summary of one run
+    GET  /runs/{run_id}/events  -> progress events as newline-delimited JSON until the run ends
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from aiohttp import web
+from junitparser import Error, Failure, JUnitXml, TestSuite
+
+RunProcess = Callable[..., Awaitable[str]]
+
+RUN_FINISHED = "run_finished"
+FINISHED_STATUSES = ("passed", "failed", "error")
+
+
+@dataclass
+class DaemonRun:
+    """A job submitted to the daemon and its progress."""
+
+    run_id: str
+    run_dir: str
+    scenarios: Optional[List[str]] = None
+    status: str = "queued"
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    listeners: List["asyncio.Queue[Dict[str, Any]]"] = field(default_factory=list, repr=False)
+
+    def to_dict(self, with_events: bool = False) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"run_id": self.run_id, "status": self.status, "run_dir": self.run_dir}
+        if self.result is not None:
+            data["result"] = self.result
+        if self.error:
+            data["error"] = self.error
+        if with_events:
+            data["events"] = self.events
+        return data
+
+
+def new_run_id() -> str:
+    """Return a unique, sortable run id."""
+    return f"run_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+def run_config(run_dir: str, run_id: str) -> Dict[str, Any]:
+    """Return the config overrides that point a job at its own run folder."""
+    return {
+        "RUN_ID": run_id,
+        "PROJECT_SOURCE_ROOT": run_dir,
+        "INPUT_GHERKIN_FILE_PATH": os.path.join(run_dir, "input", "test.feature"),
+        "JUNIT_XML_BASE_PATH": os.path.join(run_dir, "output"),
+        "TEST_DATA_PATH": os.path.join(run_dir, "test_data"),
+        "SCREEN_SHOT_PATH": os.path.join(run_dir, "proofs"),
+        "PROJECT_TEMP_PATH": os.path.join(run_dir, "temp"),
+        "SOURCE_LOG_FOLDER_PATH": os.path.join(run_dir, "log_files"),
+        "TMP_GHERKIN_PATH": os.path.join(run_dir, "gherkin_files"),
+        "EXECUTE_BULK": "false",
+        "SHARD": None,
+    }
+
+
+def summarize_junit(result_file: str) -> Dict[str, Any]:
+    """Summarise a JUnit XML report as a JSON-friendly dict."""
+    report = JUnitXml.fromfile(result_file)
+    suites = [report] if isinstance(report, TestSuite) else list(report)
+    test_cases = []
+    for suite in suites:
+        for case in suite:
+            failure = next((r.message or r.text or "" for r in case.result if isinstance(r, (Failure, Error))), None)
+            test_cases.append({"name": case.name, "time": case.time, "passed": failure is None, **({"failure": failure} if failure is not None else {})})
+    failed = sum(1 for case in test_cases if not case["passed"])
+    return {
+        "status": "failed" if failed else "passed",
+        "tests": len(test_cases),
+        "failures": failed,
+        "time_seconds": sum(case["time"] or 0.0 for case in test_cases),
+        "result_file": result_file,
+        "html_report_path": os.path.splitext(result_file)[0] + ".html",
+        "test_cases": test_cases,
+    }
+
+
+def _test_data_file_name(name: Any) -> str:
+    if not isinstance(name, str) or not name or name != os.path.basename(name) or name in (".", ".."):
+        raise ValueError(f"Invalid test data file name: {name!r}")
+    return name
+
+
+async def _default_process(**kwargs: Any) -> str:
+    from testzeus_hercules.__main__ import sequential_process
+
+    return await sequential_process(**kwargs)
+
+
+class HerculesDaemon:
+    """Queue of Hercules jobs executed inside one warm process."""
+
+    def __init__(self, runs_dir: str, max_concurrent_runs: int = 1, process: RunProcess = _default_process) -> None:
+        self.runs_dir = os.path.abspath(runs_dir)
+        self.max_concurrent_runs = max(max_concurrent_runs, 1)
+        self.runs: Dict[str, DaemonRun] = {}
+        self._process = process
+        self._queue: "asyncio.Queue[DaemonRun]" = asyncio.Queue()
+        self._workers: List[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Start the workers that take jobs off the queue."""
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrent_runs)]
+
+    async def stop(self, close_shared_resources: bool = True) -> None:
+        """Stop the workers and release the browsers, agents and MCP connections kept warm."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if not close_shared_resources:
+            return
+        from testzeus_hercules.core.browser_pool import BrowserPool
+        from testzeus_hercules.core.playwright_manager import PlaywrightManager
+        from testzeus_hercules.core.simple_hercules import SimpleHercules
+        from testzeus_hercules.utils.mcp_help import MCPHelper
+
+        PlaywrightManager.close_all_instances()
+        await MCPHelper.destroy()
+        await SimpleHercules.destroy_engines()
+        await BrowserPool.destroy()
+
+    def submit(self, gherkin: str, test_data: Optional[Dict[str, str]] = None, scenarios: Optional[List[str]] = None) -> DaemonRun:
+        """
+        Queue a job and return it.
+
+        Raises:
+            ValueError: If the gherkin text, test data or scenario list is malformed.
+        """
+        if not isinstance(gherkin, str) or not gherkin.strip():
+            raise ValueError("gherkin must be a non-empty string")
+        if test_data is not None and not isinstance(test_data, dict):
+            raise ValueError("test_data must map file names to file contents")
+        if scenarios is not None and (not isinstance(scenarios, list) or not all(isinstance(s, str) for s in scenarios)):
+            raise ValueError("scenarios must be a list of scenario titles")
+        files = {_test_data_file_name(name): str(content) for name, content in (test_data or {}).items()}
+
+        run_id = new_run_id()
+        run = DaemonRun(run_id=run_id, run_dir=os.path.join(self.runs_dir, run_id), scenarios=scenarios)
+        config = run_config(run.run_dir, run_id)
+        os.makedirs(config["TEST_DATA_PATH"], exist_ok=True)
+        os.makedirs(os.path.dirname(config["INPUT_GHERKIN_FILE_PATH"]), exist_ok=True)
+        with open(config["INPUT_GHERKIN_FILE_PATH"], "w", encoding="utf-8") as f:
+            f.write(gherkin)
+        for name, content in files.items():
+            with open(os.path.join(config["TEST_DATA_PATH"], name), "w", encoding="utf-8") as f:
+                f.write(content)
+
+        self.runs[run_id] = run
+        self._publish(run, {"event": "run_queued"})
+        self._queue.put_nowait(run)
+        return run
+
+    def subscribe(self, run: DaemonRun) -> "asyncio.Queue[Dict[str, Any]]":
+        """Return a queue receiving the run's past and future events."""
+        listener: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        for event in run.events:
+            listener.put_nowait(event)
+        if run.status not in FINISHED_STATUSES:
+            run.listeners.append(listener)
+        return listener
+
+    def _publish(self, run: DaemonRun, event: Dict[str, Any]) -> None:
+        event = {"run_id": run.run_id, "time": time.time(), **event}
+        if event["event"] == "scenario_finished" and event.get("result_file"):
+            try:
+                event["status"] = summarize_junit(event["result_file"])["status"]
+            except Exception:
+                event["status"] = "unknown"
+        run.events.append(event)
+        for listener in run.listeners:
+            listener.put_nowait(event)
+        if event["event"] == RUN_FINISHED:
+            run.listeners.clear()
+
+    async def _worker(self) -> None:
+        while True:
+            run = await self._queue.get()
+            try:
+                # Own task so the job's scoped config does not leak into the next one.
+                await asyncio.create_task(self._execute(run))
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, run: DaemonRun) -> None:
+        from testzeus_hercules.config import scope_global_conf
+
+        scope_global_conf(run_config(run.run_dir, run.run_id))
+        run.status = "running"
+        self._publish(run, {"event": "run_started"})
+        try:
+            result_file = await self._process(
+                scenarios=run.scenarios,
+                close_shared_resources=False,
+                on_progress=lambda event: self._publish(run, event),
+            )
+            run.result = summarize_junit(result_file)
+            run.status = run.result["status"]
+        except (Exception, SystemExit) as e:
+            run.status = "error"
+            run.error = f"{type(e).__name__}: {e}"
+        self._publish(run, {"event": RUN_FINISHED, "status": run.status, "result": run.result, "error": run.error})
+
+
+def build_app(daemon: HerculesDaemon) -> web.Application:
+    """Return the aiohttp application serving the daemon's job API."""
+
+    async def submit_run(request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+            if not isinstance(payload, dict):
+                raise ValueError("request body must be a JSON object")
+            run = daemon.submit(payload.get("gherkin", ""), payload.get("test_data"), payload.get("scenarios"))
+        except (ValueError, json.JSONDecodeError) as e:
+            return web.json_response({"error": str(e)}, status=400)
+        return web.json_response(run.to_dict(), status=202)
+
+    async def list_runs(request: web.Request) -> web.Response:
+        return web.json_response([run.to_dict() for run in daemon.runs.values()])
+
+    def get_run_or_404(request: web.Request) -> DaemonRun:
+        run = daemon.runs.get(request.match_info["run_id"])
+        if run is None:
+            raise web.HTTPNotFound(text=json.dumps({"error": "unknown run id"}), content_type="application/json")
+        return run
+
+    async def get_run(request: web.Request) -> web.Response:
+        return web.json_response(get_run_or_404(request).to_dict(with_events=True))
+
+    async def stream_events(request: web.Request) -> web.StreamResponse:
+        run = get_run_or_404(request)
+        listener = daemon.subscribe(run)
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        while True:
+            event = await listener.get()
+            await response.write((json.dumps(event) + "\n").encode("utf-8"))
+            if event["event"] == RUN_FINISHED:
+                break
+        await response.write_eof()
+        return response
+
+    async def on_startup(app: web.Application) -> None:
+        await daemon.start()
+
+    async def on_cleanup(app: web.Application) -> None:
+        await daemon.stop()
+
+    app = web.Application()
+    app.router.add_post("/runs", submit_run)
+    app.router.add_get("/runs", list_runs)
+    app.router.add_get("/runs/{run_id}", get_run)
+    app.router.add_get("/runs/{run_id}/events", stream_events)
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run Hercules as a long-lived daemon accepting test jobs over a local HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind host (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8765, help="Bind port (default: 8765).")
+    parser.add_argument("--socket", help="Serve on this Unix socket path instead of host/port.")
+    parser.add_argument("--max-concurrent-runs", type=int, default=1, help="Jobs executed at the same time (default: 1).")
+    parser.add_argument("--runs-dir", default=os.path.join("opt", "daemon_runs"), help="Folder holding one sub-folder per run (default: opt/daemon_runs).")
+    # Remaining arguments are regular Hercules options (LLM, browser, ...), read by the config.
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entrypoint for the testzeus-hercules-daemon console script."""
+    args = _parse_args(argv)
+    # Imported after parsing: loading the config also parses sys.argv for the main CLI.
+    from testzeus_hercules.config import get_global_conf, set_global_conf
+    from testzeus_hercules.telemetry import init_telemetry
+    from testzeus_hercules.utils.logger import logger
+
+    init_telemetry()
+    if get_global_conf().get_browser_pool_size() == 0:
+        set_global_conf({"BROWSER_POOL_SIZE": str(max(args.max_concurrent_runs, 1))})
+    daemon = HerculesDaemon(args.runs_dir, args.max_concurrent_runs)
+    where = args.socket or f"http://{args.host}:{args.port}"
+    logger.info(f"Hercules daemon listening on {where} (max concurrent runs: {daemon.max_concurrent_runs})")
+    if args.socket:
+        web.run_app(build_app(daemon), path=args.socket, print=None)
+    else:
+        web.run_app(build_app(daemon), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,8 @@ Environment variables (all optional):
     MCP_HOST          – bind host,  default 0.0.0.0
     MCP_PORT          – bind port,  default 8000
     MCP_PATH          – URL path,   default /mcp
+    HERCULES_DAEMON_URL    – run tests on a warm `testzeus-hercules-daemon`, e.g. http://127.0.0.1:8765
+    HERCULES_DAEMON_SOCKET – same, over the daemon's Unix socket
 """
 
 from __future__ import annotations
@@ -29,10 +31,13 @@ import asyncio
 import json
 import os
 import sys
+import time
+import uuid
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
+import httpx
 from mcp.server.fastmcp import FastMCP
 
 # ── configuration ─────────────────────────────────────────────────────────────
@@ -50,10 +55,58 @@ def _feature_path() -> Path:
     return Path(_hercules_root()) / "opt" / "input" / "test.feature"
 
 
+def _test_data_dir() -> Path:
+    return Path(_hercules_root()) / "opt" / "test_data"
+
+
+def _shared_test_data() -> tuple[dict[str, str], list[str]]:
+    """Text files of opt/test_data by name, and the names of files the daemon API cannot carry."""
+    files: dict[str, str] = {}
+    skipped: list[str] = []
+    if _test_data_dir().is_dir():
+        for path in sorted(_test_data_dir().iterdir()):
+            if not path.is_file():
+                continue
+            try:
+                files[path.name] = path.read_text(encoding="utf-8")
+            except UnicodeDecodeError:
+                skipped.append(path.name)
+    return files, skipped
+
+
+def _runs_dir() -> Path:
+    return Path(_hercules_root()) / "opt" / "mcp_runs"
+
+
+def _new_run_dir() -> Path:
+    # One project folder per run, so concurrent run_test calls never share a feature file,
+    # temporary gherkin files or results.
+    run_id = f"run_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    return _runs_dir() / run_id
+
+
+def _daemon_client() -> httpx.AsyncClient | None:
+    socket_path = os.getenv("HERCULES_DAEMON_SOCKET")
+    if socket_path:
+        return httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=socket_path), base_url="http://hercules-daemon", timeout=None)
+    daemon_url = os.getenv("HERCULES_DAEMON_URL")
+    if daemon_url:
+        return httpx.AsyncClient(base_url=daemon_url, timeout=None)
+    return None
+
+
 def _result_dir() -> Path:
     return Path(_hercules_root()) / "opt" / "output"
 
 
+def _result_run_dirs() -> list[Path]:
+    """Result folders of CLI runs in opt/output and of run_test runs in opt/mcp_runs/<run_id>/output."""
+    output_dirs = [_result_dir()]
+    if _runs_dir().exists():
+        output_dirs += [run / "output" for run in _runs_dir().iterdir()]
+    return [r for output_dir in output_dirs if output_dir.is_dir() for r in output_dir.iterdir() if r.is_dir()]
+
+
 def _mcp_host() -> str:
     return os.getenv("MCP_HOST", "0.0.0.0")
 
@@ -142,23 +195,46 @@ async def run_test(gherkin: str = "", description: str = "") -> str:
         description: Plain-English description — will auto-generate Gherkin and run it.
                      Ignored if gherkin is provided.
     """
-    feature_file = _feature_path()
+    if not gherkin and description:
+        gherkin = await generate_gherkin(description)
+        if gherkin.startswith("Error"):
+            return gherkin
+    if not gherkin:
+        if not _feature_path().exists():
+            return "No test to run. Provide gherkin or description, or ensure test.feature exists."
+        gherkin = _feature_path().read_text()
+
+    preview = f"Running:\n{gherkin}\n{'='*50}\n"
+
+    client = _daemon_client()
+    if client is not None:
+        async with client:
+            try:
+                return preview + await asyncio.wait_for(_run_on_daemon(client, gherkin), timeout=300)
+            except asyncio.TimeoutError:
+                return preview + "Test is still running on the Hercules daemon after 5 minutes; use get_test_results to check later."
+            except httpx.HTTPError as e:
+                return preview + f"Error talking to the Hercules daemon: {e}"
+
+    run_dir = _new_run_dir()
+    feature_file = run_dir / "input" / "test.feature"
     feature_file.parent.mkdir(parents=True, exist_ok=True)
+    feature_file.write_text(gherkin)
 
-    if gherkin:
-        feature_file.write_text(gherkin)
-    elif description:
-        generated = await generate_gherkin(description)
-        if generated.startswith("Error"):
-            return generated
-        feature_file.write_text(generated)
-        gherkin = generated
-    elif not feature_file.exists():
-        return "No test to run. Provide gherkin or description, or ensure test.feature exists."
-
-    preview = f"Running:\n{feature_file.read_text()}\n{'='*50}\n"
-
-    cmd = [_hercules_python(), "-u", "-m", "testzeus_hercules"]
+    # The run folder is the project base, so output, proofs, logs and temporary gherkin
+    # files stay in it; test data still comes from the shared opt/test_data.
+    cmd = [
+        _hercules_python(),
+        "-u",
+        "-m",
+        "testzeus_hercules",
+        "--project-base",
+        str(run_dir),
+        "--input-file",
+        str(feature_file),
+        "--test-data-path",
+        str(_test_data_dir()),
+    ]
     proc = await asyncio.create_subprocess_exec(
         *cmd,
         stdout=asyncio.subprocess.PIPE,
@@ -172,7 +248,28 @@ async def run_test(gherkin: str = "", description: str = "") -> str:
         return preview + "Test timed out after 5 minutes."
 
     output = stdout.decode() + stderr.decode()
-    return preview + _summarize_output(output)
+    return preview + f"run_id: {run_dir.name}\n" + _summarize_output(output)
+
+
+async def _run_on_daemon(client: httpx.AsyncClient, gherkin: str) -> str:
+    # Daemon runs get an empty test data folder of their own; send opt/test_data along.
+    test_data, skipped = _shared_test_data()
+    response = await client.post("/runs", json={"gherkin": gherkin, "test_data": test_data})
+    response.raise_for_status()
+    run_id = response.json()["run_id"]
+    lines = [f"run_id: {run_id}"]
+    if skipped:
+        lines.append(f"Test data not sent to the daemon (not UTF-8 text): {', '.join(skipped)}")
+    async with client.stream("GET", f"/runs/{run_id}/events") as events:
+        async for line in events.aiter_lines():
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            if event["event"] == "scenario_finished":
+                lines.append(f"{event.get('scenario')}: {event.get('status')}")
+            elif event["event"] == "run_finished":
+                lines.append(json.dumps({k: event.get(k) for k in ("status", "result", "error")}, indent=2))
+    return "\n".join(lines)
 
 
 def _summarize_output(output: str) -> str:
@@ -193,23 +290,27 @@ async def get_test_results(run_id: str = "") -> str:
         run_id: Specific run folder name e.g. run_20260609_132411.
                 Omit to get the latest run's results.
     """
-    output_dir = _result_dir()
-    if not output_dir.exists():
+    client = _daemon_client() if run_id else None
+    if client is not None:
+        async with client:
+            try:
+                response = await client.get(f"/runs/{run_id}")
+                if response.status_code == 200:
+                    return json.dumps(response.json(), indent=2)
+            except httpx.HTTPError:
+                pass
+
+    runs = _result_run_dirs()
+    if not runs:
         return "No results found. Run a test first."
 
     if run_id:
-        run_dir = output_dir / run_id
-        if not run_dir.exists():
-            return f"Run '{run_id}' not found in {output_dir}."
-    else:
-        runs = sorted(
-            [r for r in output_dir.iterdir() if r.is_dir()],
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
-        if not runs:
-            return "No test runs found."
-        run_dir = runs[0]
+        # run_test reports the id of its run folder; CLI runs are found by their result folder name.
+        matching = [r for r in runs if run_id in (r.name, r.parent.parent.name)]
+        if not matching:
+            return f"Run '{run_id}' not found in {_result_dir()} or {_runs_dir()}."
+        runs = matching
+    run_dir = max(runs, key=lambda p: p.stat().st_mtime)
 
     results: dict[str, Any] = {
         "run_id": run_dir.name,
@@ -0,0 +1,48 @@
+"""
+Merge the JUnit reports of a sharded run (``testzeus-hercules --shard i/n``).
+
+Run:
+    testzeus-hercules-merge-shards -o merged_result.xml shard-1/output shard-2/output
+
+Inputs may be report files or directories; directories are searched recursively
+for ``*_result.xml``. An HTML report is written next to the merged XML file.
+"""
+
+import argparse
+import asyncio
+import os
+from typing import List, Optional
+
+from junit2htmlreport.runner import run as prepare_html
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Merge JUnit reports produced by sharded Hercules runs.")
+    parser.add_argument("reports", nargs="+", help="Shard report files or directories containing them.")
+    parser.add_argument(
+        "-o",
+        "--merged-file",
+        default="merged_result.xml",
+        help="Path of the merged JUnit XML report (default: merged_result.xml).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entrypoint for the testzeus-hercules-merge-shards console script."""
+    args = _parse_args(argv)
+    # Imported after parsing: loading the config also parses sys.argv for the main CLI.
+    from testzeus_hercules.utils.shard_helper import merge_shard_reports
+
+    try:
+        merged_file = asyncio.run(merge_shard_reports(args.reports, args.merged_file))
+    except FileNotFoundError as e:
+        raise SystemExit(str(e))
+    merged_html_file = os.path.splitext(merged_file)[0] + ".html"
+    prepare_html([merged_file, merged_html_file])
+    print(f"Merged report: {merged_file}")
+    print(f"HTML report: {merged_html_file}")
+
+
+if __name__ == "__main__":
+    main()
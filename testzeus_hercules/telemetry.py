@@ -9,19 +9,17 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
-import sentry_sdk
 from pydantic import BaseModel
-from sentry_sdk.scrubber import DEFAULT_DENYLIST, DEFAULT_PII_DENYLIST, EventScrubber
-from sentry_sdk.types import Event, Hint
 
 DSN = "https://d14d2ee82f26a3585b2a892fab7fffaa@o4508256143540224.ingest.us.sentry.io/4508256153042944"
 
 # Telemetry flag, default is enabled (1) unless set to "0" in the environment variable
 ENABLE_TELEMETRY = os.getenv("ENABLE_TELEMETRY", "1") == "1"
 
-# custom denylist
-denylist = DEFAULT_DENYLIST + ["sys.argv", "argv", "server_name"]
-pii_denylist = DEFAULT_PII_DENYLIST + ["sys.argv", "argv", "server_name"]
+# Extra keys scrubbed from Sentry events on top of the SDK defaults
+EXTRA_DENYLIST = ["sys.argv", "argv", "server_name"]
+
+_sentry_initialized = False
 
 
 class EventType(Enum):
@@ -40,7 +38,7 @@ class EventData(BaseModel):
     additional_data: Optional[Dict[str, Any]] = None  # For any extra details specific to certain events
 
 
-def my_before_send(event: Event, hint: Hint) -> Event | None:
+def my_before_send(event: Dict[str, Any], hint: Dict[str, Any]) -> Dict[str, Any] | None:
     # Filter out all ZeroDivisionError events.
     # Note that the exception type is available in the hint,
     # but we should handle the case where the exception info
@@ -61,8 +59,27 @@ def my_before_send(event: Event, hint: Hint) -> Event | None:
     return event
 
 
-# Initialize Sentry only if telemetry is enabled
-if ENABLE_TELEMETRY:
+def init_sentry() -> None:
+    """
+    Initialize Sentry once, only if telemetry is enabled.
+
+    Importing and initializing the SDK is deferred until the run starts (or the
+    first event is recorded) so importing hercules modules stays fast. Auto-enabled
+    integrations are off: they import every supported library that is installed
+    (langchain, openai, anthropic, ...) while only adding breadcrumbs and spans,
+    which are not collected here.
+    """
+    global _sentry_initialized
+    if not ENABLE_TELEMETRY or _sentry_initialized:
+        return
+    _sentry_initialized = True
+
+    import sentry_sdk
+    from sentry_sdk.scrubber import (
+        DEFAULT_DENYLIST,
+        DEFAULT_PII_DENYLIST,
+        EventScrubber,
+    )
 
     sentry_sdk.init(
         dsn=DSN,
@@ -71,7 +88,12 @@ if ENABLE_TELEMETRY:
         send_default_pii=False,
         send_client_reports=False,
         server_name=None,
-        event_scrubber=EventScrubber(denylist=denylist, pii_denylist=pii_denylist, recursive=True),
+        auto_enabling_integrations=False,
+        event_scrubber=EventScrubber(
+            denylist=DEFAULT_DENYLIST + EXTRA_DENYLIST,
+            pii_denylist=DEFAULT_PII_DENYLIST + EXTRA_DENYLIST,
+            recursive=True,
+        ),
     )
     sentry_sdk.set_extra("sys.argv", None)
     sentry_sdk.set_user(None)
@@ -126,18 +148,33 @@ def get_installation_id(file_path: str = "installation_id.txt", is_manual_run: b
     return data
 
 
-# Initialize the installation_id
-installation_data = get_installation_id(is_manual_run=os.environ.get("AUTO_MODE", "0") == "0")
-
-# Global event collector with event_type buckets
+# Global event collector with event_type buckets; the installation data is
+# filled in by load_installation_data() on first use.
 event_collector = {
-    "installation_id": installation_data["installation_id"],
-    "user_email": installation_data["user_email"],
+    "installation_id": None,
+    "user_email": None,
     "buckets": {},
     "start_time": datetime.now().isoformat(),
 }
 
 
+def load_installation_data(is_manual_run: bool = True) -> None:
+    """Read (or create) the installation id into the event collector, once."""
+    if event_collector["installation_id"] is not None:
+        return
+    installation_data = get_installation_id(is_manual_run=is_manual_run and os.environ.get("AUTO_MODE", "0") == "0")
+    event_collector["installation_id"] = installation_data["installation_id"]
+    event_collector["user_email"] = installation_data["user_email"]
+
+
+def init_telemetry() -> None:
+    """Load the installation data and start Sentry; called when a run starts."""
+    if not ENABLE_TELEMETRY:
+        return
+    load_installation_data()
+    init_sentry()
+
+
 def add_event(event_type: EventType, event_data: EventData) -> None:
     """
     Adds an event to the event collector in the appropriate event_type bucket,
@@ -146,6 +183,10 @@ def add_event(event_type: EventType, event_data: EventData) -> None:
     if not ENABLE_TELEMETRY:
         return  # Skip event logging if telemetry is disabled
 
+    # Entry points other than the CLI (daemon, MCP server, library use) never call
+    # init_telemetry(); events must still carry the installation id. Never prompt here.
+    load_installation_data(is_manual_run=False)
+    init_sentry()
     global event_collector
     event = {
         "timestamp": datetime.now().isoformat(),
@@ -163,13 +204,16 @@ async def send_message_to_sentry() -> None:
     """
     Sends the final message to Sentry asynchronously, only if telemetry is enabled.
     """
-    if not ENABLE_TELEMETRY:
-        return  # Skip sending if telemetry is disabled
+    if not ENABLE_TELEMETRY or not _sentry_initialized:
+        return  # Skip sending if telemetry is disabled or was never started
     try:
+        import sentry_sdk
+
         message = build_final_message()
         with sentry_sdk.push_scope() as scope:
             scope.set_extra("session_summary", message)
             sentry_sdk.capture_message("Program execution summary")
+        sentry_sdk.flush()
     except Exception as e:
 
         print(f"Error sending message to Sentry: {e}")
@@ -179,6 +223,8 @@ def build_final_message() -> Dict[str, Any]:
     """
     Builds the final message from collected events, organized by event_type buckets.
     """
+    # Never prompt for an email while the program is exiting.
+    load_installation_data(is_manual_run=False)
     message = {
         "installation_id": event_collector["installation_id"],
         "user_email": event_collector["user_email"],
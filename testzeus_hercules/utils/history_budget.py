@@ -0,0 +1,105 @@
+"""
+Token budget for the message history sent to the planner and navigation agents.
+
+Before each model call the history is measured with a cheap character-based
+token estimate. Once it exceeds the budget, the oldest tool outputs and helper
+responses are cut down to a short preview, oldest first, until it fits. The
+system prompt, the task and the most recent messages are always sent verbatim,
+and no message is removed, so tool calls keep their matching tool results.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, List
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+# Characters of an elided message that are still sent.
+ELIDED_PREVIEW_CHARS = 300
+# Rough cost of a message envelope and of one image part, in tokens.
+_MESSAGE_OVERHEAD_TOKENS = 4
+_IMAGE_PART_TOKENS = 765
+
+
+def _content_tokens(content: Any) -> int:
+    if isinstance(content, str):
+        return len(content) // 4
+    if isinstance(content, list):
+        tokens = 0
+        for part in content:
+            if isinstance(part, dict) and part.get("type") in ("image_url", "image"):
+                tokens += _IMAGE_PART_TOKENS
+            elif isinstance(part, dict):
+                tokens += len(str(part.get("text", ""))) // 4
+            else:
+                tokens += len(str(part)) // 4
+        return tokens
+    return len(str(content or "")) // 4
+
+
+def estimate_message_tokens(message: BaseMessage) -> int:
+    """Estimate the prompt tokens of one message, about four characters per token."""
+    tokens = _MESSAGE_OVERHEAD_TOKENS + _content_tokens(message.content)
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        tokens += len(json.dumps(tool_call, default=str)) // 4
+    return tokens
+
+
+@dataclass
+class FittedHistory:
+    """History to send to the model and its estimated size before and after elision."""
+
+    messages: List[BaseMessage] = field(default_factory=list)
+    tokens_before: int = 0
+    tokens_after: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+def _is_elidable(message: BaseMessage) -> bool:
+    return isinstance(message, (ToolMessage, HumanMessage)) and isinstance(message.content, str) and len(message.content) > ELIDED_PREVIEW_CHARS
+
+
+def _elide(message: BaseMessage) -> BaseMessage:
+    content = str(message.content)
+    preview = content[:ELIDED_PREVIEW_CHARS]
+    elided = f"{preview}\n[... {len(content) - len(preview)} more characters of this earlier output elided to fit the history budget ...]"
+    return message.model_copy(update={"content": elided})
+
+
+def fit_history(messages: List[BaseMessage], budget_tokens: int, keep_recent: int) -> FittedHistory:
+    """
+    Elide older tool outputs and helper responses until the history fits the budget.
+
+    Parameters:
+        messages (List[BaseMessage]): History in the order it is sent; it is not modified.
+        budget_tokens (int): Estimated prompt tokens allowed; 0 sends the history unchanged.
+        keep_recent (int): Number of latest messages that are never elided.
+
+    Returns:
+        FittedHistory: The messages to send and the estimated tokens before and after.
+    """
+    sizes = [estimate_message_tokens(message) for message in messages]
+    total = sum(sizes)
+    if budget_tokens <= 0 or total <= budget_tokens:
+        return FittedHistory(list(messages), total, total)
+
+    protected = set(range(max(len(messages) - keep_recent, 0), len(messages)))
+    if messages and isinstance(messages[0], SystemMessage):
+        protected.add(0)
+    task_index = next((index for index, message in enumerate(messages) if isinstance(message, HumanMessage)), None)
+    if task_index is not None:
+        protected.add(task_index)
+
+    fitted = list(messages)
+    for index, message in enumerate(messages):
+        if total <= budget_tokens:
+            break
+        if index in protected or not _is_elidable(message):
+            continue
+        fitted[index] = _elide(message)
+        elided_size = estimate_message_tokens(fitted[index])
+        total -= sizes[index] - elided_size
+    return FittedHistory(fitted, sum(sizes), total)
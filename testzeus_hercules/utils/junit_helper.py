@@ -4,7 +4,7 @@ import tempfile
 from typing import Any, Dict, List
 
 import aiofiles
-from junitparser import Failure, JUnitXml, Property, TestCase, TestSuite
+from junitparser import Failure, JUnitXml, Property, Skipped, TestCase, TestSuite
 from junitparser.junitparser import Properties, SystemOut
 from testzeus_hercules.config import get_global_conf
 from testzeus_hercules.telemetry import EventData, EventType, add_event
@@ -90,8 +90,11 @@ class JUnitXMLGenerator:
         assert_summary = json_data.get("assert_summary", "Runtime Failure")
         is_assert = json_data.get("is_assert", False)
         is_passed = json_data.get("is_passed", False)
+        is_skipped = json_data.get("is_skipped", False)
 
-        if is_assert:
+        if is_skipped:
+            test_case.result = Skipped(message=str(final_response))
+        elif is_assert:
             add_event(
                 EventType.ASSERT,
                 EventData(detail=f"Assertion with result: {is_passed}"),
@@ -128,6 +131,7 @@ class JUnitXMLGenerator:
             if key not in [
                 "is_assert",
                 "is_passed",
+                "is_skipped",
                 "final_response",
                 "assert_summary",
             ]:
@@ -192,14 +196,16 @@ class JUnitXMLGenerator:
         os.unlink(tmp_path)
 
     @staticmethod
-    async def merge_junit_xml(files: List[str], output_file: str) -> None:
+    async def merge_junit_xml(files: List[str], output_file: str, delete_sources: bool = True) -> None:
         """
         Merge multiple JUnit XML files into one asynchronously.
 
         Args:
             files (List[str]): List of file paths to JUnit XML files.
             output_file (str): Path to the output merged JUnit XML file.
+            delete_sources (bool): Remove the input files after merging (skipped in debug mode).
         """
+        delete_sources = delete_sources and get_global_conf().get_mode() not in ["debug"]
         merged_xml = JUnitXml()
         suite_dict: Dict[str, TestSuite] = {}
 
@@ -233,7 +239,7 @@ class JUnitXMLGenerator:
                     suite_dict[suite_name] = suite
 
             # delete the files of individual test cases
-            if os.path.exists(file) and get_global_conf().get_mode() not in ["debug"]:
+            if delete_sources and os.path.exists(file):
                 os.remove(file)
 
         for suite in suite_dict.values():
@@ -253,7 +259,7 @@ class JUnitXMLGenerator:
         os.unlink(tmp_path)
 
         # Delete individual test files if not in debug mode
-        if get_global_conf().get_mode() not in ["debug"]:
+        if delete_sources:
             for file in files:
                 if os.path.exists(file):
                     os.remove(file)
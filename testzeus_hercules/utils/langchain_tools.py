@@ -174,6 +174,7 @@ def registry_tools_to_structured_tools(agent_name: str) -> list[StructuredTool]:
                 name=name,
                 description=description,
                 args_schema=args_schema,
+                metadata={"read_only": entry.get("read_only", False), "resource": entry.get("resource")},
             )
             tools.append(tool)
             logger.info(f"[TOOL_DEBUG] Successfully registered tool '{name}' for agent '{agent_name}'")
@@ -0,0 +1,179 @@
+"""
+Content-addressed record/replay cache of LLM responses.
+
+Each model call is keyed by a hash of the model and its parameters, the bound
+tool schemas and the messages sent. Responses are stored in a local SQLite
+database so that re-running an unchanged suite against an unchanged app can be
+served without calling the model:
+
+- ``record`` calls the model for every request and stores the response.
+- ``replay`` serves every request from the cache and fails on a miss.
+- ``auto`` serves hits from the cache and records misses.
+
+Replayed responses carry no token usage or cost, since none was spent.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.prompt_layout import TIMESTAMP_PREFIX
+
+LLM_CACHE_MODES = ("off", "record", "replay", "auto")
+LLM_CACHE_FILE_NAME = "llm_cache.sqlite"
+# Bumped when the key or the stored response format changes.
+CACHE_KEY_VERSION = 1
+
+# Message text that changes between otherwise identical runs and is left out of the key.
+_VOLATILE_TEXT = re.compile(re.escape(TIMESTAMP_PREFIX) + r"[^\n]*")
+# Response metadata that describes the original call's usage and is not replayed.
+_USAGE_METADATA_KEYS = ("token_usage", "usage", "total_cost", "response_cost", "cost")
+
+_caches: Dict[str, "LLMResponseCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class LLMCacheMiss(RuntimeError):
+    """Raised in ``replay`` mode when a model call has no cached response."""
+
+
+def _normalize_text(text: str) -> str:
+    return _VOLATILE_TEXT.sub(TIMESTAMP_PREFIX + "<volatile>", text)
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return _normalize_text(content)
+    if isinstance(content, list):
+        return [{**part, "text": _normalize_text(str(part["text"]))} if isinstance(part, dict) and "text" in part else part for part in content]
+    return content
+
+
+def _message_key(message: BaseMessage) -> Dict[str, Any]:
+    key: Dict[str, Any] = {"type": message.type, "content": _normalize_content(message.content)}
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        key["tool_calls"] = [{"name": call.get("name"), "args": call.get("args"), "id": call.get("id")} for call in tool_calls]
+    tool_call_id = getattr(message, "tool_call_id", None)
+    if tool_call_id:
+        key["tool_call_id"] = tool_call_id
+    return key
+
+
+def _model_key(llm: Any) -> Dict[str, Any]:
+    """Describe the model, its parameters and bound arguments such as tool schemas."""
+    bound_kwargs: Dict[str, Any] = {}
+    model = llm
+    # ``bind_tools`` and ``bind`` wrap the model in RunnableBindings that hold the tools.
+    while hasattr(model, "bound") and isinstance(getattr(model, "kwargs", None), dict):
+        bound_kwargs = {**model.kwargs, **bound_kwargs}
+        model = model.bound
+    params = getattr(model, "_identifying_params", None)
+    return {
+        "class": type(model).__name__,
+        "params": params if isinstance(params, dict) else {},
+        "base_url": getattr(model, "openai_api_base", None),
+        "bound": bound_kwargs,
+    }
+
+
+def llm_cache_key(llm: Any, messages: List[BaseMessage]) -> str:
+    """Return the content hash identifying a model call."""
+    payload = {
+        "version": CACHE_KEY_VERSION,
+        "model": _model_key(llm),
+        "messages": [_message_key(message) for message in messages],
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _without_usage(message: BaseMessage) -> BaseMessage:
+    metadata = {key: value for key, value in (message.response_metadata or {}).items() if key not in _USAGE_METADATA_KEYS}
+    metadata["llm_cache"] = "hit"
+    update: Dict[str, Any] = {"response_metadata": metadata}
+    if hasattr(message, "usage_metadata"):
+        update["usage_metadata"] = None
+    return message.model_copy(update=update)
+
+
+class LLMResponseCache:
+    """SQLite store of model responses shared by every engine of the process."""
+
+    def __init__(self, path: str, mode: str) -> None:
+        self.path = path
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Scenarios run in several processes at once, hence WAL and a busy timeout.
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, agent TEXT, response TEXT NOT NULL)")
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[BaseMessage]:
+        with self._lock:
+            row = self._connection.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return _without_usage(messages_from_dict([json.loads(row[0])])[0])
+
+    def put(self, key: str, agent_name: str, response: Any) -> None:
+        if not isinstance(response, BaseMessage):
+            return
+        encoded = json.dumps(message_to_dict(response), default=str)
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO responses (key, agent, response) VALUES (?, ?, ?)", (key, agent_name, encoded))
+            self._connection.commit()
+
+    async def ainvoke(self, llm: Any, messages: List[BaseMessage], agent_name: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Serve a model call according to the cache mode.
+
+        Parameters:
+            llm (Any): The chat model, possibly with bound tools; part of the key.
+            messages (List[BaseMessage]): Messages sent to the model; part of the key.
+            agent_name (str): Agent making the call, stored for inspection.
+            call (Callable[[], Awaitable[Any]]): Performs the real model call.
+
+        Returns:
+            Any: The cached or the live response.
+        """
+        key = llm_cache_key(llm, messages)
+        if self.mode in ("replay", "auto"):
+            cached = await asyncio.to_thread(self.get, key)
+            if cached is not None:
+                self.hits += 1
+                logger.debug("[LLM_CACHE] hit agent=%s key=%s", agent_name, key[:12])
+                return cached
+            self.misses += 1
+            if self.mode == "replay":
+                raise LLMCacheMiss(f"No cached response for {agent_name} call {key[:12]} in {self.path} (LLM_CACHE_MODE=replay)")
+        response = await call()
+        await asyncio.to_thread(self.put, key, agent_name, response)
+        return response
+
+
+def open_llm_cache(mode: str, path: str) -> Optional[LLMResponseCache]:
+    """Return the process-wide cache for ``path``, or None when ``mode`` is ``off``."""
+    if mode == "off":
+        return None
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = LLMResponseCache(path, mode)
+            _caches[path] = cache
+            logger.info("LLM response cache %s opened in %s mode", path, mode)
+        cache.mode = mode
+        return cache
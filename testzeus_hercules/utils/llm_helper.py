@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from testzeus_hercules.core.agents_llm_config_manager import AgentsLLMConfigManager
+from testzeus_hercules.utils.llm_http_pool import shared_llm_http_client
 from testzeus_hercules.utils.logger import logger
 from testzeus_hercules.utils.model_utils import adapt_llm_params_for_model
 from testzeus_hercules.utils.response_parser import parse_response
@@ -20,6 +22,12 @@ DEFAULT_LLM_SYS_MSG = "You are a helpful AI assistant."
 DEFAULT_MODEL = "gpt-4o"
 DEFAULT_LLM_REQUEST_TIMEOUT_SECONDS = 60.0
 DEFAULT_LLM_MAX_RETRIES = 1
+DEFAULT_LLM_WARMUP_TIMEOUT_SECONDS = 5.0
+DEFAULT_LLM_HISTORY_TOKEN_BUDGET = 100_000
+DEFAULT_LLM_HISTORY_KEEP_RECENT = 6
+
+# Endpoints whose connection pool was already warmed in this process.
+_warmed_llm_endpoints: set[str] = set()
 
 
 def _env_float(name: str, default: float) -> float:
@@ -57,6 +65,80 @@ def get_llm_max_retries() -> int:
     return _env_int("LLM_MAX_RETRIES", DEFAULT_LLM_MAX_RETRIES)
 
 
+def get_llm_warmup_timeout_seconds() -> float:
+    """Return the timeout of the start-up LLM connection warm-up (0 disables it)."""
+    return _env_float("LLM_WARMUP_TIMEOUT", DEFAULT_LLM_WARMUP_TIMEOUT_SECONDS)
+
+
+def get_llm_history_token_budget() -> int:
+    """Return the estimated token budget of the history sent per model call (0 disables it)."""
+    return max(_env_int("LLM_HISTORY_TOKEN_BUDGET", DEFAULT_LLM_HISTORY_TOKEN_BUDGET), 0)
+
+
+def get_llm_history_keep_recent() -> int:
+    """Return how many of the latest messages are always sent to the model verbatim."""
+    return max(_env_int("LLM_HISTORY_KEEP_RECENT", DEFAULT_LLM_HISTORY_KEEP_RECENT), 0)
+
+
+def get_llm_rate_limit_rpm() -> int:
+    """Return the requests-per-minute limit of each model in this process (0 disables it)."""
+    return max(_env_int("LLM_RATE_LIMIT_RPM", 0), 0)
+
+
+def get_llm_rate_limit_tpm() -> int:
+    """Return the tokens-per-minute limit of each model in this process (0 disables it)."""
+    return max(_env_int("LLM_RATE_LIMIT_TPM", 0), 0)
+
+
+def get_llm_adaptive_timeout_factor() -> float:
+    """Return the multiple of a model's p95 latency used as its call timeout (0 disables it)."""
+    return max(_env_float("LLM_ADAPTIVE_TIMEOUT_FACTOR", 0.0), 0.0)
+
+
+def get_llm_hedge_requests() -> bool:
+    """Return whether a duplicate request is sent when a call outlasts its p95 latency."""
+    return os.getenv("LLM_HEDGE_REQUESTS", "false").lower().strip() == "true"
+
+
+def get_llm_prompt_cache_hints() -> bool:
+    """Return whether system prompts carry explicit ``cache_control`` breakpoints."""
+    return os.getenv("LLM_PROMPT_CACHE_HINTS", "false").lower().strip() == "true"
+
+
+async def warm_up_llm_connections(llms: Iterable[Any]) -> List[str]:
+    """
+    Open the HTTP connection (DNS, TCP and TLS handshake) to each distinct model
+    endpoint ahead of the first completion, with a cheap ``GET /models`` request.
+
+    Endpoints are warmed once per process; errors are ignored since the request
+    only exists to leave a pooled keep-alive connection behind.
+
+    Returns:
+        The base URLs warmed by this call.
+    """
+    timeout = get_llm_warmup_timeout_seconds()
+    if timeout <= 0:
+        return []
+    clients: Dict[str, Any] = {}
+    for llm in llms:
+        client = getattr(llm, "root_async_client", None)
+        if client is None or not hasattr(client, "models"):
+            continue
+        endpoint = str(getattr(client, "base_url", ""))
+        if endpoint and endpoint not in _warmed_llm_endpoints:
+            clients.setdefault(endpoint, client)
+
+    async def warm_up(endpoint: str, client: Any) -> None:
+        _warmed_llm_endpoints.add(endpoint)
+        try:
+            await asyncio.wait_for(client.with_options(max_retries=0).models.list(), timeout)
+        except Exception as e:
+            logger.debug("LLM warm-up request to %s ended with %s", endpoint, e)
+
+    await asyncio.gather(*(warm_up(endpoint, client) for endpoint, client in clients.items()))
+    return list(clients)
+
+
 def convert_model_config_to_langchain_format(
     model_config: dict[str, str],
 ) -> dict[str, Any]:
@@ -98,6 +180,8 @@ def create_chat_model(
     base_url = model_config.get("base_url") or model_config.get("model_base_url")
     if base_url:
         kwargs["base_url"] = base_url
+    if kwargs.get("http_async_client") is None:
+        kwargs["http_async_client"] = shared_llm_http_client(base_url, api_key, kwargs["timeout"])
 
     return ChatOpenAI(**kwargs)
 
@@ -309,6 +393,8 @@ class GraphChatResult:
     messages: list[BaseMessage] = field(default_factory=list)
     cost: dict[str, Any] = field(default_factory=dict)
     terminate: str = "no"
+    # Duration of each planner and executor node run, in graph order.
+    step_timings: list[dict[str, Any]] = field(default_factory=list)
 
     @property
     def summary(self) -> str:
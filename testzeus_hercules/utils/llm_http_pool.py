@@ -0,0 +1,196 @@
+"""
+Process-wide pool of HTTP clients shared by the chat models.
+
+Every agent builds its own chat model, and each model would otherwise open its
+own connection pool to the same gateway. ``shared_llm_http_client`` returns one
+keep-alive ``httpx.AsyncClient`` per event loop, base URL and API key, so the
+planner, the nav agents and the multimodal helper reuse the same connections.
+HTTP/2 is negotiated when the optional ``h2`` package is installed.
+
+Each pool counts its requests, how many of them had to open a new connection
+and the time to the response headers (time to first byte).
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+import httpx
+from testzeus_hercules.utils.logger import logger
+
+DEFAULT_LLM_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# httpcore trace events emitted when a request opens a new connection.
+_CONNECT_EVENTS = ("connection.connect_tcp.started", "connection.connect_unix_socket.started")
+
+
+@dataclass
+class LLMHttpPoolStats:
+    """Counters of one pooled client."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    ttfb_seconds_total: float = 0.0
+
+    @property
+    def connections_reused(self) -> int:
+        return self.requests - self.connections_opened
+
+    def add(self, other: "LLMHttpPoolStats", sign: int = 1) -> None:
+        self.requests += sign * other.requests
+        self.connections_opened += sign * other.connections_opened
+        self.ttfb_seconds_total += sign * other.ttfb_seconds_total
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "ttfb_mean_seconds": round(self.ttfb_seconds_total / self.requests, 4) if self.requests else 0.0,
+        }
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport that records connection reuse and time to first byte."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, stats: LLMHttpPoolStats) -> None:
+        self._transport = transport
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        opened_connection = False
+        caller_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal opened_connection
+            if event_name in _CONNECT_EVENTS:
+                opened_connection = True
+            if caller_trace is not None:
+                await caller_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        started = time.perf_counter()
+        # Streaming transports return once the response headers have arrived.
+        response = await self._transport.handle_async_request(request)
+        ttfb = time.perf_counter() - started
+        self.stats.requests += 1
+        self.stats.connections_opened += int(opened_connection)
+        self.stats.ttfb_seconds_total += ttfb
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_PoolKey = Tuple[str, str]
+# Connections belong to the event loop that opened them, so clients are kept per
+# loop and dropped with it; models built outside a running loop share the None entry.
+_clients: MutableMapping[asyncio.AbstractEventLoop, Dict[_PoolKey, httpx.AsyncClient]] = weakref.WeakKeyDictionary()
+_loopless_clients: Dict[_PoolKey, httpx.AsyncClient] = {}
+_stats: Dict[_PoolKey, LLMHttpPoolStats] = {}
+_clients_lock = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %s.", name, raw, default)
+        return default
+
+
+def llm_http2_enabled() -> bool:
+    """Return whether pooled clients negotiate HTTP/2 (``LLM_HTTP2``, needs ``h2``)."""
+    if os.getenv("LLM_HTTP2", "true").lower().strip() != "true":
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_key(base_url: Optional[str], api_key: Optional[str]) -> _PoolKey:
+    credential = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+    return base_url or "", credential
+
+
+def _loop_clients() -> Dict[_PoolKey, httpx.AsyncClient]:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _loopless_clients
+    clients = _clients.get(loop)
+    if clients is None:
+        clients = _clients[loop] = {}
+    return clients
+
+
+def shared_llm_http_client(base_url: Optional[str], api_key: Optional[str], timeout: Optional[float] = None) -> httpx.AsyncClient:
+    """
+    Return the pooled async HTTP client for a model endpoint and API key.
+
+    Parameters:
+        base_url (Optional[str]): Endpoint of the model API; None for the provider default.
+        api_key (Optional[str]): API key used with the endpoint; only its hash is kept.
+        timeout (Optional[float]): Default request timeout in seconds for a new client.
+
+    Returns:
+        httpx.AsyncClient: A keep-alive client shared by every model with the same key.
+    """
+    key = _pool_key(base_url, api_key)
+    with _clients_lock:
+        clients = _loop_clients()
+        client = clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+        max_connections = int(_env_float("LLM_HTTP_MAX_CONNECTIONS", DEFAULT_LLM_HTTP_MAX_CONNECTIONS))
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=_env_float("LLM_HTTP_KEEPALIVE_EXPIRY", DEFAULT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS),
+        )
+        http2 = llm_http2_enabled()
+        stats = _stats.setdefault(key, LLMHttpPoolStats())
+        client = httpx.AsyncClient(
+            transport=_MeteredTransport(httpx.AsyncHTTPTransport(http2=http2, limits=limits), stats),
+            timeout=httpx.Timeout(timeout),
+            follow_redirects=True,
+        )
+        clients[key] = client
+        logger.debug("Opened pooled LLM HTTP client for %s (http2=%s, max_connections=%d)", base_url or "default endpoint", http2, max_connections)
+        return client
+
+
+def llm_http_pool_stats() -> Dict[str, LLMHttpPoolStats]:
+    """Return a copy of the counters of every pool, summed per base URL."""
+    totals: Dict[str, LLMHttpPoolStats] = {}
+    with _clients_lock:
+        for (base_url, _), stats in _stats.items():
+            totals.setdefault(base_url or "default", LLMHttpPoolStats()).add(stats)
+    return totals
+
+
+def llm_http_pool_usage(since: Optional[Dict[str, LLMHttpPoolStats]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the pool counters per base URL, counting only traffic after ``since``.
+
+    Parameters:
+        since (Optional[Dict[str, LLMHttpPoolStats]]): An earlier ``llm_http_pool_stats()`` result.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Requests, opened and reused connections and mean TTFB per base URL.
+    """
+    usage = {}
+    for base_url, stats in llm_http_pool_stats().items():
+        if since and base_url in since:
+            stats.add(since[base_url], sign=-1)
+        if stats.requests:
+            usage[base_url] = stats.as_dict()
+    return usage
@@ -0,0 +1,167 @@
+"""
+Latency tracking, adaptive timeouts and hedged requests for model calls.
+
+The latency of every successful model call is kept per model and agent in a
+rolling window. Once a window holds enough samples its 95th percentile drives
+two optional behaviours:
+
+- an adaptive timeout of ``LLM_ADAPTIVE_TIMEOUT_FACTOR`` times the p95, never
+  above the hard ``LLM_REQUEST_TIMEOUT``, so a stalled call fails or is retried
+  long before the hard limit;
+- hedging (``LLM_HEDGE_REQUESTS``): when a call has not answered by the p95, a
+  duplicate request is sent, the first successful response is used and the
+  other request is cancelled.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+LATENCY_WINDOW = 200
+# Samples needed before a window's percentiles are trusted.
+MIN_LATENCY_SAMPLES = 20
+# Adaptive timeouts never drop below this many seconds.
+MIN_ADAPTIVE_TIMEOUT_SECONDS = 10.0
+
+
+def _percentile(samples: Any, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(math.ceil(fraction * len(ordered)) - 1, 0))]
+
+
+class LLMLatencyTracker:
+    """Rolling latency windows per model and agent."""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = MIN_LATENCY_SAMPLES) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        # Calls ever recorded per window, so a caller can tell which samples came after a snapshot.
+        self._recorded: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, agent_name: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault((model, agent_name), deque(maxlen=self.window)).append(seconds)
+            self._recorded[(model, agent_name)] = self._recorded.get((model, agent_name), 0) + 1
+
+    def p95(self, model: str, agent_name: str) -> Optional[float]:
+        """Return the 95th percentile latency, or None while there are too few samples."""
+        with self._lock:
+            samples = list(self._samples.get((model, agent_name), ()))
+        if len(samples) < self.min_samples:
+            return None
+        return _percentile(samples, 0.95)
+
+    def timeout_for(self, model: str, agent_name: str, hard_timeout: float, factor: float) -> float:
+        """Return ``factor`` times the p95, bounded by ``hard_timeout``; the hard timeout without data."""
+        p95 = self.p95(model, agent_name)
+        if factor <= 0 or p95 is None:
+            return hard_timeout
+        return min(hard_timeout, max(p95 * factor, MIN_ADAPTIVE_TIMEOUT_SECONDS))
+
+    def counts(self) -> Dict[Tuple[str, str], int]:
+        """Return how many calls each window has recorded so far; pass it to ``summary`` later."""
+        with self._lock:
+            return dict(self._recorded)
+
+    def summary(self, since: Optional[Dict[Tuple[str, str], int]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the call count, p50 and p95 of every window, keyed ``model/agent``.
+
+        Parameters:
+            since (Optional[Dict[Tuple[str, str], int]]): An earlier ``counts()`` result; only calls
+                recorded after it are summarised, as far as the window still holds them.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Call count, p50 and p95 in seconds per ``model/agent``.
+        """
+        with self._lock:
+            windows = {}
+            for key, samples in self._samples.items():
+                new_calls = self._recorded[key] - (since or {}).get(key, 0)
+                windows[key] = list(samples)[-new_calls:] if new_calls > 0 else []
+        return {
+            f"{model}/{agent_name}": {
+                "calls": len(samples),
+                "p50_seconds": round(_percentile(samples, 0.5), 3),
+                "p95_seconds": round(_percentile(samples, 0.95), 3),
+            }
+            for (model, agent_name), samples in windows.items()
+            if samples
+        }
+
+
+llm_latency_tracker = LLMLatencyTracker()
+
+
+@dataclass
+class HedgedResponse:
+    """Outcome of ``hedged_call``."""
+
+    response: Any
+    # Seconds from the start of the original request until the answer, also when the
+    # duplicate answered: that is how long the caller waited.
+    latency: float
+    hedged: bool = False
+    hedge_won: bool = False
+
+
+async def hedged_call(
+    call: Callable[[], Awaitable[Any]],
+    timeout: float,
+    hedge_after: Optional[float] = None,
+    can_hedge: Callable[[], bool] = lambda: True,
+) -> HedgedResponse:
+    """
+    Run ``call`` and, if it has not answered after ``hedge_after`` seconds, race a duplicate.
+
+    Parameters:
+        call (Callable[[], Awaitable[Any]]): Starts one model request.
+        timeout (float): Overall deadline in seconds; raises ``asyncio.TimeoutError`` when reached.
+        hedge_after (Optional[float]): Seconds before the duplicate is sent; None never hedges.
+        can_hedge (Callable[[], bool]): Checked before hedging, e.g. for rate limit capacity.
+
+    Returns:
+        HedgedResponse: The first successful response. When every request fails, the
+        first error is raised. Requests still running are cancelled.
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    primary = asyncio.ensure_future(call())
+    tasks = [primary]
+    hedge: Optional["asyncio.Future[Any]"] = None
+    try:
+        if hedge_after is not None and hedge_after < timeout:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+            if not done and can_hedge():
+                hedge = asyncio.ensure_future(call())
+                tasks.append(hedge)
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                raise asyncio.TimeoutError()
+            for task in done:
+                if task.exception() is None:
+                    return HedgedResponse(
+                        response=task.result(),
+                        latency=time.monotonic() - started,
+                        hedged=hedge is not None,
+                        hedge_won=task is hedge,
+                    )
+                error = error or task.exception()
+        assert error is not None
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
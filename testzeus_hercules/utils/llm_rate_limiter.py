@@ -0,0 +1,162 @@
+"""
+Process-wide requests-per-minute and tokens-per-minute limits for model calls.
+
+Every agent of every scenario running in the process calls the provider through
+one ``LLMRateLimiter`` per model. Each limiter holds two token buckets that
+refill continuously up to their per-minute limit. A call reserves one request
+and its estimated prompt tokens before it is sent, and the reservation is
+settled with the real token usage once the response arrives.
+
+Calls wait in a single queue per model, served strictly in order of priority
+and arrival, so planner calls go ahead of the navigation agents' calls.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from testzeus_hercules.utils.logger import logger
+
+PLANNER_PRIORITY = 0
+NAV_PRIORITY = 1
+# Longest sleep between two checks of a waiting call.
+_QUEUE_POLL_SECONDS = 0.05
+
+
+class _TokenBucket:
+    """Bucket of ``limit`` units per minute that refills continuously."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.available = float(limit)
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.available = min(float(self.limit), self.available + (now - self._updated) * self.limit / 60.0)
+        self._updated = now
+
+    def seconds_until(self, amount: float) -> float:
+        # Requests larger than the whole bucket wait for a full bucket instead of forever.
+        missing = min(amount, float(self.limit)) - self.available
+        return max(missing, 0.0) * 60.0 / self.limit
+
+
+@dataclass
+class RateLimitReservation:
+    """Capacity taken by one call, settled with its real usage afterwards."""
+
+    model: str
+    estimated_tokens: int
+    queue_wait: float
+
+
+class LLMRateLimiter:
+    """Request and token buckets of one model, shared by every engine of the process."""
+
+    def __init__(self, model: str, requests_per_minute: int, tokens_per_minute: int) -> None:
+        self.model = model
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._queue: List[Tuple[int, int]] = []
+        self._order = itertools.count()
+        # Engines may run on different event loops, so the state is guarded by a thread lock.
+        self._lock = threading.Lock()
+
+    def _seconds_until_available(self, tokens: int) -> float:
+        now = time.monotonic()
+        wait = 0.0
+        if self._requests is not None:
+            self._requests.refill(now)
+            wait = self._requests.seconds_until(1)
+        if self._tokens is not None:
+            self._tokens.refill(now)
+            wait = max(wait, self._tokens.seconds_until(tokens))
+        return wait
+
+    async def acquire(self, estimated_tokens: int, priority: int = NAV_PRIORITY) -> RateLimitReservation:
+        """
+        Wait until the buckets can take one request and ``estimated_tokens``.
+
+        Parameters:
+            estimated_tokens (int): Estimated tokens of the call.
+            priority (int): Lower values are served first; ``PLANNER_PRIORITY`` or ``NAV_PRIORITY``.
+
+        Returns:
+            RateLimitReservation: The reservation to pass to ``settle``.
+        """
+        ticket = (priority, next(self._order))
+        started = time.monotonic()
+        with self._lock:
+            heapq.heappush(self._queue, ticket)
+        try:
+            while True:
+                with self._lock:
+                    if self._queue[0] == ticket:
+                        wait = self._seconds_until_available(estimated_tokens)
+                        if wait <= 0:
+                            heapq.heappop(self._queue)
+                            if self._requests is not None:
+                                self._requests.available -= 1
+                            if self._tokens is not None:
+                                self._tokens.available -= estimated_tokens
+                            break
+                    else:
+                        wait = _QUEUE_POLL_SECONDS
+                # Short sleeps let a planner call that arrives meanwhile take the head of the queue.
+                await asyncio.sleep(min(wait, _QUEUE_POLL_SECONDS))
+        except BaseException:
+            with self._lock:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                    heapq.heapify(self._queue)
+            raise
+        queue_wait = time.monotonic() - started
+        if queue_wait >= 1.0:
+            logger.info("[LLM_RATE_LIMIT] %s call waited %.2fs for capacity", self.model, queue_wait)
+        return RateLimitReservation(model=self.model, estimated_tokens=estimated_tokens, queue_wait=queue_wait)
+
+    def try_acquire(self, estimated_tokens: int) -> Optional[RateLimitReservation]:
+        """Reserve capacity only if nothing is queued and it is available right now."""
+        with self._lock:
+            if self._queue or self._seconds_until_available(estimated_tokens) > 0:
+                return None
+            if self._requests is not None:
+                self._requests.available -= 1
+            if self._tokens is not None:
+                self._tokens.available -= estimated_tokens
+        return RateLimitReservation(model=self.model, estimated_tokens=estimated_tokens, queue_wait=0.0)
+
+    def settle(self, reservation: RateLimitReservation, used_tokens: Optional[int]) -> None:
+        """Replace the estimated tokens of a reservation with the tokens actually used."""
+        if self._tokens is None or not used_tokens:
+            return
+        with self._lock:
+            self._tokens.available += reservation.estimated_tokens - used_tokens
+
+
+_limiters: Dict[str, LLMRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def llm_rate_limiter(model: str, requests_per_minute: int, tokens_per_minute: int) -> Optional[LLMRateLimiter]:
+    """Return the process-wide limiter of ``model``, or None when both limits are 0."""
+    if requests_per_minute <= 0 and tokens_per_minute <= 0:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get(model)
+        if limiter is None:
+            limiter = LLMRateLimiter(model, requests_per_minute, tokens_per_minute)
+            _limiters[model] = limiter
+        return limiter
+
+
+def model_name_of(llm: Any) -> str:
+    """Return the model name of a chat model, looking through ``bind_tools`` bindings."""
+    model = llm
+    while hasattr(model, "bound"):
+        model = model.bound
+    return str(getattr(model, "model_name", None) or getattr(model, "model", None) or type(model).__name__)
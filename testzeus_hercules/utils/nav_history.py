@@ -0,0 +1,84 @@
+"""
+Compaction of stale page snapshots in a navigation agent's tool-calling history.
+
+DOM and page-text tools return large snapshots that go stale as soon as the
+page changes or a newer snapshot is taken, yet a plain history re-sends every
+one of them on each later turn. ``NavHistoryCompactor`` replaces such outputs
+with a short placeholder that points at what superseded them, and turns exact
+repeats of earlier tool outputs into a reference to the first one.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from langchain_core.messages import BaseMessage, ToolMessage
+
+# Tools whose output is a snapshot of the current page.
+SNAPSHOT_TOOLS = frozenset({"get_interactive_elements", "get_page_text", "get_input_fields"})
+# Shorter repeated outputs are cheaper than the reference that would replace them.
+MIN_DEDUP_CHARS = 200
+
+
+@dataclass
+class _ToolOutput:
+    index: int
+    turn: int
+    name: str
+    content: str
+    changes_page: bool
+    compacted: bool = False
+
+
+class NavHistoryCompactor:
+    """
+    Tracks the tool outputs of one nav agent run and compacts superseded ones.
+
+    ``record`` is called for every ``ToolMessage`` appended to the history, with
+    its position in the history list; ``compact`` then rewrites that list in place.
+    """
+
+    def __init__(self) -> None:
+        self._outputs: List[_ToolOutput] = []
+        self.chars_saved = 0
+
+    def record(self, index: int, turn: int, name: str, content: str, changes_page: bool) -> None:
+        self._outputs.append(_ToolOutput(index, turn, name, content, changes_page))
+
+    def _superseded_by(self, position: int) -> Optional[str]:
+        output = self._outputs[position]
+        for later in self._outputs[position + 1 :]:
+            if later.name == output.name:
+                return f"[{output.name} output superseded by snapshot at turn {later.turn}]"
+            if later.changes_page:
+                return f"[{output.name} output superseded: page changed by {later.name} at turn {later.turn}]"
+        return None
+
+    def _duplicate_of(self, position: int) -> Optional[str]:
+        output = self._outputs[position]
+        if len(output.content) < MIN_DEDUP_CHARS:
+            return None
+        for earlier in self._outputs[:position]:
+            if not earlier.compacted and earlier.name == output.name and earlier.content == output.content:
+                return f"[same output as {earlier.name} at turn {earlier.turn}]"
+        return None
+
+    def compact(self, messages: List[BaseMessage]) -> int:
+        """Replace superseded snapshots and repeated outputs in ``messages``; return the characters removed."""
+        removed = 0
+        for position, output in enumerate(self._outputs):
+            if output.compacted:
+                continue
+            if output.name in SNAPSHOT_TOOLS:
+                placeholder = self._superseded_by(position)
+            else:
+                placeholder = self._duplicate_of(position)
+            if placeholder is None or len(placeholder) >= len(output.content):
+                continue
+            message = messages[output.index]
+            if not isinstance(message, ToolMessage):
+                continue
+            messages[output.index] = message.model_copy(update={"content": placeholder})
+            output.compacted = True
+            removed += len(output.content) - len(placeholder)
+        self.chars_saved += removed
+        return removed
@@ -0,0 +1,73 @@
+"""
+Layout of agent prompts for provider-side prompt caching.
+
+OpenAI, Anthropic and LiteLLM cache the longest prompt prefix that is
+byte-identical to an earlier request. Prompts are therefore laid out from the
+most to the least stable part: the static instructions first, the per-scenario
+test data after them, and data that changes on every call (such as the
+current timestamp) in the conversation messages rather than the system prompt.
+The tool schemas are placed before the system prompt by the providers.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Union
+
+DEFAULT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIMESTAMP_PREFIX = "Current timestamp is "
+# Replaces a test data placeholder that a custom prompt puts before other instructions.
+TEST_DATA_POINTER = "(see Available Test Data at the end of this prompt)"
+_TEST_DATA_HEADING = "\n\nAvailable Test Data: "
+_PLACEHOLDER = re.compile(r"\$(?:basic_test_information\b|\{basic_test_information\})")
+_TRAILING_PLACEHOLDER = re.compile(_PLACEHOLDER.pattern + r"\s*\Z")
+
+
+def static_prompt_prefix(template: str) -> str:
+    """
+    Return the part of a prompt template that does not depend on the scenario.
+
+    A placeholder at the end of the template is cut off. Placeholders anywhere
+    else are replaced by a pointer to a test data section appended at the end.
+    """
+    trailing = _TRAILING_PLACEHOLDER.search(template)
+    if trailing:
+        template = template[: trailing.start()]
+    elif not _PLACEHOLDER.search(template):
+        return template
+    else:
+        template = _PLACEHOLDER.sub(TEST_DATA_POINTER, template).rstrip() + _TEST_DATA_HEADING
+    return _PLACEHOLDER.sub(TEST_DATA_POINTER, template)
+
+
+def layout_system_prompt(template: str, test_data: str) -> str:
+    """
+    Render a system prompt as its static prefix followed by the scenario's test data.
+
+    Parameters:
+        template (str): Prompt template, optionally containing ``$basic_test_information``.
+        test_data (str): Test data of the current scenario.
+
+    Returns:
+        str: The prompt; prompts with the same template share everything before the test data.
+    """
+    if not _PLACEHOLDER.search(template):
+        return template
+    return static_prompt_prefix(template) + test_data
+
+
+def timestamp_line(timestamp_format: str) -> str:
+    """Return the current timestamp line that is sent with each task instead of in the system prompt."""
+    return f"{TIMESTAMP_PREFIX}{datetime.now().strftime(timestamp_format)}"
+
+
+def system_prompt_content(text: str, cache_hint: bool) -> Union[str, List[Dict[str, Any]]]:
+    """
+    Return system message content, marked as a cache breakpoint when ``cache_hint`` is set.
+
+    The marker is the Anthropic ``cache_control`` block field, which LiteLLM
+    forwards to providers that need explicit breakpoints. Providers with
+    automatic prefix caching do not need it.
+    """
+    if not cache_hint:
+        return text
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
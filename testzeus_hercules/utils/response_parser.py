@@ -34,8 +34,12 @@ def parse_response(message: str) -> dict[str, Any]:
 
     # Find all top-level JSON objects and take the last one (most recent planner response)
     json_candidates = []
+    candidate_end = 0
     for m in re.finditer(r"\{", message):
         start = m.start()
+        if start < candidate_end:
+            # Nested inside the previous object, e.g. an entry of "next_steps".
+            continue
         depth = 0
         for i, ch in enumerate(message[start:]):
             if ch == "{":
@@ -44,6 +48,7 @@ def parse_response(message: str) -> dict[str, Any]:
                 depth -= 1
                 if depth == 0:
                     json_candidates.append(message[start : start + i + 1])
+                    candidate_end = start + i + 1
                     break
     if json_candidates:
         for candidate in reversed(json_candidates):
@@ -0,0 +1,149 @@
+"""
+Reuse of unchanged passed scenarios in incremental runs.
+
+Each split scenario is fingerprinted from its feature file, the test data folder
+and the configuration that can change its outcome. A scenario whose fingerprint
+matches its last pass in the scenario history is not executed again; its stored
+JUnit test case is copied into the report and marked as reused.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from junitparser import JUnitXml, Property, TestCase, TestSuite
+from junitparser.junitparser import Properties, SystemOut
+from testzeus_hercules.config import get_global_conf
+from testzeus_hercules.utils.scenario_history import ScenarioHistory
+
+REUSED_PROPERTY = "Reused Result"
+
+# Settings that can change how a scenario behaves; any change invalidates cached passes.
+FINGERPRINT_CONFIG_KEYS = [
+    "LLM_MODEL_NAME",
+    "LLM_MODEL_BASE_URL",
+    "LLM_MODEL_API_TYPE",
+    "LLM_MODEL_API_VERSION",
+    "LLM_MODEL_TEMPERATURE",
+    "AGENTS_LLM_CONFIG_FILE",
+    "AGENTS_LLM_CONFIG_FILE_REF_KEY",
+    "ENABLE_PORTKEY",
+    "BROWSER_TYPE",
+    "BROWSER_CHANNEL",
+    "BROWSER_VERSION",
+    "HEADLESS",
+    "BROWSER_RESOLUTION",
+    "RUN_DEVICE",
+    "LOCALE",
+    "TIMEZONE",
+    "GEOLOCATION",
+    "COLOR_SCHEME",
+    "LOAD_EXTRA_TOOLS",
+    "ADDITIONAL_TOOL_DIRS",
+    "BROWSER_COOKIES",
+]
+
+
+def _hash_file(digest: Any, path: str) -> None:
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+
+
+def fingerprint_config(config: Dict[str, Any]) -> str:
+    """Hash the outcome-relevant settings, including the content of the agents LLM config file."""
+    digest = hashlib.sha256()
+    relevant = {key: config.get(key) for key in FINGERPRINT_CONFIG_KEYS}
+    digest.update(json.dumps(relevant, sort_keys=True, default=str).encode("utf-8"))
+    llm_config_file = config.get("AGENTS_LLM_CONFIG_FILE")
+    if llm_config_file and os.path.isfile(llm_config_file):
+        _hash_file(digest, llm_config_file)
+    return digest.hexdigest()
+
+
+def fingerprint_test_data(test_data_path: str) -> str:
+    """Hash the names and contents of every file under the test data folder."""
+    digest = hashlib.sha256()
+    if os.path.isdir(test_data_path):
+        for root, dirs, files in os.walk(test_data_path):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, test_data_path).encode("utf-8"))
+                _hash_file(digest, path)
+    return digest.hexdigest()
+
+
+def fingerprint_scenario(feature_file: str, test_data_fingerprint: str, config_fingerprint: str) -> str:
+    """Combine a split scenario file with the test data and config fingerprints."""
+    digest = hashlib.sha256()
+    _hash_file(digest, feature_file)
+    digest.update(test_data_fingerprint.encode("utf-8"))
+    digest.update(config_fingerprint.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultsCache:
+    """
+    Reuse of earlier passes, based on the fingerprints kept in the scenario history.
+
+    ``partition`` fingerprints the scenarios of a run; passing ``fingerprints`` to
+    ``ScenarioHistory.record`` afterwards keeps the test case of each pass for reuse.
+    """
+
+    def __init__(self, history: ScenarioHistory) -> None:
+        self.history = history
+        # Scenario title to the fingerprint it runs with in this run.
+        self.fingerprints: Dict[str, str] = {}
+
+    def partition(self, list_of_feats: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+        """
+        Fingerprint the scenarios and split them into those to run and those whose cached pass can be reused.
+
+        Returns:
+            Tuple[List[Dict[str, str]], List[Dict[str, str]]]: Scenarios to run and scenarios to reuse, both in file order.
+        """
+        conf = get_global_conf()
+        test_data_fingerprint = fingerprint_test_data(conf.get_test_data_path())
+        config_fingerprint = fingerprint_config(conf.get_config())
+
+        to_run: List[Dict[str, str]] = []
+        reused: List[Dict[str, str]] = []
+        for feat in list_of_feats:
+            fingerprint = fingerprint_scenario(feat["output_file"], test_data_fingerprint, config_fingerprint)
+            self.fingerprints[feat["scenario"]] = fingerprint
+            entry = self.history.get(feat["scenario"])
+            if entry and entry.get("last_passed") and entry.get("fingerprint") == fingerprint and entry.get("result_xml"):
+                reused.append(feat)
+            else:
+                to_run.append(feat)
+        return to_run, reused
+
+    def write_reused_result(self, feat: Dict[str, str], output_dir: str) -> Optional[str]:
+        """Write a JUnit fragment with the cached pass of a scenario, marked as reused."""
+        entry = self.history.get(feat["scenario"])
+        if not entry or not entry.get("result_xml"):
+            return None
+        recorded_at = entry.get("passed_at", "")
+        case = TestCase.fromstring(entry["result_xml"])
+        properties = case.child(Properties)
+        if properties is None:
+            properties = Properties()
+            case.append(properties)
+        properties.add_property(Property(name=REUSED_PROPERTY, value="true"))
+        properties.add_property(Property(name="Reused From", value=recorded_at))
+        case.append(SystemOut(f"Reused the pass recorded at {recorded_at}: the scenario, test data and config are unchanged."))
+
+        suite = TestSuite(entry.get("suite") or feat["feature"])
+        suite.add_testcase(case)
+        suite.time = float(case.time or 0.0)
+        suite.update_statistics()
+        xml = JUnitXml()
+        xml.add_testsuite(suite)
+
+        os.makedirs(output_dir, exist_ok=True)
+        scenario_r = feat["scenario"].replace(" ", "_").replace(":", "").replace("/", "_")
+        result_file = os.path.join(output_dir, f"{scenario_r}_reused_results.xml")
+        xml.write(result_file)
+        return result_file
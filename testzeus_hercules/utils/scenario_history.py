@@ -0,0 +1,179 @@
+"""
+History of scenario outcomes and durations, the one per-scenario store of a project.
+
+Every executed scenario records whether it passed and its ``execution_time``
+from the JUnit fragment written by ``build_junit_xml``. The history is read by:
+
+- the ``failed-first`` scenario order, which runs previously failed scenarios
+  before the others and, when scenarios run in parallel, the longest expected
+  ones first to shorten the overall run;
+- the shard balancer (``shard_helper``), which weighs scenarios by their
+  expected durations;
+- incremental runs (``results_cache``), which reuse a scenario's last pass when
+  its fingerprint is unchanged.
+"""
+
+import datetime
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from junitparser import JUnitXml, TestSuite
+from testzeus_hercules.config import get_global_conf
+from testzeus_hercules.utils.logger import logger
+
+HISTORY_VERSION = 2
+HISTORY_FILE_NAME = "scenario_history.json"
+# Weight of the latest run in the smoothed expected duration.
+DURATION_SMOOTHING = 0.5
+
+# Ranks of the failed-first order: known failures, then scenarios without history, then known passes.
+_RANK_FAILED = 0
+_RANK_NEW = 1
+_RANK_PASSED = 2
+
+
+def _suites(result_file: str) -> List[TestSuite]:
+    xml = JUnitXml.fromfile(result_file)
+    return [xml] if isinstance(xml, TestSuite) else list(xml)
+
+
+def is_failed_result(result_file: str) -> bool:
+    """Return whether a JUnit fragment contains a failed or errored test case."""
+    try:
+        return any(not case.is_passed and not case.is_skipped for suite in _suites(result_file) for case in suite)
+    except Exception as e:
+        logger.warning(f"Treating unreadable JUnit result {result_file} as failed: {e}")
+        return True
+
+
+def median_duration(durations: Iterable[Optional[float]], default: float) -> float:
+    """Return the median of the known durations, or ``default`` when none is known; the weight of scenarios without history."""
+    known = sorted(duration for duration in durations if duration)
+    return known[len(known) // 2] if known else default
+
+
+class ScenarioHistory:
+    """
+    Outcomes and smoothed durations of the scenarios of one feature file, stored as JSON.
+
+    Entries are keyed by the path of the input feature file relative to the folder
+    of the history file, and the scenario title, so a history file can be shared
+    between checkouts. Incremental runs also keep the fingerprint a scenario last
+    ran with and, for passes, the JUnit XML of its test case.
+    """
+
+    def __init__(self, history_file: str, feature_file: str) -> None:
+        self.history_file = history_file
+        history_dir = os.path.dirname(os.path.abspath(history_file))
+        self.feature_key = os.path.relpath(os.path.abspath(feature_file), history_dir).replace(os.sep, "/")
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @classmethod
+    def for_current_run(cls) -> "ScenarioHistory":
+        """Open the history of the configured project and input feature file."""
+        conf = get_global_conf()
+        history_file = os.path.join(conf.get_project_source_root(), HISTORY_FILE_NAME)
+        return cls(history_file, conf.get_input_gherkin_file_path())
+
+    def _load(self) -> None:
+        if not os.path.exists(self.history_file):
+            return
+        try:
+            with open(self.history_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scenario history {self.history_file}: {e}")
+            return
+        if data.get("version") == HISTORY_VERSION:
+            self._entries = data.get("scenarios", {})
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.history_file)), exist_ok=True)
+        tmp_file = f"{self.history_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": HISTORY_VERSION, "scenarios": self._entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.history_file)
+
+    def _key(self, scenario: str) -> str:
+        return f"{self.feature_key}::{scenario}"
+
+    def get(self, scenario: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(self._key(scenario))
+
+    def expected_duration(self, scenario: str) -> Optional[float]:
+        entry = self.get(scenario)
+        return entry.get("duration") if entry else None
+
+    def durations(self) -> Dict[str, float]:
+        """Return the expected duration of every scenario of the feature file that has one."""
+        prefix = self._key("")
+        return {key[len(prefix) :]: entry["duration"] for key, entry in self._entries.items() if key.startswith(prefix) and entry.get("duration")}
+
+    def _executed_cases(self, result_files: List[str]) -> Iterator[Tuple[TestSuite, Any]]:
+        for result_file in result_files:
+            try:
+                suites = _suites(result_file)
+            except Exception as e:
+                logger.warning(f"Not recording unreadable JUnit result {result_file}: {e}")
+                continue
+            for suite in suites:
+                for case in suite:
+                    if case.name and not case.is_skipped:
+                        yield suite, case
+
+    def record(self, result_files: List[str], fingerprints: Optional[Dict[str, str]] = None) -> None:
+        """
+        Store the outcome and duration of every executed scenario found in the given JUnit fragments.
+
+        Parameters:
+            result_files (List[str]): JUnit fragments of the executed scenarios.
+            fingerprints (Optional[Dict[str, str]]): Fingerprints of the scenarios of an
+                incremental run; passes of these scenarios keep their test case for reuse.
+        """
+        now = datetime.datetime.now().isoformat()
+        for suite, case in self._executed_cases(result_files):
+            entry = self._entries.setdefault(self._key(case.name), {"runs": 0, "failures": 0})
+            passed = bool(case.is_passed)
+            entry["runs"] += 1
+            entry["failures"] += 0 if passed else 1
+            entry["last_passed"] = passed
+            entry["recorded_at"] = now
+            if case.time:
+                previous = entry.get("duration")
+                duration = float(case.time)
+                entry["duration"] = duration if previous is None else DURATION_SMOOTHING * duration + (1 - DURATION_SMOOTHING) * previous
+            if fingerprints is not None and case.name in fingerprints:
+                entry["fingerprint"] = fingerprints[case.name]
+                if passed:
+                    entry.update({"suite": suite.name, "result_xml": case.tostring().decode("utf-8"), "passed_at": now})
+                else:
+                    for key in ("suite", "result_xml", "passed_at"):
+                        entry.pop(key, None)
+
+    def order(self, list_of_feats: List[Dict[str, str]], longest_first: bool = False) -> List[Dict[str, str]]:
+        """
+        Order scenarios failed first, then those without history, then known passes.
+
+        Parameters:
+            list_of_feats (List[Dict[str, str]]): Split scenarios in feature file order.
+            longest_first (bool): Within each group, run the longest expected scenarios first.
+                Scenarios without a known duration are weighted with the median of the known ones.
+
+        Returns:
+            List[Dict[str, str]]: The scenarios in execution order; ties keep feature file order.
+        """
+        fallback = median_duration((self.expected_duration(feat["scenario"]) for feat in list_of_feats), 0.0)
+
+        def sort_key(item: Any) -> Any:
+            index, feat = item
+            entry = self.get(feat["scenario"])
+            if entry is None or "last_passed" not in entry:
+                rank = _RANK_NEW
+            else:
+                rank = _RANK_PASSED if entry["last_passed"] else _RANK_FAILED
+            duration = (entry or {}).get("duration") or fallback
+            return (rank, -duration if longest_first else 0.0, index)
+
+        return [feat for _, feat in sorted(enumerate(list_of_feats), key=sort_key)]
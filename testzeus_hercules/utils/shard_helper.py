@@ -0,0 +1,120 @@
+import glob
+import heapq
+import os
+import tempfile
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+from testzeus_hercules.utils.gherkin_helper import split_feature_file
+from testzeus_hercules.utils.junit_helper import JUnitXMLGenerator
+from testzeus_hercules.utils.logger import logger
+from testzeus_hercules.utils.scenario_history import ScenarioHistory, median_duration
+
+K = TypeVar("K", bound=Hashable)
+
+# Weight given to scenarios without history when no scenario has history at all,
+# which degrades the partition to balancing by count.
+DEFAULT_SCENARIO_WEIGHT = 1.0
+
+
+def load_scenario_durations(durations_file: Optional[str], feature_file: str) -> Dict[str, float]:
+    """
+    Read the expected scenario durations of a feature file from a shared scenario history file.
+
+    Every shard must weigh scenarios the same way, so durations only come from an
+    explicitly given file that all nodes share (e.g. a committed
+    ``scenario_history.json``), never from a node's own run history.
+
+    Parameters:
+        durations_file (Optional[str]): The shared scenario history file; None to split by count.
+        feature_file (str): The input feature file being sharded.
+
+    Returns:
+        Dict[str, float]: Scenario title to expected duration in seconds; empty without a file.
+        A missing file is treated as empty, so the split still only depends on repository contents.
+    """
+    if not durations_file:
+        return {}
+    if not os.path.isfile(durations_file):
+        logger.warning(f"Shard durations file not found: {durations_file}; splitting its scenarios by count.")
+        return {}
+    return ScenarioHistory(durations_file, feature_file).durations()
+
+
+def assign_shards(weights: Sequence[Tuple[K, Optional[float]]], shard_count: int) -> Dict[K, int]:
+    """
+    Partition keys across shards by expected duration, longest-processing-time first.
+
+    Keys without a known duration are weighted with the median of the known ones;
+    without any known duration the keys are dealt out by count in input order. The
+    result only depends on the input, so every CI node computes the same split.
+
+    Parameters:
+        weights (Sequence[Tuple[K, Optional[float]]]): Keys with their expected duration, in a stable order.
+        shard_count (int): Number of shards.
+
+    Returns:
+        Dict[K, int]: The 1-based shard of every key.
+    """
+    fallback = median_duration((weight for _, weight in weights), DEFAULT_SCENARIO_WEIGHT)
+
+    order = sorted(range(len(weights)), key=lambda i: (-(weights[i][1] or fallback), i))
+    loads = [(0.0, shard) for shard in range(1, shard_count + 1)]
+    assignment: Dict[K, int] = {}
+    for i in order:
+        key, weight = weights[i]
+        load, shard = heapq.heappop(loads)
+        assignment[key] = shard
+        heapq.heappush(loads, (load + (weight or fallback), shard))
+    return assignment
+
+
+def select_shard_scenarios(
+    list_of_feats: List[Dict[str, str]],
+    shard: Tuple[int, int],
+    durations: Dict[str, float],
+) -> List[Dict[str, str]]:
+    """Return the split scenarios that belong to ``shard``, in feature file order."""
+    shard_index, shard_count = shard
+    assignment = assign_shards([(feat["scenario"], durations.get(feat["scenario"])) for feat in list_of_feats], shard_count)
+    return [feat for feat in list_of_feats if assignment[feat["scenario"]] == shard_index]
+
+
+async def list_feature_scenarios(feature_file: str) -> List[str]:
+    """Return the scenario titles of a feature file as the runner will name them."""
+    if not os.path.exists(feature_file):
+        return []
+    with tempfile.TemporaryDirectory() as output_dir:
+        return [feat["scenario"] for feat in await split_feature_file(feature_file, output_dir)]
+
+
+def collect_report_files(paths: Sequence[str]) -> List[str]:
+    """Expand report files and directories (searched recursively for ``*_result.xml``)."""
+    report_files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            report_files.extend(sorted(glob.glob(os.path.join(path, "**", "*_result.xml"), recursive=True)))
+        else:
+            report_files.append(path)
+    return report_files
+
+
+async def merge_shard_reports(paths: Sequence[str], output_file: str) -> str:
+    """
+    Merge the JUnit reports produced by several shards into one report.
+
+    Parameters:
+        paths (Sequence[str]): Shard report files, or directories containing them.
+        output_file (str): Path of the merged JUnit XML file.
+
+    Returns:
+        str: The path of the merged report.
+    """
+    report_files = [path for path in collect_report_files(paths) if os.path.abspath(path) != os.path.abspath(output_file)]
+    if not report_files:
+        raise FileNotFoundError(f"No JUnit reports found in: {', '.join(paths)}")
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    await JUnitXMLGenerator.merge_junit_xml(report_files, output_file, delete_sources=False)
+    logger.info(f"Merged {len(report_files)} shard reports into {output_file}")
+    return output_file
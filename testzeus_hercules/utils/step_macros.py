@@ -0,0 +1,400 @@
+"""
+Learned step macros: recorded browser tool sequences replayed without the nav LLM.
+
+When the browser navigation agent completes a planner step, the tool calls it
+made are stored under the normalised step text, a pattern of the page URL
+(query, fragment and id-like path segments left out) and a digest of the test
+data the agent was given, since the recorded arguments are literal values
+taken from it. Each element the calls
+target is stored with a fingerprint of stable properties (tag, role, id, name,
+label, placeholder and visible text) taken just before the call ran.
+
+On a later run of the same step on a matching page the calls are executed
+again directly. Before each call its target elements are looked up: a selector
+that now points at an element with another fingerprint is re-targeted to the
+one element that carries the recorded fingerprint, and the replay stops as
+soon as an element cannot be found or a tool reports an error, so the step
+falls back to the LLM loop. The replay reports the results of the calls it
+made, which become the step's response, or tell the LLM what was already done.
+
+Only steps made of page actions and DOM snapshots are recorded; steps that read
+page content to answer (page text, screenshots, visual checks) always use the
+LLM because their answer depends on what is read.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from testzeus_hercules.utils.js_helper import get_js_with_element_finder
+from testzeus_hercules.utils.logger import logger
+
+STEP_MACRO_MODES = ("off", "record", "replay", "auto")
+# Bumped when the stored macro format changes; older macros are ignored.
+STEP_MACRO_VERSION = 3
+
+# Tools a macro may contain. DOM snapshots are replayed too: they assign the
+# md ids the recorded selectors use.
+MACRO_ACTION_TOOLS = frozenset(
+    {
+        "open_url",
+        "click",
+        "hover",
+        "press_key_combination",
+        "bulk_enter_text",
+        "bulk_select_option",
+        "bulk_set_date_time_value",
+        "bulk_set_slider",
+        "drag_and_drop",
+        "execute_action_sequence",
+    }
+)
+MACRO_SNAPSHOT_TOOLS = frozenset({"get_interactive_elements", "get_input_fields"})
+_ERROR_MARKERS = ("[error]", "[tool error]")
+# Action tools report failures in prose; snapshots may contain any page text.
+_FAILED_ACTION_MARKERS = _ERROR_MARKERS + ("unable to", "not found", "failed")
+
+# Tool results longer than this are cut in replay reports; snapshots are whole pages.
+_REPORT_RESULT_CHARS = 200
+
+_ID_LIKE_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8,}|[0-9a-f-]{32,36})$", re.IGNORECASE)
+
+# Fingerprint of one element; shared by the lookup of a selector and of all md elements.
+_FINGERPRINT_JS = """
+const fingerprintOf = (el) => ({
+    tag: el.tagName.toLowerCase(),
+    type: el.getAttribute('type') || '',
+    role: el.getAttribute('role') || '',
+    id: el.id || '',
+    name: el.getAttribute('name') || '',
+    label: el.getAttribute('aria-label') || el.getAttribute('title') || '',
+    placeholder: el.getAttribute('placeholder') || '',
+    text: (el.innerText || '').trim().replace(/\\s+/g, ' ').slice(0, 80),
+});
+"""
+
+_ELEMENT_FINGERPRINT_JS = get_js_with_element_finder(
+    """(selector) => {
+    /*INJECT_FIND_ELEMENT_IN_SHADOW_DOM*/
+    """
+    + _FINGERPRINT_JS
+    + """
+    const element = findElementInShadowDOMAndIframes(document, selector);
+    return element ? fingerprintOf(element) : null;
+}"""
+)
+
+_MD_FINGERPRINTS_JS = (
+    """() => {
+    """
+    + _FINGERPRINT_JS
+    + """
+    const found = [];
+    const visit = (root) => {
+        root.querySelectorAll('*').forEach((el) => {
+            if (el.hasAttribute('md')) {
+                found.push({md: el.getAttribute('md'), fingerprint: fingerprintOf(el)});
+            }
+            if (el.shadowRoot) {
+                visit(el.shadowRoot);
+            }
+            if (el.tagName.toLowerCase() === 'iframe') {
+                try {
+                    const doc = el.contentDocument || el.contentWindow.document;
+                    if (doc) {
+                        visit(doc);
+                    }
+                } catch (e) {
+                    // Cross-origin iframes are not reachable.
+                }
+            }
+        });
+    };
+    visit(document);
+    return found;
+}"""
+)
+
+
+def url_pattern(url: str) -> str:
+    """Return the URL without query and fragment, with id-like path segments replaced by ``*``."""
+    parts = urlsplit(url or "")
+    segments = ["*" if _ID_LIKE_SEGMENT.match(segment) else segment for segment in parts.path.split("/")]
+    return f"{parts.scheme}://{parts.netloc}{'/'.join(segments)}"
+
+
+def selector_paths(tool_name: str, args: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """Yield ``(path, selector)`` for every element selector in a tool call's arguments."""
+    for key in ("selector", "source_selector", "target_selector"):
+        if isinstance(args.get(key), str):
+            yield key, args[key]
+    for index, entry in enumerate(args.get("entries") or []):
+        if isinstance(entry, dict) and isinstance(entry.get("selector"), str):
+            yield f"entries.{index}.selector", entry["selector"]
+        elif isinstance(entry, (list, tuple)) and entry and isinstance(entry[0], str):
+            yield f"entries.{index}.0", entry[0]
+    for index, action in enumerate(args.get("actions") or []):
+        if isinstance(action, dict) and isinstance(action.get("selector"), str) and action["selector"]:
+            yield f"actions.{index}.selector", action["selector"]
+
+
+def _set_selector(args: Dict[str, Any], path: str, selector: str) -> None:
+    keys = path.split(".")
+    target: Any = args
+    for key in keys[:-1]:
+        target = target[int(key)] if isinstance(target, list) else target[key]
+    last = keys[-1]
+    if isinstance(target, list):
+        target[int(last)] = selector
+    else:
+        target[last] = selector
+
+
+def _css_selector(selector: str) -> str:
+    # Browser tools take a bare md id as well as a CSS selector.
+    return selector if "md=" in selector else f"[md='{selector}']"
+
+
+def tool_call_failed(tool_name: str, result: str) -> bool:
+    """Return whether a macro tool's result reports an error."""
+    markers = _ERROR_MARKERS if tool_name in MACRO_SNAPSHOT_TOOLS else _FAILED_ACTION_MARKERS
+    lower = result.lower()
+    return any(marker in lower for marker in markers)
+
+
+async def element_fingerprint(page: Any, selector: str) -> Optional[Dict[str, str]]:
+    """Return the fingerprint of the element a tool selector points at, or None."""
+    try:
+        return await page.evaluate(_ELEMENT_FINGERPRINT_JS, _css_selector(selector))
+    except Exception as e:
+        logger.debug("Fingerprinting %s failed: %s", selector, e)
+        return None
+
+
+async def retarget_selector(page: Any, selector: str, fingerprint: Dict[str, str]) -> Optional[str]:
+    """
+    Return a selector for the element with ``fingerprint`` on the current page.
+
+    The recorded selector is kept when it still points at a matching element.
+    Otherwise the one md element with the same fingerprint is used; None is
+    returned when there is no such element or more than one.
+    """
+    if await element_fingerprint(page, selector) == fingerprint:
+        return selector
+    try:
+        candidates = await page.evaluate(_MD_FINGERPRINTS_JS)
+    except Exception as e:
+        logger.debug("Listing md elements failed: %s", e)
+        return None
+    matches = [candidate["md"] for candidate in candidates if candidate.get("fingerprint") == fingerprint]
+    if len(matches) != 1:
+        return None
+    return matches[0] if "md=" not in selector else f"[md='{matches[0]}']"
+
+
+@dataclass
+class MacroCall:
+    """One recorded tool call and the fingerprints of the elements it targets."""
+
+    name: str
+    args: Dict[str, Any]
+    fingerprints: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+
+@dataclass
+class StepMacro:
+    """Tool calls that completed a step on pages matching ``url_pattern``."""
+
+    agent_name: str
+    step_signature: str
+    url_pattern: str
+    calls: List[MacroCall]
+    test_data: str = ""
+
+    @property
+    def key(self) -> str:
+        return step_macro_key(self.agent_name, self.step_signature, self.url_pattern, self.test_data)
+
+
+def test_data_digest(test_data: Optional[str]) -> str:
+    """Digest of the test data a step ran with; macros only replay under the same test data."""
+    return hashlib.sha256(test_data.encode("utf-8")).hexdigest()[:16] if test_data else ""
+
+
+def step_macro_key(agent_name: str, step_signature: str, pattern: str, test_data: str = "") -> str:
+    return json.dumps([STEP_MACRO_VERSION, agent_name, step_signature, pattern, test_data])
+
+
+class StepMacroRecorder:
+    """Collects the tool calls of one nav agent run while it happens."""
+
+    def __init__(self, page: Any) -> None:
+        self.page = page
+        self.calls: List[MacroCall] = []
+        self.replayable = page is not None
+
+    async def before_call(self, tool_name: str, args: Dict[str, Any]) -> Optional[MacroCall]:
+        """Fingerprint the call's target elements before it runs; None once the run is not replayable."""
+        if not self.replayable:
+            return None
+        if tool_name not in MACRO_ACTION_TOOLS and tool_name not in MACRO_SNAPSHOT_TOOLS:
+            self.replayable = False
+            return None
+        call = MacroCall(name=tool_name, args=copy.deepcopy(args))
+        for path, selector in selector_paths(tool_name, args):
+            fingerprint = await element_fingerprint(self.page, selector)
+            if fingerprint is None:
+                self.replayable = False
+                return None
+            call.fingerprints[path] = fingerprint
+        return call
+
+    def after_call(self, call: Optional[MacroCall], result: str) -> None:
+        # Failed attempts the agent recovered from are not part of the macro.
+        if call is not None and not tool_call_failed(call.name, result):
+            self.calls.append(call)
+
+    def macro(self, agent_name: str, step_signature: str, page_url: str, test_data: str = "") -> Optional[StepMacro]:
+        if not self.replayable or not any(call.name in MACRO_ACTION_TOOLS for call in self.calls):
+            return None
+        return StepMacro(agent_name, step_signature, url_pattern(page_url), self.calls, test_data)
+
+
+@dataclass
+class MacroReplay:
+    """The calls a replay made with their results, and why it stopped early, if it did."""
+
+    results: List[Tuple[str, Dict[str, Any], str]] = field(default_factory=list)
+    stopped: str = ""
+
+    @property
+    def completed(self) -> bool:
+        return not self.stopped
+
+    @property
+    def acted(self) -> bool:
+        """Whether any call that changes the page ran."""
+        return any(name in MACRO_ACTION_TOOLS for name, _, _ in self.results)
+
+    def report(self) -> str:
+        lines = []
+        for index, (name, args, result) in enumerate(self.results, start=1):
+            result = " ".join(result.split())
+            if len(result) > _REPORT_RESULT_CHARS:
+                result = result[:_REPORT_RESULT_CHARS] + "..."
+            lines.append(f"{index}. {name}({json.dumps(args)}) -> {result}")
+        return "\n".join(lines)
+
+
+async def replay_step_macro(
+    macro: StepMacro,
+    get_page: Callable[[], Awaitable[Any]],
+    run_call: Callable[[str, Dict[str, Any]], Awaitable[str]],
+) -> MacroReplay:
+    """
+    Execute a macro's calls, re-targeting each selector to its recorded element.
+
+    Parameters:
+        macro (StepMacro): The macro to replay.
+        get_page (Callable[[], Awaitable[Any]]): Returns the current browser page, fetched again before every call.
+        run_call (Callable[[str, Dict[str, Any]], Awaitable[str]]): Executes one tool call and returns its result.
+
+    Returns:
+        MacroReplay: The calls made and their results. It stops as soon as the page diverges from
+        the recording or a call fails; calls made before that point are not undone.
+    """
+    replay = MacroReplay()
+    for index, call in enumerate(macro.calls):
+        page = await get_page()
+        if page is None:
+            replay.stopped = "no browser page is open"
+            return replay
+        args = copy.deepcopy(call.args)
+        selectors = dict(selector_paths(call.name, args))
+        for path, fingerprint in call.fingerprints.items():
+            selector = selectors.get(path)
+            retargeted = await retarget_selector(page, selector, fingerprint) if selector else None
+            if retargeted is None:
+                logger.info("[STEP_MACRO] call %d (%s): no element matches %s; falling back to the LLM", index, call.name, path)
+                name = fingerprint.get("text") or fingerprint.get("label") or fingerprint.get("name") or fingerprint.get("id")
+                replay.stopped = f"the {fingerprint.get('tag', 'element')} {name!r} that {call.name} targets is no longer on the page"
+                return replay
+            if retargeted != selector:
+                _set_selector(args, path, retargeted)
+        result = await run_call(call.name, args)
+        replay.results.append((call.name, args, result))
+        if tool_call_failed(call.name, result):
+            logger.info("[STEP_MACRO] call %d (%s) failed: %s; falling back to the LLM", index, call.name, result[:200])
+            replay.stopped = f"{call.name} failed"
+            return replay
+    return replay
+
+
+class StepMacroStore:
+    """SQLite store of step macros shared by every engine of the process."""
+
+    def __init__(self, path: str, mode: str) -> None:
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS macros (key TEXT PRIMARY KEY, macro TEXT NOT NULL)")
+        self._connection.commit()
+
+    @property
+    def replays(self) -> bool:
+        return self.mode in ("replay", "auto")
+
+    @property
+    def records(self) -> bool:
+        return self.mode in ("record", "auto")
+
+    def _get(self, key: str) -> Optional[StepMacro]:
+        with self._lock:
+            row = self._connection.execute("SELECT macro FROM macros WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        data["calls"] = [MacroCall(**call) for call in data["calls"]]
+        return StepMacro(**data)
+
+    def _put(self, macro: StepMacro) -> None:
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO macros (key, macro) VALUES (?, ?)", (macro.key, json.dumps(asdict(macro))))
+            self._connection.commit()
+
+    async def get(self, agent_name: str, step_signature: str, page_url: str, test_data: str = "") -> Optional[StepMacro]:
+        return await asyncio.to_thread(self._get, step_macro_key(agent_name, step_signature, url_pattern(page_url), test_data))
+
+    async def put(self, macro: StepMacro) -> None:
+        await asyncio.to_thread(self._put, macro)
+
+
+_stores: Dict[str, StepMacroStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_step_macro_store(mode: str, path: str) -> Optional[StepMacroStore]:
+    """Return the process-wide macro store for ``path``, or None when ``mode`` is ``off``."""
+    if mode == "off":
+        return None
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = StepMacroStore(path, mode)
+            _stores[path] = store
+            logger.info("Step macro store %s opened in %s mode", path, mode)
+        store.mode = mode
+        return store
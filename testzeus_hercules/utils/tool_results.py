@@ -0,0 +1,82 @@
+"""
+Tool results read back outside the tool that produced them.
+
+The last API response and SQL result are kept for the assertion tools, per test
+id so that scenarios running concurrently in one process each see their own.
+Read-only tool calls run concurrently, so "last" means the call that started
+last, not the one that finished last.
+Assertion tools answer with an ``AssertionOutcome`` line, which the executor
+parses to feed the planner's ``is_assert``/``is_passed`` state.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from testzeus_hercules.config import get_global_conf
+
+API_RESULT = "api"
+SQL_RESULT = "sql"
+ASSERT_PASS = "[ASSERT PASS]"
+ASSERT_FAIL = "[ASSERT FAIL]"
+
+# test id -> kind -> (start sequence number of the call, result)
+_last_results: Dict[str, Dict[str, Tuple[int, Dict[str, Any]]]] = {}
+_call_sequence = itertools.count()
+
+
+def _test_id() -> str:
+    return get_global_conf().get_default_test_id()
+
+
+def start_result() -> int:
+    """Number a tool call as it starts; pass it to ``record_last_result`` once the call is done."""
+    return next(_call_sequence)
+
+
+def record_last_result(kind: str, result: Dict[str, Any], started: Optional[int] = None) -> None:
+    """
+    Remember ``result`` as the latest result of ``kind`` (API_RESULT or SQL_RESULT) for the running test.
+
+    ``started`` is the call's ``start_result()`` number; a result is dropped when a call that
+    started later has already recorded its own. Without it the call counts as starting now.
+    """
+    if started is None:
+        started = start_result()
+    results = _last_results.setdefault(_test_id(), {})
+    previous = results.get(kind)
+    if previous is None or previous[0] <= started:
+        results[kind] = (started, result)
+
+
+def get_last_result(kind: str) -> Optional[Dict[str, Any]]:
+    """Return the latest result of ``kind`` recorded for the running test, or None."""
+    entry = _last_results.get(_test_id(), {}).get(kind)
+    return entry[1] if entry else None
+
+
+def clear_last_results() -> None:
+    """Forget the results recorded for the running test."""
+    _last_results.pop(_test_id(), None)
+
+
+@dataclass
+class AssertionOutcome:
+    """Verdict of one deterministic check and the evidence it is based on."""
+
+    passed: bool
+    check: str
+    evidence: str
+
+    def __str__(self) -> str:
+        return f"{ASSERT_PASS if self.passed else ASSERT_FAIL} {self.check}: {self.evidence}"
+
+
+def parse_assertion_result(result: str) -> Optional[AssertionOutcome]:
+    """Turn an assertion tool's result line back into its outcome; None for any other text."""
+    result = str(result or "").strip()
+    for marker, passed in ((ASSERT_PASS, True), (ASSERT_FAIL, False)):
+        if result.startswith(marker):
+            check, _, evidence = result[len(marker) :].strip().partition(": ")
+            return AssertionOutcome(passed=passed, check=check, evidence=evidence)
+    return None